@@ -0,0 +1,100 @@
+import math
+
+import numpy as np
+import pytest
+
+from wellfare.ewald import EwaldSum, reciprocalLimits
+from wellfare.ff import Atom, Molecule
+
+SYMBOLS = ["Na", "Cl", "Na", "Cl", "O", "H", "H", "F"]
+CHARGES = np.array([0.6, -0.6, 0.5, -0.5, -0.4, 0.2, 0.2, 0.0])
+COORDS = np.random.default_rng(5).uniform(-2.5, 2.5, (len(SYMBOLS), 3))
+
+
+def ions(box=None, method=None):
+    # A neutral cluster of unbonded atoms, isolated or periodic with Ewald electrostatics
+    molecule = Molecule("Ions", 0)
+    for symbol, x, q in zip(SYMBOLS, COORDS, CHARGES):
+        molecule.addAtom(Atom(symbol, *x, q))
+    if box is not None:
+        molecule.setCell([box] * 3)
+        molecule.setNonbondedCutoff(12.0)
+        molecule.setElectrostatics(method)
+    return molecule
+
+
+def randomCell(n=30, seed=7):
+    rng = np.random.default_rng(seed)
+    box = np.array([24.0, 22.0, 26.0])
+    charges = rng.uniform(-1.0, 1.0, n)
+    return rng.uniform(0.0, 1.0, (n, 3)) * box, charges - np.mean(charges), box
+
+
+def test_ewald_and_pme_agree():
+    X, charges, box = randomCell()
+    energy, gradient = EwaldSum("ewald", cutoff=9.0).energyGradient(X, charges, box)
+    energy_pme, gradient_pme = EwaldSum("pme", cutoff=9.0).energyGradient(X, charges, box)
+    assert energy_pme == pytest.approx(energy, rel=1.0e-4)
+    assert np.max(np.abs(gradient_pme - gradient)) < 1.0e-3 * np.max(np.abs(gradient))
+    # A finer grid and higher spline order converge on the plain Ewald sum
+    energy_pme, gradient_pme = EwaldSum("pme", cutoff=9.0, spacing=0.5, order=8).energyGradient(X, charges, box)
+    assert energy_pme == pytest.approx(energy, rel=1.0e-7)
+    assert np.max(np.abs(gradient_pme - gradient)) < 1.0e-6 * np.max(np.abs(gradient))
+
+
+@pytest.mark.parametrize("method", ["ewald", "pme"])
+def test_ewald_gradient_matches_finite_differences(method):
+    X, charges, box = randomCell()
+    ewald = EwaldSum(method, cutoff=9.0)
+    gradient = ewald.energyGradient(X, charges, box)[1]
+    step = 1.0e-5
+    for i in range(0, len(X), 7):
+        for d in range(3):
+            Y = X.copy()
+            Y[i, d] += step
+            forward = ewald.energyGradient(Y, charges, box)[0]
+            Y[i, d] -= 2 * step
+            backward = ewald.energyGradient(Y, charges, box)[0]
+            assert gradient[i, d] == pytest.approx((forward - backward) / (2 * step), abs=1.0e-9)
+
+
+@pytest.mark.parametrize("method", ["ewald", "pme"])
+def test_periodic_energy_approaches_direct_summation(method):
+    coords = COORDS.flatten()
+    energy, gradient = ions().FFEnergyGradient(coords)
+    # With conducting boundary conditions, a cell with dipole M differs from the isolated cluster by
+    # -2 pi M^2 / 3 V, which falls off with the volume (up to the PME discretisation error of about 5e-7)
+    dipole = CHARGES @ COORDS
+    errors = []
+    for box in (30.0, 60.0, 120.0):
+        energy_box, gradient_box = ions(box, method).FFEnergyGradient(coords)
+        dipoleTerm = 2 * math.pi * (dipole @ dipole) / (3 * box ** 3)
+        assert energy_box - energy == pytest.approx(-dipoleTerm, rel=0.05, abs=1.0e-6)
+        errors.append((abs(energy_box - energy), np.max(np.abs(gradient_box - gradient))))
+    assert errors[0][0] > errors[1][0] > errors[2][0]
+    assert errors[0][1] > errors[1][1] > errors[2][1]
+    assert errors[2][0] < 1.0e-5 and errors[2][1] < 1.0e-5
+
+
+@pytest.mark.parametrize("method", ["ewald", "pme"])
+def test_periodic_gradient_matches_finite_differences(method):
+    molecule = ions(30.0, method)
+    coords = COORDS.flatten()
+    gradient = molecule.FFEnergyGradient(coords)[1]
+    step = 1.0e-5
+    for i in range(len(coords)):
+        displacement = np.zeros_like(coords)
+        displacement[i] = step
+        numerical = (molecule.FFEnergy(coords + displacement) - molecule.FFEnergy(coords - displacement)) / (2 * step)
+        assert gradient[i] == pytest.approx(numerical, abs=1.0e-9)
+
+
+def test_reciprocal_limits_follow_the_tolerance():
+    box = np.array([20.0, 30.0, 40.0])
+    alpha = 0.3
+    limits = reciprocalLimits(box, alpha, 1.0e-6)
+    # The first wave vector left out along each edge has decayed below the tolerance, the last one kept has not
+    for n, length in zip(limits, box):
+        assert math.exp(-(2 * math.pi * (n + 1) / length) ** 2 / (4 * alpha ** 2)) < 1.0e-6
+        assert math.exp(-(2 * math.pi * (n - 1) / length) ** 2 / (4 * alpha ** 2)) > 1.0e-6
+    assert np.all(reciprocalLimits(box, alpha, 1.0e-8) >= limits)
@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pytest
+
+from wellfare.build import extractCoordinates
+from wellfare.ff import Atom, Molecule
+from wellfare.finitediff import numericalHessian
+from wellfare.fitting import fitForceConstants
+
+LOGS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def fittedMolecule(filename):
+    # The force field of a bundled log, at a structure displaced from its equilibrium
+    molecule = Molecule(filename, 0)
+    extractCoordinates(os.path.join(LOGS, filename), molecule, cache=False, nprocs=1)
+    fitForceConstants(molecule)
+    coords = np.array([atom.coord for atom in molecule.atoms]).flatten()
+    return molecule, coords + np.random.default_rng(3).uniform(-0.05, 0.05, coords.shape)
+
+
+def test_disconnected_atoms_are_not_screened():
+    # Two separate H2 molecules: only the atoms of the same molecule are 1,2 pairs
+    molecule = Molecule("2 H2", 0)
+    for x, y in ((0.0, 0.0), (0.74, 0.0), (0.0, 3.0), (0.74, 3.0)):
+        molecule.addAtom(Atom("H", x, y, 0.0, 0.0))
+    molecule.addBond(0, 1)
+    molecule.addBond(2, 3)
+    rep_disp, elstat = molecule.screeningMatrices()
+    assert rep_disp[0, 1] == 0.0 and elstat[0, 1] == 0.0
+    for a, b in ((0, 2), (0, 3), (1, 2), (1, 3)):
+        assert rep_disp[a, b] == 1.0
+        assert elstat[a, b] == 1.0
+
+
+def test_unbonded_atom_pair_is_not_screened():
+    for n in (2, 3):
+        molecule = Molecule("He" + str(n), 0)
+        for i in range(n):
+            molecule.addAtom(Atom("He", 3.0 * i, 0.0, 0.0, 0.0))
+        rep_disp, elstat = molecule.screeningMatrices()
+        offdiagonal = ~np.eye(n, dtype=bool)
+        assert np.all(rep_disp[offdiagonal] == 1.0)
+        assert np.all(elstat[offdiagonal] == 1.0)
+
+
+@pytest.mark.parametrize("filename", ["g09-h2o.log", "g09-f3bnh2cho.log"])
+def test_gradient_matches_finite_differences(filename):
+    molecule, coords = fittedMolecule(filename)
+    energy, gradient = molecule.FFEnergyGradient(coords)
+    assert energy == pytest.approx(molecule.FFEnergy(coords), abs=1.0e-10)
+    step = 1.0e-5
+    numerical = np.zeros_like(coords)
+    for i in range(len(coords)):
+        displacement = np.zeros_like(coords)
+        displacement[i] = step
+        numerical[i] = molecule.FFEnergy(coords + displacement) - molecule.FFEnergy(coords - displacement)
+    numerical = numerical / (2 * step)
+    assert np.max(np.abs(gradient - numerical)) < 1.0e-7
+
+
+@pytest.mark.parametrize("filename", ["g09-h2o.log", "g09-f3bnh2cho.log"])
+def test_hessian_matches_numerical_hessian(filename):
+    molecule, coords = fittedMolecule(filename)
+    hessian = molecule.FFHessian(coords)
+    assert np.allclose(hessian, hessian.T, rtol=0.0, atol=1.0e-12)
+    assert np.max(np.abs(hessian - numericalHessian(molecule, coords, nprocs=1))) < 1.0e-6
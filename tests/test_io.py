@@ -0,0 +1,31 @@
+import os
+
+import numpy as np
+import pytest
+
+from wellfare.io import cachedQMOutput, loadQMData, parseQMOutput
+
+LOG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "g09-h2o.log")
+
+
+@pytest.mark.parametrize("length", [0, 10, 100, -50])
+def test_truncated_cache_entry_is_parsed_again(tmp_path, monkeypatch, length):
+    monkeypatch.setenv("WELLFARE_CACHE_DIR", str(tmp_path))
+    reference = parseQMOutput(LOG)
+    cachedQMOutput(LOG)
+    directory = tmp_path / "logs"
+    entries = [name for name in os.listdir(directory) if name.endswith(".npz")]
+    assert len(entries) == 1
+    path = str(directory / entries[0])
+
+    # Cut the entry short, as a crash while writing it would
+    with open(path, 'rb') as f:
+        contents = f.read()
+    with open(path, 'wb') as f:
+        f.write(contents[:length])
+
+    data = cachedQMOutput(LOG)
+    assert data.atoms == reference.atoms
+    assert np.array_equal(data.hessian, reference.hessian)
+    # The damaged entry has been replaced by a readable one
+    assert loadQMData(path).atoms == reference.atoms
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from wellfare.ff import Atom, Molecule
+from wellfare.neighbours import NeighbourList, switchingFunction
+
+
+def cluster(n=12, seed=2):
+    # Unbonded atoms with partial charges, none of them closer than 1.5 Angstrom
+    rng = np.random.default_rng(seed)
+    coords = []
+    while len(coords) < n:
+        x = rng.uniform(-4.0, 4.0, 3)
+        if all(np.linalg.norm(x - y) > 1.5 for y in coords):
+            coords.append(x)
+    charges = rng.uniform(-0.5, 0.5, n)
+    molecule = Molecule("Cluster", 0)
+    for i, (x, q) in enumerate(zip(coords, charges)):
+        molecule.addAtom(Atom(("C", "N", "O", "H")[i % 4], *x, q))
+    return molecule, np.array(coords).flatten()
+
+
+def test_switching_function_is_smooth():
+    switch, cutoff = 8.0, 10.0
+    r = np.linspace(7.0, 11.0, 81)
+    s, ds, d2s = switchingFunction(r, switch, cutoff, deriv=2)
+    assert np.all(s[r <= switch] == 1.0) and np.all(s[r >= cutoff] == 0.0)
+    assert np.all(np.diff(s) <= 0.0)
+    step = 1.0e-6
+    assert np.allclose(ds, (switchingFunction(r + step, switch, cutoff) - switchingFunction(r - step, switch, cutoff))
+                       / (2 * step), atol=1.0e-8)
+    assert np.allclose(d2s, (switchingFunction(r + step, switch, cutoff, deriv=1)[1]
+                             - switchingFunction(r - step, switch, cutoff, deriv=1)[1]) / (2 * step), atol=1.0e-5)
+    # First and second derivatives vanish at both ends
+    for bound in (switch, cutoff):
+        assert np.allclose(switchingFunction(np.array([bound]), switch, cutoff, deriv=2)[1:], 0.0)
+
+
+def test_disabled_cutoff_gives_all_pairs():
+    molecule, coords = cluster()
+    energy, gradient = molecule.FFEnergyGradient(coords)
+    # A cutoff with its switching distance beyond all atom pairs changes nothing
+    molecule.setNonbondedCutoff(60.0, 2.0, 50.0)
+    energy_cutoff, gradient_cutoff = molecule.FFEnergyGradient(coords)
+    assert energy_cutoff == pytest.approx(energy, abs=1.0e-12)
+    assert np.allclose(gradient_cutoff, gradient, rtol=0.0, atol=1.0e-12)
+    assert molecule.FFEnergy(coords) == pytest.approx(energy, abs=1.0e-12)
+    # A short cutoff drops pairs, and disabling it brings them back
+    molecule.setNonbondedCutoff(4.0)
+    assert molecule.FFEnergy(coords) != pytest.approx(energy, abs=1.0e-8)
+    molecule.setNonbondedCutoff(None)
+    energy_none, gradient_none = molecule.FFEnergyGradient(coords)
+    assert energy_none == pytest.approx(energy, abs=1.0e-12)
+    assert np.allclose(gradient_none, gradient, rtol=0.0, atol=1.0e-12)
+
+
+def test_switched_energy_and_gradient_are_continuous():
+    molecule = Molecule("Ne2", 0)
+    molecule.addAtom(Atom("Ne", 0.0, 0.0, 0.0, 0.3))
+    molecule.addAtom(Atom("Ne", 5.0, 0.0, 0.0, -0.3))
+    switch, cutoff = 4.0, 6.0
+    molecule.setNonbondedCutoff(cutoff, 1.0, switch)
+
+    def evaluate(r):
+        return molecule.FFEnergyGradient(np.array([0.0, 0.0, 0.0, r, 0.0, 0.0]))
+
+    epsilon = 1.0e-7
+    for bound in (switch, cutoff):
+        energy_in, gradient_in = evaluate(bound - epsilon)
+        energy_out, gradient_out = evaluate(bound + epsilon)
+        assert abs(energy_out - energy_in) < 1.0e-8
+        assert np.max(np.abs(gradient_out - gradient_in)) < 1.0e-8
+    # Beyond the cutoff, the atoms no longer interact
+    assert np.all(evaluate(cutoff + 0.5)[1] == 0.0)
+    assert evaluate(cutoff + 0.5)[0] == evaluate(cutoff + 2.0)[0]
+    # Inside the switching region, the gradient is that of the switched energy
+    step = 1.0e-5
+    for r in (4.3, 5.0, 5.7):
+        numerical = (evaluate(r + step)[0] - evaluate(r - step)[0]) / (2 * step)
+        assert evaluate(r)[1][3] == pytest.approx(numerical, abs=1.0e-9)
+
+
+def test_neighbour_list_keeps_all_pairs_within_the_skin():
+    rng = np.random.default_rng(4)
+    X = rng.uniform(0.0, 20.0, (200, 3))
+    neighbours = NeighbourList(cutoff=5.0, skin=1.0)
+    for moves in range(5):
+        pair_i, pair_j = neighbours.pairs(X)
+        listed = set(zip(pair_i.tolist(), pair_j.tolist()))
+        distances = np.linalg.norm(X[:, np.newaxis] - X[np.newaxis], axis=-1)
+        within = set(zip(*np.nonzero(np.triu(distances < neighbours.cutoff, 1))))
+        assert within <= listed
+        # Moves of less than half the skin keep the list
+        X = X + rng.uniform(-0.1, 0.1, X.shape)
+    assert neighbours.builds < 5
@@ -0,0 +1,50 @@
+import numpy as np
+
+from wellfare.optimise import newtonStep, optimiseGeometry, rfoStep
+
+
+def test_newton_step_with_huge_negative_curvature():
+    gradient = np.ones(3)
+    hessian = np.diag([-1.0e17, 1.0, 2.0])
+    for step_function in (newtonStep, rfoStep):
+        step, predicted = step_function(gradient, hessian, 1.0e-10)
+        assert np.all(np.isfinite(step))
+        assert np.linalg.norm(step) <= 1.0e-10 * (1 + 1.0e-8)
+        assert predicted < 0.0
+
+
+def test_trust_radius_floor_ends_optimisation():
+    # The gradient promises far more than the energy delivers, so every step is accepted with a poor ratio of actual
+    # to predicted energy change and the trust radius keeps shrinking
+    def function(x, hessian):
+        return 1.0e-6 * np.sum(x), np.ones_like(x), np.eye(len(x)) if hessian else None
+
+    for method in ("bfgs", "lbfgs", "rfo", "newton"):
+        result = optimiseGeometry(function, np.zeros(6), method, maxiter=100000)
+        assert not result["converged"]
+        assert result["iterations"] < 100
+
+
+def test_non_finite_energy_stops_optimisation():
+    start = np.array([1.0, 0.5, -0.5])
+
+    def function(x, hessian):
+        if np.array_equal(x, start):
+            return np.sum(x ** 2), 2 * x, 2 * np.eye(len(x)) if hessian else None
+        return np.nan, 2 * x, 2 * np.eye(len(x)) if hessian else None
+
+    for method in ("bfgs", "lbfgs", "rfo", "newton"):
+        result = optimiseGeometry(function, start, method)
+        assert not result["converged"]
+        assert result["evaluations"] == 2
+        assert np.array_equal(result["coords"], start)
+        assert np.isfinite(result["energy"])
+
+
+def test_non_finite_gradient_at_start():
+    def function(x, hessian):
+        return 0.0, np.full_like(x, np.inf), np.eye(len(x)) if hessian else None
+
+    result = optimiseGeometry(function, np.zeros(3), "rfo")
+    assert not result["converged"]
+    assert result["evaluations"] == 1
@@ -0,0 +1,138 @@
+import math
+import os
+
+import numpy as np
+
+import wellfare.build
+from wellfare.constants import SymbolToNumber
+from wellfare.ff import Atom, Molecule
+from wellfare.torsions import fragmentSignature, mirrorScan
+
+LOGS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+POINTS = 20
+
+# Two chiral centres bonded along z, each with three different substituents
+RIGHT = ("C", (0.0, 0.0, 0.0), [("H", 1.09, 0.0), ("F", 1.35, 120.0), ("Cl", 1.77, 240.0)])
+LEFT = ("C", (0.0, 0.0, 1.54), [("H", 1.09, 40.0), ("S", 1.82, 160.0), ("O", 1.43, 280.0)])
+
+
+def fragment(side, transform=lambda x: x, reverse=False):
+    (symbol, centre, substituents) = side
+    theta = math.radians(109.5 if centre[2] == 0.0 else 70.5)
+    molecule = Molecule("Fragment", 0)
+    molecule.addAtom(Atom(symbol, *transform(np.array(centre)), 0.0))
+    if reverse:
+        substituents = substituents[::-1]
+    for symbol, r, phi in substituents:
+        phi = math.radians(phi)
+        position = np.array(centre) - r * np.array([math.sin(theta) * math.cos(phi), math.sin(theta) * math.sin(phi),
+                                                    math.cos(theta) if centre[2] == 0.0 else -math.cos(theta)])
+        molecule.addAtom(Atom(symbol, *transform(position), 0.0))
+    return molecule
+
+
+def pairEnergy(right, left):
+    # Depends on interatomic distances only, so the mirror image at the mirrored angle has the same energy
+    energy = 0.0
+    for a in right.atoms[1:]:
+        for b in left.atoms[1:]:
+            r = np.linalg.norm(np.array(a.coord) - np.array(b.coord))
+            energy += SymbolToNumber[a.symbol] * SymbolToNumber[b.symbol] / r
+    return energy
+
+
+def scan(transform=lambda x: x):
+    # Rotates the left side about the central bond as extractCoordinates() does
+    energies = []
+    for k in range(POINTS):
+        right, left = fragment(RIGHT, transform), fragment(LEFT, transform)
+        left.rotateMoleculeArbAxis(list(right.atoms[0].coord), list(left.atoms[0].coord), (360 / POINTS) * k)
+        energies.append(pairEnergy(right, left))
+    return energies
+
+
+def dihedral(right, left):
+    # Dihedral angle of the first substituents of the two sides about the central bond, in degrees
+    a, b, c, d = (np.array(right.atoms[1].coord), np.array(right.atoms[0].coord), np.array(left.atoms[0].coord),
+                  np.array(left.atoms[1].coord))
+    axis = (c - b) / np.linalg.norm(c - b)
+    p = (a - b) - np.dot(a - b, axis) * axis
+    q = (d - c) - np.dot(d - c, axis) * axis
+    return math.degrees(math.atan2(np.dot(np.cross(p, q), axis), np.dot(p, q)))
+
+
+def mirror(x):
+    return x * np.array([-1.0, 1.0, 1.0])
+
+
+def test_signature_independent_of_position_orientation_and_order():
+    reference = fragmentSignature(fragment(RIGHT), fragment(LEFT), POINTS, "eht")
+    rotation = np.linalg.qr(np.random.default_rng(11).standard_normal((3, 3)))[0]
+    if np.linalg.det(rotation) < 0.0:
+        rotation = -rotation
+
+    def move(x):
+        return rotation @ x + np.array([3.2, -1.7, 0.4])
+
+    moved = fragmentSignature(fragment(RIGHT, move, reverse=True), fragment(LEFT, move, reverse=True), POINTS, "eht")
+    assert moved == reference
+    # Swapping the two sides describes the same rotation about the central bond
+    assert fragmentSignature(fragment(LEFT), fragment(RIGHT), POINTS, "eht") == reference
+
+
+def test_mirror_image_maps_to_mirrored_scan():
+    key, mirrored = fragmentSignature(fragment(RIGHT), fragment(LEFT), POINTS, "eht")
+    key_mirror, mirrored_mirror = fragmentSignature(fragment(RIGHT, mirror), fragment(LEFT, mirror), POINTS, "eht")
+    assert key_mirror == key
+    assert mirrored_mirror != mirrored
+
+    energies = scan()
+    energies_mirror = scan(mirror)
+    assert not np.allclose(energies, energies_mirror)
+    assert np.allclose(mirrorScan(energies), energies_mirror)
+    assert mirrorScan(mirrorScan(energies)) == energies
+    # Both store the same canonical scan in the cache
+    canonical = mirrorScan(energies) if mirrored else energies
+    canonical_mirror = mirrorScan(energies_mirror) if mirrored_mirror else energies_mirror
+    assert np.allclose(canonical, canonical_mirror)
+
+    # The minimum, eqHMO, lies at minus the angle of the original, so the fit relative to eqHMO is the same
+    start = dihedral(fragment(RIGHT), fragment(LEFT))
+    start_mirror = dihedral(fragment(RIGHT, mirror), fragment(LEFT, mirror))
+    assert math.isclose(start_mirror, -start, abs_tol=1.0e-9)
+    angles = start + (360 / POINTS) * np.arange(POINTS)
+    angles_mirror = start_mirror + (360 / POINTS) * np.arange(POINTS)
+    eq = angles[np.argmin(energies)]
+    eq_mirror = angles_mirror[np.argmin(energies_mirror)]
+    assert math.isclose((eq + eq_mirror + 180.0) % 360.0, 180.0, abs_tol=1.0e-9)
+
+
+def test_different_substituent_changes_signature():
+    reference = fragmentSignature(fragment(RIGHT), fragment(LEFT), POINTS, "eht")[0]
+    symbol, centre, substituents = LEFT
+    substituted = (symbol, centre, [substituents[0], ("P", 1.82, 160.0), substituents[2]])
+    assert fragmentSignature(fragment(RIGHT), fragment(substituted), POINTS, "eht")[0] != reference
+    # So do the number of scan points and the backend
+    assert fragmentSignature(fragment(RIGHT), fragment(LEFT), POINTS + 1, "eht")[0] != reference
+    assert fragmentSignature(fragment(RIGHT), fragment(LEFT), POINTS, "g09")[0] != reference
+
+
+def test_ethane_dihedrals_share_one_scan(monkeypatch, tmp_path):
+    monkeypatch.setenv("WELLFARE_CACHE_DIR", str(tmp_path))
+    scans = []
+    runTorsionScans = wellfare.build.runTorsionScans
+
+    def counted(fragments, *args):
+        scans.append(len(fragments))
+        return runTorsionScans(fragments, *args)
+
+    monkeypatch.setattr(wellfare.build, "runTorsionScans", counted)
+    molecule = Molecule("Ethane", 0)
+    wellfare.build.extractCoordinates(os.path.join(LOGS, "g09-ethane.log"), molecule, cache=False, nprocs=1)
+
+    torsions = [term for term in molecule.tors if term.typ == 4]
+    assert len(molecule.dihedrals) == 9 and len(torsions) == 9
+    assert scans == [POINTS]
+    for term in torsions[1:]:
+        assert np.array_equal(term.k_tors, torsions[0].k_tors)
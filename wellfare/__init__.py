@@ -0,0 +1,52 @@
+import importlib
+from importlib.util import find_spec
+
+#############################################################################################################
+# WellFAReFF: Wellington Fast Assessment of Reactions - Force Field
+#
+# The library is split into modules: constants, messages, potentials, terms (force field terms and term tables),
+# sto and eht (Slater type orbitals and extended Hueckel theory), topology, profiler, neighbours (neighbour lists),
+# ff (Atom and Molecule), io (parsing and caching of qc output files), torsions (torsion scans),
+# build (extractCoordinates), fitting (fitForceConstants), tools (optional calculations) and cli (the command line
+# program).
+# The names below are available directly from the package; each module is only imported on first use,
+# so importing the package itself is cheap and does no I/O.
+#############################################################################################################
+
+# Check for numpy and scipy, exit immediately if not available
+from .messages import ProgramAbort, ProgramError
+
+for module in ("numpy", "scipy"):
+    if find_spec(module) is None:
+        ProgramError()
+        print("Module " + module + " is required")
+        ProgramAbort()
+
+# Public names of the library and the modules that define them
+PublicNames = {"Atom": "ff", "Molecule": "ff",
+               "FFStretch": "terms", "FFBend": "terms", "FFTorsion": "terms", "FFInversion": "terms",
+               "FFHBond": "terms",
+               "STO": "eht", "solveHueckel": "eht",
+               "FFProfiler": "profiler",
+               "NeighbourList": "neighbours",
+               "EwaldSum": "ewald",
+               "numericalHessian": "finitediff",
+               "QMData": "io", "parseQMOutput": "io", "cachedQMOutput": "io", "cacheDirectory": "io",
+               "runTorsionScans": "torsions", "ScanBackends": "torsions",
+               "extractCoordinates": "build", "perceiveTopology": "build",
+               "fitForceConstants": "fitting",
+               "optimiseGeometry": "optimise", "OptimisationMethods": "optimise", "ConvergenceCriteria": "optimise",
+               "dissociateBond": "tools", "TSbySEAM": "tools",
+               "main": "cli"}
+
+__all__ = sorted(PublicNames)
+
+
+def __getattr__(name):
+    if name in PublicNames:
+        return getattr(importlib.import_module("." + PublicNames[name], __name__), name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(PublicNames))
@@ -0,0 +1,864 @@
+import math
+
+import numpy as np
+import scipy.optimize
+
+from . import topology
+from .messages import ProgramWarning
+from .constants import SymbolToRadius
+from .potentials import DampingFunction, potCosineSum, potTorsion
+from .ff import Atom, Molecule
+from .io import cachedQMOutput, parseQMOutput
+from .torsions import fragmentSignature, loadFragmentCache, mirrorScan, runTorsionScans, saveFragmentCache
+
+
+#############################################################################################################
+# Topology perception: bonds from bond orders or covalent radii, and the angles and dihedrals they form
+#############################################################################################################
+
+def perceiveTopology(molecule, bondorders, verbosity=0, distfactor=1.3, bondcutoff=0.45):
+    """
+    Adds the bonds, angles and dihedrals of molecule: bonds between atoms with a Mayer bond order (in the NxN array
+    bondorders) of at least bondcutoff or, without bond orders, closer than distfactor times the sum of their
+    covalent radii, and the angles and dihedrals these bonds form
+    """
+    # Test if we actually have Mayer Bond orders
+    if np.count_nonzero(bondorders) != 0:
+        if verbosity >= 1:
+            print("\nAdding bonds to WellFARe molecule: ", molecule.name)
+            print("(using bond orders with a cutoff of {: .2f}):".format(bondcutoff))
+        for i in range(0, molecule.numatoms()):
+            for j in range(i + 1, molecule.numatoms()):
+                if bondorders[i][j] >= bondcutoff:
+                    molecule.addBond(i, j)
+                    if verbosity >= 2:
+                        print(
+                            " {:<3} ({:3d}) and {:<3} ({:3d}) (Bond order: {: .3f})".format(molecule.atoms[i].symbol, i,
+                                                                                            molecule.atoms[j].symbol, j,
+                                                                                            bondorders[i][j]))
+    # Else use 130% of the sum of covalent radii as criterion for a bond (user defined: distfactor)
+    else:
+        if verbosity >= 1:
+            print("\nAdding bonds to WellFARe molecule:", molecule.name)
+            print("(using covalent radii scaled by {: .2f}):".format(distfactor))
+        # Only pairs of geometric neighbours are tested, in the same order as a loop over all pairs i < j
+        candidates = topology.bondCandidates(molecule.cartesianCoordinates(),
+                                             [SymbolToRadius[atom.symbol] for atom in molecule.atoms], distfactor)
+        for i, j in candidates:
+            if molecule.atmatmdist(i, j) <= (
+                        SymbolToRadius[molecule.atoms[i].symbol] + SymbolToRadius[
+                        molecule.atoms[j].symbol]) * distfactor:
+                molecule.addBond(i, j)
+                if verbosity >= 2:
+                    print(
+                        " {:<3} ({:3d}) and {:<3} ({:3d}) (Distance: {:.3f} A)".format(molecule.atoms[i].symbol, i,
+                                                                                       molecule.atoms[j].symbol, j,
+                                                                                       molecule.atmatmdist(i, j)))
+
+    # Now that we know where the bonds are, find angles around each atom from its bonding partners
+    if verbosity >= 2:
+        print("\nAdding angles to WellFARe molecule: ", molecule.name)
+    for angle in topology.findAngles(molecule.bonds, molecule.numatoms(), molecule.angles):
+        molecule.angles.append(angle)
+        if verbosity >= 2:
+            print(" {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({:6.2f} deg)".format(
+                molecule.atoms[angle[0]].symbol, angle[0], molecule.atoms[angle[1]].symbol, angle[1],
+                molecule.atoms[angle[2]].symbol, angle[2], math.degrees(molecule.bondangle(len(molecule.angles) - 1))))
+
+    # Same for dihedrals: Use angles sharing two atoms to determine where they are
+    if verbosity >= 2:
+        print("\nAdding dihedrals to WellFARe molecule: ", molecule.name)
+    for dihedral in topology.findDihedrals(molecule.angles, molecule.numatoms(), molecule.dihedrals):
+        molecule.dihedrals.append(dihedral)
+        if verbosity >= 2:
+            print(" {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({: 7.2f} deg)".format(
+                molecule.atoms[dihedral[0]].symbol, dihedral[0], molecule.atoms[dihedral[1]].symbol, dihedral[1],
+                molecule.atoms[dihedral[2]].symbol, dihedral[2], molecule.atoms[dihedral[3]].symbol, dihedral[3],
+                math.degrees(molecule.dihedralangle(len(molecule.dihedrals) - 1))))
+
+
+#############################################################################################################
+# Most important function so far: Read Quantum Chemistry output file and construct WellFaRe Molecule from it
+#############################################################################################################
+
+def extractCoordinates(filename, molecule, verbosity=0, distfactor=1.3, bondcutoff=0.45, cache=True, nprocs=None,
+                       scanbackend="eht"):
+    if verbosity >= 1:
+        print("\nSetting up WellFARe molecule: ", molecule.name)
+    # Parsed output files are kept in an on-disk cache unless cache=False
+    if cache:
+        data = cachedQMOutput(filename, verbosity)
+    else:
+        data = parseQMOutput(filename, verbosity)
+
+    # GEOMETRY AND ATOMIC CHARGE SECTION
+    if verbosity >= 1:
+        print("\nReading of geometry finished.\nAdding atoms to WellFARe molecule: ", molecule.name)
+    for i in data.atoms:
+        molecule.addAtom(Atom(i[0], i[1], i[2], i[3], 0.1))  # 0.1 a placeholder for QM calculated charge on the atom
+        if verbosity >= 2:
+            print(" {:<3} {: .8f} {: .8f} {: .8f}".format(i[0], i[1], i[2], i[3]))
+    if data.charges is not None:
+        if verbosity >= 1:
+            print("\nReading of Mulliken charges finished. \nAdding QM atomic charges to atoms in WellFARe molecule: ",
+                  molecule.name)
+        for n in range(molecule.numatoms()):
+            molecule.atoms[n].setq(data.charges[n])
+            if verbosity >= 2:
+                print(" {:<3} ({:3d}) (Charge: {: .3f} e)".format(molecule.atoms[n].symbol, n,
+                                                                  molecule.atoms[n].QMcharge))
+
+    # EQUILIBRIUM ENERGY SECTION
+    if data.energy is not None:
+        molecule.setQMenergy(data.energy)
+        if verbosity >= 1:
+            print("\nReading of QM equilibrium energy complete")
+            if verbosity >= 2:
+                print("Ee_QM = " + str(data.energy))
+    else:
+        ProgramWarning()
+        print("No QM equilibrium energy found in file: " + str(filename))
+
+    # BOND ORDER SECTION
+    bo = data.bondorders
+    if verbosity >= 3:
+        print("\nBond Orders:")
+        np.set_printoptions(suppress=True)
+        np.set_printoptions(formatter={'float': '{: 0.3f}'.format})
+        print(bo)
+
+    # FORCE CONSTANT SECTION
+    H = np.zeros((3 * molecule.numatoms(), 3 * molecule.numatoms()))
+    if data.hessian is not None:
+        H = data.hessian
+        molecule.setHessian(H)  # Store H as the QM calculated Hessian for this molecule
+        if verbosity >= 3:
+            print("\nForce constants in Cartesian coordinates (Input orientation):")
+            print(H)
+    else:
+        ProgramWarning()
+        print("No QM Hessian found in file: " + str(filename))
+
+    # BOND, ANGLE AND DIHEDRAL SECTION
+    perceiveTopology(molecule, bo, verbosity, distfactor, bondcutoff)
+
+    # Postpone dealing with inversions to later...
+    # # Same for threefolds: Use angles to determine where they are
+    # if verbosity >= 2:
+    #     print("\nAdding threefolds to WellFARe molecule: ", molecule.name)
+    # for i in range(0, len(molecule.angles)):
+    #     for j in range(i + 1, len(molecule.angles)):
+    #         for k in range(j + 1, len(molecule.angles)):
+    #             if molecule.angles[i][1] == molecule.angles[j][1] == molecule.angles[k][1]:
+    #                 if molecule.angles[i][0] == molecule.angles[j][0] and molecule.angles[j][2] == molecule.angles[k][
+    #                     2] and molecule.angles[i][2] == molecule.angles[k][0]:
+    #                     molecule.addThreefold(molecule.angles[i][1], molecule.angles[i][0], molecule.angles[j][2],
+    #                                           molecule.angles[i][2])
+    #                     if verbosity >= 2:
+    #                         print(
+    #                             " {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({: 7.2f} deg)".format(
+    #                                 molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+    #                                 molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+    #                                 molecule.atoms[molecule.angles[j][2]].symbol, molecule.angles[j][2],
+    #                                 molecule.atoms[molecule.angles[i][2]].symbol, molecule.angles[i][2],
+    #                                 math.degrees(molecule.outofplaneangle(len(molecule.threefolds) - 1))))
+    #                 if molecule.angles[i][0] == molecule.angles[j][0] and molecule.angles[j][2] == molecule.angles[k][
+    #                     0] and molecule.angles[i][2] == molecule.angles[k][2]:
+    #                     molecule.addThreefold(molecule.angles[i][1], molecule.angles[i][0], molecule.angles[j][2],
+    #                                           molecule.angles[i][2])
+    #                     if verbosity >= 2:
+    #                         print(
+    #                             " {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({: 7.2f} deg)".format(
+    #                                 molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+    #                                 molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+    #                                 molecule.atoms[molecule.angles[j][2]].symbol, molecule.angles[j][2],
+    #                                 molecule.atoms[molecule.angles[i][2]].symbol, molecule.angles[i][2],
+    #                                 math.degrees(molecule.outofplaneangle(len(molecule.threefolds) - 1))))
+    #                 if molecule.angles[i][0] == molecule.angles[j][2] and molecule.angles[j][0] == molecule.angles[k][
+    #                     0] and molecule.angles[i][2] == molecule.angles[k][2]:
+    #                     molecule.addThreefold(molecule.angles[i][1], molecule.angles[i][0], molecule.angles[j][0],
+    #                                           molecule.angles[i][2])
+    #                     if verbosity >= 2:
+    #                         print(
+    #                             " {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({: 7.2f} deg)".format(
+    #                                 molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+    #                                 molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+    #                                 molecule.atoms[molecule.angles[j][0]].symbol, molecule.angles[j][0],
+    #                                 molecule.atoms[molecule.angles[i][2]].symbol, molecule.angles[i][2],
+    #                                 math.degrees(molecule.outofplaneangle(len(molecule.threefolds) - 1))))
+    #                 if molecule.angles[i][0] == molecule.angles[j][2] and molecule.angles[j][0] == molecule.angles[k][
+    #                     2] and molecule.angles[i][2] == molecule.angles[k][0]:
+    #                     molecule.addThreefold(molecule.angles[i][1], molecule.angles[i][0], molecule.angles[j][0],
+    #                                           molecule.angles[i][2])
+    #                     if verbosity >= 2:
+    #                         print(
+    #                             " {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({: 7.2f} deg)".format(
+    #                                 molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+    #                                 molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+    #                                 molecule.atoms[molecule.angles[j][0]].symbol, molecule.angles[j][0],
+    #                                 molecule.atoms[molecule.angles[i][2]].symbol, molecule.angles[i][2],
+    #                                 math.degrees(molecule.outofplaneangle(len(molecule.threefolds) - 1))))
+    #                 if molecule.angles[i][2] == molecule.angles[j][0] and molecule.angles[j][2] == molecule.angles[k][
+    #                     0] and molecule.angles[i][0] == molecule.angles[k][2]:
+    #                     molecule.addThreefold(molecule.angles[i][1], molecule.angles[i][2], molecule.angles[j][2],
+    #                                           molecule.angles[i][0])
+    #                     if verbosity >= 2:
+    #                         print(
+    #                             " {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({: 7.2f} deg)".format(
+    #                                 molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+    #                                 molecule.atoms[molecule.angles[i][2]].symbol, molecule.angles[i][2],
+    #                                 molecule.atoms[molecule.angles[j][2]].symbol, molecule.angles[j][2],
+    #                                 molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+    #                                 math.degrees(molecule.outofplaneangle(len(molecule.threefolds) - 1))))
+    #                 if molecule.angles[i][2] == molecule.angles[j][0] and molecule.angles[j][2] == molecule.angles[k][
+    #                     2] and molecule.angles[i][0] == molecule.angles[k][0]:
+    #                     molecule.addThreefold(molecule.angles[i][1], molecule.angles[i][2], molecule.angles[j][2],
+    #                                           molecule.angles[i][0])
+    #                     if verbosity >= 2:
+    #                         print(
+    #                             " {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({: 7.2f} deg)".format(
+    #                                 molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+    #                                 molecule.atoms[molecule.angles[i][2]].symbol, molecule.angles[i][2],
+    #                                 molecule.atoms[molecule.angles[j][2]].symbol, molecule.angles[j][2],
+    #                                 molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+    #                                 math.degrees(molecule.outofplaneangle(len(molecule.threefolds) - 1))))
+    #                 if molecule.angles[i][2] == molecule.angles[j][2] and molecule.angles[j][0] == molecule.angles[k][
+    #                     0] and molecule.angles[i][0] == molecule.angles[k][2]:
+    #                     molecule.addThreefold(molecule.angles[i][1], molecule.angles[i][2], molecule.angles[j][0],
+    #                                           molecule.angles[i][0])
+    #                     if verbosity >= 2:
+    #                         print(
+    #                             " {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({: 7.2f} deg)".format(
+    #                                 molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+    #                                 molecule.atoms[molecule.angles[i][2]].symbol, molecule.angles[i][2],
+    #                                 molecule.atoms[molecule.angles[j][0]].symbol, molecule.angles[j][0],
+    #                                 molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+    #                                 math.degrees(molecule.outofplaneangle(len(molecule.threefolds) - 1))))
+    #                 if molecule.angles[i][2] == molecule.angles[j][2] and molecule.angles[j][0] == molecule.angles[k][
+    #                     2] and molecule.angles[i][0] == molecule.angles[k][0]:
+    #                     molecule.addThreefold(molecule.angles[i][1], molecule.angles[i][2], molecule.angles[j][0],
+    #                                           molecule.angles[i][0])
+    #                     if verbosity >= 2:
+    #                         print(
+    #                             " {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) ({: 7.2f} deg)".format(
+    #                                 molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+    #                                 molecule.atoms[molecule.angles[i][2]].symbol, molecule.angles[i][2],
+    #                                 molecule.atoms[molecule.angles[j][0]].symbol, molecule.angles[j][0],
+    #                                 molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+    #                                 math.degrees(molecule.outofplaneangle(len(molecule.threefolds) - 1))))
+
+    # Now that we know bonds, angles, dihedrals and threefolds we determine the corresponding force constants
+    # Bonds first:
+    if verbosity >= 2:
+        print("\nAdding Force Field bond stretching terms to WellFARe molecule: ", molecule.name)
+    for i in range(0, len(molecule.bonds)):
+        # print(molecule.atoms[molecule.bonds[i][0]].coord[1])
+        a = np.array([molecule.atoms[molecule.bonds[i][0]].coord[0], molecule.atoms[molecule.bonds[i][0]].coord[1],
+                      molecule.atoms[molecule.bonds[i][0]].coord[2]])
+        b = np.array([molecule.atoms[molecule.bonds[i][1]].coord[0], molecule.atoms[molecule.bonds[i][1]].coord[1],
+                      molecule.atoms[molecule.bonds[i][1]].coord[2]])
+        c1 = (a - b)
+        c2 = (b - a)
+        c = np.zeros(molecule.numatoms() * 3)
+        c[3 * molecule.bonds[i][0]] = c1[0]
+        c[3 * molecule.bonds[i][0] + 1] = c1[1]
+        c[3 * molecule.bonds[i][0] + 2] = c1[2]
+        c[3 * molecule.bonds[i][1]] = c2[0]
+        c[3 * molecule.bonds[i][1] + 1] = c2[1]
+        c[3 * molecule.bonds[i][1] + 2] = c2[2]
+        c = c / np.linalg.norm(c)
+        fc = np.dot(np.dot(c, H), np.transpose(c))
+        if fc < 0.002:
+            ProgramWarning()
+            print(" This force constant is smaller than 0.002")
+        if verbosity >= 2:
+            print(" {:<3} ({:3d}) and {:<3} ({:3d}) (Force constant: {: .3f})".format(
+                molecule.atoms[molecule.bonds[i][0]].symbol, molecule.bonds[i][0],
+                molecule.atoms[molecule.bonds[i][1]].symbol, molecule.bonds[i][1], fc))
+        molecule.addFFStretch(molecule.bonds[i][0], molecule.bonds[i][1],
+                              molecule.atmatmdist(molecule.bonds[i][0], molecule.bonds[i][1]), 3,
+                              [fc, "b", molecule.atoms[molecule.bonds[i][0]].symbol,
+                               molecule.atoms[molecule.bonds[i][1]].symbol]) #, molecule.ringcheckbd(i)])
+        # Note "b" as an argument in the previouw line is a placeholder so that indices are consistent in the FFstretch class
+        # it  would need replacing with the appropriate value to make using the  Morse potential an option
+
+    # There's a bug in this code that sometimes mis-identifies where 1,3 bond stretches are (example: H2O2)
+    # # Then 1,3-stretches:
+    # if verbosity >= 2:
+    #     print("\nAdding Force Field 1,3-bond stretching terms to WellFARe molecule: ", molecule.name)
+    # for i in range(0, len(molecule.angles)):
+    #     a = np.array([molecule.atoms[molecule.angles[i][0]].coord[0], molecule.atoms[molecule.angles[i][0]].coord[1],
+    #                      molecule.atoms[molecule.angles[i][0]].coord[2]])
+    #     b = np.array([molecule.atoms[molecule.angles[i][2]].coord[0], molecule.atoms[molecule.angles[i][2]].coord[1],
+    #                      molecule.atoms[molecule.angles[i][2]].coord[2]])
+    #     c1 = (a - b)
+    #     c2 = (b - a)
+    #     c = np.zeros(molecule.numatoms() * 3)
+    #     c[3 * molecule.angles[i][0]] = c1[0]
+    #     c[3 * molecule.angles[i][0] + 1] = c1[1]
+    #     c[3 * molecule.angles[i][0] + 2] = c1[2]
+    #     c[3 * molecule.angles[i][1]] = c2[0]
+    #     c[3 * molecule.angles[i][1] + 1] = c2[1]
+    #     c[3 * molecule.angles[i][1] + 2] = c2[2]
+    #     c = c / np.linalg.norm(c)
+    #     fc = np.dot(np.dot(c, H), np.transpose(c))
+    #     if fc < 0.002:
+    #         ProgramWarning()
+    #         print(" This force constant is smaller than 0.002")
+    #     endinring = False
+    #     ringend0 = molecule.ringcheckatm(molecule.angles[i][0])
+    #     ringend1 = molecule.ringcheckatm(molecule.angles[i][1])
+    #     if ringend0 or ringend1:
+    #         endinring = True
+    #     if verbosity >= 2:
+    #         print(" {:<3} ({:3d}) and {:<3} ({:3d}) (Force constant: {: .3f})".format(
+    #             molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+    #             molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0], fc))
+    #     molecule.addFFStr13(molecule.angles[i][0], molecule.angles[i][2],
+    #                         molecule.atmatmdist(molecule.angles[i][0], molecule.angles[i][2]), 4,
+    #                         [fc, "b", molecule.atoms[molecule.angles[i][0]].symbol,
+    #                          molecule.atoms[molecule.angles[i][2]].symbol, endinring])
+
+    # Then angle bends:
+    if verbosity >= 2:
+        print("\nAdding Force Field angle bending terms to WellFARe molecule: ", molecule.name)
+    for i in range(0, len(molecule.angles)):
+        a = np.array([molecule.atoms[molecule.angles[i][0]].coord[0], molecule.atoms[molecule.angles[i][0]].coord[1],
+                      molecule.atoms[molecule.angles[i][0]].coord[2]])
+        b = np.array([molecule.atoms[molecule.angles[i][1]].coord[0], molecule.atoms[molecule.angles[i][1]].coord[1],
+                      molecule.atoms[molecule.angles[i][1]].coord[2]])
+        c = np.array([molecule.atoms[molecule.angles[i][2]].coord[0], molecule.atoms[molecule.angles[i][2]].coord[1],
+                      molecule.atoms[molecule.angles[i][2]].coord[2]])
+        aprime = a - b
+        bprime = c - b
+        p = np.cross(aprime, bprime)
+        adprime = np.cross(p, aprime)
+        bdprime = np.cross(bprime, p)
+        c = np.zeros(molecule.numatoms() * 3)
+        c[3 * molecule.angles[i][0]] = adprime[0]
+        c[3 * molecule.angles[i][0] + 1] = adprime[1]
+        c[3 * molecule.angles[i][0] + 2] = adprime[2]
+        c[3 * molecule.angles[i][2]] = bdprime[0]
+        c[3 * molecule.angles[i][2] + 1] = bdprime[1]
+        c[3 * molecule.angles[i][2] + 2] = bdprime[2]
+        # Temporary fix to avoid divide-by-zero errors follows, may be replaced by better check in future
+        if c.all() == np.zeros(molecule.numatoms() * 3).all():
+            if verbosity >= 3:
+                print("Zero vector returned while extracting angle bend force constants, skipping normalisation")
+                print("(This is nothing to worry about)")
+        else:
+            c = c / np.linalg.norm(c)
+        fc = np.dot(np.dot(c, H), np.transpose(c))
+        if fc < 0.002:
+            ProgramWarning()
+            print(" This force constant is smaller than 0.002")
+        if verbosity >= 2:
+            print(" {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) (Force constant: {: .3f})".format(
+                molecule.atoms[molecule.angles[i][0]].symbol, molecule.angles[i][0],
+                molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+                molecule.atoms[molecule.angles[i][1]].symbol, molecule.angles[i][1],
+                molecule.atoms[molecule.angles[i][2]].symbol, molecule.angles[i][2], fc))
+        molecule.addFFBend(molecule.angles[i][0], molecule.angles[i][1], molecule.angles[i][2], molecule.bondangle(i),
+                           2, [fc, molecule.atoms[molecule.angles[i][0]].symbol,
+                               molecule.atoms[molecule.angles[i][1]].symbol,
+                               molecule.atoms[molecule.angles[i][2]].symbol,
+                               molecule.atmatmdist(molecule.angles[i][0], molecule.angles[i][1]),
+                               molecule.atmatmdist(molecule.angles[i][1], molecule.angles[i][2])])
+    # currently initiating bends with extra information in arguments list to avoid calling molecule or atom class methods inside FFBend.
+    #  These quantities might ultimately be better included explicitly. 
+
+    # Then dihedral torsions:
+    if verbosity >= 2:
+        print("\nAdding Force Field torsion terms to WellFARe molecule: ", molecule.name)
+    # First set up the fragment calculations of the torsion scans of all dihedrals, then run them together
+    # and finally fit the torsion potentials to the resulting energies
+    torsionfit_points = 20  # Number of points for the fit; '20' equals steps of 18 degrees
+    torsion_fcs = []
+    torsion_angles = []
+    torsion_scans = []
+    scan_fragments = []
+    scan_queue = {}
+    # Chemically identical fragments share their scan, within this run and across runs through the on-disk cache
+    if cache:
+        scan_cache = loadFragmentCache(verbosity)
+    else:
+        scan_cache = {}
+    for i in range(0, len(molecule.dihedrals)):
+        a = np.array(
+            [molecule.atoms[molecule.dihedrals[i][0]].coord[0], molecule.atoms[molecule.dihedrals[i][0]].coord[1],
+             molecule.atoms[molecule.dihedrals[i][0]].coord[2]])
+        b = np.array(
+            [molecule.atoms[molecule.dihedrals[i][1]].coord[0], molecule.atoms[molecule.dihedrals[i][1]].coord[1],
+             molecule.atoms[molecule.dihedrals[i][1]].coord[2]])
+        c = np.array(
+            [molecule.atoms[molecule.dihedrals[i][2]].coord[0], molecule.atoms[molecule.dihedrals[i][2]].coord[1],
+             molecule.atoms[molecule.dihedrals[i][2]].coord[2]])
+        d = np.array(
+            [molecule.atoms[molecule.dihedrals[i][3]].coord[0], molecule.atoms[molecule.dihedrals[i][3]].coord[1],
+             molecule.atoms[molecule.dihedrals[i][3]].coord[2]])
+        aprime = a - b
+        dprime = d - c
+        c1prime = c - b
+        c2prime = b - c
+        p1 = np.cross(aprime, c1prime)
+        p2 = np.cross(dprime, c2prime)
+        c = np.zeros(molecule.numatoms() * 3)
+        c[3 * molecule.dihedrals[i][0]] = p1[0]
+        c[3 * molecule.dihedrals[i][0] + 1] = p1[1]
+        c[3 * molecule.dihedrals[i][0] + 2] = p1[2]
+        c[3 * molecule.dihedrals[i][2]] = p2[0]
+        c[3 * molecule.dihedrals[i][2] + 1] = p2[1]
+        c[3 * molecule.dihedrals[i][2] + 2] = p2[2]
+        if c.all() == np.zeros(molecule.numatoms() * 3).all():
+            if verbosity >= 3:
+                # Avoids fc=nan error for cases where all three atoms lie in the plane of two coordinate axes
+                print("Zero vector returned while extracting force constants, skipping normalisation")
+                print("(This is nothing to worry about)")
+        else:
+            c = c / np.linalg.norm(c)
+        # Note that the above is just an initial fix for cases where there would otherwise be a divide-by-zero error
+        # These arise where several atoms have 0 in one coordinate which propagates through cross-products and are a
+        # side-effect of orienting molecule along principal axes from the centre of mass as bonds lie in a coordinate plane
+        # Better fix may be possible/necessary - could translate molecule, for instance
+        fc = np.dot(np.dot(c, H), np.transpose(c))
+        if fc < 0.002:
+            ProgramWarning()
+            print(" This force constant is smaller than 0.002")
+
+        # NOTE: eventually if simple torsion is used, could save time by skipping this step altogether
+
+        # Setup list of angles at which the torsion potential has to be calculated for the fitting procedure
+        torsionfit_angles = np.zeros(torsionfit_points)
+        for j in range(0, torsionfit_points):
+            torsionfit_angles[j] = math.degrees(molecule.dihedralangle(i)) + (j * (360 / torsionfit_points))
+            if torsionfit_angles[j] > 180.0:
+                torsionfit_angles[j] -= 360.0
+
+
+
+        # Set up the fragments for the dihedral scan, unless an identical scan is already known
+        torsion_fcs.append(fc)
+        torsion_angles.append(torsionfit_angles)
+        rightside, leftside = molecule.assembleDihedralScanFragments(molecule.dihedrals[i])
+        scankey, mirrored = fragmentSignature(rightside, leftside, torsionfit_points, scanbackend)
+        torsion_scans.append((scankey, mirrored))
+        if scankey in scan_cache or scankey in scan_queue:
+            if verbosity >= 2:
+                print(" Dihedral {} reuses the scan of an identical fragment".format(i))
+            continue
+        scan_queue[scankey] = mirrored
+        for k in range(0, torsionfit_points):
+            # Create two "molecules", one with all atoms to consider on the right side of the dihedral, one for the left.
+
+            # Creating "right side" first
+            rightside = Molecule("Right side of the dihedral", 0)
+
+            # Creating the left side
+            leftside = Molecule("Left side of the dihedral", 0)
+
+            # Assemble the two sides from the molecule
+            rightside, leftside = molecule.assembleDihedralScanFragments(molecule.dihedrals[i])
+
+            # Rotating the left side (around the middle bond in the dihedral)
+            # leftside.rotateMoleculeArbAxis(
+            #     [molecule.atoms[molecule.dihedrals[i][1]].coord[0], molecule.atoms[molecule.dihedrals[i][1]].coord[1],
+            #      molecule.atoms[molecule.dihedrals[i][1]].coord[2]],
+            #     [molecule.atoms[molecule.dihedrals[i][2]].coord[0], molecule.atoms[molecule.dihedrals[i][2]].coord[1],
+            #      molecule.atoms[molecule.dihedrals[i][2]].coord[2]], (360 / torsionfit_points))
+            leftside.rotateMoleculeArbAxis(
+                [rightside.atoms[0].coord[0], rightside.atoms[0].coord[1], rightside.atoms[0].coord[2]],
+                [leftside.atoms[0].coord[0], leftside.atoms[0].coord[1], leftside.atoms[0].coord[2]],
+                (360 / torsionfit_points)*k)
+
+            # Creating the "supermolecule" by copying all atoms from right and left into one
+            bothsides = Molecule(
+                "Dihedral at {: .1f} degrees rotation ({: .1f} deg)".format(k * (360 / torsionfit_points),
+                                                                            torsionfit_angles[k]), 0)
+            for j in range(0, rightside.numatoms()):
+                bothsides.addAtom(rightside.atoms[j])
+            for j in range(0, leftside.numatoms()):
+                bothsides.addAtom(leftside.atoms[j])
+            # Debug only: Print the geometries that are used for the fitting
+            if bothsides.mult == 2:
+                bothsides.charge = 1
+                bothsides.mult = 1
+            #print(bothsides.xyzString())
+
+            # The extended Hückel energy of the "supermolecule" is calculated by the scan backend below
+            scan_fragments.append(bothsides)
+
+    # Determine the energies along all dihedral scans that are not known yet
+    if verbosity >= 1:
+        print("\n{} of {} dihedral scans are new".format(len(scan_queue), len(molecule.dihedrals)))
+    scan_energies = runTorsionScans(scan_fragments, nprocs, verbosity, scanbackend)
+    # Scans are kept for the canonical mirror image of their fragments
+    for n, scankey in enumerate(scan_queue):
+        energies = scan_energies[n * torsionfit_points:(n + 1) * torsionfit_points]
+        if scan_queue[scankey]:
+            energies = mirrorScan(energies)
+        scan_cache[scankey] = {"energies": energies}
+
+    for i in range(0, len(molecule.dihedrals)):
+        fc = torsion_fcs[i]
+        torsionfit_angles = torsion_angles[i]
+        scankey, mirrored = torsion_scans[i]
+        scan = scan_cache[scankey]
+        if mirrored:
+            HMO_energies = np.array(mirrorScan(scan["energies"]))
+        else:
+            HMO_energies = np.array(scan["energies"])
+
+        # Debug only: Print the energies that will be used for fitting
+        print("HMO energies: ", HMO_energies)
+
+        # Check if any of the energy values is infinite, remove that data point from fit set if so
+        modifycheck = 0
+        for j in range(len(HMO_energies)):
+            if j == len(HMO_energies):
+              break
+            if np.isinf(HMO_energies[j]):
+              try:
+                HMO_energies= np.ndarray.tolist(HMO_energies)
+              except:
+                HMO_energies = HMO_energies
+              try:
+                torsionfit_angles = np.ndarray.tolist(torsionfit_angles)
+              except:
+                torsionfit_angles = torsionfit_angles
+              del(HMO_energies[j])
+              del(torsionfit_angles[j])
+              modifycheck += 1
+            else:
+              pass
+        if modifycheck > 0:
+            HMO_energies = np.asarray(HMO_energies)
+            torsionfit_angles = np.asarray(torsionfit_angles)
+            print("Revised energies: ", HMO_energies)
+        else:
+            pass
+
+        # Fitting routine to determine values of k_tors_n begins here
+        # Calculate the inputs needed for the torsion potential
+        #theta0 = molecule.dihedralangle(i)
+        sym1 = molecule.atoms[molecule.dihedrals[i][0]].symbol
+        sym2 = molecule.atoms[molecule.dihedrals[i][1]].symbol
+        sym3 = molecule.atoms[molecule.dihedrals[i][2]].symbol
+        sym4 = molecule.atoms[molecule.dihedrals[i][3]].symbol
+        r_12 = molecule.atmatmdist(molecule.dihedrals[i][0], molecule.dihedrals[i][1])
+        r_23 = molecule.atmatmdist(molecule.dihedrals[i][1], molecule.dihedrals[i][2])
+        r_34 = molecule.atmatmdist(molecule.dihedrals[i][2], molecule.dihedrals[i][3])
+        f_dmp_12 = DampingFunction(sym1, sym2, r_12)
+        f_dmp_23 = DampingFunction(sym2, sym3, r_23)
+        f_dmp_34 = DampingFunction(sym3, sym4, r_34)
+        f_dmp = f_dmp_12 * f_dmp_23 * f_dmp_34 
+        # Determine the equilibrium dihedral angle from EHT calculations to use in fitting
+        minHMOenergy = min(HMO_energies)
+        eqHMOindex = np.where(HMO_energies == minHMOenergy)
+        print(minHMOenergy)
+        print(eqHMOindex)
+        print("---------")
+        eqHMO = torsionfit_angles[eqHMOindex[0][0]] # NOTE: using the first, rather than second or later, angle in the list of fit points at which HMO energy is minimal as the equilibrium angle may affect results
+        print("eqHMOindex:")
+        print(eqHMOindex)
+        print("eqHMO:")
+        print(eqHMO)
+
+        # Define objective functions for the difference between HMOEnergy and energy from the torsion potential
+         
+        def TorsEnergyDiff(k_tors, energies, angles, theta0, f_dmp):
+            energydiffs = np.zeros(len(energies))
+            for j in range(len(energies)):
+                energydiff = abs(potTorsion(math.radians(angles[j]), theta0, f_dmp, k_tors) - energies[j])
+                energydiffs[j] = energydiff
+            return energydiffs 
+        
+        def TorsLeastSq(k_tors, energies, angles, theta0, f_dmp):
+            sum_sq_diffs = 0.0
+            for j in range(len(energies)):
+                ediff = potTorsion(math.radians(angles[j]), theta0, f_dmp, k_tors) - energies[j]
+                absdiff = abs(ediff)
+                sqdiff = absdiff ** 2
+                sum_sq_diffs += sqdiff
+            return sum_sq_diffs
+
+        def CosSeriesLeastSq(k_tors, energies, angles, theta0):
+            sq_diffs_sum = 0.0
+            for j in range(len(energies)):
+                difference = potCosineSum(math.radians(angles[j]), theta0, k_tors) - energies[j]
+                absolutediff = abs(difference)
+                squarediff = absolutediff ** 2
+                sq_diffs_sum += squarediff
+            return sq_diffs_sum
+
+        # Offset HMO energies to center around zero for fitting
+        offset = (max(HMO_energies) + min(HMO_energies))/2.0
+        torsionfit_energies = np.zeros(len(HMO_energies))
+        for j in range(len(HMO_energies)):
+            torsionfit_energies[j] = HMO_energies[j] - offset
+        # Print the modified energies to be used in fitting
+        print("torsionfit_energies:")
+        print(torsionfit_energies)
+        
+        # Set up initial k_tors values for the optimisation
+        k_tors_init = np.zeros(4) # NOTE: Setting values to a non-zero guess value may be useful to avoid problems currently arising in geometry optimisation with bonds dissociating
+        for j in range(len(k_tors_init)):
+            k_tors_init[j] = 1 # 1 is just a guess to try and ensure optimisation reaches a reasonable solution
+        print("Starting values of k_tors for fitting:")
+        print(k_tors_init)
+        # Use the SciPy leastsq optimiser to carry out a least squares fit for k_tors
+        #k_tors = scipy.optimize.leastsq(TorsEnergyDiff, k_tors_init, (torsionfit_energies, torsionfit_angles, theta0, f_dmp))
+        # Use a built in optimiser and the TorsLeastSq objective function to obtain a least squares fit for k_tors values
+        #k_tors_opt = scipy.optimize.minimize(TorsLeastSq, k_tors_init, (torsionfit_energies, torsionfit_angles, math.radians(eqHMO), f_dmp)) #, method='BFGS', options={'disp': True, 'gtol':1e-05}, tol=None)
+        # The fit only depends on the angles relative to eqHMO, so identical and mirror image scans share their k_tors
+        if "k_tors" in scan:
+            k_tors = np.array(scan["k_tors"])
+            print("Reusing k_tors fitted to an identical scan")
+        else:
+            k_tors_opt = scipy.optimize.minimize(CosSeriesLeastSq, k_tors_init, (torsionfit_energies, torsionfit_angles, math.radians(eqHMO))) #, method='BFGS', options={'disp': True, 'gtol':1e-05}, tol=None)
+            k_tors = k_tors_opt.x
+            scan["k_tors"] = k_tors.tolist()
+            #print("Optimisation output:")
+            print(k_tors_opt)
+
+        #Check quality of fit, print a warning if difference in any two energies exceeds a chosen threshold
+        for j in range(len(torsionfit_angles)):
+            #torsfittedenergy = potTorsion(math.radians(torsionfit_angles[j]), math.radians(eqHMO), f_dmp, k_tors)
+            torsfittedenergy = potCosineSum(math.radians(torsionfit_angles[j]), math.radians(eqHMO), k_tors)
+            if abs(torsfittedenergy - torsionfit_energies[j]) > 0.4: # This value could be tailored depending on margin of error permissible
+                print("Warning: energy from torsion fit not within 0.4 of EHT energy")
+                 #ProgramAbort() #NOTE: Must delete this to test fit further once suitable candidate is found
+                break
+
+        print("Optimised values of k_tors:")
+        print(k_tors)
+        """
+        k_tors_1 = k_tors[0]
+        k_tors_2 = k_tors[1]
+        k_tors_3 = k_tors[2]
+        k_tors_4 = k_tors[3] 
+        # Debugging only, access the individual constants and print        
+        print("k_tors_1 = " + str(k_tors_1))
+        print("k_tors_2 = " + str(k_tors_2))
+        print("k_tors_3 = " + str(k_tors_3))
+        print("k_tors_4 = " + str(k_tors_4))
+        # Debug for h2o2 only
+        print("Printing atom list")
+        print(str(molecule.atoms))
+        print("Printing dihedral list")
+        print(molecule.dihedrals)
+        print("Printing dihedrals[0]")
+        print(molecule.dihedrals[0])
+        print("Printing dihedrals[i]")
+        print(molecule.dihedrals[i])
+        print("Printing dihedrals[i][0]")
+        print(molecule.dihedrals[i][0])
+        print("Printing the atom at index dihedrals[i][0]")
+        print(molecule.atoms[molecule.dihedrals[i][0]])
+        """
+
+        # As a temporary measure, calculate and print both HMO and PotTors energies to be plotted as a check on the fit
+        torsionfitted_energies = np.zeros(len(torsionfit_angles))
+        torsfit_ediffs = np.zeros(len(torsionfit_angles))
+        for j in range(len(torsionfit_angles)):
+            #torsionfitted_energies[j] = potTorsion(math.radians(torsionfit_angles[j]), math.radians(eqHMO), f_dmp, k_tors)
+            torsionfitted_energies[j] = potCosineSum(math.radians(torsionfit_angles[j]), math.radians(eqHMO), k_tors)
+            torsfit_ediffs[j] = torsionfitted_energies[j] - torsionfit_energies[j]
+        print("torsionfit_angles: " + str(torsionfit_angles))
+        print("torsionfit_energies: " + str(torsionfit_energies))
+        print("torsionfitted_energies: " + str(torsionfitted_energies))
+        print("\nTorsion fit comparison for dihedral " + str(i))
+        print("{:^9}  {:^13}  {:^13} {:^13} ".format("Angle", "EH energy", "FF energy", "FF - EH energy"))
+        print("{:^9}  {:^13}  {:^13} {:^13} ".format(" ", "(offset)", " ", " "))
+        for j in range(len(torsionfit_angles)):
+            print("{:>9.4f}  {:>13.9f}  {:>13.9f}  {:>13.9f}".format(torsionfit_angles[j], torsionfit_energies[j], torsionfitted_energies[j], torsfit_ediffs[j]))
+        mean_ediff = 0
+        for j in range(len(torsfit_ediffs)):
+            mean_ediff += torsfit_ediffs[j]
+        mean_ediff = mean_ediff/len(torsfit_ediffs)
+        print("Mean energy difference: " + str(mean_ediff))
+        ediff_range = max(torsfit_ediffs) - min(torsfit_ediffs)
+        print("Range in energy differences: " + str(ediff_range))
+        # Stop after certain dihedral for examination
+        #if i == 2:
+        #    exit(0)
+
+        #print("Using k_tors with torsion type 3")
+
+        # Determine whether the central bond of the dihedral is in part of a ring
+        bdinring = False
+        for j in range(len(molecule.bonds)):
+            if molecule.bonds[j][0] == molecule.dihedrals[i][1] and molecule.bonds[j][1] == molecule.dihedrals[i][2]:
+                bdinring = molecule.ringcheckbd(j)
+            elif molecule.bonds[j][0] == molecule.dihedrals[i][2] and molecule.bonds[j][1] == molecule.dihedrals[i][1]:
+                bdinring = molecule.ringcheckbd(j)
+        
+        # Once the torsion potential has been determined, add the torsion term to the Force Field
+        if verbosity >= 2:
+            print(" {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) (Force constant: {: .3f})".format(
+                molecule.atoms[molecule.dihedrals[i][0]].symbol, molecule.dihedrals[i][0],
+                molecule.atoms[molecule.dihedrals[i][1]].symbol, molecule.dihedrals[i][1],
+                molecule.atoms[molecule.dihedrals[i][2]].symbol, molecule.dihedrals[i][2],
+                molecule.atoms[molecule.dihedrals[i][3]].symbol, molecule.dihedrals[i][3], fc))
+        molecule.addFFTorsion(molecule.dihedrals[i][0], molecule.dihedrals[i][1], molecule.dihedrals[i][2],
+                              molecule.dihedrals[i][3], molecule.dihedralangle(i), 4,
+                              [fc, molecule.atoms[molecule.dihedrals[i][0]].symbol,
+                               molecule.atoms[molecule.dihedrals[i][1]].symbol,
+                               molecule.atoms[molecule.dihedrals[i][2]].symbol,
+                               molecule.atoms[molecule.dihedrals[i][3]].symbol,
+                               molecule.atmatmdist(molecule.dihedrals[i][0], molecule.dihedrals[i][1]),
+                               molecule.atmatmdist(molecule.dihedrals[i][1], molecule.dihedrals[i][2]),
+                               molecule.atmatmdist(molecule.dihedrals[i][2], molecule.dihedrals[i][3]), k_tors, math.radians(eqHMO), bdinring])
+        # As for bends, arg list now includes atom symbols and bond lengths, which could be separated out later
+
+    if cache:
+        saveFragmentCache(scan_cache, verbosity)
+
+    # Here are the more complicated inversions, H-bonds and X-bonds - deal with this later!
+    # # Threefold inversions last
+    # if verbosity >= 2:
+    #     print("\nAdding Force Field inversion terms to WellFARe molecule: ", molecule.name)
+    # # (Extracting force constants to be implemented later)
+    # for i in range(0, len(molecule.threefolds)):
+    #     a = np.array(
+    #         [molecule.atoms[molecule.threefolds[i][0]].coord[0], molecule.atoms[molecule.threefolds[i][0]].coord[1],
+    #          molecule.atoms[molecule.threefolds[i][0]].coord[2]])
+    #     b = np.array(
+    #         [molecule.atoms[molecule.threefolds[i][1]].coord[0], molecule.atoms[molecule.threefolds[i][1]].coord[1],
+    #          molecule.atoms[molecule.threefolds[i][1]].coord[2]])
+    #     c = np.array(
+    #         [molecule.atoms[molecule.threefolds[i][2]].coord[0], molecule.atoms[molecule.threefolds[i][2]].coord[1],
+    #          molecule.atoms[molecule.threefolds[i][2]].coord[2]])
+    #     d = np.array(
+    #         [molecule.atoms[molecule.threefolds[i][3]].coord[0], molecule.atoms[molecule.threefolds[i][3]].coord[1],
+    #          molecule.atoms[molecule.threefolds[i][3]].coord[2]])
+    #     ba = a - b
+    #     cb = b - c
+    #     db = b - d
+    #     dc = c - d
+    #     bprime = np.cross(-cb, -db)
+    #     cprime = np.cross(-dc, cb)
+    #     dprime = np.cross(db, dc)
+    #     aprime = np.cross(bprime, np.cross(-ba, bprime)) / np.dot(bprime, bprime)
+    #     c = np.zeros(molecule.numatoms() * 3)
+    #     c[3 * molecule.threefolds[i][0]] = aprime[0]
+    #     c[3 * molecule.threefolds[i][0] + 1] = aprime[1]
+    #     c[3 * molecule.threefolds[i][0] + 2] = aprime[2]
+    #     c[3 * molecule.threefolds[i][1]] = bprime[0]
+    #     c[3 * molecule.threefolds[i][1] + 1] = bprime[1]
+    #     c[3 * molecule.threefolds[i][1] + 2] = bprime[2]
+    #     c[3 * molecule.threefolds[i][2]] = cprime[0]
+    #     c[3 * molecule.threefolds[i][2] + 1] = cprime[1]
+    #     c[3 * molecule.threefolds[i][2] + 2] = cprime[2]
+    #     c[3 * molecule.threefolds[i][3]] = dprime[0]
+    #     c[3 * molecule.threefolds[i][3] + 1] = dprime[1]
+    #     c[3 * molecule.threefolds[i][3] + 2] = dprime[2]
+    #     # Temporary fix to avoid divide-by-zero errors follows, may be replaced by better check in future
+    #     if c.all() == np.zeros(molecule.numatoms() * 3).all():
+    #         print("Zero vector returned while extracting inversion force constants, skipping normalisation")
+    #     else:
+    #         c = c / np.linalg.norm(c)
+    #     fc = np.dot(np.dot(c, H), np.transpose(c))
+    #     if fc < 0.002:
+    #         ProgramWarning()
+    #         print(" This force constant is smaller than 0.002")
+    #     if verbosity >= 2:
+    #         print(" {:<3} ({:3d}), {:<3} ({:3d}), {:<3} ({:3d}) and {:<3} ({:3d}) (Force constant: {: .3f})".format(
+    #             molecule.atoms[molecule.threefolds[i][0]].symbol, molecule.threefolds[i][0],
+    #             molecule.atoms[molecule.threefolds[i][1]].symbol, molecule.threefolds[i][1],
+    #             molecule.atoms[molecule.threefolds[i][2]].symbol, molecule.threefolds[i][2],
+    #             molecule.atoms[molecule.threefolds[i][3]].symbol, molecule.threefolds[i][3], fc))
+    #     molecule.addFFInversion(molecule.threefolds[i][0], molecule.threefolds[i][1], molecule.threefolds[i][2],
+    #                             molecule.threefolds[i][3], molecule.outofplaneangle(i), 2,
+    #                             [fc, molecule.atoms[molecule.threefolds[i][0]].symbol,
+    #                              molecule.atoms[molecule.threefolds[i][1]].symbol,
+    #                              molecule.atoms[molecule.threefolds[i][2]].symbol,
+    #                              molecule.atoms[molecule.threefolds[i][3]].symbol,
+    #                              molecule.atmatmdist(molecule.threefolds[i][0], molecule.threefolds[i][1]),
+    #                              molecule.atmatmdist(molecule.threefolds[i][0], molecule.threefolds[i][2]),
+    #                              molecule.atmatmdist(molecule.threefolds[i][0], molecule.threefolds[i][3])])
+    #
+    # # Moving to noncovalent interactions
+    # # Locate hydrogen atoms and add them to the list hatoms
+    # if verbosity >= 2:
+    #     print("\nListing hydrogen atoms in WellFARe molecule: ", molecule.name)
+    # for i in range(0, len(molecule.atoms)):
+    #     if molecule.atoms[i].symbol == "H":
+    #         molecule.addHAtom(i)
+    #         if verbosity >= 2:
+    #             print(molecule.atoms[i].symbol, molecule.atoms[i].coord)
+    #
+    # # Locate high electronegatvity atoms and add them to the list highENatoms
+    # if verbosity >= 2:
+    #     print("Listing highly electronegative atoms in WellFARe molecule: ", molecule.name)
+    # for i in range(0, len(molecule.atoms)):
+    #     sym = molecule.atoms[i].symbol
+    #     if sym == "N" or sym == "O" or sym == "F" or sym == "S" or sym == "Cl":
+    #         molecule.addhighENatom(i)
+    #         if verbosity >= 2:
+    #             print(sym, molecule.atoms[i].coord)
+    #
+    # # Locate halogen atoms and add them to the list halogens
+    # if verbosity >= 2:
+    #     print("Listing non-F halogen atoms in WellFARe molecule: ", molecule.name)
+    # for i in range(0, len(molecule.atoms)):
+    #     sym = molecule.atoms[i].symbol
+    #     if sym == "Cl" or sym == "Br" or sym == "I" or sym == "At":
+    #         molecule.addXatom(i)
+    #         if verbosity >= 2:
+    #             print(sym, molecule.atoms[i].coord)
+    #
+    # # Locate hydrogen bonding triples AHB and create instances of FFHBond
+    # if verbosity >= 2:
+    #     print("\nAdding hydrogen bonds to WellFARe molecule: ", molecule.name)
+    # for i in range(0, len(molecule.bonds)):
+    #     sym1 = molecule.atoms[molecule.bonds[i][0]].symbol
+    #     sym2 = molecule.atoms[molecule.bonds[i][1]].symbol
+    #     if sym1 == "H":
+    #         atH = molecule.bonds[i][0]
+    #         if sym2 == "N" or sym2 == "O" or sym2 == "F" or sym2 == "S" or sym2 == "Cl":
+    #             atA = molecule.bonds[i][1]
+    #             for j in range(0, len(molecule.atoms)):
+    #                 sym3 = molecule.atoms[j].symbol
+    #                 if sym3 == "N" or sym3 == "O" or sym3 == "F" or sym3 == "S" or sym3 == "Cl":
+    #                     r = molecule.atmatmdist(atH, j)
+    #                     r_check = SymbolToVdWRadius[molecule.atoms[atH].symbol] + SymbolToVdWRadius[
+    #                         molecule.atoms[j].symbol]  # Using sum of van der Waals radii
+    #                     if r <= r_check and j != atA:
+    #                         theta = molecule.anybondangle(atA, atH, j)
+    #                         molecule.addFFHBond(atA, atH, j, theta, 1,
+    #                                             [sym2, molecule.atoms[atA].charge, sym1, molecule.atoms[atH].charge,
+    #                                              sym3, molecule.atoms[j].charge, molecule.atmatmdist(atA, atH),
+    #                                              molecule.atmatmdist(j, atH), molecule.atmatmdist(atA, j)])
+    #                         if verbosity >= 2:
+    #                             print(
+    #                                 " ({:<3}, {:<3}, {:<3} {:3.2f} deg), {:<3}, [{:<3}, {:3.2f}, {:<3}, {:3.2f}, {:<3}, {:3.2f}, {:3.2f}, {:3.2f}, {:3.2f}]".format(
+    #                                     atA, atH, j, theta, 1, sym2, molecule.atoms[atA].charge, sym1,
+    #                                     molecule.atoms[atH].charge, sym3, molecule.atoms[j].charge,
+    #                                     molecule.atmatmdist(atA, atH), molecule.atmatmdist(j, atH),
+    #                                     molecule.atmatmdist(atA, j)))
+    #     elif sym2 == "H":
+    #         atH = molecule.bonds[i][1]
+    #         if sym1 == "N" or sym1 == "O" or sym1 == "F" or sym1 == "S" or sym1 == "Cl":
+    #             atA = molecule.bonds[i][0]
+    #             for j in range(0, len(molecule.atoms)):
+    #                 sym3 = molecule.atoms[j].symbol
+    #                 if sym3 == "N" or sym3 == "O" or sym3 == "F" or sym3 == "S" or sym3 == "Cl":
+    #                     r = molecule.atmatmdist(atH, j)
+    #                     r_check = SymbolToVdWRadius[sym1] + SymbolToVdWRadius[
+    #                         sym2]  # Sum of van der Waals radii again used as check
+    #                     if r <= r_check and j != atA:
+    #                         theta = molecule.anybondangle(atA, atH, j)
+    #                         molecule.addFFHBond(atA, atH, j, theta, 1,
+    #                                             [sym1, molecule.atoms[atA].charge, sym2, molecule.atoms[atH].charge,
+    #                                              sym3, molecule.atoms[j].charge, molecule.atmatmdist(atA, atH),
+    #                                              molecule.atmatmdist(j, atH), molecule.atmatmdist(atA, j)])
+    #                         if verbosity >= 2:
+    #                             print(
+    #                                 " ({:<3}, {:<3}, {:<3} {:3.2f} deg), {:<3}, [{:<3}, {:3.2f}, {:<3}, {:3.2f}, {:<3}, {:3.2f}, {:3.2f}, {:3.2f}, {:3.2f}]".format(
+    #                                     atA, atH, j, theta, 1, sym1, molecule.atoms[atA].charge, sym2,
+    #                                     molecule.atoms[atH].charge, sym3, molecule.atoms[j].charge,
+    #                                     molecule.atmatmdist(atA, atH), molecule.atmatmdist(j, atH),
+    #                                     molecule.atmatmdist(atA, j)))
+
+
+# End of routine
@@ -0,0 +1,194 @@
+import argparse
+
+from .messages import ProgramFooter, ProgramHeader
+from .ff import Molecule
+from .torsions import ScanBackends
+from .build import extractCoordinates
+from .fitting import fitForceConstants
+from .optimise import ConvergenceCriteria, OptimisationMethods
+
+
+################################################################################
+#                                                                              #
+# This is the part of the program where the command line arguments are defined #
+#                                                                              #
+################################################################################
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="WellFAReFF: Wellington Fast Assessment of Reactions - Force Field",
+        epilog="recognised filetypes: g09, orca")
+    parser.add_argument("-r", "--reactant", metavar='file', help="input file with qc data of the reactant",
+                        default="g09-dielsalder-r.log")
+    parser.add_argument("-p", "--product", metavar='file', help="input file with qc data of the product",
+                        default="g09-dielsalder-p.log")
+    parser.add_argument("-v", "--verbosity", help="increase output verbosity", type=int, choices=[0, 1, 2, 3], default=2)
+    parser.add_argument("-b", "--bondcutoff", help="Cutoff value for bond identification through Mayer bond order",
+                        type=float, default=0.45)
+    parser.add_argument("-f", "--fitmethod", help="Method for fitting the force constants to the QM Hessian",
+                        choices=["lstsq", "nnls", "ridge", "bfgs"], default="lstsq")
+    parser.add_argument("--fitobjective", help="Deviation from the QM Hessian minimised in the fit",
+                        choices=["cartesian", "normalmodes"], default="cartesian")
+    parser.add_argument("--fitpower", help="Weighting of the normal modes by their eigenvalues in the fit "
+                                           "(0: equal weights, 1: relative deviations)", type=float, default=0.0)
+    parser.add_argument("--nocache", help="do not use the on-disk caches of parsed qc output files and torsion scans",
+                        action="store_true")
+    parser.add_argument("-n", "--nprocs", help="number of torsion scan calculations to run at the same time",
+                        type=int, default=None)
+    parser.add_argument("--scan-backend", help="program for the extended Hueckel energies of the torsion scans",
+                        choices=sorted(ScanBackends), default="eht")
+    parser.add_argument("-c", "--cutoff", help="cutoff for the non-bonded interactions in Angstrom (default: all pairs)",
+                        type=float, default=None)
+    parser.add_argument("--skin", help="skin of the non-bonded neighbour list in Angstrom", type=float, default=2.0)
+    parser.add_argument("--cell", help="edge lengths of an orthorhombic periodic cell in Angstrom", metavar='L',
+                        type=float, nargs=3, default=None)
+    parser.add_argument("--electrostatics", help="evaluation of the electrostatics (ewald and pme need --cell and "
+                                                 "--cutoff)", choices=["direct", "ewald", "pme"], default="direct")
+    parser.add_argument("--optimiser", help="algorithm of the geometry optimisation", choices=OptimisationMethods,
+                        default="rfo")
+    parser.add_argument("--convergence", help="convergence criteria of the geometry optimisation",
+                        choices=sorted(ConvergenceCriteria), default="normal")
+    parser.add_argument("--profile", help="report the time spent in each force field contribution",
+                        action="store_true")
+
+    args = parser.parse_args()
+
+    ###############################################################################
+    #                                                                             #
+    # The main part of the program starts here                                    #
+    #                                                                             #
+    ###############################################################################
+
+    # Print GPL v3 statement and program header
+    ProgramHeader()
+
+    # print("Number of Atoms: ", reactant_mol.numatoms(), "Multiplicity: ", reactant_mol.mult)
+
+    # print(molecule)
+    # print("Molecular mass = ", reactant_mol.mass())
+    # reactant_mol.orient()
+
+    # print(reactant_mol.gaussString())
+
+    # print("Bonds:")
+    # for i in reactant_mol.bonds:
+    #   print(i)
+    #
+    # print("")
+    # print("Angles:")
+    # for i in reactant_mol.angles:
+    #   print(i)
+    #
+    # print("")
+    # print("Angles in degrees:")
+    # for i in range(len(reactant_mol.angles)):
+    #   print(math.degrees(reactant_mol.bondangle(i)))
+    #
+    # print("")
+    # print("Dihedrals:")
+    # for i in reactant_mol.dihedrals:
+    #   print(i)
+    #
+    # print("")
+    # print("Dihedral angles in degrees:")
+    # for i in range(len(reactant_mol.dihedrals)):
+    #   print(math.degrees(reactant_mol.dihedralangle(i)))
+
+    # print("")
+    # print("Bond Stretches:")
+    # for i in reactant_mol.stretch:
+    #   print(i)
+    #
+    # print("")
+    # print("1-3 Bond Stretches:")
+    # for i in reactant_mol.str13:
+    #   print(i)
+    #
+    # print("")
+    # print("Angle Bends:")
+    # for i in reactant_mol.bend:
+    #   print(i)
+    #
+    # print("")
+    # print("Dihedral Torsions:")
+    # for i in reactant_mol.tors:
+    #   print(i)
+
+    reactant_mol = Molecule("Reactant", 0)
+    if args.profile:
+        reactant_mol.enableProfiling()
+    extractCoordinates(args.reactant, reactant_mol, verbosity=args.verbosity, bondcutoff=args.bondcutoff,
+                       cache=not args.nocache, nprocs=args.nprocs, scanbackend=args.scan_backend)
+    if args.cutoff is not None:
+        reactant_mol.setNonbondedCutoff(args.cutoff, args.skin)
+    if args.cell is not None:
+        reactant_mol.setCell(args.cell)
+    reactant_mol.setElectrostatics(args.electrostatics)
+    fitForceConstants(reactant_mol, verbosity=args.verbosity, method=args.fitmethod, objective=args.fitobjective,
+                      power=args.fitpower)
+    reactant_mol.compileTermTable()
+
+    #for i in range(len(reactant_mol.bonds)):
+    #    reactant_mol.ringcheckbd(i)
+
+    #for i in range(len(reactant_mol.atoms)):
+    #    reactant_mol.ringcheckatm(i)
+
+    print("\nForce Field Energy of molecule:", reactant_mol.name)
+    print("\nHere we go:", reactant_mol.FFEnergy(reactant_mol.cartesianCoordinates(), verbosity=args.verbosity))
+
+    print("\nOptimising geometry of molecule:", reactant_mol.name)
+    reactant_mol.optimise(method=args.optimiser, criteria=args.convergence, verbosity=args.verbosity)
+    print("\nOptimized Geometry in Gaussian format for molecule:", reactant_mol.name)
+    print(reactant_mol.gaussString()) 
+
+    if args.profile:
+        print("\nTime spent in the force field contributions for molecule:", reactant_mol.name)
+        print(reactant_mol.profiler)
+
+    # product_mol = Molecule("Product",0)
+    # extractCoordinates(,rgs.product product_mol, verbosity = args.verbosity, bondcutoff = args.bondcutoff)
+    # fitForceConstants(product_mol, verbosity = args.verbosity)
+
+    # print("\nCartesian Coordinates of Product (as one list):")
+    # print(product_mol.cartesianCoordinates())
+
+    # print("\nForce Field Energy of Product:")
+    # print(product_mol.FFEnergy(product_mol.cartesianCoordinates(), verbosity = 1))
+
+    # print("\nOptimising geometry of molecule:", reactant_mol.name)
+    # initialcoords2optimiseP = product_mol.cartesianCoordinates()
+    # xopt = scipy.optimize.fmin_bfgs(product_mol.FFEnergy, initialcoords2optimiseP, gtol=0.00005)
+    # print("\Optimized Geometry coordinates (Product):")
+    # print(xopt)
+
+    # product_mol.setGeometry(xopt)
+    # print("\nOptimized Geometry in Gaussian format for molecule:", product_mol.name)
+    # print(product_mol.gaussString())
+
+
+    # print("\nDistort Geometry by interpolation and print energy again:")
+    # coordinates2optimiseR = reactant_mol.cartesianCoordinates()
+    # coordinates2optimiseP = product_mol.cartesianCoordinates()
+
+    # coordinates2optimiseR = (np.array(coordinates2optimiseR)+(np.array(coordinates2optimiseP))/2.0)
+
+    # print(reactant_mol.FFEnergy(coordinates2optimiseR, verbosity = 1))
+
+    # print("\nGeometry Optimizer:")
+    # xopt = scipy.optimize.fmin_bfgs(reactant_mol.FFEnergy, coordinates2optimiseR, gtol=0.00005)
+    # print("\nOptimized Geometry coordinates:")
+    # print(xopt)
+
+    # print("\nBond Dissociation:")
+    # dissociateBond(reactant_mol, 0, 1, 10**-3, 14)
+
+    # TSbySEAM(reactant_mol, product_mol, verbosity = 1)
+
+    # Test the screening procedure used to determine appropriate values of elstat_AB
+    # print("\nTesting electrostatic topological screening parameter procedure\n")
+    # for i in range(len(reactant_mol.atoms)):
+    #  for j in range(len(reactant_mol.atoms)):
+    #    reactant_mol.screen_ES(i, j)
+
+    ProgramFooter()
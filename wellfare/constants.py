@@ -0,0 +1,362 @@
+#############################################################################################################
+# This section is for the definition of *all* constants and conversion factors
+#############################################################################################################
+
+# Conversion of mass in atomic mass units (AMU) to
+# atomic units (electron masses)
+def AMU2au(amu):
+    return amu * 1822.88839
+
+
+# Same in reverse
+def au2AMU(au):
+    return au / 1822.88839
+
+
+# Conversion of length in Angstroms to
+# atomic units (Bohrs)
+def Ang2Bohr(ang):
+    return ang * 1.889725989
+
+
+# Same in reverse
+def Bohr2Ang(bohr):
+    return bohr / 1.889725989
+
+
+# Conversion of energy in Joules to atomic units (Hartrees)
+def J2au(J):
+    return J / (4.35974394 * (10 ** -18))
+
+
+# Same in reverse
+def au2J(au):
+    return au * (4.35974393 * (10 ** -18))
+
+
+# Conversion of energy in kcal/mol to atomic units (Hartrees)
+def kcal_mol2au(kcm):
+    return kcm / 627.503
+
+
+# Same in reverse
+def au2kcal_mol(au):
+    return au * 627.503
+
+# Dictionary to convert atomic symbols to atomic numbers
+SymbolToNumber = {
+    "H": 1, "He": 2, "Li": 3, "Be": 4, "B": 5, "C": 6, "N": 7, "O": 8, "F": 9,
+    "Ne": 10, "Na": 11, "Mg": 12, "Al": 13, "Si": 14, "P": 15, "S": 16, "Cl": 17,
+    "Ar": 18, "K": 19, "Ca": 20, "Sc": 21, "Ti": 22, "V": 23, "Cr": 24,
+    "Mn": 25, "Fe": 26, "Co": 27, "Ni": 28, "Cu": 29, "Zn": 30, "Ga": 31,
+    "Ge": 32, "As": 33, "Se": 34, "Br": 35, "Kr": 36, "Rb": 37, "Sr": 38,
+    "Y": 39, "Zr": 40, "Nb": 41, "Mo": 42, "Tc": 43, "Ru": 44, "Rh": 45,
+    "Pd": 46, "Ag": 47, "Cd": 48, "In": 49, "Sn": 50, "Sb": 51, "Te": 52,
+    "I": 53, "Xe": 54, "Cs": 55, "Ba": 56, "La": 57, "Ce": 58, "Pr": 59,
+    "Nd": 60, "Pm": 61, "Sm": 62, "Eu": 63, "Gd": 64, "Tb": 65, "Dy": 66,
+    "Ho": 67, "Er": 68, "Tm": 69, "Yb": 70, "Lu": 71, "Hf": 72, "Ta": 73,
+    "W": 74, "Re": 75, "Os": 76, "Ir": 77, "Pt": 78, "Au": 79, "Hg": 80,
+    "Tl": 81, "Pb": 82, "Bi": 83, "Po": 84, "At": 85, "Rn": 86, "Fr": 87,
+    "Ra": 88, "Ac": 89, "Th": 90, "Pa": 91, "U": 92, "Np": 93, "Pu": 94,
+    "Am": 95, "Cm": 96, "Bk": 97, "Cf": 98, "Es": 99, "Fm": 100, "Md": 101,
+    "No": 102, "Lr": 103, "Rf": 104, "Db": 105, "Sg": 106, "Bh": 107,
+    "Hs": 108, "Mt": 109, "Ds": 110, "Rg": 111, "Cn": 112, "Uut": 113,
+    "Fl": 114, "Uup": 115, "Lv": 116, "Uus": 117, "Uuo": 118}
+
+# Invert the above: atomic numbers to atomic symbols
+NumberToSymbol = {v: k for k, v in SymbolToNumber.items()}
+
+# Dictionary to convert atomic symbols to atomic masses
+SymbolToMass = {
+    "H": 1.00794, "He": 4.002602, "Li": 6.941, "Be": 9.012182, "B": 10.811,
+    "C": 12.0107, "N": 14.0067, "O": 15.9994, "F": 18.9984032, "Ne": 20.1797,
+    "Na": 22.98976928, "Mg": 24.3050, "Al": 26.9815386, "Si": 28.0855,
+    "P": 30.973762, "S": 32.065, "Cl": 35.453, "Ar": 39.948, "K": 39.0983,
+    "Ca": 40.078, "Sc": 44.955912, "Ti": 47.867, "V": 50.9415, "Cr": 51.9961,
+    "Mn": 54.938045, "Fe": 55.845, "Co": 58.933195, "Ni": 58.6934, "Cu": 63.546,
+    "Zn": 65.38, "Ga": 69.723, "Ge": 72.64, "As": 74.92160, "Se": 78.96,
+    "Br": 79.904, "Kr": 83.798, "Rb": 85.4678, "Sr": 87.62, "Y": 88.90585,
+    "Zr": 91.224, "Nb": 92.90638, "Mo": 95.96, "Tc": 98.0, "Ru": 101.07,
+    "Rh": 102.90550, "Pd": 106.42, "Ag": 107.8682, "Cd": 112.411, "In": 114.818,
+    "Sn": 118.710, "Sb": 121.760, "Te": 127.60, "I": 126.90447, "Xe": 131.293,
+    "Cs": 132.9054519, "Ba": 137.327, "La": 138.90547, "Ce": 140.116,
+    "Pr": 140.90765, "Nd": 144.242, "Pm": 145.0, "Sm": 150.36, "Eu": 151.964,
+    "Gd": 157.25, "Tb": 158.92535, "Dy": 162.500, "Ho": 164.93032, "Er": 167.259,
+    "Tm": 168.93421, "Yb": 173.054, "Lu": 174.9668, "Hf": 178.49, "Ta": 180.94788,
+    "W": 183.84, "Re": 186.207, "Os": 190.23, "Ir": 192.217, "Pt": 195.084,
+    "Au": 196.966569, "Hg": 200.59, "Tl": 204.3833, "Pb": 207.2, "Bi": 208.98040,
+    "Po": 209.0, "At": 210.0, "Rn": 222.0, "Fr": 223.0, "Ra": 226.0, "Ac": 227.0,
+    "Th": 232.03806, "Pa": 231.03588, "U": 238.02891, "Np": 237.0, "Pu": 244.0,
+    "Am": 243.0, "Cm": 247.0, "Bk": 247.0, "Cf": 251.0, "Es": 252.0, "Fm": 257.0,
+    "Md": 258.0, "No": 259.0, "Lr": 262.0, "Rf": 267.0, "Db": 268.0, "Sg": 271.0,
+    "Bh": 272.0, "Hs": 270.0, "Mt": 276.0, "Ds": 281.0, "Rg": 280.0, "Cn": 285.0,
+    "Uut": 284.0, "Uuq": 289.0, "Uup": 288.0, "Uuh": 293.0, "Uuo": 294.0}
+
+# Define dictionary to convert atomic symbols to covalent radii (in Angstrom)
+SymbolToRadius = {
+    "H": 0.37, "He": 0.32, "Li": 1.34, "Be": 0.90, "B": 0.82, "C": 0.77,
+    "N": 0.75, "O": 0.73, "F": 0.71, "Ne": 0.69, "Na": 1.54, "Mg": 1.30,
+    "Al": 1.18, "Si": 1.11, "P": 1.06, "S": 1.02, "Cl": 0.99, "Ar": 0.97,
+    "K": 1.96, "Ca": 1.74, "Sc": 1.44, "Ti": 1.36, "V": 1.25, "Cr": 1.27,
+    "Mn": 1.39, "Fe": 1.25, "Co": 1.26, "Ni": 1.21, "Cu": 1.38, "Zn": 1.31,
+    "Ga": 1.26, "Ge": 1.22, "As": 1.19, "Se": 1.16, "Br": 1.14, "Kr": 1.10,
+    "Rb": 2.11, "Sr": 1.92, "Y": 1.62, "Zr": 1.48, "Nb": 1.37, "Mo": 1.45,
+    "Tc": 1.56, "Ru": 1.26, "Rh": 1.35, "Pd": 1.31, "Ag": 1.53, "Cd": 1.48,
+    "In": 1.44, "Sn": 1.41, "Sb": 1.38, "Te": 1.35, "I": 1.33, "Xe": 1.30,
+    "Cs": 2.25, "Ba": 1.98, "La": 1.69, "Ce": 1.70, "Pr": 1.70, "Nd": 1.70,
+    "Pm": 1.70, "Sm": 1.70, "Eu": 1.70, "Gd": 1.70, "Tb": 1.70, "Dy": 1.70,
+    "Ho": 1.70, "Er": 1.70, "Tm": 1.70, "Yb": 1.70, "Lu": 1.60, "Hf": 1.50,
+    "Ta": 1.38, "W": 1.46, "Re": 1.59, "Os": 1.28, "Ir": 1.37, "Pt": 1.28,
+    "Au": 1.44, "Hg": 1.49, "Tl": 1.48, "Pb": 1.47, "Bi": 1.46, "Po": 1.50,
+    "At": 1.50, "Rn": 1.45, "Fr": 1.50, "Ra": 1.50, "Ac": 1.50, "Th": 1.50,
+    "Pa": 1.50, "U": 1.50, "Np": 1.50, "Pu": 1.50, "Am": 1.50, "Cm": 1.50,
+    "Bk": 1.50, "Cf": 1.50, "Es": 1.50, "Fm": 1.50, "Md": 1.50, "No": 1.50,
+    "Lr": 1.50, "Rf": 1.50, "Db": 1.50, "Sg": 1.50, "Bh": 1.50, "Hs": 1.50,
+    "Mt": 1.50, "Ds": 1.50, "Rg": 1.50, "Cn": 1.50, "Uut": 1.50, "Uuq": 1.50,
+    "Uup": 1.50, "Uuh": 1.50, "Uus": 1.50, "Uuo": 1.50}
+
+# Define dictionary to convert atomic symbols to van der Waals radii (in Angstrom)
+SymbolToVdWRadius = {
+    "H": 1.10, "He": 1.40, "Li": 1.82, "Be": 1.53, "B": 1.92, "C": 1.70,
+    "N": 1.55, "O": 1.52, "F": 1.47, "Ne": 1.54, "Na": 2.27, "Mg": 1.73,
+    "Al": 1.84, "Si": 2.10, "P": 1.80, "S": 1.80, "Cl": 1.75, "Ar": 1.88,
+    "K": 2.75, "Ca": 2.31, "Sc": 2.15, "Ti": 2.11, "V": 2.07, "Cr": 2.06,
+    "Mn": 2.05, "Fe": 2.04, "Co": 2.00, "Ni": 1.97, "Cu": 1.96, "Zn": 2.01,
+    "Ga": 1.87, "Ge": 2.11, "As": 1.85, "Se": 1.90, "Br": 1.85, "Kr": 2.02,
+    "Rb": 3.03, "Sr": 2.49, "Y": 2.32, "Zr": 2.23, "Nb": 2.18, "Mo": 2.17,
+    "Tc": 2.16, "Ru": 2.13, "Rh": 2.10, "Pd": 2.10, "Ag": 2.11, "Cd": 2.18,
+    "In": 1.93, "Sn": 2.17, "Sb": 2.06, "Te": 2.06, "I": 1.98, "Xe": 2.16,
+    "Cs": 3.43, "Ba": 2.68, "La": 2.43, "Ce": 2.42, "Pr": 2.40, "Nd": 2.39,
+    "Pm": 2.38, "Sm": 2.36, "Eu": 2.35, "Gd": 2.34, "Tb": 2.33, "Dy": 2.31,
+    "Ho": 2.30, "Er": 2.29, "Tm": 2.27, "Yb": 2.26, "Lu": 2.24, "Hf": 2.23,
+    "Ta": 2.22, "W": 2.18, "Re": 2.16, "Os": 2.16, "Ir": 2.13, "Pt": 2.13,
+    "Au": 2.14, "Hg": 2.23, "Tl": 1.96, "Pb": 2.02, "Bi": 2.07, "Po": 1.97,
+    "At": 2.02, "Rn": 2.20, "Fr": 3.48, "Ra": 2.83, "Ac": 2.47, "Th": 2.45,
+    "Pa": 2.43, "U": 2.41, "Np": 2.39, "Pu": 2.43, "Am": 2.44, "Cm": 2.45,
+    "Bk": 2.44, "Cf": 2.45, "Es": 2.45, "Fm": 2.45, "Md": 2.46, "No": 2.46,
+    "Lr": 2.46, "Rf": "?", "Db": "?", "Sg": "?", "Bh": "?", "Hs": "?",
+    "Mt": "?", "Ds": "?", "Rg": "?", "Cn": "?", "Uut": "?", "Uuq": "?",
+    "Uup": "?", "Uuh": "?", "Uus": "?", "Uuo": "?"}
+
+# Define dictionary to convert atomic symbols to (Pauling) electronegativity
+SymbolToEN = {
+    "H": 2.20, "He": 0.00, "Li": 0.98, "Be": 1.57, "B": 2.04, "C": 2.55,
+    "N": 3.04, "O": 3.44, "F": 3.98, "Ne": 0.00, "Na": 0.93, "Mg": 1.31,
+    "Al": 1.61, "Si": 1.90, "P": 2.19, "S": 2.58, "Cl": 3.16, "Ar": 0.00,
+    "K": 0.82, "Ca": 1.00, "Sc": 1.36, "Ti": 1.54, "V": 1.63, "Cr": 1.66,
+    "Mn": 1.55, "Fe": 1.83, "Co": 1.88, "Ni": 1.91, "Cu": 1.90, "Zn": 1.65,
+    "Ga": 1.81, "Ge": 2.01, "As": 2.18, "Se": 2.55, "Br": 2.96, "Kr": 3.00,
+    "Rb": 0.82, "Sr": 0.95, "Y": 1.22, "Zr": 1.33, "Nb": 1.60, "Mo": 2.16,
+    "Tc": 1.90, "Ru": 2.00, "Rh": 2.28, "Pd": 2.20, "Ag": 1.93, "Cd": 1.69,
+    "In": 1.78, "Sn": 1.96, "Sb": 2.05, "Te": 2.10, "I": 2.66, "Xe": 2.60,
+    "Cs": 0.79, "Ba": 0.89, "La": 1.10, "Ce": 1.12, "Pr": 1.13, "Nd": 1.14,
+    "Pm": 1.13, "Sm": 1.17, "Eu": 1.20, "Gd": 1.20, "Tb": 1.10, "Dy": 1.22,
+    "Ho": 1.23, "Er": 1.24, "Tm": 1.25, "Yb": 1.10, "Lu": 1.27, "Hf": 1.30,
+    "Ta": 1.50, "W": 2.36, "Re": 1.90, "Os": 2.20, "Ir": 2.20, "Pt": 2.28,
+    "Au": 2.54, "Hg": 2.00, "Tl": 1.62, "Pb": 1.87, "Bi": 2.02, "Po": 2.00,
+    "At": 2.20, "Rn": 2.20, "Fr": 0.70, "Ra": 0.90, "Ac": 1.10, "Th": 1.30,
+    "Pa": 1.50, "U": 1.38, "Np": 1.36, "Pu": 1.28, "Am": 1.13, "Cm": 1.28,
+    "Bk": 1.30, "Cf": 1.30, "Es": 1.30, "Fm": 1.30, "Md": 1.30, "No": 1.30,
+    "Lr": 1.30, "Rf": 1.30, "Db": 1.30, "Sg": 1.30, "Bh": 1.30, "Hs": 1.30,
+    "Mt": 1.30, "Ds": 1.30, "Rg": 1.30, "Cn": 1.30, "Uut": 1.30, "Uuq": 1.30,
+    "Uup": 1.30, "Uuh": 1.30, "Uus": 1.30, "Uuo": 1.30}
+
+# Define dictionary to convert atomic symbols to valence electron number
+SymbolToValenceE = {
+    "H": 1, "He": 2, "Li": 1, "Be": 2, "B": 3, "C": 4,
+    "N": 5, "O": 6, "F": 7, "Ne": 8, "Na": 1, "Mg": 2,
+    "Al": 3, "Si": 4, "P": 5, "S": 6, "Cl": 7, "Ar": 8,
+    "K": 1, "Ca": 2, "Sc": 3, "Ti": 4, "V": 5, "Cr": 6,
+    "Mn": 7, "Fe": 8, "Co": 9, "Ni": 10, "Cu": 11, "Zn": 12}
+# Note that this will need to be completed later
+
+# ---------------------------------------------------
+# Define global empirical parameters for force field
+# ---------------------------------------------------
+
+# Define a dictionary for the element specific parameter k_a
+k_a = {
+    "H": 1.755, "He": 1.755, "B": 2.287, "C": 2.463, "N": 2.559, "O": 2.579,
+    "F": 2.465, "Ne": 2.465, "Al": 2.508, "Si": 2.684, "P": 2.780, "S": 2.800,
+    "Cl": 2.686, "Li": 2.20, "Na": 2.20, "K": 2.20, "Rb": 2.20, "Cs": 2.20,
+    "Fr": 2.20, "Be": 2.80, "Mg": 2.80, "Ca": 2.80, "Sr": 2.80, "Ba": 2.80,
+    "Ra": 2.80, "Ar": 2.75, "Sc": 2.95, "Ti": 2.95, "V": 2.95, "Cr": 2.95,
+    "Mn": 2.95, "Fe": 2.95, "Co": 2.95, "Ni": 2.95, "Cu": 2.95, "Zn": 2.95,
+    "Ga": 2.95, "Ge": 2.95, "As": 2.95, "Se": 2.95, "Br": 2.95, "Kr": 2.95,
+    "Y": 3.15, "Zr": 3.15, "Nb": 3.15, "Mo": 3.15, "Tc": 3.15, "Ru": 3.15,
+    "Rh": 3.15, "Pd": 3.15, "Ag": 3.15, "Cd": 3.15, "In": 3.15, "Sn": 3.15,
+    "Sb": 3.15, "Te": 3.15, "I": 3.15, "Xe": 3.15, "La": 3.80, "Ce": 3.80,
+    "Pr": 3.80, "Nd": 3.80, "Pm": 3.80, "Sm": 3.80, "Eu": 3.80, "Gd": 3.80,
+    "Tb": 3.80, "Dy": 3.80, "Ho": 3.80, "Er": 3.80, "Tm": 3.80, "Yb": 3.80,
+    "Lu": 3.80, "Hf": 3.80, "Ta": 3.80, "W": 3.80, "Re": 3.80, "Os": 3.80,
+    "Ir": 3.80, "Pt": 3.80, "Au": 3.80, "Hg": 3.80, "Tl": 3.80, "Pb": 3.80,
+    "Bi": 3.80, "Po": 3.80, "At": 3.80, "Rn": 3.80}
+
+# Define dictionary for the element specific parameter k_z
+k_z = {
+    "H": 3.00, "He": 2.35, "Li": 1.70, "Be": 5.50, "B": 0.95, "C": 0.95,
+    "N": 0.95, "O": 0.95, "F": 0.95, "Ne": 0.95, "Na": 2.50, "Mg": 3.00,
+    "Al": 0.75, "Si": 0.75, "P": 0.75, "S": 0.75, "Cl": 0.75, "Ar": 0.75,
+    "K": 3.00, "Ca": 3.00, "Sc": 0.65, "Ti": 0.65, "V": 0.65, "Cr": 0.65,
+    "Mn": 0.65, "Fe": 0.65, "Co": 0.65, "Ni": 0.65, "Cu": 0.65, "Zn": 0.65,
+    "Ga": 0.65, "Ge": 0.65, "As": 0.65, "Se": 0.65, "Br": 0.65, "Kr": 0.65,
+    "Rb": 3.00, "Sr": 3.00, "Cs": 0.60, "Ba": 0.60, "La": 0.60, "Ce": 0.60,
+    "Pr": 0.60, "Nd": 0.60, "Pm": 0.60, "Sm": 0.60, "Eu": 0.60, "Gd": 0.60,
+    "Tb": 0.60, "Dy": 0.60, "Ho": 0.60, "Er": 0.60, "Tm": 0.60, "Yb": 0.60,
+    "Lu": 0.60, "Hf": 0.60, "Ta": 0.60, "W": 0.60, "Re": 0.60, "Os": 0.60,
+    "Ir": 0.60, "Pt": 0.60, "Au": 0.60, "Hg": 0.60, "Tl": 0.60, "Pb": 0.60,
+    "Bi": 0.60, "Po": 0.60, "At": 0.60, "Rn": 0.60, "Fr": 0.60, "Ra": 0.60,
+    "Ac": 0.60, "Th": 0.60, "Pa": 0.60, "U": 0.60, "Np": 0.60, "Pu": 0.60,
+    "Am": 0.60, "Cm": 0.60, "Bk": 0.60, "Cf": 0.60, "Es": 0.60, "Fm": 0.60,
+    "Md": 0.60, "No": 0.60, "Lr": 0.60, "Rf": 0.60, "Db": 0.60, "Sg": 0.60,
+    "Bh": 0.60, "Hs": 0.60, "Mt": 0.60, "Ds": 0.60, "Rg": 0.60, "Cn": 0.60,
+    "Uut": 0.60, "Uuq": 0.60, "Uup": 0.60, "Uuh": 0.60, "Uus": 0.60, "Uuo": 0.60}
+# Note no values specified for row 5 elements outside s block - Grimme gives rows 1, 2, 3 and 4, then Z>54
+
+# Define individual global parameters
+k_EN = -0.164
+k_a2 = 0.221
+k_a13 = 2.81
+k_b13 = 0.53
+k_13r = 0.7
+k_damping = 0.11
+k_overlap = 0.5
+a1 = 0.45
+a2 = 4.0
+s8 = 2.7
+E_ES_14 = 0.85
+E_disp_rep = 0.5
+beta_rep = 16.5
+k_q = 1.15
+
+# Define dictionary for the element specific hydrogen bonding parameter
+k_hbnd = {"N": 0.8,
+          "O": 0.3,
+          "F": 0.1,
+          "P": 2.0,
+          "S": 2.0,
+          "Cl": 2.0,
+          "Se": 2.0,
+          "Br": 2.0}
+
+# Define dictionary for the element specific parameter k_X
+k_X = {"Cl": 0.3,
+       "Br": 0.6,
+       "I": 0.8,
+       "At": 1.0}
+
+# Define dictionaries for the hydrogen and halogen bonding parameters k_q1 and k_q2
+k_q1 = {"hbond": 10,
+        "xbond": -6.5}
+k_q2 = {"hbond": 5,
+        "xbond": 1}
+
+# Define a dictionary for the DFT-D3 C6 coefficients
+# (Values taken from www.thch.uni-bonn.de/tc/downloads/DFT-D3/data/refmol.txt)
+C6 = {
+    "H": 7.5916, "He": 1.5583, "Li": 1163.4454, "Be": 257.4863, "B": 107.1777,
+    "C": 49.1130, "N": 25.2685, "O": 15.5059, "F": 9.6916, "Ne": 6.2896,
+    "Na": 1608.0286, "Mg": 683.3758, "Al": 540.5406, "Si": 317.8574, "P": 191.6887,
+    "S": 134.0066, "Cl": 92.3460, "Ar": 64.6462, "K": 4983.5009, "Ca": 2352.6862,
+    "Sc": 1702.6213, "Ti": 1361.9185, "V": 1116.0984, "Cr": 690.7425, "Mn": 802.7484,
+    "Fe": 109.5041, "Co": 532.7794, "Ni": 574.7436, "Cu": 337.1808, "Zn": 340.5213,
+    "Ga": 483.7516, "Ge": 363.5474, "As": 262.9498, "Se": 213.6738, "Br": 167.1297,
+    "Kr": 130.4017, "Rb": 6138.7755, "Sr": 3381.3672, "Y": 2365.8925, "Zr": 1822.7181,
+    "Nb": 1475.2500, "Mo": 845.8972, "Tc": 1067.0169, "Ru": 239.0071, "Pd": 608.5041,
+    "Ag": 426.7450, "Cd": 468.1900, "In": 757.7397, "Sn": 627.5677, "Sb": 492.9379,
+    "Te": 425.5355, "I": 351.9667, "Xe": 290.2223, "Cs": 9330.7294, "Ba": 5726.9887,
+    "La": 3990.6172, "Ce": 688.0353, "Pr": 4342.2386, "Nd": 3924.4211, "Pm": 3710.9375,
+    "Sm": 3522.0508, "Eu": 3358.3122, "Gd": 1891.6719, "Tb": 2851.6677, "Dy": 2617.3310,
+    "Ho": 2664.1668, "Er": 2545.1713, "Tm": 2437.4539, "Yb": 2390.1227, "Lu": 1597.4796,
+    "Hf": 1441.2394, "Ta": 1163.8241, "W": 814.3622, "Re": 836.3310, "Os": 297.8338,
+    "Ir": 566.0660, "Pt": 391.1448, "Au": 342.3526, "Hg": 362.0755, "Tl": 792.2378,
+    "Pb": 738.8156, "Bi": 617.5296, "Po": 562.6011, "At": 483.6536, "Rn": 412.8275,
+    "Fr": 7314.7398, "Ra": 5305.4399, "Ac": 3799.6565, "Th": 2847.2704, "Pa": 2908.9206,
+    "U": 2721.5209, "Np": 3032.9760, "Pu": 2815.2366}
+# Note: Several elements have two different C6 values listed, for different numbers of unpaired electrons. At present, the value with fewest unpaired electrons is used
+# This affects Fe (4 unpaired, 491.3349; 0 unpaired 109.5041), Ru (4 unpaired, 598.1988; 0 unpaired, 239.0071), Os (4 unpaired, 678.5278; 0 unpaired, 297.8338)
+# Note also that values are for the element alone, except Ce with data available only for CeH3
+
+# Define a dictionary for the optimised values of the parameter a1 used in C6-only dispersion for different density functional approximations
+# Values in atomic units from DOI: 10.1021/acs.jctc.5b00400
+CSO_a1 = {
+    "BLYP": 1.28, "BP86": 1.01, "PBE": 0.24, "TPSS": 0.72,
+    "B3LYP": 0.86, "PBE0": 0.20, "PW6B95": -0.15, "B2PLYP": 0.24}
+
+# Define dictionary to convert atomic symbols to number of valence electrons
+SymbolToValE = {
+    "H": 1, "He": 2, "Li": 1, "Be": 2, "B": 3, "C": 4, "N": 5, "O": 6, "F": 7, "Ne": 8,
+    "Na": 1, "Mg": 2, "Al": 3, "Si": 4, "P": 5, "S": 6, "Cl": 7, "Ar": 8
+}
+
+# Define dictionary to convert atomic symbols to STO exponents for s functions
+SymbolToSTOexpS = {
+    "H": 1.200, "He": 1.688, "Li": 0.650, "Be": 0.975, "B": 1.300, "C": 1.625,
+    "N": 1.950, "O": 2.275, "F": 2.425, "Ne": 2.879, "Na": 0.733, "Mg": 1.100,
+    "Al": 1.167, "Si": 1.383, "P": 1.750, "S": 2.122, "Cl": 2.183, "Ar": 2.461,
+
+}
+
+# Define dictionary to convert atomic symbols to STO exponents for p functions
+SymbolToSTOexpP = {
+    "Li": 0.650, "Be": 0.975, "B": 1.300, "C": 1.625,
+    "N": 1.950, "O": 2.275, "F": 2.425, "Ne": 2.879, "Na": 0.733, "Mg": 1.100,
+    "Al": 1.167, "Si": 1.383, "P": 1.300, "S": 1.827, "Cl": 1.733, "Ar": 2.105,
+}
+
+# Define dictionary to convert atomic symbols to ionisation energies in Extended Hückel Hamiltonians
+# Here for s electrons in hartrees
+SymbolToEHTieS = {
+    "H": -0.5000, "He": -0.8599, "Li": -0.1984, "Be": -0.3675, "B": -0.5586, "C": -0.7144,
+    "N": -0.9555, "O": -1.1870, "F": -1.4700, "Ne": -1.5876, "Na": -0.1874, "Mg": -0.3307,
+    "Al": -0.4520, "Si": -0.6358, "P": -0.6835, "S": -0.7350, "Cl": -0.9665, "Ar": -1.2774,
+}
+
+# Define dictionary to convert atomic symbols to ionisation energies in Extended Hückel Hamiltonians
+# Here for p electrons in hartrees
+SymbolToEHTieP = {
+    "Li": -0.1286, "Be": -0.2205, "B": -0.3124, "C": -0.3921,
+    "N": -0.4924, "O": -0.5439, "F": -0.6652, "Ne": -0.7350, "Na": -0.1102, "Mg": -0.1654,
+    "Al": -0.2389, "Si": -0.3381, "P": -0.5145, "S": -0.4042, "Cl": -0.5218, "Ar": -0.5910,
+}
+
+# Define dictionary to convert angular momentum quantum numbers to symbols
+L2Symb = {
+    0: "s", 1: "p", 2: "d", 3: "f", 4: "g", 5: "h", 6: "i", 7: "j", 8: "k"
+}
+
+# Define dictionary to convert quantum numbers to symbols for p orbitals
+Porb2Symb = {
+    -1: "x", 0: "z", 1: "y"
+}
+
+# Define dictionary to convert quantum numbers to symbols for d orbitals
+Dorb2Symb = {
+    -2: "xx", -1: "xx", 0: "z2", 1: "yy", 2: "yy"
+}
+
+
+# Function to translate quantum numbers to symbols.
+def qn2symb(l, m=None):
+    if m == None:
+        return L2Symb[l]
+    elif l == 0:
+        return ""
+    elif l == 1:
+        return Porb2Symb[m]
+    elif l == 2:
+        return Dorb2Symb[m]
+
+
+#############################################################################################################
+# Do *not* define constants or conversion factors below here
+#############################################################################################################
+
+# Test if the argument is (can be converted to)
+# an integer number
+def isInt(s):
+    try:
+        int(s)
+        return True
+    except ValueError:
+        return False
@@ -0,0 +1,83 @@
+import numpy as np
+import scipy.linalg
+
+from .messages import ProgramAbort, ProgramError, ProgramWarning
+from .constants import SymbolToEHTieP, SymbolToEHTieS, SymbolToSTOexpP, SymbolToSTOexpS
+
+
+#############################################################################################################
+# STO (Slater Type Orbital class and class methods to be defined below
+#############################################################################################################
+
+class STO:
+    """ A Slater Type Orbital with an atomic symbol quantum numbers n and l, and an exponent"""
+
+    def __init__(self, sym, n, l, exp=None, ie=None):
+        """ (STO, str, number, number, number, number) -> NoneType
+
+        Create an STO with (int) quantum numbers n and l.
+        Exponent exp and ionisation energy are set automatically according to
+        symbol if not explicitly specified.
+        """
+
+        self.n = n
+        self.l = l
+        if l == 0:
+            self.exp = SymbolToSTOexpS[sym]
+            self.ie = SymbolToEHTieS[sym]
+        elif l == 1:
+            self.exp = SymbolToSTOexpP[sym]
+            self.ie = SymbolToEHTieP[sym]
+        else:
+            ProgramError("This angular momentum is not (yet) implemented")
+            ProgramAbort()
+
+    def __str__(self):
+        """ (STO) -> str
+
+        Return a string representation of this STO in this format:
+
+          (n, l, exp, ie)
+        """
+
+        return '({0}, {1}, {2}, {3})'.format(self.n, self.l, self.exp, self.ie)
+
+    def __repr__(self):
+        """ (STO) -> str
+
+        Return a string representation of this STO in this format:"
+
+          STO(n, l, exp, ie)
+        """
+
+        return '({0}, {1}, {2}, {3})'.format(self.n, self.l, self.exp, self.ie)
+
+
+def solveHueckel(hamiltonian, overlap, typ=1, verbosity=0):
+    """ (array, array, int, int) -> array, array
+
+    Solves the generalised eigenvalue problem HC = SCE of an extended Hueckel calculation and returns the
+    real MO energies in ascending order with the MO vectors in the matching columns. With typ 1, the symmetric
+    solver is used, which requires the overlap matrix to be positive definite; should it not be, the general
+    solver of typ 2 is used instead. Infinite or undefined eigenvalues of the general solver are sorted last.
+    """
+
+    if typ == 1:
+        try:
+            return scipy.linalg.eigh(hamiltonian, b=overlap)
+        except (np.linalg.LinAlgError, ValueError):
+            if verbosity >= 1:
+                ProgramWarning()
+                print("Overlap matrix is not positive definite, using the general eigenvalue solver instead")
+    # Note that this returns the right eigenvectors by default and no ordering of the eigenvalues is guaranteed
+    MOEnergies, MOVectors = scipy.linalg.eig(hamiltonian, b=overlap)
+    MOEnergies = np.real(MOEnergies)
+    MOVectors = np.real(MOVectors)
+    undefined = ~np.isfinite(MOEnergies)
+    if np.any(undefined) and verbosity >= 1:
+        print("\nInfinite eigenvalue found in list of MO Energies")
+        print("Program will continue\n")
+    order = np.lexsort((MOEnergies, undefined))
+    MOEnergies = np.where(undefined, np.inf, MOEnergies)
+
+    return MOEnergies[order], MOVectors[:, order]
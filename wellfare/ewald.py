@@ -0,0 +1,289 @@
+import math
+
+import numpy as np
+import scipy.special
+
+from .messages import ProgramAbort, ProgramError
+
+
+#############################################################################################################
+# Ewald summation of the electrostatics in a periodic (orthorhombic) cell: plain Ewald and smooth PME
+#############################################################################################################
+
+# The electrostatic energy is q_A q_B / r_AB as in potElectrostatic(), with r in Angstrom. It is split into the
+# direct-space pair potential q_A q_B erfc(alpha r_AB) / r_AB, evaluated over the pairs of the neighbour list, and
+# the reciprocal-space and self-energy terms below.
+
+def ewaldAlpha(cutoff, tolerance=1.0e-6):
+    """
+    Returns the Ewald splitting parameter alpha (in 1/Angstrom) for which erfc(alpha * cutoff) equals tolerance,
+    i.e. for which the direct-space pair potential has decayed to tolerance times its unscreened value at the cutoff
+    """
+
+    return scipy.special.erfcinv(tolerance) / cutoff
+
+
+def directPairPotential(r, alpha):
+    """
+    Returns erfc(alpha r) / r, the direct-space part of the Coulomb potential 1 / r, with its first and second
+    derivatives with respect to r
+    """
+    erfc = scipy.special.erfc(alpha * r)
+    gauss = 2 * alpha / math.sqrt(math.pi) * np.exp(-(alpha * r) ** 2)
+    u = erfc / r
+    du = -erfc / r ** 2 - gauss / r
+    d2u = 2 * erfc / r ** 3 + gauss * (2 / r ** 2 + 2 * alpha ** 2)
+
+    return u, du, d2u
+
+
+def selfEnergy(charges, box, alpha):
+    """
+    Returns the Ewald self-energy of the point charges and, for a cell that is not neutral, the energy of the
+    neutralising background charge
+    """
+    charges = np.asarray(charges, dtype=float)
+    volume = np.prod(box)
+
+    return (-alpha / math.sqrt(math.pi) * np.sum(charges ** 2)
+            - math.pi * np.sum(charges) ** 2 / (2 * volume * alpha ** 2))
+
+
+def reciprocalLimits(box, alpha, tolerance=1.0e-6):
+    """
+    Returns the largest wave vector indices n_d along each edge of the cell with edge lengths box for which the
+    Gaussian factor exp(-k^2 / (4 alpha^2)) of the reciprocal-space sum, with k = 2 pi n_d / L_d, is still above
+    tolerance, i.e. ceil(alpha L_d sqrt(-ln tolerance) / pi)
+    """
+
+    return np.ceil(alpha * np.asarray(box, dtype=float) * math.sqrt(-math.log(tolerance)) / math.pi).astype(int)
+
+
+def ewaldReciprocal(X, charges, box, alpha, kmax=8, chunk=4096):
+    """
+    Returns the reciprocal-space Ewald energy of the point charges at the (N, 3) positions X in the orthorhombic
+    cell with edge lengths box, summed directly over all wave vectors 2 pi (n_x / L_x, n_y / L_y, n_z / L_z) with
+    |n_d| <= kmax (a number, or one for each edge), and its (N, 3) gradient. The wave vectors are processed in
+    chunks of the given size.
+    """
+    X = np.asarray(X, dtype=float)
+    charges = np.asarray(charges, dtype=float)
+    box = np.asarray(box, dtype=float)
+    volume = np.prod(box)
+    kmax = np.broadcast_to(np.asarray(kmax, dtype=int), (3,))
+    n = [np.arange(-kmax[d], kmax[d] + 1) for d in range(3)]
+    vectors = np.stack(np.meshgrid(n[0], n[1], n[2], indexing='ij'), axis=-1).reshape(-1, 3)
+    # k and -k contribute equally, so only one half of the wave vectors is summed and counted twice
+    half = (vectors[:, 0] > 0) | ((vectors[:, 0] == 0) & ((vectors[:, 1] > 0)
+                                                         | ((vectors[:, 1] == 0) & (vectors[:, 2] > 0))))
+    kvectors = 2 * math.pi * vectors[half] / box
+
+    energy = 0.0
+    gradient = np.zeros_like(X)
+    for start in range(0, len(kvectors), chunk):
+        k = kvectors[start:start + chunk]
+        ksq = np.einsum('ij,ij->i', k, k)
+        weight = 2 * (2 * math.pi / volume) * np.exp(-ksq / (4 * alpha ** 2)) / ksq
+        phase = X @ k.T
+        cos = np.cos(phase)
+        sin = np.sin(phase)
+        s_cos = charges @ cos
+        s_sin = charges @ sin
+        energy += np.sum(weight * (s_cos ** 2 + s_sin ** 2))
+        # d|S|^2 / dr_i = 2 q_i k (s_sin cos(k.r_i) - s_cos sin(k.r_i))
+        gradient += 2 * charges[:, np.newaxis] * (((cos * s_sin - sin * s_cos) * weight) @ k)
+
+    return energy, gradient
+
+
+def cardinalBSpline(u, order):
+    """
+    Values of the cardinal B-spline M_order at u, which is non-zero for 0 < u < order
+    """
+    u = np.asarray(u, dtype=float)
+    if order == 2:
+        return np.maximum(1.0 - np.abs(u - 1.0), 0.0)
+
+    return (u * cardinalBSpline(u, order - 1) + (order - u) * cardinalBSpline(u - 1.0, order - 1)) / (order - 1)
+
+
+def bsplineModuli(points, order):
+    """
+    Returns |b(m)|^2 of the smooth PME method for the m = 0 ... points - 1 grid frequencies of one dimension
+    """
+    m = np.arange(points)
+    k = np.arange(order - 1)
+    denominator = np.abs(np.exp(2j * math.pi * np.outer(m, k) / points) @ cardinalBSpline(k + 1.0, order)) ** 2
+    # For odd orders the denominator vanishes at the Nyquist frequency; use the mean of the neighbouring values
+    for i in np.nonzero(denominator < 1.0e-7)[0]:
+        denominator[i] = 0.5 * (denominator[i - 1] + denominator[(i + 1) % points])
+
+    return 1.0 / denominator
+
+
+def pmeReciprocal(X, charges, box, alpha, grid, order=6):
+    """
+    Returns the reciprocal-space Ewald energy of the point charges at the (N, 3) positions X in the orthorhombic
+    cell with edge lengths box, evaluated by the smooth particle mesh Ewald method (Essmann et al.,
+    J. Chem. Phys. 103, 8577 (1995)) on a grid with the given numbers of points along each edge, with B-splines
+    of the given order, and its (N, 3) gradient
+    """
+    X = np.asarray(X, dtype=float)
+    charges = np.asarray(charges, dtype=float)
+    box = np.asarray(box, dtype=float)
+    grid = np.asarray(grid, dtype=int)
+    volume = np.prod(box)
+
+    # Scaled fractional coordinates, and the B-spline weights of the order grid points below each of them
+    scaled = grid * (X / box - np.floor(X / box))
+    base = np.floor(scaled).astype(int)
+    offset = (scaled - base)[:, :, np.newaxis] + np.arange(order)
+    weights = cardinalBSpline(offset, order)
+    dweights = (cardinalBSpline(offset, order - 1) - cardinalBSpline(offset - 1.0, order - 1)) * (grid / box)[:, np.newaxis]
+    index = np.mod(base[:, :, np.newaxis] - np.arange(order), grid[:, np.newaxis])
+
+    # Spread the charges onto the grid
+    ix = index[:, 0, :, np.newaxis, np.newaxis]
+    iy = index[:, 1, np.newaxis, :, np.newaxis]
+    iz = index[:, 2, np.newaxis, np.newaxis, :]
+    wx = weights[:, 0, :, np.newaxis, np.newaxis]
+    wy = weights[:, 1, np.newaxis, :, np.newaxis]
+    wz = weights[:, 2, np.newaxis, np.newaxis, :]
+    Q = np.zeros(grid)
+    np.add.at(Q, (ix, iy, iz), charges[:, np.newaxis, np.newaxis, np.newaxis] * wx * wy * wz)
+
+    # Influence function exp(-pi^2 m^2 / alpha^2) / (pi V m^2) B(m) over the grid frequencies m
+    msq = np.zeros(grid)
+    moduli = np.ones(grid)
+    for d in range(3):
+        m = np.fft.fftfreq(grid[d], 1.0 / grid[d]) / box[d]
+        shape = [1, 1, 1]
+        shape[d] = grid[d]
+        msq = msq + (m ** 2).reshape(shape)
+        moduli = moduli * bsplineModuli(grid[d], order).reshape(shape)
+    msq[0, 0, 0] = 1.0
+    influence = np.exp(-math.pi ** 2 * msq / alpha ** 2) / (math.pi * volume * msq) * moduli
+    influence[0, 0, 0] = 0.0
+
+    transform = np.fft.fftn(Q)
+    energy = 0.5 * np.sum(influence * np.abs(transform) ** 2)
+    potential = np.fft.ifftn(influence * transform).real * np.prod(grid)
+
+    # Gradient from the derivatives of the spread charges with respect to the positions
+    phi = potential[ix, iy, iz]
+    dwx = dweights[:, 0, :, np.newaxis, np.newaxis]
+    dwy = dweights[:, 1, np.newaxis, :, np.newaxis]
+    dwz = dweights[:, 2, np.newaxis, np.newaxis, :]
+    gradient = np.stack((np.sum(phi * dwx * wy * wz, axis=(1, 2, 3)), np.sum(phi * wx * dwy * wz, axis=(1, 2, 3)),
+                         np.sum(phi * wx * wy * dwz, axis=(1, 2, 3))), axis=1) * charges[:, np.newaxis]
+
+    return energy, gradient
+
+
+class EwaldSum:
+    """ Settings for the Ewald summation of the electrostatics in a periodic cell"""
+
+    def __init__(self, method="pme", alpha=None, cutoff=12.0, tolerance=1.0e-6, kmax=None, spacing=1.0, order=6):
+        """ (EwaldSum, str, number, number, number, int, number, int) -> NoneType
+
+    Ewald summation with the reciprocal-space part evaluated either directly over the wave vectors with |n_d| <= kmax
+    (method "ewald") or by smooth PME with a grid spacing of at most spacing Angstrom and B-splines of the given order
+    (method "pme"). Unless alpha is given, it is chosen such that the direct-space pair potential has decayed
+    to tolerance at the direct-space cutoff. Unless kmax is given, the wave vectors are limited for each cell edge
+    such that the reciprocal-space terms left out have decayed to tolerance, see reciprocalLimits().
+    """
+
+        if method not in ("ewald", "pme"):
+            ProgramError()
+            print("Unknown Ewald summation method: " + str(method))
+            ProgramAbort()
+        if alpha is None:
+            alpha = ewaldAlpha(cutoff, tolerance)
+        self.method = method
+        self.alpha = alpha
+        self.tolerance = tolerance
+        self.kmax = kmax
+        self.spacing = spacing
+        self.order = order
+
+    def __str__(self):
+        """ (EwaldSum) -> str
+
+    Return a string representation of the Ewald summation in this format:
+
+    (method, alpha, kmax (None if derived from the tolerance) or spacing and order)
+    """
+
+        if self.method == "ewald":
+            return '({0}, {1}, {2})'.format(self.method, self.alpha, self.kmax)
+        return '({0}, {1}, {2}, {3})'.format(self.method, self.alpha, self.spacing, self.order)
+
+    def gridPoints(self, box):
+        """ (EwaldSum, array) -> array
+
+    Returns the number of PME grid points along each edge of the cell: the smallest product of the primes 2, 3 and 5
+    (for efficient FFTs) that gives a spacing of at most self.spacing and is at least twice the spline order
+    """
+
+        points = []
+        for length in box:
+            k = max(int(math.ceil(length / self.spacing)), 2 * self.order)
+            while True:
+                rest = k
+                for prime in (2, 3, 5):
+                    while rest % prime == 0:
+                        rest //= prime
+                if rest == 1:
+                    break
+                k += 1
+            points.append(k)
+
+        return np.array(points)
+
+    def wavevectorLimits(self, box):
+        """ (EwaldSum, array) -> array
+
+    Returns the largest wave vector index along each edge of the cell for method "ewald": kmax if it was given,
+    otherwise the limits for the tolerance from reciprocalLimits()
+    """
+
+        if self.kmax is not None:
+            return np.broadcast_to(np.asarray(self.kmax, dtype=int), (3,))
+
+        return reciprocalLimits(box, self.alpha, self.tolerance)
+
+    def energyGradient(self, X, charges, box):
+        """ (EwaldSum, array, array, array) -> (number, array)
+
+    Returns the reciprocal-space and self energy of the charges at the (N, 3) positions X in the cell with edge
+    lengths box, and its (N, 3) gradient
+    """
+
+        if self.method == "ewald":
+            energy, gradient = ewaldReciprocal(X, charges, box, self.alpha, self.wavevectorLimits(box))
+        else:
+            energy, gradient = pmeReciprocal(X, charges, box, self.alpha, self.gridPoints(box), self.order)
+
+        return energy + selfEnergy(charges, box, self.alpha), gradient
+
+    def hessian(self, X, charges, box, step=1.0e-5):
+        """ (EwaldSum, array, array, array) -> array
+
+    Returns the (N, N, 3, 3) blocks of the Hessian of the reciprocal-space energy, by central differences of its
+    analytic gradient
+    """
+
+        X = np.array(X, dtype=float)
+        n = len(X)
+        hessian = np.zeros((n, 3, n, 3))
+        for i in range(n):
+            for d in range(3):
+                X[i, d] += step
+                forward = self.energyGradient(X, charges, box)[1]
+                X[i, d] -= 2 * step
+                backward = self.energyGradient(X, charges, box)[1]
+                X[i, d] += step
+                hessian[i, d] = (forward - backward) / (2 * step)
+        hessian = 0.5 * (hessian + hessian.transpose(2, 3, 0, 1))
+
+        return hessian.transpose(0, 2, 1, 3)
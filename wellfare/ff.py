@@ -0,0 +1,3349 @@
+import math
+import time
+
+import numpy as np
+import scipy.optimize
+import scipy.special
+
+from . import sto
+from .messages import ProgramAbort, ProgramError, ProgramWarning
+from .constants import (a1, a2, Ang2Bohr, beta_rep, C6, CSO_a1, E_disp_rep, E_ES_14, k_z, qn2symb, s8, SymbolToMass,
+                        SymbolToNumber, SymbolToRadius, SymbolToValE, SymbolToValenceE, SymbolToVdWRadius)
+from .potentials import (AngleDamping, AtomicXBondFactor, HBondDamping, HBondStrengthFactor, potCSODisp,
+                         potElectrostatic, potHBond, potLondonDisp, potXBond)
+from .terms import (batchTable, bendTableEnergies, FFBend, FFHBond, FFInversion, FFStretch, FFTorsion,
+                    inversionTableEnergies, packBends, packInversions, packStretches, packTorsions, pairGradient,
+                    pairHessian, stretchTableEnergies, termAngles, termDihedrals, termDistances, termOutOfPlane,
+                    torsionTableEnergies)
+from .eht import solveHueckel, STO
+from .profiler import FFProfiler
+from .neighbours import NeighbourList, switchingFunction
+from .ewald import directPairPotential, EwaldSum
+from .finitediff import numericalHessian
+from .optimise import optimiseGeometry
+
+
+#############################################################################################################
+# Atom class and class methods to be defined below
+#############################################################################################################
+
+class Atom:
+    """ An atom with an atomic symbol and cartesian coordinates"""
+
+    def __init__(self, sym, x, y, z, q):
+        """ (Atom, int, str, number, number, number) -> NoneType
+    
+    Create an Atom with (string) symbol sym,
+    and (float) cartesian coordinates (x, y, z).
+    (int) charge charge and (float) mass mass are set
+    automatically according to symbol.
+    """
+
+        self.symbol = sym
+        self.charge = SymbolToNumber[sym]
+        self.mass = SymbolToMass[sym]
+        self.coord = [x, y, z]
+        self.QMcharge = q  # Extracting q from input file yet to be implemented
+        self.basis = []
+        self.valele = SymbolToValE[sym]
+
+        if sym == "H":
+            self.basis.append(STO(sym, 1, 0))
+        elif sym == "He":
+            self.basis.append(STO(sym, 1, 0))
+        elif sym == "Li":
+            self.basis.append(STO(sym, 2, 0))
+            self.basis.append(STO(sym, 2, 1))
+        elif sym == "Be":
+            self.basis.append(STO(sym, 2, 0))
+            self.basis.append(STO(sym, 2, 1))
+        elif sym == "B":
+            self.basis.append(STO(sym, 2, 0))
+            self.basis.append(STO(sym, 2, 1))
+        elif sym == "C":
+            self.basis.append(STO(sym, 2, 0))
+            self.basis.append(STO(sym, 2, 1))
+        elif sym == "N":
+            self.basis.append(STO(sym, 2, 0))
+            self.basis.append(STO(sym, 2, 1))
+        elif sym == "O":
+            self.basis.append(STO(sym, 2, 0))
+            self.basis.append(STO(sym, 2, 1))
+        elif sym == "F":
+            self.basis.append(STO(sym, 2, 0))
+            self.basis.append(STO(sym, 2, 1))
+        elif sym == "Ne":
+            self.basis.append(STO(sym, 2, 0))
+            self.basis.append(STO(sym, 2, 1))
+        elif sym == "Na":
+            self.basis.append(STO(sym, 3, 0))
+            self.basis.append(STO(sym, 3, 1))
+        elif sym == "Mg":
+            self.basis.append(STO(sym, 3, 0))
+            self.basis.append(STO(sym, 3, 1))
+        elif sym == "Al":
+            self.basis.append(STO(sym, 3, 0))
+            self.basis.append(STO(sym, 3, 1))
+        elif sym == "Si":
+            self.basis.append(STO(sym, 3, 0))
+            self.basis.append(STO(sym, 3, 1))
+        elif sym == "P":
+            self.basis.append(STO(sym, 3, 0))
+            self.basis.append(STO(sym, 3, 1))
+        elif sym == "S":
+            self.basis.append(STO(sym, 3, 0))
+            self.basis.append(STO(sym, 3, 1))
+        elif sym == "Cl":
+            self.basis.append(STO(sym, 3, 0))
+            self.basis.append(STO(sym, 3, 1))
+        elif sym == "Ar":
+            self.basis.append(STO(sym, 3, 0))
+            self.basis.append(STO(sym, 3, 1))
+
+    def __str__(self):
+        """ (Atom) -> str
+
+        Return a string representation of this Atom in this format:
+
+          (SYMBOL, X, Y, Z, [basis])
+        """
+        s = ""
+        for i in self.basis:
+            s = s + i.__str__()
+            if i != self.basis[-1]:
+                s = s + " "
+
+        return '({0}, ({1}, {2}, {3}), ({4})'.format(self.symbol, self.coord[0], self.coord[1], self.coord[2], s)
+
+    def __repr__(self):
+        """ (Atom) -> str
+    
+        Return a string representation of this Atom in this format:"
+    
+        Atom("SYMBOL", charge, QM charge, mass, X, Y, Z)
+        """
+
+        return '("{0}", {1}, {2}, {3}, {4}, {5} {6})'.format(self.symbol, self.charge, self.QMcharge, self.mass,
+                                                             self.coord[0], self.coord[1], self.coord[2])
+
+    def x(self, x):
+        """ (Atom) -> NoneType
+    
+    Set x coordinate to x
+    """
+        self.coord[0] = x
+
+    def y(self, y):
+        """ (Atom) -> NoneType
+    
+    Set y coordinate to y
+    """
+        self.coord[1] = y
+
+    def z(self, z):
+        """ (Atom) -> NoneType
+    
+    Set z coordinate to z
+    """
+        self.coord[2] = z
+
+    def setq(self, q):
+        """ (Atom) -> NoneType
+    
+    Set QMcharge to q
+    """
+        self.QMcharge = q
+
+#############################################################################################################
+# Molecule class and class methods to be defined below
+#############################################################################################################
+
+# Topological distance of atoms that are not connected by any path of bonds, see topologicalDistances()
+Unconnected = np.iinfo(int).max
+
+
+class Molecule:
+    """A molecule with a name, charge and a list of atoms"""
+
+    def __init__(self, name, charge=0):
+        """ (Molecule, str, int) -> NoneType
+    
+    Create a Molecule named name with charge charge and no atoms
+    (int) Multiplicity mult is automatically set to the lowest
+    possible value (1 or 2) and the lists of bonds, angles and
+    dihedrals are empty.
+    """
+
+        self.name = name
+        self.charge = charge
+        self.mult = 1
+        self.Ee_QM = 0.0  # Initially set to a placeholder value for type only
+        self.atoms = []
+        self.bonds = []
+        self.angles = []
+        self.dihedrals = []
+        self.threefolds = []
+        self.stretch = []
+        self.str13 = []
+        self.bend = []
+        self.tors = []
+        self.inv = []
+        self.hbonds = []
+        self.hatoms = []
+        self.highENatoms = []
+        self.halogens = []
+        self.H_QM = np.zeros((3, 3))  # Array size arbitrary, just a placeholder for type 
+        self.topodist = None  # Number of bonds between atoms, see topologicalDistances()
+        self.screening = None
+        self.pairparams = None  # Geometry-independent non-bonded pair parameters, see pairParameters()
+        self.pairlistparams = None  # The same, packed for a list of pairs, see pairListParameters()
+        self.termtable = None  # Packed bonded terms for whole-array evaluation, see compileTermTable()
+        self.usetermtable = False
+        self.profiler = None  # FFProfiler timing the force field contributions, see enableProfiling()
+        self.neighbours = None  # NeighbourList for the non-bonded interactions, see setNonbondedCutoff()
+        self.cell = None  # Edge lengths of an orthorhombic periodic cell, see setCell()
+        self.ewald = None  # EwaldSum for the electrostatics in the periodic cell, see setElectrostatics()
+
+    def addAtom(self, a):
+        """ (Molecule, Atom) -> NoneType
+    
+    Add a to my list of Atoms.
+    """
+
+        self.atoms.append(a)
+        self.topodist = None
+        self.screening = None
+        self.pairparams = None
+        nucchg = 0
+        for i in self.atoms:
+            nucchg = nucchg + i.charge
+        if (nucchg - self.charge) % 2 != 0:
+            self.mult = 2
+        else:
+            self.mult = 1
+
+    def __str__(self):
+        """ (Molecule) -> str
+    
+    Return a string representation of this Molecule in this format:
+    (NAME, CHARGE, MULT, (ATOM1, ATOM2, ...))
+    """
+
+        res = ''
+        for atom in self.atoms:
+            res = res + str(atom) + ', '
+        res = res[:-2]
+        return '({0}, {1}, {2}, ({3}))'.format(self.name, self.charge, self.mult, res)
+
+    def __repr__(self):
+        """ (Molecule) -> str
+    
+    Return a string representation of this Molecule in this format:
+    (NAME, CHARGE, MULT, (ATOM1, ATOM2, ...))
+    """
+
+        res = ''
+        for atom in self.atoms:
+            res = res + str(atom) + ', '
+        res = res[:-2]
+        return '({0}, {1}, {2}, ({3}))'.format(self.name, self.charge, self.mult, res)
+
+    def mass(self):
+        """ (Molecule) -> number
+    
+    Return the molar mass as sum of atomic masses
+    """
+
+        mass = 0.0
+        for atom in self.atoms:
+            mass = mass + atom.mass
+
+        return mass
+
+    def numatoms(self):
+        """ (Molecule) -> int
+    
+    Return the number of atoms in the molecule
+    """
+
+        return int(len(self.atoms))
+
+    def chatom(self, n, at):
+        """ (Molecule) -> NoneType
+    
+    Change the nth atom of the Molecule
+    """
+
+        self.atoms[n] = at
+
+    def movatom(self, n, x, y, z):
+        """ (Molecule) -> NoneType
+    
+    Move the nth atom to position x, y, z
+    """
+
+        self.atoms[n].x(x)
+        self.atoms[n].y(y)
+        self.atoms[n].z(z)
+
+    def setGeometry(self, cartCoordinates):
+        """ (Molecule) -> NoneType
+
+    Move all atoms in the molecule to give the geometry defined by the input coordinates
+    """
+        n = int(len(self.atoms))
+        # Print number of atoms
+        # print(str(n))
+        if len(cartCoordinates) != 3 * n:
+            ProgramWarning()
+            print("Cannot update geometry of " + str(self.name) + ", supplied coordinates do not match number of atoms")
+        else:
+            for i in range(n):
+                self.movatom(i, cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2])
+
+    def atmmass(self, n, m):
+        """ (Molecule) -> NoneType
+    
+    Change the mass of the nth atom to m
+    """
+
+        self.atoms[n].mass = m
+
+    def atmatmdist(self, i, j):
+        """ (Molecule) -> number
+    
+    Report the distance between atoms i and j
+    """
+
+        distance = (self.atoms[i].coord[0] - self.atoms[j].coord[0]) * (self.atoms[i].coord[0] - self.atoms[j].coord[0])
+        distance = distance + (self.atoms[i].coord[1] - self.atoms[j].coord[1]) * (
+            self.atoms[i].coord[1] - self.atoms[j].coord[1])
+        distance = distance + (self.atoms[i].coord[2] - self.atoms[j].coord[2]) * (
+            self.atoms[i].coord[2] - self.atoms[j].coord[2])
+
+        return math.sqrt(distance)
+
+    def bondangle(self, i):
+        """ (Molecule) -> number (in radians)
+
+    Report the angle described by three atoms in the bonds list
+    """
+
+        # Calculate the distance between each pair of atoms
+        angle = self.angles[i]
+        d_bond_1 = self.atmatmdist(angle[0], angle[1])
+        d_bond_2 = self.atmatmdist(angle[1], angle[2])
+        d_non_bond = self.atmatmdist(angle[0], angle[2])
+
+        # Use those distances and the cosine rule to calculate bond angle theta
+        numerator = d_bond_1 ** 2 + d_bond_2 ** 2 - d_non_bond ** 2
+        denominator = 2 * d_bond_1 * d_bond_2
+        argument = numerator / denominator
+        theta = np.arccos(argument)
+
+        return theta
+
+    def anybondangle(self, i, j, k):
+        """ (Molecule) -> number (in radians)
+
+    Report the angle described by three atoms i, j and k
+    """
+
+        # Calculate the distance between each pair of atoms
+        d_bond_1 = self.atmatmdist(i, j)
+        d_bond_2 = self.atmatmdist(j, k)
+        d_non_bond = self.atmatmdist(i, k)
+
+        # Use those distances and the cosine rule to calculate bond angle theta
+        numerator = d_bond_1 ** 2 + d_bond_2 ** 2 - d_non_bond ** 2
+        denominator = 2 * d_bond_1 * d_bond_2
+        argument = numerator / denominator
+        theta = np.arccos(argument)
+
+        return theta
+
+    def dihedralangle(self, i):
+        """ (Molecule) -> number (in radians)
+
+    Report the dihedral angle described by a set of four atoms in the dihedrals list
+    """
+
+        # Calculate the vectors lying along bonds, and their cross products
+        dihedral = self.dihedrals[i]
+        atom_e1 = self.atoms[dihedral[0]]
+        atom_b1 = self.atoms[dihedral[1]]
+        atom_b2 = self.atoms[dihedral[2]]
+        atom_e2 = self.atoms[dihedral[3]]
+        end_1 = [atom_e1.coord[i] - atom_b1.coord[i] for i in range(3)]
+        bridge = [atom_b1.coord[i] - atom_b2.coord[i] for i in range(3)]
+        end_2 = [atom_b2.coord[i] - atom_e2.coord[i] for i in range(3)]
+        vnormal_1 = np.cross(end_1, bridge)
+        vnormal_2 = np.cross(bridge, end_2)
+
+        # Construct a set of orthogonal basis vectors to define a frame with vnormal_2 as the x axis
+        vcross = np.cross(vnormal_2, bridge)
+        norm_vn2 = np.linalg.norm(vnormal_2)
+        norm_b = np.linalg.norm(bridge)
+        norm_vc = np.linalg.norm(vcross)
+        basis_vn2 = [vnormal_2[i] / norm_vn2 for i in range(3)]
+        basis_b = [bridge[i] / norm_b for i in range(3)]
+        basis_cv = [vcross[i] / norm_vc for i in range(3)]
+
+        # Find the signed angle between vnormal_1 and vnormal_2 in the new frame
+        vn1_coord_n2 = np.dot(vnormal_1, basis_vn2)
+        vn1_coord_vc = np.dot(vnormal_1, basis_cv)
+        psi = math.atan2(vn1_coord_vc, vn1_coord_n2)
+
+        return psi
+
+    def anydihedralangle(self, i, j, k, l):
+        """ (Molecule) -> number (in radians)
+
+    Report the dihedral angle described by a set of four atoms i, j, k and l
+    """
+
+        # Calculate the vectors lying along bonds, and their cross products
+        atom_e1 = self.atoms[i]
+        atom_b1 = self.atoms[j]
+        atom_b2 = self.atoms[k]
+        atom_e2 = self.atoms[l]
+        end_1 = [atom_e1.coord[i] - atom_b1.coord[i] for i in range(3)]
+        bridge = [atom_b1.coord[i] - atom_b2.coord[i] for i in range(3)]
+        end_2 = [atom_b2.coord[i] - atom_e2.coord[i] for i in range(3)]
+        vnormal_1 = np.cross(end_1, bridge)
+        vnormal_2 = np.cross(bridge, end_2)
+
+        # Construct a set of orthogonal basis vectors to define a frame with vnormal_2 as the x axis
+        vcross = np.cross(vnormal_2, bridge)
+        norm_vn2 = np.linalg.norm(vnormal_2)
+        norm_b = np.linalg.norm(bridge)
+        norm_vc = np.linalg.norm(vcross)
+        basis_vn2 = [vnormal_2[i] / norm_vn2 for i in range(3)]
+        basis_b = [bridge[i] / norm_b for i in range(3)]
+        basis_cv = [vcross[i] / norm_vc for i in range(3)]
+
+        # Find the signed angle between vnormal_1 and vnormal_2 in the new frame
+        vn1_coord_n2 = np.dot(vnormal_1, basis_vn2)
+        vn1_coord_vc = np.dot(vnormal_1, basis_cv)
+        psi = math.atan2(vn1_coord_vc, vn1_coord_n2)
+
+        return psi
+
+    def rotateMoleculeArbAxis(self, v1=[0.0, 0.0, 0.0], v2=[0.0, 0.0, 1.0], angle=90.0):
+        """ (Molecule) -> none
+
+    Rotate all atoms of a molecule around axis defined by v1 and v2 by angle (in degrees)
+    """
+        # Translate v2 into coordinate origin
+        self.translateMolecule(-v2[0], -v2[1], -v2[2])
+
+        u = v1[0] - v2[0]
+        v = v1[1] - v2[1]
+        w = v1[2] - v2[2]
+        L = (u ** 2) + (v ** 2) + (w ** 2)
+        pi = np.radians(angle)
+
+        RotMatrix = []
+        Rxx = (u ** 2 + (v ** 2 + w ** 2) * np.cos(pi)) / L
+        Rxy = ((u * v) * (1 - np.cos(pi)) - w * np.sqrt(L) * np.sin(pi)) / L
+        Rxz = ((u * w) * (1 - np.cos(pi)) + v * np.sqrt(L) * np.sin(pi)) / L
+        # Rxt = (()*(1-np.cos(pi))+())/L
+
+        Ryx = ((u * v) * (1 - np.cos(pi)) + w * np.sqrt(L) * np.sin(pi)) / L
+        Ryy = (v ** 2 + (u ** 2 + w ** 2) * np.cos(pi)) / L
+        Ryz = ((v * w) * (1 - np.cos(pi)) - u * np.sqrt(L) * np.sin(pi)) / L
+        # Ryt = 0.0
+
+        Rzx = ((u * w) * (1 - np.cos(pi)) - v * np.sqrt(L) * np.sin(pi)) / L
+        Rzy = ((v * w) * (1 - np.cos(pi)) + u * np.sqrt(L) * np.sin(pi)) / L
+        Rzz = (w ** 2 + (u ** 2 + v ** 2) * np.cos(pi)) / L
+        # Rzt = 0.0
+
+        # Rtx = 0.0
+        # Rty = 0.0
+        # Rtz = 0.0
+        # Rtt = 1.0
+
+        RotMatrix.append([Rxx, Rxy, Rxz])
+        RotMatrix.append([Ryx, Ryy, Ryz])
+        RotMatrix.append([Rzx, Rzy, Rzz])
+        # RotMatrix.append([Rtx, Rty, Rtz, Rtt])
+        RotMatrix = np.matrix(RotMatrix)
+
+        for i in self.atoms:
+            vector = [i.coord[0], i.coord[1], i.coord[2]]
+            vector = np.matrix(vector)
+            vector = RotMatrix.dot(np.matrix.transpose(vector))
+            vector = np.array(vector).flatten().tolist()
+            i.coord[0] = vector[0]
+            i.coord[1] = vector[1]
+            i.coord[2] = vector[2]
+
+        # Undo: Translate v2 out of coordinate origin
+        self.translateMolecule(v2[0], v2[1], v2[2])
+
+        return
+
+    def rotateMolecule(self, axis="z", angle=90.0):
+        """ (Molecule) -> none
+
+    Rotate all atoms of a molecule around specified coordinate axis
+    """
+        # First, convert angle to radians
+        angle = np.radians(angle)
+        if axis == "x":
+            # Setup Matrix for rotation around x axis
+            RotMatrix = []
+            Rxx = 1.0
+            Rxy = 0.0
+            Rxz = 0.0
+            Ryx = 0.0
+            Ryy = np.cos(angle)
+            Ryz = -np.sin(angle)
+            Rzx = 0.0
+            Rzy = np.sin(angle)
+            Rzz = np.cos(angle)
+            RotMatrix.append([Rxx, Rxy, Rxz])
+            RotMatrix.append([Ryx, Ryy, Ryz])
+            RotMatrix.append([Rzx, Rzy, Rzz])
+            RotMatrix = np.matrix(RotMatrix)
+        elif axis == "y":
+            # Setup Matrix for rotation around y axis
+            RotMatrix = []
+            Rxx = np.cos(angle)
+            Rxy = 0.0
+            Rxz = np.sin(angle)
+            Ryx = 0.0
+            Ryy = 1.0
+            Ryz = 0.0
+            Rzx = -np.sin(angle)
+            Rzy = 0.0
+            Rzz = np.cos(angle)
+            RotMatrix.append([Rxx, Rxy, Rxz])
+            RotMatrix.append([Ryx, Ryy, Ryz])
+            RotMatrix.append([Rzx, Rzy, Rzz])
+            RotMatrix = np.matrix(RotMatrix)
+        else:
+            # Default: Setup Matrix for rotation around z axis
+            RotMatrix = []
+            Rxx = np.cos(angle)
+            Rxy = -np.sin(angle)
+            Rxz = 0.0
+            Ryx = np.sin(angle)
+            Ryy = np.cos(angle)
+            Ryz = 0.0
+            Rzx = 0.0
+            Rzy = 0.0
+            Rzz = 1.0
+            RotMatrix.append([Rxx, Rxy, Rxz])
+            RotMatrix.append([Ryx, Ryy, Ryz])
+            RotMatrix.append([Rzx, Rzy, Rzz])
+            RotMatrix = np.matrix(RotMatrix)
+        # Apply the rotation matrix to all atoms
+        for i in self.atoms:
+            vector = [i.coord[0], i.coord[1], i.coord[2]]
+            vector = np.matrix(vector)
+            vector = RotMatrix.dot(np.matrix.transpose(vector))
+            vector = np.array(vector).flatten().tolist()
+            i.coord[0] = vector[0]
+            i.coord[1] = vector[1]
+            i.coord[2] = vector[2]
+
+        return
+
+    def translateMolecule(self, x, y, z):
+        """ (Molecule) -> none
+
+    Translate all atoms of a molecule along the three axes
+    """
+        for i in self.atoms:
+            i.coord[0] = i.coord[0] + x
+            i.coord[1] = i.coord[1] + y
+            i.coord[2] = i.coord[2] + z
+
+        return
+
+    def outofplaneangle(self, i):
+        """ (Molecule) -> number (in radians)
+
+    Report the out of plane angle described by a set of four atoms in the inv list
+    """
+
+        # Calculate the vectors along bonds, and construct a vector plane_norm orthogonal to the plane of end atoms
+        threefold = self.threefolds[i]
+        atom_c = self.atoms[threefold[0]]
+        atom_e1 = self.atoms[threefold[1]]
+        atom_e2 = self.atoms[threefold[2]]
+        atom_e3 = self.atoms[threefold[3]]
+        bond_1 = [atom_e1.coord[i] - atom_c.coord[i] for i in range(3)]
+        bond_2 = [atom_e2.coord[i] - atom_c.coord[i] for i in range(3)]
+        bond_3 = [atom_e3.coord[i] - atom_c.coord[i] for i in range(3)]
+        inplane_12 = [atom_e2.coord[i] - atom_e1.coord[i] for i in range(3)]
+        inplane_13 = [atom_e3.coord[i] - atom_e1.coord[i] for i in range(3)]
+        plane_norm = np.cross(inplane_12, inplane_13)
+
+        # Construct vectors between end atoms and the projection of the central atom on the end-atom plane
+        cross_1 = np.cross(bond_1, plane_norm)
+        cross_2 = np.cross(bond_2, plane_norm)
+        cross_3 = np.cross(bond_3, plane_norm)
+        inplane_1 = np.cross(plane_norm, cross_1) / np.dot(plane_norm, plane_norm)
+        inplane_2 = np.cross(plane_norm, cross_2) / np.dot(plane_norm, plane_norm)
+        inplane_3 = np.cross(plane_norm, cross_3) / np.dot(plane_norm, plane_norm)
+
+        # Calculate the out of plane angle for each of the three bonds
+        cos_phi1 = np.dot(bond_1, inplane_1) / (np.linalg.norm(bond_1) * np.linalg.norm(inplane_1))
+        cos_phi2 = np.dot(bond_2, inplane_2) / (np.linalg.norm(bond_2) * np.linalg.norm(inplane_2))
+        cos_phi3 = np.dot(bond_3, inplane_3) / (np.linalg.norm(bond_3) * np.linalg.norm(inplane_3))
+
+        if (1.0 - (10 ** -15)) <= cos_phi1 and cos_phi1 <= (1.0 + (10 ** -15)):
+            phi1 = 0.0
+        else:
+            phi1 = np.arccos(cos_phi1)
+        if (1.0 - (10 ** -15)) <= cos_phi2 and cos_phi2 <= (1.0 + (10 ** -15)):
+            phi2 = 0.0
+        else:
+            phi2 = np.arccos(cos_phi2)
+        if (1.0 - (10 ** -15)) <= cos_phi3 and cos_phi3 <= (1.0 + (10 ** -15)):
+            phi3 = 0.0
+        else:
+            phi3 = np.arccos(cos_phi3)
+
+        # Take the numerical average of the three out of plane angles
+        # Note - other schemes for obtaining a single out of plane angle could be investigated
+        phi = (phi1 + phi2 + phi3) / 3
+
+        return phi
+
+    def orient(self):
+        """ (Molecule) -> NoneType
+    
+    Translate centre of mass to coordinate origin and
+    (re-)Orient the molecule along the principal axes of inertia.
+    """
+
+        # The molecular center of mass
+        xValue = 0.0
+        yValue = 0.0
+        zValue = 0.0
+        for i in self.atoms:
+            xValue = xValue + (i.mass * i.coord[0])
+            yValue = yValue + (i.mass * i.coord[1])
+            zValue = zValue + (i.mass * i.coord[2])
+        xValue = xValue / (self.mass())
+        yValue = yValue / (self.mass())
+        zValue = zValue / (self.mass())
+
+        # Translate whole molecule into the center of mass reference frame
+        for i in self.atoms:
+            i.coord[0] = i.coord[0] - xValue
+            i.coord[1] = i.coord[1] - yValue
+            i.coord[2] = i.coord[2] - zValue
+
+        # Build inertia tensor
+        inertiaTensor = []
+        Ixx = 0.0
+        Ixy = 0.0
+        Ixz = 0.0
+        Iyx = 0.0
+        Iyy = 0.0
+        Iyz = 0.0
+        Izx = 0.0
+        Izy = 0.0
+        Izz = 0.0
+        for i in self.atoms:
+            Ixx = Ixx + (
+                i.mass * (
+                    (Ang2Bohr(i.coord[1]) * Ang2Bohr(i.coord[1])) + (Ang2Bohr(i.coord[2]) * Ang2Bohr(i.coord[2]))))
+            Ixy = Ixy - i.mass * Ang2Bohr(i.coord[0]) * Ang2Bohr(i.coord[1])
+            Ixz = Ixz - i.mass * Ang2Bohr(i.coord[0]) * Ang2Bohr(i.coord[2])
+            Iyx = Iyx - i.mass * Ang2Bohr(i.coord[1]) * Ang2Bohr(i.coord[0])
+            Iyy = Iyy + (
+                i.mass * (
+                    (Ang2Bohr(i.coord[0]) * Ang2Bohr(i.coord[0])) + (Ang2Bohr(i.coord[2]) * Ang2Bohr(i.coord[2]))))
+            Iyz = Iyz - i.mass * Ang2Bohr(i.coord[1]) * Ang2Bohr(i.coord[2])
+            Izx = Izx - i.mass * Ang2Bohr(i.coord[2]) * Ang2Bohr(i.coord[0])
+            Izy = Izy - i.mass * Ang2Bohr(i.coord[2]) * Ang2Bohr(i.coord[1])
+            Izz = Izz + (
+                i.mass * (
+                    (Ang2Bohr(i.coord[0]) * Ang2Bohr(i.coord[0])) + (Ang2Bohr(i.coord[1]) * Ang2Bohr(i.coord[1]))))
+        inertiaTensor.append([Ixx, Ixy, Ixz])
+        inertiaTensor.append([Iyx, Iyy, Iyz])
+        inertiaTensor.append([Izx, Izy, Izz])
+        inertiaTensor = np.matrix(inertiaTensor)
+
+        # Diagonalise inertia tensor
+        inertiaMoments, inertialAxes = np.linalg.eig(inertiaTensor)
+
+        # Orthogonalise eigenvectors (only sometimes necessary)...
+        inertialAxes, r = np.linalg.qr(inertialAxes)
+
+        # Sort moments from highest to lowest
+        idx = inertiaMoments.argsort()[::-1]
+        inertiaMoments = inertiaMoments[idx]
+        inertialAxes = inertialAxes[:, idx]
+
+        # Transform molecular coordinates into new frame of principal axes of inertia
+        for i in self.atoms:
+            vector = [i.coord[0], i.coord[1], i.coord[2]]
+            vector = np.matrix(vector)
+            vector = np.matrix.transpose(inertialAxes).dot(np.matrix.transpose(vector))
+            vector = np.array(vector).flatten().tolist()
+            i.coord[0] = vector[0]
+            i.coord[1] = vector[1]
+            i.coord[2] = vector[2]
+
+    def addBond(self, a, b):
+        """ (Molecule) -> NoneType
+    
+    Adds a bond between atoms a and b to the list of bonds
+    """
+        # Make sure a < b
+        if a < b:
+            c = a
+            d = b
+        else:
+            c = b
+            d = a
+
+        # Check if the bond already exists
+        exists = False
+        for i in self.bonds:
+            if i == [c, d]:
+                exists = True
+
+        # Append bond to list if doesn't exist and is plausible
+        if exists == False and a >= 0 and b >= 0 and a <= len(self.atoms) and b <= len(self.atoms) and c != d:
+            self.bonds.append([c, d])
+            self.topodist = None
+            self.screening = None
+            self.pairparams = None
+
+    def setHessian(self, H):
+        """ (Molecule) -> NoneType
+
+    Set the Quantum Mechanically calculated Hessian, H_QM, equal to H
+    """
+        self.H_QM = H
+
+    def setQMenergy(self, E):
+        """ (Molecule) -> NoneType
+
+    Set the Quantum Mechanically calculated equilibrium energy, Ee_QM, equal to E
+    """
+        self.Ee_QM = E
+
+    def addFFStretch(self, a, b, r0, typ, arg):
+        """ (Molecule) -> NoneType
+
+    Adds a stretching potential between atoms a and b to the list of stretches
+    """
+        # Make sure a < b
+        if a < b:
+            c = a
+            d = b
+        else:
+            c = b
+            d = a
+
+        # Note: There's no check if the stretch already exists. Mainly because there's no reason not to have
+        # two different functions adding energy to the same "stretch"
+
+        # Append stretch to list if doesn't exist and is plausible
+        if a >= 0 and b >= 0 and a <= len(self.atoms) and b <= len(self.atoms) and c != d:
+            self.stretch.append(FFStretch(c, d, r0, typ, arg))
+            self.termtable = None
+            #    print("Adding FFStretch with bond " + str([a, b]) + " and fc = " + str(arg[0])) # REMOVE ONCE FIXED
+
+    def addFFStr13(self, a, b, r0, typ, arg):
+        """ (Molecule) -> NoneType
+
+    Adds a stretching potential between atoms a and b to the list of stretches
+    """
+        # Make sure a < b
+        if a < b:
+            c = a
+            d = b
+        else:
+            c = b
+            d = a
+
+        # Note: There's no check if the stretch already exists. Mainly because there's no reason not to have
+        # two different functions adding energy to the same "stretch"
+
+        # Append stretch to list if doesn't exist and is plausible
+        if a >= 0 and b >= 0 and a <= len(self.atoms) and b <= len(self.atoms) and c != d:
+            self.str13.append(FFStretch(c, d, r0, typ, arg))
+            self.termtable = None
+            #    print("Adding FFStretch with bond " + str([a, b]) + " and fc = " + str(arg[0])) # REMOVE ONCE FIXED
+
+    def delBond(self, a, b):
+        """ (Molecule) -> NoneType
+    
+    Deletes the bond between atoms a and b from the list of bonds
+    """
+        # Make sure a < b
+        if a < b:
+            c = a
+            d = b
+        else:
+            c = b
+            d = a
+
+        # Check if the bond actually exists
+        exists = False
+        for i in self.bonds:
+            if i == [c, d]:
+                exists = True
+
+        # Remove if it does
+        if exists == True:
+            self.bonds.remove([c, d])
+            self.topodist = None
+            self.screening = None
+            self.pairparams = None
+
+    def addAngle(self, a, b, c):
+        """ (Molecule) -> NoneType
+    
+    Adds an angle between atoms a, b and c to the list of angles
+    """
+
+        # Check if the angle already exists
+        exists = False
+        for i in self.angles:
+            if i == [a, b, c]:
+                exists = True
+
+        # Append angle to list if doesn't exist and is plausible
+        # (it's a bit unsatisfactory, but I don't think there are
+        # better sanity checks)
+        if exists == False and a >= 0 and b >= 0 and c >= 0 and a <= len(self.atoms) and b <= len(
+                self.atoms) and c <= len(self.atoms) and a != b and a != c and b != c:
+            self.angles.append([a, b, c])
+
+    def addFFBend(self, a, b, c, a0, typ, arg):
+        """ (Molecule) -> NoneType
+
+    Adds an angle bend potential between atoms a, b and c to the list of angle bends.
+    """
+
+        # Note: There's no check if the bend already exists. Mainly because there's no reason not to have
+        # two different functions adding energy to the same "bend"
+
+        # Append bend to list if doesn't exist and is plausible
+        # (it's a bit unsatisfactory, but I don't think there are
+        # better sanity checks)
+        if a >= 0 and b >= 0 and c >= 0 and a <= len(self.atoms) and b <= len(self.atoms) and c <= len(
+                self.atoms) and a != b and a != c and b != c:
+            self.bend.append(FFBend(a, b, c, a0, typ, arg))
+            self.termtable = None
+
+    def addDihedral(self, a, b, c, d):
+        """ (Molecule) -> NoneType
+    
+    Adds a dihedral between atoms a, b, c and d to the list of dihedrals
+    """
+
+        # Check if the dihedral already exists
+        exists = False
+        for i in self.dihedrals:
+            if i == [a, b, c, d]:
+                exists = True
+
+        # Append dihedral to list if doesn't exist and is plausible
+        # (it's a bit unsatisfactory, but I don't think there are
+        # better sanity checks)
+        if exists == False and a >= 0 and b >= 0 and c >= 0 and d >= 0 and a <= len(self.atoms) and b <= len(
+                self.atoms) and c <= len(self.atoms) and d <= len(
+            self.atoms) and a != b and a != c and a != d and b != c and b != d and c != d:
+            self.dihedrals.append([a, b, c, d])
+
+    def addFFTorsion(self, a, b, c, d, theta0, typ, arg):
+        """ (Molecule) -> NoneType
+
+    Adds a dihedral torsion potential between atoms a, b, c and d to the list of dihedral torsions.
+    """
+
+        # Note: There's no check if the bend already exists. Mainly because there's no reason not to have
+        # two different functions adding energy to the same "torsion"
+
+        # Append torsion to list if doesn't exist and is plausible
+        # (it's a bit unsatisfactory, but I don't think there are
+        # better sanity checks)
+        if a >= 0 and b >= 0 and c >= 0 and d >= 0 and a <= len(self.atoms) and b <= len(self.atoms) and c <= len(
+                self.atoms) and d <= len(self.atoms) and a != b and a != c and a != d and b != c and b != d and c != d:
+            self.tors.append(FFTorsion(a, b, c, d, theta0, typ, arg))
+            self.termtable = None
+
+    def addThreefold(self, a, b, c, d):
+        """ (Molecule) -> NoneType
+
+    Adds the atom a and its bonding partners b, c and d to the list of 3-fold coordinated atom groups
+    """
+
+        # Check if these atoms are already in the list inv
+        exists = False
+        for i in self.threefolds:
+            if i == [a, b, c, d]:
+                exists = True
+
+        # Append this three-fold coordinated group to list if it doesn't exist and is plausible
+        # Check currently based upon those for angles and dihedrals, for lack of a better alternative
+        if exists == False and a >= 0 and b >= 0 and c >= 0 and d >= 0 and a <= len(self.atoms) and b <= len(
+                self.atoms) and c <= len(self.atoms) and d <= len(
+            self.atoms) and a != b and a != c and a != d and b != c and b != d and c != d:
+            self.threefolds.append([a, b, c, d])
+
+    def addFFInversion(self, a, b, c, d, phi0, typ, arg):
+        """ (Molecule) -> NoneType
+
+    Adds an out-of-plane inversion type potential between atoms a, b, c and d to the list of inversion
+    """
+
+        # Note: As for other potentials, no check to see if this inversion exists already since there's no
+        # reason not to allow two different functions to contribute energy to the same 'inversion'
+
+        # Append inversion to list if it doesn't exist and is plausible
+        if a >= 0 and b >= 0 and c >= 0 and d >= 0 and a <= len(self.atoms) and b <= len(self.atoms) and c <= len(
+                self.atoms) and d <= len(self.atoms) and a != b and a != c and a != d and b != c and b != d and c != d:
+            self.inv.append(FFInversion(a, b, c, d, phi0, typ, arg))
+            self.termtable = None
+
+    def addFFHBond(self, a, b, c, theta, typ, arg):
+        """ (Molecule) -> NoneType
+
+    Adds a hydrogen bonding interaction potential between donor/acceptor atoms a and c and hydrogen atom b to the list of hbonds
+    """
+
+        # Note: No check to see if this interaction exists already, consistent with the treatment of other potentials
+
+        # Append new hydrogen bonding interaction to the list if it's plausible
+        # Where plausibility is checked by distinct atoms only
+        # (Checks for distance over which hydrogen bonds could exist and the electronegativity of atoms involved could be added, but will be used to identify interactions to add in any case)
+        if a >= 0 and b >= 0 and c >= 0 and a <= len(self.atoms) and b <= len(self.atoms) and c <= len(
+                self.atoms) and a != b and a != c and b != c:
+            self.hbonds.append(FFHBond(a, b, c, theta, typ, arg))
+
+    def addHAtom(self, a):
+        """ (Molecule) -> NoneType
+
+    Adds the atom a to the list of hydrogen atoms present in the molecule
+    """
+
+        # Note currently no check for whether this atom is already in the list
+        # May be worth implementing such a check. Could also check atomic symbol, though that will be done before calling this method
+        if a >= 0 and a <= len(self.atoms):
+            self.hatoms.append(a)
+
+    def addhighENatom(self, a):
+        """ (Molecule) -> NoneType
+
+    Adds the atom a to the list of atoms sufficiently electronegative to be involved in hydrogen bonding
+    """
+
+        # Note currently no check for whether the atom is already in the list
+        # As with list of hydrogens, could implement atomic symbol check for extra care
+        if a >= 0 and a <= len(self.atoms):
+            self.highENatoms.append(a)
+
+    def addXatom(self, a):
+        """ (Molecule) -> NoneType
+
+    Adds the atom a to the list of halogens present in the molecule
+    """
+
+        # Currently no check to see if this atom already belongs to the list
+        # Also no check on atomic symbol at present, but one could be implemented
+        if a >= 0 and a <= len(self.atoms):
+            self.halogens.append(a)
+
+    def ringcheckbd(self, checkbond):
+        """ (Molecule) -> Boolean
+
+        Checks whether or not the bond a forms part of a ring
+        """
+        
+        bond1 = self.bonds[checkbond]
+        a = bond1[0]
+        b = bond1[1]
+        print("\nChecking bond " + str(bond1))
+        inring = False
+        terminalbd = False 
+        ringsize  = 0
+        bonds_a = []
+        bonds_b = []
+        # Find bonds from atom a to any other atom, and from atom b to any other atom
+        # NOTE: A single loop, and a single list, expanding outwards could be used to cover rings of arbitary size provided a suitable break condition to stop the loop when all bonds have been checked is found. 
+        # For now, rings up to 8 atoms are covered manually to allow testing
+        for bond in self.bonds:
+            if not bond == bond1:
+                if bond[0] == a:
+                    bonds_a.append(bond)
+                elif bond[1] == a:
+                    bonds_a.append([bond[1], bond[0]])
+                elif bond[0] == b:
+                    bonds_b.append(bond)
+                elif bond[1] == b:
+                    bonds_b.append([bond[1], bond[0]])
+            # Check whether there is a common third atom bonded to both a and b, stopping if one such atom is found 
+        #print("Bonds from atom " + str(a) +": " + str(bonds_a)) # REMOVE ONCE FIXED
+        #print("Bonds from atom " + str(b) +": " + str(bonds_b)) # REMOVE ONCE FIXED
+        if not bonds_a or not bonds_b:
+            terminalbd = True
+            print("Bond is in a terminal position in the molecule")
+        else:
+            for bd_a in bonds_a:
+                for bd_b in bonds_b:
+                    if bd_a[1] == bd_b[1]:
+                        inring = True
+                        ringsize = 3
+                        break 
+                if inring:
+                    break
+        # If not, find all bonds 1 bond away from each of atom a and atom b
+        if not inring and not terminalbd:
+            bonds_a1 = []
+            bonds_b1 = []
+            for bond in self.bonds:
+                for bd_a in bonds_a:
+                    if bd_a[1] == bond[0] and bd_a[0] != bond[1]:
+                        bonds_a1.append(bond)
+                    elif bd_a[1] == bond[1] and bd_a[0] != bond[0]:
+                        bonds_a1.append([bond[1], bond[0]])
+                for bd_b in bonds_b:
+                    if bd_b[1] == bond[0] and bd_b[0] != bond[1]:
+                        bonds_b1.append(bond)
+                    elif bd_b[1] == bond[1] and bd_b[0] != bond[0]:
+                        bonds_b1.append([bond[1], bond[0]])
+            # Then check whether there is one of those bonds in common to both a and b, ending the loop if so
+            #print("Bonds one bond away from atom " + str(a) +": " + str(bonds_a1)) # REMOVE ONCE FIXED
+            #print("Bonds one bond away from atom " + str(b) +": " + str(bonds_b1)) # REMOVE ONCE FIXED
+            for bd_a1 in bonds_a1:
+                for bd_b1 in bonds_b1:
+                    if bd_a1[0] == bd_b1[1]:
+                        inring = True
+                        ringsize = 4
+                        break
+                    elif bd_a1[1] == bd_b1[1]:
+                        inring = True
+                        ringsize = 5
+                        break
+                if inring:
+                    break
+        # If not, find all bonds 2 away from each of atom a and b 
+        if not inring and not terminalbd:
+            bonds_a2 = []
+            bonds_b2 = []
+            for bond in self.bonds:
+                for bd_a1 in bonds_a1:
+                    if bd_a1[1] == bond[0] and bd_a1[0] != bond[1]:
+                        bonds_a2.append(bond)
+                    elif bd_a1[1] == bond[1] and bd_a1[0] != bond[0]:
+                        bonds_a2.append([bond[1], bond[0]])
+                for bd_b1 in bonds_b1:
+                    if bd_b1[1] == bond[0] and bd_b1[0] != bond[1]:
+                        bonds_b2.append(bond)
+                    elif bd_b1[1] == bond[1] and bd_b1[0] != bond[0]:
+                        bonds_b2.append([bond[1], bond[0]])
+                        # Then check whether there is one of those bonds in common to both a and b, ending the loop if so
+            #print("Bonds two bonds away from atom " + str(a) +": " + str(bonds_a2)) # REMOVE ONCE FIXED
+            #print("Bonds two bonds away from atom " + str(b) +": " + str(bonds_b2)) # REMOVE ONCE FIXED
+            for bd_a2 in bonds_a2:
+                for bd_b2 in bonds_b2:
+                    if bd_a2[0] == bd_b2[1]:
+                        inring = True
+                        ringsize = 6
+                        break
+                    elif bd_a2[1] == bd_b2[1]:
+                        inring == True
+                        ringsize = 7
+                if inring:
+                    break
+        # If not, find all bonds 3 away from each of atom a and b 
+        if not inring and not terminalbd:
+            bonds_a3 = []
+            bonds_b3 = []
+            for bond in self.bonds:
+                for bd_a2 in bonds_a2:
+                    if bd_a2[1] == bond[0] and bd_a2[0] != bond[1]:
+                        bonds_a3.append(bond)
+                    elif bd_a2[1] == bond[1] and bd_a2[0] != bond[0]:
+                        bonds_a3.append([bond[1], bond[0]])
+                for bd_b2 in bonds_b2:
+                    if bd_b2[1] == bond[0] and bd_b2[0] != bond[1]:
+                        bonds_b3.append(bond)
+                    elif bd_b2[1] == bond[1] and bd_b2[0] != bond[0]:
+                        bonds_b3.append([bond[1], bond[0]])
+                        # Then check whether there is one of those bonds in common to both a and b, ending the loop if so
+            #print("Bonds three bonds away from atom " + str(a) +": " + str(bonds_a3)) # REMOVE ONCE FIXED
+            #print("Bonds three bonds away from atom " + str(b) +": " + str(bonds_b3)) # REMOVE ONCE FIXED
+            for bd_a3 in bonds_a3:
+                for bd_b3 in bonds_b3:
+                    if bd_a3[0] == bd_b3[1]:
+                        inring = True
+                        ringsize = 8
+                        break
+                    elif bd_a3[1] == bd_b3[1]:
+                        inring = True
+                        ringsize = 9
+                        break
+                if inring:
+                    break
+        # If not, find all bonds 4 away from each of atom a and b 
+        if not inring and not terminalbd:
+            bonds_a4 = []
+            bonds_b4 = []
+            for bond in self.bonds:
+                for bd_a3 in bonds_a3:
+                    if bd_a3[1] == bond[0] and bd_a3[0] != bond[1]:
+                        bonds_a4.append(bond)
+                    elif bd_a3[1] == bond[1] and bd_a3[0] != bond[0]:
+                        bonds_a4.append([bond[1], bond[0]])
+                for bd_b3 in bonds_b3:
+                    if bd_b3[1] == bond[0] and bd_b3[0] != bond[1]:
+                        bonds_b4.append(bond)
+                    elif bd_b3[1] == bond[1] and bd_b3[0] != bond[0]:
+                        bonds_b4.append([bond[1], bond[0]])
+                        # Then check whether there is one of those bonds in common to both a and b, ending the loop if so
+            #print("Bonds four bonds away from atom " + str(a) +": " + str(bonds_a4)) # REMOVE ONCE FIXED
+            #print("Bonds four bonds away from atom " + str(b) +": " + str(bonds_b4)) # REMOVE ONCE FIXED
+            for bd_a4 in bonds_a4:
+                for bd_b4 in bonds_b4:
+                    if bd_a4[0] == bd_b4[1]:
+                        inring = True
+                        ringsize = 10
+                        break
+                    elif bd_a4[1] == bd_b4[1]:
+                        inring = True
+                        ringsize = 11
+                        break
+                if inring:
+                    break
+        # If not, find all bonds 5 away from each of atom a and b 
+        if not inring and not terminalbd:
+            bonds_a5 = []
+            bonds_b5 = []
+            for bond in self.bonds:
+                for bd_a4 in bonds_a4:
+                    if bd_a4[1] == bond[0] and bd_a4[0] != bond[1]:
+                        bonds_a5.append(bond)
+                    elif bd_a4[1] == bond[1] and bd_a4[0] != bond[0]:
+                        bonds_a5.append([bond[1], bond[0]])
+                for bd_b4 in bonds_b4:
+                    if bd_b4[1] == bond[0] and bd_b4[0] != bond[1]:
+                        bonds_b5.append(bond)
+                    elif bd_b4[1] == bond[1] and bd_b4[0] != bond[0]:
+                        bonds_b5.append([bond[1], bond[0]])
+                        # Then check whether there is one of those bonds in common to both a and b, ending the loop if so
+            #print("Bonds five bonds away from atom " + str(a) +": " + str(bonds_a5)) # REMOVE ONCE FIXED
+            #print("Bonds five bonds away from atom " + str(b) +": " + str(bonds_b5)) # REMOVE ONCE FIXED
+            for bd_a5 in bonds_a5:
+                for bd_b5 in bonds_b5:
+                    if bd_a5[0] == bd_b5[1]:
+                        inring = True
+                        ringsize = 12
+                        break
+                    elif bd_a5[1] == bd_b5[1]:
+                        inring = True
+                        ringsize = 13
+                        break
+
+        if not inring and not terminalbd:
+            if not bonds_a5 and not bonds_b5:
+                pass 
+            else:
+                print("Search for rings stopped at ring size 13")
+
+        print("Bond {0} in ring? {1}".format(checkbond, inring))
+        if inring:
+            print("Size of ring: " + str(ringsize))
+
+        return inring        
+
+    def ringcheckatm(self, checkatom):
+        """ (Molecule) -> Bool
+
+        Checks whether or not the atom given forms part of a ring, by checking bonds in which it is contained
+        """
+
+        # Construct a list of bonds containing the atom in question
+        a = checkatom
+        atmbonds = []
+        for i in range(len(self.bonds)):
+            if a == self.bonds[i][0] or a == self.bonds[i][1]:
+                atmbonds.append(i)
+
+        #print("\n----------------------------------------")
+        #print("Checking whether atom {0} is in a ring".format(a))
+
+        atminring = False        
+        # Check whether any of those bonds are contained in a ring
+        for atmbd in atmbonds:
+            bdinring = self.ringcheckbd(atmbd)
+            if bdinring:
+                atminring = True
+
+        #print("Atom {0} in ring? {1}\n".format(checkatom, atminring))
+
+        return atminring
+
+    def topologicalDistances(self):
+        """ (Molecule) -> array
+
+    Returns the NxN matrix of the number of bonds separating each pair of atoms, found by a breadth-first
+    search from every atom over the list of bonds. Atoms not connected by any path of bonds are given the
+    value Unconnected, which exceeds any number of bonds. The matrix is kept until the list of bonds (or atoms)
+    changes.
+    """
+
+        if self.topodist is None:
+            n = len(self.atoms)
+            neighbours = [[] for i in range(n)]
+            for bond in self.bonds:
+                neighbours[bond[0]].append(bond[1])
+                neighbours[bond[1]].append(bond[0])
+            topodist = np.full((n, n), Unconnected, dtype=int)
+            for start in range(n):
+                topodist[start, start] = 0
+                shell = [start]
+                nbonds = 0
+                while shell:
+                    nbonds += 1
+                    nextshell = []
+                    for a in shell:
+                        for b in neighbours[a]:
+                            if topodist[start, b] == Unconnected:
+                                topodist[start, b] = nbonds
+                                nextshell.append(b)
+                    shell = nextshell
+            self.topodist = topodist
+
+        return self.topodist
+
+    def screeningMatrices(self):
+        """ (Molecule) -> (array, array)
+
+    Returns NxN arrays holding the topological screening parameters rep_disp_AB and elstat_AB for all pairs of atoms,
+    derived from the topological distance matrix and kept until the list of bonds changes
+    """
+
+        if self.screening is None:
+            nbonds = self.topologicalDistances()
+            # Pauli repulsion and dispersion: off for 1,2 and 1,3 pairs, scaled for 1,4 and 1,5 pairs
+            rep_disp = np.where(nbonds <= 2, 0.0, np.where(nbonds <= 4, E_disp_rep, 1.0))
+            # Electrostatics: off for 1,2 and 1,3 pairs, scaled for 1,4 pairs
+            elstat = np.where(nbonds <= 2, 0.0, np.where(nbonds == 3, E_ES_14, 1.0))
+            self.screening = (rep_disp, elstat)
+
+        return self.screening
+
+    def pairParameters(self):
+        """ (Molecule) -> dict
+
+    Returns a dictionary of NxN arrays with the parameters of the non-bonded interactions for all pairs of atoms
+    that do not depend on the geometry: the products of the effective nuclear charges z_eff_AB, the cutoff radii
+    R0_AB with the exponents decay_AB of the Pauli repulsion, the dispersion coefficients C6_AB, the Becke-Johnson
+    damping radii BJdamp_AB and the screening parameters rep_disp and elstat. Kept until the atoms or bonds change.
+    """
+
+        if self.pairparams is None:
+            symbols = [atom.symbol for atom in self.atoms]
+            z_eff = np.array([SymbolToValenceE[sym] * k_z[sym] for sym in symbols])
+            vdw = np.array([SymbolToVdWRadius[sym] for sym in symbols])
+            c6 = np.array([C6[sym] for sym in symbols])
+            rep_disp, elstat = self.screeningMatrices()
+            # Combined the same way as in potPauliRep(), VdWCutoffRadius() and FFEnergy
+            R0_AB = (vdw[:, np.newaxis] + vdw) / 2
+            C6_AB = (c6[:, np.newaxis] + c6) / 2
+            self.pairparams = {"z_eff_AB": np.outer(z_eff, z_eff), "R0_AB": R0_AB,
+                               "decay_AB": beta_rep / (R0_AB ** (3 / 2)), "C6_AB": C6_AB,
+                               # As BJdamping() with dtyp=2, from C6_AB and its placeholder C8_AB = 1
+                               "BJdamp_AB": a1 * np.sqrt(C6_AB) + a2,
+                               "rep_disp": rep_disp, "elstat": elstat}
+
+        return self.pairparams
+
+    def pairListParameters(self, pair_i, pair_j):
+        """ (Molecule) -> dict
+
+    Returns the parameters of pairParameters() packed into arrays over the atom pairs (pair_i, pair_j).
+    They are kept as long as the same pairs are asked for, e.g. until the neighbour list is rebuilt.
+    """
+
+        params = self.pairParameters()
+        cached = self.pairlistparams
+        if (cached is None or cached[2] is not params or not np.array_equal(cached[0], pair_i)
+                or not np.array_equal(cached[1], pair_j)):
+            packed = {key: value[pair_i, pair_j] for key, value in params.items()}
+            self.pairlistparams = (np.array(pair_i), np.array(pair_j), params, packed)
+
+        return self.pairlistparams[3]
+
+    def screen_ES(self, a, b):
+        """ (Molecule) -> Number
+    
+    Returns the appropriate value of the topological screening parameter elstat_AB for atoms a and b
+    """
+
+        return self.screeningMatrices()[1][a, b]
+
+    def screen_RepDisp(self, a, b):
+        """ (Molecule) -> Number
+    
+    Returns the appropriate value of the topological screening parameter rep_disp_AB for atoms a and b
+    """
+
+        return self.screeningMatrices()[0][a, b]
+
+    def cartesianCoordinates(self):
+        """ (Molecule) ->
+
+    Returns a list containing the cartesian coordinates.
+    """
+
+        coord = []
+        for i in self.atoms:
+            coord.append(i.coord[0])
+            coord.append(i.coord[1])
+            coord.append(i.coord[2])
+
+        return coord
+
+    def xyzString(self):
+        """ (Molecule) -> str
+    
+    Returns a string containing an xyz file
+    """
+
+        s = str(self.numatoms()) + "\n" + self.name + "\n"
+        for i in self.atoms:
+            t = "{:<3} {: .8f} {: .8f} {: .8f}\n".format(i.symbol, i.coord[0], i.coord[1], i.coord[2])
+            s = s + t
+
+        return s
+
+    def gamessString(self):
+        """ (Molecule) -> str
+    
+      Returns a string containing cartesian coordinates in Gamess format
+    """
+
+        s = " $DATA\n" + self.name + "\nC1\n"
+        for i in self.atoms:
+            t = "{:<3} {:<3d} {: .8f} {: .8f} {: .8f}\n".format(i.symbol, i.charge, i.coord[0], i.coord[1], i.coord[2])
+            s = s + t
+        s = s + " $END\n"
+        return s
+
+    def gaussString(self):
+        """ (Molecule) -> str
+    
+      Returns a string containing cartesian coordinates in Gaussian format
+    """
+
+        s = "\n" + self.name + "\n\n" + str(self.charge) + " " + str(self.mult) + "\n"
+        for i in self.atoms:
+            t = "{:<3} {: .8f} {: .8f} {: .8f}\n".format(i.symbol, i.coord[0], i.coord[1], i.coord[2])
+            s = s + t
+        s = s + "\n"
+        return s
+
+    def gaussStringatX(self, cartCoordinates):
+        """ (Molecule) -> str
+
+    Returns a string in Gaussian format with the given cartesian coordinates for the molecule
+    """
+
+        s = "\n" + self.name + "\n\n" + str(self.charge) + " " + str(self.mult) + "\n"
+        for i in range(len(self.atoms)):
+            atm = self.atoms[i]
+            t = "{:<3} {: .8f} {: .8f} {: .8f}\n".format(atm.symbol, cartCoordinates[3 * i + 0],
+                                                         cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2])
+            s = s + t
+        s = s + "\n"
+        return s
+
+    def compileTermTable(self):
+        """ (Molecule) -> NoneType
+
+    Packs the bonded force field terms (stretches, 1,3-stretches, bends, torsions and inversions) into
+    NumPy index and parameter arrays, and switches FFEnergy to whole-array evaluation of those terms.
+    Adding terms discards the table (it is rebuilt on the next energy evaluation), but after changing
+    force constants with setk() the table needs to be compiled again.
+    """
+
+        self.termtable = {"stretch": packStretches(self.stretch), "str13": packStretches(self.str13),
+                          "bend": packBends(self.bend), "tors": packTorsions(self.tors),
+                          "inv": packInversions(self.inv)}
+        self.usetermtable = True
+
+    def enableProfiling(self, profiler=None):
+        """ (Molecule) -> FFProfiler
+
+    Starts recording call counts and wall times of the force field contributions in FFEnergy, FFEnergyGradient,
+    FFHessian and kdepHessianBasis, in profiler or in a new FFProfiler, which is returned
+    """
+
+        if profiler is None:
+            profiler = FFProfiler()
+        self.profiler = profiler
+
+        return profiler
+
+    def disableProfiling(self):
+        """ (Molecule) -> FFProfiler
+
+    Stops recording call counts and wall times, and returns the profiler that was in use (or None)
+    """
+
+        profiler = self.profiler
+        self.profiler = None
+
+        return profiler
+
+    def profileReport(self):
+        """ (Molecule) -> dict
+
+    Returns the report of the profiler attached with enableProfiling() (see FFProfiler.report()), or None
+    """
+
+        if self.profiler is None:
+            return None
+
+        return self.profiler.report()
+
+    def termTableEnergy(self, cartCoordinates, energy=0.0, verbosity=0):
+        """ (Molecule) -> number (Force Field energy)
+
+    Adds the energy of all bonded terms at the structure given by cartCoordinates to energy, evaluated
+    from the compiled term table. Reports the running total in the same way as FFEnergy.
+    """
+
+        if self.termtable is None:
+            self.compileTermTable()
+        X = np.asarray(cartCoordinates, dtype=float).reshape(-1, 3)
+        table = self.termtable
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark = time.perf_counter()
+
+        energy = energy + np.sum(stretchTableEnergies(termDistances(X, table["stretch"]["idx"]), table["stretch"]))
+        if profiler is not None:
+            profiler.lap("stretch")
+        if verbosity >= 1:
+            print(" + bond stretches                    = {:> 16.8f}".format(energy))
+        energy = energy + np.sum(stretchTableEnergies(termDistances(X, table["str13"]["idx"]), table["str13"]))
+        if profiler is not None:
+            profiler.lap("str13")
+        if verbosity >= 1:
+            print(" + 1,3-stretches                     = {:> 16.8f}".format(energy))
+        energy = energy + np.sum(bendTableEnergies(termAngles(X, table["bend"]["idx"]), table["bend"]))
+        if profiler is not None:
+            profiler.lap("bend")
+        if verbosity >= 1:
+            print(" + angle bends                       = {:> 16.8f}".format(energy))
+        energy = energy + np.sum(torsionTableEnergies(termDihedrals(X, table["tors"]["idx"]), table["tors"]))
+        if profiler is not None:
+            profiler.lap("tors")
+        if verbosity >= 1:
+            print(" + dihedral torsions                 = {:> 16.8f}".format(energy))
+        energy = energy + np.sum(inversionTableEnergies(termOutOfPlane(X, table["inv"]["idx"]), table["inv"]))
+        if profiler is not None:
+            profiler.lap("inv")
+        if verbosity >= 1:
+            print(" + inversions                        = {:> 16.8f}".format(energy))
+
+        return energy
+
+    def FFEnergy(self, cartCoordinates, verbosity=0, dtyp=1):
+        """ (Molecule) -> number (Force Field energy)
+
+      Returns a number containing the molecular energy according to the current Force Field definition at structure
+      specified by the provided cartesian coordinates.
+      Bonded terms are evaluated from the packed term table once compileTermTable() has been called.
+      The dispersion correction used is specified by dtyp, with 1 for C6-only calculating cutoff radius from van der Waals radii, 2 for full D3 using C6 and C8 coefficients
+    """
+
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start("FFEnergy")
+        energy = 0.0
+        if verbosity >= 1:
+            print("Initial energy for calculation       = {:> 16.8f}".format(energy))
+        energy = energy + self.Ee_QM
+        if verbosity >= 1:
+            print(" + QM energy (equilibrium structure) = {:> 16.8f}".format(energy))
+
+            #  if verbosity >= 1: # REMOVE ONCE FIXED
+            #    print("Omitting stretching energy") # REMOVE ONCE FIXED
+
+        if self.usetermtable:
+            # Bonded terms are evaluated with whole-array operations from the compiled term table
+            energy = self.termTableEnergy(cartCoordinates, energy, verbosity)
+        else:
+            for i in self.stretch:
+                distance = (cartCoordinates[3 * i.atom1] - cartCoordinates[3 * i.atom2]) ** 2
+                distance += (cartCoordinates[3 * i.atom1 + 1] - cartCoordinates[3 * i.atom2 + 1]) ** 2
+                distance += (cartCoordinates[3 * i.atom1 + 2] - cartCoordinates[3 * i.atom2 + 2]) ** 2
+                distance = math.sqrt(distance)
+                #      print("Adding energy for bond " + str([i.atom1, i.atom2]) + ", distance = " + str(distance) + " energy = " + str(i.energy(distance)) + " to total")
+                energy = energy + i.energy(distance)
+            if profiler is not None:
+                profiler.lap("stretch")
+            if verbosity >= 1:
+                print(" + bond stretches                    = {:> 16.8f}".format(energy))
+
+            for i in self.str13:
+                distance = (cartCoordinates[3 * i.atom1] - cartCoordinates[3 * i.atom2]) ** 2
+                distance += (cartCoordinates[3 * i.atom1 + 1] - cartCoordinates[3 * i.atom2 + 1]) ** 2
+                distance += (cartCoordinates[3 * i.atom1 + 2] - cartCoordinates[3 * i.atom2 + 2]) ** 2
+                distance = math.sqrt(distance)
+                energy = energy + i.energy(distance)
+            if profiler is not None:
+                profiler.lap("str13")
+            if verbosity >= 1:
+                print(" + 1,3-stretches                     = {:> 16.8f}".format(energy))
+
+            for i in self.bend:
+                d_bond_1 = (cartCoordinates[3 * i.atom1] - cartCoordinates[3 * i.atom2]) ** 2
+                d_bond_1 += (cartCoordinates[3 * i.atom1 + 1] - cartCoordinates[3 * i.atom2 + 1]) ** 2
+                d_bond_1 += (cartCoordinates[3 * i.atom1 + 2] - cartCoordinates[3 * i.atom2 + 2]) ** 2
+                d_bond_1 = math.sqrt(d_bond_1)
+
+                d_bond_2 = (cartCoordinates[3 * i.atom2] - cartCoordinates[3 * i.atom3]) ** 2
+                d_bond_2 += (cartCoordinates[3 * i.atom2 + 1] - cartCoordinates[3 * i.atom3 + 1]) ** 2
+                d_bond_2 += (cartCoordinates[3 * i.atom2 + 2] - cartCoordinates[3 * i.atom3 + 2]) ** 2
+                d_bond_2 = math.sqrt(d_bond_2)
+
+                d_non_bond = (cartCoordinates[3 * i.atom1] - cartCoordinates[3 * i.atom3]) ** 2
+                d_non_bond += (cartCoordinates[3 * i.atom1 + 1] - cartCoordinates[3 * i.atom3 + 1]) ** 2
+                d_non_bond += (cartCoordinates[3 * i.atom1 + 2] - cartCoordinates[3 * i.atom3 + 2]) ** 2
+                d_non_bond = math.sqrt(d_non_bond)
+
+                # Use those distances and the cosine rule to calculate bond angle theta
+                numerator = d_bond_1 ** 2 + d_bond_2 ** 2 - d_non_bond ** 2
+                denominator = 2 * d_bond_1 * d_bond_2
+                argument = numerator / denominator
+                theta = np.arccos(argument)
+                energy = energy + i.energy(theta)
+            if profiler is not None:
+                profiler.lap("bend")
+            if verbosity >= 1:
+                print(" + angle bends                       = {:> 16.8f}".format(energy))
+
+            for i in self.tors:
+                # Calculate the vectors lying along bonds, and their cross products
+                atom_e1 = [cartCoordinates[3 * i.atom1], cartCoordinates[3 * i.atom1 + 1], cartCoordinates[3 * i.atom1 + 2]]
+                atom_b1 = [cartCoordinates[3 * i.atom2], cartCoordinates[3 * i.atom2 + 1], cartCoordinates[3 * i.atom2 + 2]]
+                atom_b2 = [cartCoordinates[3 * i.atom3], cartCoordinates[3 * i.atom3 + 1], cartCoordinates[3 * i.atom3 + 2]]
+                atom_e2 = [cartCoordinates[3 * i.atom4], cartCoordinates[3 * i.atom4 + 1], cartCoordinates[3 * i.atom4 + 2]]
+                end_1 = [atom_e1[i] - atom_b1[i] for i in range(3)]
+                bridge = [atom_b1[i] - atom_b2[i] for i in range(3)]
+                end_2 = [atom_b2[i] - atom_e2[i] for i in range(3)]
+                vnormal_1 = np.cross(end_1, bridge)
+                vnormal_2 = np.cross(bridge, end_2)
+
+                # Construct a set of orthogonal basis vectors to define a frame with vnormal_2 as the x axis
+                vcross = np.cross(vnormal_2, bridge)
+                norm_vn2 = np.linalg.norm(vnormal_2)
+                norm_b = np.linalg.norm(bridge)
+                norm_vc = np.linalg.norm(vcross)
+                basis_vn2 = [vnormal_2[i] / norm_vn2 for i in range(3)]
+                basis_b = [bridge[i] / norm_b for i in range(3)]
+                basis_cv = [vcross[i] / norm_vc for i in range(3)]
+
+                # Find the signed angle between vnormal_1 and vnormal_2 in the new frame
+                vn1_coord_n2 = np.dot(vnormal_1, basis_vn2)
+                vn1_coord_vc = np.dot(vnormal_1, basis_cv)
+                psi = math.atan2(vn1_coord_vc, vn1_coord_n2)
+                energy = energy + i.energy(psi)
+            if profiler is not None:
+                profiler.lap("tors")
+            if verbosity >= 1:
+                print(" + dihedral torsions                 = {:> 16.8f}".format(energy))
+
+            for i in self.inv:
+                # Calculate the vectors along bonds, and construct a vector plane_norm orthogonal to the plane of end ato
+                atom_c = [cartCoordinates[3 * i.atom1], cartCoordinates[3 * i.atom1 + 1], cartCoordinates[3 * i.atom1 + 2]]
+                atom_e1 = [cartCoordinates[3 * i.atom2], cartCoordinates[3 * i.atom2 + 1], cartCoordinates[3 * i.atom2 + 2]]
+                atom_e2 = [cartCoordinates[3 * i.atom3], cartCoordinates[3 * i.atom3 + 1], cartCoordinates[3 * i.atom3 + 2]]
+                atom_e3 = [cartCoordinates[3 * i.atom4], cartCoordinates[3 * i.atom4 + 1], cartCoordinates[3 * i.atom4 + 2]]
+                bond_1 = [atom_e1[i] - atom_c[i] for i in range(3)]
+                bond_2 = [atom_e2[i] - atom_c[i] for i in range(3)]
+                bond_3 = [atom_e3[i] - atom_c[i] for i in range(3)]
+                inplane_12 = [atom_e2[i] - atom_e1[i] for i in range(3)]
+                inplane_13 = [atom_e3[i] - atom_e1[i] for i in range(3)]
+                plane_norm = np.cross(inplane_12, inplane_13)
+
+                # Construct vectors between end atoms and the projection of the central atom on the end-atom pla
+                cross_1 = np.cross(bond_1, plane_norm)
+                cross_2 = np.cross(bond_2, plane_norm)
+                cross_3 = np.cross(bond_3, plane_norm)
+                inplane_1 = np.cross(plane_norm, cross_1) / np.dot(plane_norm, plane_norm)
+                inplane_2 = np.cross(plane_norm, cross_2) / np.dot(plane_norm, plane_norm)
+                inplane_3 = np.cross(plane_norm, cross_3) / np.dot(plane_norm, plane_norm)
+
+                # Calculate the out of plane angle for each of the three bonds
+                cos_phi1 = np.dot(bond_1, inplane_1) / (np.linalg.norm(bond_1) * np.linalg.norm(inplane_1))
+                cos_phi2 = np.dot(bond_2, inplane_2) / (np.linalg.norm(bond_2) * np.linalg.norm(inplane_2))
+                cos_phi3 = np.dot(bond_3, inplane_3) / (np.linalg.norm(bond_3) * np.linalg.norm(inplane_3))
+
+                if (1.0 - (10 ** -15)) <= cos_phi1 and cos_phi1 <= (1.0 + (10 ** -15)):
+                    phi1 = 0.0
+                else:
+                    phi1 = np.arccos(cos_phi1)
+                if (1.0 - (10 ** -15)) <= cos_phi2 and cos_phi2 <= (1.0 + (10 ** -15)):
+                    phi2 = 0.0
+                else:
+                    phi2 = np.arccos(cos_phi2)
+                if (1.0 - (10 ** -15)) <= cos_phi3 and cos_phi3 <= (1.0 + (10 ** -15)):
+                    phi3 = 0.0
+                else:
+                    phi3 = np.arccos(cos_phi3)
+
+                # Take the numerical average of the three out of plane angles
+                # Note - other schemes for obtaining a single out of plane angle could be investigated
+                phi = (phi1 + phi2 + phi3) / 3
+
+                energy = energy + i.energy(phi)
+            if profiler is not None:
+                profiler.lap("inv")
+            if verbosity >= 1:
+                print(" + inversions                        = {:> 16.8f}".format(energy))
+            # Don't forget to add non-bonded interactions here
+
+        #    print("Omitting all non-covalent interactions") # REMOVE ONCE FIXED
+        #    print("Omitting hydrogen bonding interactions") # REMOVE ONCE FIXED
+        #    print("Omitting all non-covalent interactions except hydrogen bonding")
+        #    print("Omitting all non-covalent interactions expcept halogen bonding")
+        #    print("Omitting all non-covalent interactions except Pauli repulsion")         
+        #    print("Omitting all non-covalent interactions except electrostatics")
+        #    print("Omitting all non-covalent interactions except dispersion")
+
+        e_hbnd = 0.0
+        for i in self.hatoms:
+            atH = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+            for j in self.highENatoms:
+                atA = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                # Calculate distance between hydrogen i and electronegative atom j
+                # Determine whether they are (likely) joined by a covalent bond
+                dist_HA = (atH[0] - atA[0]) ** 2
+                dist_HA += (atH[1] - atA[1]) ** 2
+                dist_HA += (atH[2] - atA[2]) ** 2
+                dist_HA = math.sqrt(dist_HA)
+                bond_dist_HA = SymbolToRadius[self.atoms[i].symbol] + SymbolToRadius[self.atoms[j].symbol]
+                if dist_HA <= bond_dist_HA:
+                    for k in self.highENatoms:
+                        atB = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                        # Calculate distance between hydrogen i and electronegative atom k
+                        # Determine whether they are close enough for a hydrogen bonding interaction
+                        dist_HB = (atH[0] - atB[0]) ** 2
+                        dist_HB += (atH[1] - atB[1]) ** 2
+                        dist_HB += (atH[2] - atB[2]) ** 2
+                        dist_HB = math.sqrt(dist_HB)
+                        Hbond_dist_HB = SymbolToVdWRadius[self.atoms[i].symbol] + SymbolToVdWRadius[
+                            self.atoms[k].symbol]
+                        # If so, and if A and B are distinct, take the triple AHB to be involved in hydrogen bonding and use to calculate energy
+                        if dist_HB <= Hbond_dist_HB and atA != atB:
+                            dist_AB = (atA[0] - atB[0]) ** 2
+                            dist_AB += (atA[1] - atB[1]) ** 2
+                            dist_AB += (atA[2] - atB[2]) ** 2
+                            dist_AB = math.sqrt(dist_AB)
+
+                            # Use the calculated distances and the cosine rule to calculate AHB andgle theta
+                            numerator = dist_HA ** 2 + dist_HB ** 2 - dist_AB ** 2
+                            denominator = 2 * dist_HA * dist_HB
+                            argument = numerator / denominator
+                            theta = np.arccos(argument)
+
+                            # Calculate the relevant constants for a hydrogen bonding potential
+                            c_hbnd_AB = HBondStrengthFactor(j.symbol, j.charge, dist_HA, k.symbol, k.charge, dist_HB)
+                            f_dmp_theta = AngleDamping(theta)
+                            f_dmp_hbnd = HBondDamping(j.symbol, k.symbol, dist_AB)
+
+                            # Calculate the energy of this interaction, and add to the total hydrogen bonding contribution
+                            e_hbnd = e_hbnd + potHBond(f_dmp_theta, f_dmp_hbnd, c_hbnd_AB, dist_AB)
+        # Calculate total hydrogen bonding contribution from the sum over AHB triples, and add to energy
+        e_hbnd = -1 * e_hbnd
+        energy = energy + e_hbnd
+        if profiler is not None:
+            profiler.lap("hbond")
+        if verbosity >= 1:
+            print(" + hydrogen bonds                    = {:> 16.8f}".format(energy))
+        # print("Omitting halogen bonding interactions")
+
+        e_xbnd = 0.0
+        for i in self.halogens:
+            atX = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+            # Locate bonding partner(s), Y, for X by searching through the list of bonds in the molecule
+            bondsX = []
+            for j in range(len(self.bonds)):
+                if self.bonds[j][0] == i:
+                    bondsX.append([self.bonds[j][1], self.bonds[j][0]])
+                elif self.bonds[j][1] == i:
+                    bondsX.append(self.bonds[j])
+            # Locate donor atoms D that could participate in halogen bonding (check for not being bonded to X implemented later)
+            # Sum of van der Waals radii currently employed as a check for this
+            donors = []
+            for k in range(len(self.atoms)):
+                sym = self.atoms[k].symbol
+                donorsyms = ["N", "O", "F", "P", "S", "Cl", "As", "Se", "Br", "Sb", "Te", "I", "Bi", "Bi", "Po", "At",
+                             "Uup", "Lv", "Uus"]
+                if sym in donorsyms:
+                    atD = [cartCoordinates[3 * k], cartCoordinates[3 * k + 1], cartCoordinates[3 * k + 2]]
+                    dist_XD = (atX[0] - atD[0]) ** 2
+                    dist_XD += (atX[1] - atD[1]) ** 2
+                    dist_XD += (atX[2] - atD[2]) ** 2
+                    dist_XD = math.sqrt(dist_XD)
+                    Xbond_dist_XD = SymbolToVdWRadius[self.atoms[k].symbol] + SymbolToVdWRadius[self.atoms[i].symbol]
+                    if dist_XD <= Xbond_dist_XD:
+                        donors.append([k, dist_XD])
+            # For each triple formed by a bond YX and donor D, calculate halogen bonding potential
+            for bond in bondsX:
+                for donor in donors:
+                    if donor[0] != bond[0] and donor[0] != bond[1]:
+                        symY = bond[0].symbol
+                        coordY = [cartCoordinates[3 * bond[0]], cartCoordinates[3 * bond[0] + 1],
+                                  cartCoordinates[3 * bond[0] + 2]]
+                        symX = self.atoms[i].symbol
+                        coordX = atX
+                        symD = donor[0].symbol
+                        coordD = [cartCoordinates[3 * donor[0]], cartCoordinates[3 * donor[0] + 1],
+                                  cartCoordinates[3 * donor[0] + 2]]
+                        r_XD = self.atoms[donor[1]].symbol
+
+                        # Calculate the DXY angle
+                        r_XY = (coordY[0] - coordX[0]) ** 2
+                        r_XY += (coordY[1] - coordX[1]) ** 2
+                        r_XY += (coordY[2] - coordX[2]) ** 2
+                        r_XY = math.sqrt(r_XY)
+
+                        r_DY = (coordY[0] - coordD[0]) ** 2
+                        r_DY += (coordY[1] - coordD[1]) ** 2
+                        r_DY += (coordY[2] - coordD[2]) ** 2
+                        r_DY = math.sqrt(r_DY)
+
+                        numerator = r_XD ** 2 + r_XY ** 2 - r_DY ** 2
+                        denominator = 2 * r_XD * r_XY
+                        argument = numerator / denominator
+                        theta = np.arccos(argument)
+
+                        # Calculate the relevant constants for a halogen bonding potential
+                        f_dmp_theta = AngleDamping(theta)
+                        f_dmp_xbnd = HBondDamping(symX, symD, r_XD)
+                        c_xbnd = AtomicXBondFactor(symX, self.atoms[i].charge)
+
+                        # Calculate the energy of this halogen bonding interaction and add to the total
+                        e_xbnd = e_xbnd + potXBond(f_dmp_theta, f_dmp_xbnd, c_xbnd_x, r_XD)
+                        # Calculate total halogen bonding contribution from the sum over DXY triples, and add to energy of the molecule
+        e_xbnd = -1 * e_xbnd
+        energy = energy + e_xbnd
+        if profiler is not None:
+            profiler.lap("xbond")
+        if verbosity >= 1:
+            print(" + halogen bonds                     = {:> 16.8f}".format(energy))
+        # print("Omitting all Pauli repulsion interactions")
+
+        if self.neighbours is not None or self.cell is not None:
+            # Pauli repulsion, electrostatics and dispersion over the pairs in the neighbour list or over the nearest
+            # periodic images, all at once
+            e_Pauli, e_ES, e_disp = self.nonbondedEnergies(np.asarray(cartCoordinates, dtype=float).reshape(-1, 3),
+                                                           dtyp)
+            energy = energy + e_Pauli
+            if verbosity >= 1:
+                print(" + Pauli repulsion                   = {:> 16.8f}".format(energy))
+            energy = energy + e_ES
+            if verbosity >= 1:
+                print(" + (classic) electrostatics          = {:> 16.8f}".format(energy))
+            energy = energy + e_disp
+            if profiler is not None:
+                profiler.lap("nonbonded")
+            if verbosity >= 1:
+                print(" + London dispersion                 = {:> 16.8f}".format(energy))
+        else:
+            # Nested lists of the pair parameters, for fast access to single elements in the loops below
+            params = {key: value.tolist() for key, value in self.pairParameters().items()}
+            rep_disp, elstat = params["rep_disp"], params["elstat"]
+            e_Pauli = 0.0
+            for i in range(len(self.atoms)):
+                for j in range(i + 1, len(self.atoms)):
+                    # Calculate the distance between atoms i and j
+                    coordA = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+                    coordB = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                    distance = (coordA[0] - coordB[0]) ** 2
+                    distance += (coordA[1] - coordB[1]) ** 2
+                    distance += (coordA[2] - coordB[2]) ** 2
+                    distance = math.sqrt(distance)
+                    # Calculate the required screening parameter, then the energy for this pair, and add to the total
+                    # Note that proper calculation will require the D3 cutoff radii R_0D3 which are yet to be worked in
+                    # As potPauliRep(), with the pair parameters looked up once in pairParameters()
+                    rep_disp_AB = rep_disp[i][j]
+                    energy_AB = rep_disp_AB * (params["z_eff_AB"][i][j] / distance) * math.exp(
+                        -1 * params["decay_AB"][i][j] * distance)
+                    e_Pauli = e_Pauli + energy_AB
+            energy = energy + e_Pauli
+            if profiler is not None:
+                profiler.lap("pauli")
+            if verbosity >= 1:
+                print(" + Pauli repulsion                   = {:> 16.8f}".format(energy))
+            # print("Omitting all electrostatic interactions")
+
+            e_ES = 0.0
+            for i in range(len(self.atoms)):
+                for j in range(i + 1, len(self.atoms)):
+                    # Note QM computed atomic charges at equilibrium structure should be used as per QMDFF
+                    # Currently the charge in class atom is used, which comes from atomic number
+                    chgA = self.atoms[i].QMcharge
+                    chgB = self.atoms[j].QMcharge
+
+                    # Calculate the distance between atoms i and j
+                    coordA = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+                    coordB = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                    distance = (coordA[0] - coordB[0]) ** 2
+                    distance += (coordA[1] - coordB[1]) ** 2
+                    distance += (coordA[2] - coordB[2]) ** 2
+                    distance = math.sqrt(distance)
+
+                    # Calculate the required screening parameter, and the energy for this paiwise interaction, then add to the total
+                    elstat_AB = elstat[i][j]
+                    energy_AB = potElectrostatic(elstat_AB, chgA, chgB, distance)
+                    e_ES = e_ES + energy_AB
+                    #        print("Adding ES energy for atoms " + str([i, j]) + " with charges " + str([chgA, chgB]) + ", distance " + str(distance) + ", screening parameter " + str(elstat_AB) + ", giving energy = " + str(energy_AB))
+            energy = energy + e_ES
+            if profiler is not None:
+                profiler.lap("es")
+            if verbosity >= 1:
+                print(" + (classic) electrostatics          = {:> 16.8f}".format(energy))
+            # print("Omitting all dispersion interactions")
+
+            e_disp = 0.0
+            for i in range(len(self.atoms)):
+                for j in range(len(self.atoms)):
+                    # Calculate the distance between atoms i and j
+                    coordA = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+                    coordB = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                    distance = (coordA[0] - coordB[0]) ** 2
+                    distance += (coordA[1] - coordB[1]) ** 2
+                    distance += (coordA[2] - coordB[2]) ** 2
+                    distance = math.sqrt(distance)
+                    # Calculate the required paramenters and thence the energy for this pairwise interaction, then add to the total
+                    # Note that this is incomplete until the D3 cutoff radii R_0D3, as well as the coefficients C6_AB and C8_AB, are incorporated properly
+                    rep_disp_AB = rep_disp[i][j]
+                    C6_AB = params["C6_AB"][i][j]
+                    C8_AB = C6_AB  # To be completed - temporarily set equal to C6 for test run only
+                    if dtyp == 1:
+                        energy_AB = potCSODisp(C6_AB, distance, params["R0_AB"][i][j])
+                    elif dtyp == 2:
+                        energy_AB = potLondonDisp(rep_disp_AB, C6_AB, C8_AB, params["BJdamp_AB"][i][j], distance)
+                    e_disp = e_disp + energy_AB
+            energy = energy + e_disp
+            if profiler is not None:
+                profiler.lap("disp")
+            if verbosity >= 1:
+                print(" + London dispersion                 = {:> 16.8f}".format(energy))
+
+        # Calculation of polarisation energy (for solute-solvent) to go here in future
+        # Left out for version 1 as optional, only important as intermolecular interactions
+
+        if verbosity >= 1:
+            print("Total energy                         = {:> 16.8f}".format(energy))
+        return energy
+
+    def nonbondedPairPotentials(self, r, pair_i, pair_j, dtyp=1, deriv=1):
+        """ (Molecule) -> (array, array, array, number, array[, array])
+
+    Returns the Pauli repulsion, electrostatic and dispersion energies of the atom pairs (pair_i, pair_j), i < j,
+    at distances r, the dispersion energy of each atom with itself, and the derivative of the total pair energy
+    with respect to r. With deriv=2 the second derivative with respect to r is returned as well.
+    r may have leading axes (one row of distances per structure), the results then have the same shape.
+    Same potentials as in FFEnergy.
+    """
+
+        params = self.pairListParameters(pair_i, pair_j)
+        rep_disp = params["rep_disp"]
+        elstat = params["elstat"]
+        R0_AB = params["R0_AB"]
+        C6_AB = params["C6_AB"]
+        chg = np.array([atom.QMcharge for atom in self.atoms], dtype=float)
+
+        decay = params["decay_AB"]
+        u_Pauli = rep_disp * (params["z_eff_AB"] / r) * np.exp(-1 * decay * r)
+        du = u_Pauli * (-1 / r - decay)
+        d2u = u_Pauli * ((1 / r + decay) ** 2 + 1 / r ** 2)
+
+        if self.ewald is not None:
+            # Direct-space part of the Ewald sum, unscreened (see ewaldCorrections() for the screened pairs).
+            # It has decayed to the Ewald tolerance at the cutoff, so it is truncated there instead of switched off.
+            f, df, d2f = directPairPotential(r, self.ewald.alpha)
+            qq = chg[pair_i] * chg[pair_j] * (r <= self.neighbours.cutoff)
+            u_ES = qq * f
+            du_ES = qq * df
+            d2u_ES = qq * d2f
+        else:
+            u_ES = elstat * (chg[pair_i] * chg[pair_j] / r)
+            du += -u_ES / r
+            d2u += 2 * u_ES / r ** 2
+
+        # FFEnergy sums dispersion over both orderings of every pair and over each atom with itself
+        if dtyp == 1:
+            a1_CSO = CSO_a1["B3LYP"]
+            s6 = 1
+            exparg = r - (2.5 * R0_AB)
+            sigmoid = scipy.special.expit(exparg)
+            sigmoid_rev = scipy.special.expit(-exparg)
+            C6indep = s6 + a1_CSO * sigmoid_rev
+            denominator = r ** 6 + (2.5 ** 2) ** 6
+            C6dep = C6_AB / denominator
+            u_disp = 2 * C6indep * C6dep
+            dC6indep = -a1_CSO * sigmoid * sigmoid_rev
+            dC6dep = -6 * r ** 5 * C6_AB / denominator ** 2
+            du += 2 * (dC6indep * C6dep + C6indep * dC6dep)
+            d2C6indep = -a1_CSO * sigmoid * sigmoid_rev * (sigmoid_rev - sigmoid)
+            d2C6dep = C6_AB * (-30 * r ** 4 / denominator ** 2 + 72 * r ** 10 / denominator ** 3)
+            d2u += 2 * (d2C6indep * C6dep + 2 * dC6indep * dC6dep + C6indep * d2C6dep)
+            atoms = self.pairParameters()
+            e_self = np.sum((s6 + a1_CSO * scipy.special.expit(2.5 * np.diagonal(atoms["R0_AB"])))
+                            * np.diagonal(atoms["C6_AB"]) / ((2.5 ** 2) ** 6))
+        elif dtyp == 2:
+            # C8_AB set equal to C6_AB as in FFEnergy
+            BJdamp_AB = params["BJdamp_AB"]
+            denominator_6 = r ** 6 + BJdamp_AB ** 6
+            denominator_8 = r ** 8 + BJdamp_AB ** 8
+            u_disp = 2 * rep_disp * (C6_AB / denominator_6 + s8 * C6_AB / denominator_8)
+            du += 2 * rep_disp * (-6 * r ** 5 * C6_AB / denominator_6 ** 2
+                                  - 8 * s8 * r ** 7 * C6_AB / denominator_8 ** 2)
+            d2u += 2 * rep_disp * C6_AB * (-30 * r ** 4 / denominator_6 ** 2 + 72 * r ** 10 / denominator_6 ** 3
+                                           + s8 * (-56 * r ** 6 / denominator_8 ** 2
+                                                   + 128 * r ** 14 / denominator_8 ** 3))
+            e_self = 0.0
+
+        if self.neighbours is not None:
+            # Switch all pair potentials off smoothly between the switching distance and the cutoff
+            s, ds, d2s = switchingFunction(r, self.neighbours.switch, self.neighbours.cutoff, deriv=2)
+            u = u_Pauli + u_disp
+            if self.ewald is None:
+                u = u + u_ES
+                u_ES = u_ES * s
+            d2u = d2u * s + 2 * du * ds + u * d2s
+            du = du * s + u * ds
+            u_Pauli, u_disp = u_Pauli * s, u_disp * s
+        if self.ewald is not None:
+            du = du + du_ES
+            d2u = d2u + d2u_ES
+
+        if deriv >= 2:
+            return u_Pauli, u_ES, u_disp, e_self, du, d2u
+
+        return u_Pauli, u_ES, u_disp, e_self, du
+
+    def setNonbondedCutoff(self, cutoff=12.0, skin=2.0, switch=None):
+        """ (Molecule) -> NeighbourList
+
+    Restricts the Pauli repulsion, electrostatic and dispersion interactions to the pairs of atoms within cutoff
+    (in Angstrom), kept in a Verlet neighbour list with the given skin, and switches them off smoothly between
+    the distance switch (by default 2 Angstrom below cutoff) and cutoff. Returns the neighbour list.
+    With cutoff None, all pairs of atoms interact again without switching (the default), and the electrostatics
+    are evaluated directly again.
+    """
+
+        if cutoff is None:
+            self.neighbours = None
+            self.ewald = None
+        else:
+            self.neighbours = NeighbourList(cutoff, skin, switch)
+
+        return self.neighbours
+
+    def setCell(self, box):
+        """ (Molecule) -> NoneType
+
+    Makes the molecule periodic in an orthorhombic cell with the edge lengths box (three numbers, in Angstrom):
+    the non-bonded interactions are then evaluated between the nearest periodic images of the atoms.
+    With box None, the molecule is no longer periodic, which also switches back to direct electrostatics.
+    """
+
+        if box is None:
+            self.cell = None
+            self.ewald = None
+            return
+        box = np.array(box, dtype=float).reshape(-1)
+        if box.shape != (3,) or np.any(box <= 0.0):
+            ProgramError()
+            print("A periodic cell needs three positive edge lengths, not " + str(box))
+            ProgramAbort()
+        self.cell = box
+
+    def setElectrostatics(self, method="direct", **settings):
+        """ (Molecule) -> EwaldSum
+
+    Selects the evaluation of the electrostatic interactions: "direct" sums q_A q_B / r over the pairs of atoms,
+    "ewald" and "pme" use the Ewald summation in the periodic cell of the molecule, with the direct-space part
+    evaluated over the neighbour list and the reciprocal-space part summed over the wave vectors or by smooth
+    particle mesh Ewald. The further settings are passed on to EwaldSum. Returns the EwaldSum, or None for "direct".
+    """
+
+        if method == "direct":
+            self.ewald = None
+            return None
+        if self.cell is None or self.neighbours is None:
+            ProgramError()
+            print("Ewald electrostatics need a periodic cell and a non-bonded cutoff, see setCell() and "
+                  "setNonbondedCutoff()")
+            ProgramAbort()
+        self.ewald = EwaldSum(method, cutoff=self.neighbours.cutoff, **settings)
+
+        return self.ewald
+
+    def nonbondedPairs(self, X):
+        """ (Molecule) -> (array, array)
+
+    Returns the index arrays (pair_i, pair_j), i < j, of the atom pairs for the non-bonded interactions at the
+    structure given by the (N, 3) array X: those of the neighbour list, if one is set, otherwise all pairs
+    """
+
+        if self.neighbours is not None:
+            return self.neighbours.pairs(X, self.cell)
+
+        return np.triu_indices(len(self.atoms), 1)
+
+    def pairVectors(self, X, pair_i, pair_j):
+        """ (Molecule) -> array
+
+    Returns the vectors X[pair_i] - X[pair_j] between the atom pairs, taken along the last but one axis of X,
+    between the nearest periodic images if the molecule has a periodic cell
+    """
+
+        vector = X[..., pair_i, :] - X[..., pair_j, :]
+        if self.cell is not None:
+            vector -= self.cell * np.round(vector / self.cell)
+
+        return vector
+
+    def ewaldCorrections(self, X, deriv=1):
+        """ (Molecule) -> (number, array[, array])
+
+    Returns the part of the Ewald electrostatic energy at the structure given by the (N, 3) array X that is not
+    covered by the direct-space pair potentials: the reciprocal-space and self energies, less the interactions of
+    the pairs that are screened (1,2- and 1,3-pairs) or scaled by E_ES_14 (1,4-pairs) in FFEnergy. Also returns its
+    (N, 3) gradient and, with deriv=2, its (N, N, 3, 3) Hessian blocks, of which the reciprocal-space part
+    is obtained by finite differences of the gradient.
+    """
+
+        n = len(self.atoms)
+        chg = np.array([atom.QMcharge for atom in self.atoms], dtype=float)
+        energy, gradient = self.ewald.energyGradient(X, chg, self.cell)
+
+        # The reciprocal-space sum includes all pairs in full, so remove (1 - elstat) q_A q_B / r for screened pairs
+        elstat = self.screeningMatrices()[1]
+        pair_i, pair_j = np.nonzero(np.triu(elstat < 1.0, 1))
+        vector = self.pairVectors(X, pair_i, pair_j)
+        r = np.linalg.norm(vector, axis=1)
+        c = (1.0 - elstat[pair_i, pair_j]) * chg[pair_i] * chg[pair_j]
+        energy -= np.sum(c / r)
+        gradient = gradient + pairGradient(n, pair_i, pair_j, vector, c / r ** 2)
+        if deriv < 2:
+            return energy, gradient
+
+        hessian = self.ewald.hessian(X, chg, self.cell) + pairHessian(n, pair_i, pair_j, vector, c / r ** 2,
+                                                                     -2 * c / r ** 3)
+
+        return energy, gradient, hessian
+
+    def nonbondedEnergies(self, X, dtyp=1):
+        """ (Molecule) -> (number, number, number)
+
+    Returns the Pauli repulsion, electrostatic and dispersion energies at the structure given by the (N, 3) array X,
+    evaluated for all pairs from nonbondedPairs() at once. Same potentials as in FFEnergy.
+    """
+
+        pair_i, pair_j = self.nonbondedPairs(X)
+        r = np.linalg.norm(self.pairVectors(X, pair_i, pair_j), axis=1)
+        u_Pauli, u_ES, u_disp, e_self = self.nonbondedPairPotentials(r, pair_i, pair_j, dtyp)[:4]
+        e_ES = np.sum(u_ES)
+        if self.ewald is not None:
+            e_ES += self.ewaldCorrections(X)[0]
+
+        return np.sum(u_Pauli), e_ES, np.sum(u_disp) + e_self
+
+    def nonbondedEnergyGradient(self, X, dtyp=1):
+        """ (Molecule) -> (number, number, number, array)
+
+    Returns the Pauli repulsion, electrostatic and dispersion energies at the structure given by the (N, 3) array X,
+    evaluated for all pairs from nonbondedPairs() at once, and the (N, 3) gradient of their sum.
+    Same potentials as in FFEnergy.
+    """
+
+        n = len(self.atoms)
+        pair_i, pair_j = self.nonbondedPairs(X)
+        vector = self.pairVectors(X, pair_i, pair_j)
+        r = np.linalg.norm(vector, axis=1)
+        u_Pauli, u_ES, u_disp, e_self, du = self.nonbondedPairPotentials(r, pair_i, pair_j, dtyp)
+        gradient = pairGradient(n, pair_i, pair_j, vector, du)
+        e_ES = np.sum(u_ES)
+        if self.ewald is not None:
+            e_ewald, gradient_ewald = self.ewaldCorrections(X)
+            e_ES += e_ewald
+            gradient += gradient_ewald
+
+        return np.sum(u_Pauli), e_ES, np.sum(u_disp) + e_self, gradient
+
+    def FFEnergyGradient(self, cartCoordinates, dtyp=1, table=None):
+        """ (Molecule) -> (number, array)
+
+      Returns the Force Field energy at the structure specified by cartCoordinates together with its analytic
+      gradient, as a flat array ordered like cartCoordinates. The bonded terms are taken from table if one is given,
+      otherwise from the term table of the molecule, which is compiled if necessary. Hydrogen and halogen bonds are
+      not included, as the atom lists they are built from are not populated at present.
+    """
+
+        if table is None:
+            if self.termtable is None:
+                self.compileTermTable()
+            table = self.termtable
+        X = np.asarray(cartCoordinates, dtype=float).reshape(-1, 3)
+        gradient = np.zeros_like(X)
+        energy = self.Ee_QM
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start("FFEnergyGradient")
+
+        for family, geometry, potential in (("stretch", termDistances, stretchTableEnergies),
+                                            ("str13", termDistances, stretchTableEnergies),
+                                            ("bend", termAngles, bendTableEnergies),
+                                            ("tors", termDihedrals, torsionTableEnergies),
+                                            ("inv", termOutOfPlane, inversionTableEnergies)):
+            q, dq = geometry(X, table[family]["idx"], deriv=True)
+            u, du = potential(q, table[family], deriv=True)
+            energy = energy + np.sum(u)
+            np.add.at(gradient, table[family]["idx"], du[:, np.newaxis, np.newaxis] * dq)
+            if profiler is not None:
+                profiler.lap(family)
+
+        e_Pauli, e_ES, e_disp, gradient_nb = self.nonbondedEnergyGradient(X, dtyp)
+        energy = energy + e_Pauli + e_ES + e_disp
+        if profiler is not None:
+            profiler.lap("nonbonded")
+
+        return energy, (gradient + gradient_nb).flatten()
+
+    def FFEnergyBatch(self, cartCoordinates, dtyp=1, terms=False):
+        """ (Molecule) -> array[, dict]
+
+      Returns the Force Field energies of K structures, given as a (K, 3N) array of cartesian coordinates
+      ordered like cartCoordinates() for each structure. All structures are evaluated in one pass: the bonded terms
+      from the term table repeated for every structure, the non-bonded terms for all atom pairs of all structures
+      at once. Same terms as in FFEnergyGradient. With terms=True, a dictionary with the contributions of the
+      stretches, 1,3-stretches, bends, torsions, inversions, Pauli repulsion, electrostatics and dispersion
+      (keys as in ProfiledTerms) to each energy is returned as well.
+    """
+
+        if self.termtable is None:
+            self.compileTermTable()
+        n = len(self.atoms)
+        X = np.asarray(cartCoordinates, dtype=float).reshape(-1, n, 3)
+        k = len(X)
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start("FFEnergyBatch")
+
+        contributions = {}
+        for family, geometry, potential in (("stretch", termDistances, stretchTableEnergies),
+                                            ("str13", termDistances, stretchTableEnergies),
+                                            ("bend", termAngles, bendTableEnergies),
+                                            ("tors", termDihedrals, torsionTableEnergies),
+                                            ("inv", termOutOfPlane, inversionTableEnergies)):
+            table = batchTable(self.termtable[family], k, n)
+            u = potential(geometry(X.reshape(-1, 3), table["idx"]), table)
+            contributions[family] = np.sum(u.reshape(k, -1), axis=1)
+            if profiler is not None:
+                profiler.lap(family)
+
+        if self.neighbours is not None and self.neighbours.isValid(X, self.cell):
+            pair_i, pair_j = self.neighbours.pair_i, self.neighbours.pair_j
+        else:
+            # A neighbour list built for one structure need not hold for all of them, so take all pairs;
+            # the switching function still removes those beyond the cutoff
+            pair_i, pair_j = np.triu_indices(n, 1)
+        r = np.linalg.norm(self.pairVectors(X, pair_i, pair_j), axis=2)
+        u_Pauli, u_ES, u_disp, e_self = self.nonbondedPairPotentials(r, pair_i, pair_j, dtyp)[:4]
+        contributions["pauli"] = np.sum(u_Pauli, axis=1)
+        contributions["es"] = np.sum(u_ES, axis=1)
+        if self.ewald is not None:
+            # The reciprocal-space sums are evaluated one structure at a time
+            contributions["es"] += np.array([self.ewaldCorrections(x)[0] for x in X])
+        contributions["disp"] = np.sum(u_disp, axis=1) + e_self
+        if profiler is not None:
+            profiler.lap("nonbonded")
+
+        energies = np.full(k, self.Ee_QM)
+        for term in contributions.values():
+            energies = energies + term
+
+        if terms:
+            return energies, contributions
+        return energies
+
+    def FFGradient(self, cartCoordinates, dtyp=1):
+        """ (Molecule) -> array
+
+      Returns the analytic gradient of the Force Field energy at the structure specified by cartCoordinates
+    """
+
+        return self.FFEnergyGradient(cartCoordinates, dtyp)[1]
+
+    def nonbondedHessian(self, X, dtyp=1):
+        """ (Molecule) -> array
+
+    Returns the (N, N, 3, 3) blocks of the Hessian of the Pauli repulsion, electrostatic and dispersion energies
+    at the structure given by the (N, 3) array X, with block [i, j] holding the derivatives with respect to
+    the positions of atoms i and j
+    """
+
+        return self.nonbondedDerivatives(X, dtyp)[4]
+
+    def nonbondedDerivatives(self, X, dtyp=1):
+        """ (Molecule) -> (number, number, number, array, array)
+
+    Returns the Pauli repulsion, electrostatic and dispersion energies at the structure given by the (N, 3) array X,
+    the (N, 3) gradient of their sum and its (N, N, 3, 3) Hessian blocks as in nonbondedHessian, all from a single
+    evaluation of the pair potentials
+    """
+
+        n = len(self.atoms)
+        pair_i, pair_j = self.nonbondedPairs(X)
+        vector = self.pairVectors(X, pair_i, pair_j)
+        r = np.linalg.norm(vector, axis=1)
+        u_Pauli, u_ES, u_disp, e_self, du, d2u = self.nonbondedPairPotentials(r, pair_i, pair_j, dtyp, deriv=2)
+        gradient = pairGradient(n, pair_i, pair_j, vector, du)
+        hessian = pairHessian(n, pair_i, pair_j, vector, du, d2u)
+        e_ES = np.sum(u_ES)
+        if self.ewald is not None:
+            e_ewald, gradient_ewald, hessian_ewald = self.ewaldCorrections(X, deriv=2)
+            e_ES += e_ewald
+            gradient += gradient_ewald
+            hessian += hessian_ewald
+
+        return np.sum(u_Pauli), e_ES, np.sum(u_disp) + e_self, gradient, hessian
+
+    def FFHessian(self, cartCoordinates, dtyp=1, table=None):
+        """ (Molecule) -> 3N x 3N matrix
+
+      Returns the analytic Hessian of the Force Field energy at the structure specified by cartCoordinates,
+      ordered like cartCoordinates. The bonded terms are taken from table if one is given, otherwise from the
+      term table of the molecule, which is compiled if necessary. Same terms as in FFEnergyGradient.
+    """
+
+        return self.FFEnergyDerivatives(cartCoordinates, dtyp, table=table)[2]
+
+    def FFEnergyDerivatives(self, cartCoordinates, dtyp=1, hessian=True, table=None):
+        """ (Molecule) -> (number, array, 3N x 3N matrix)
+
+      Returns the Force Field energy at the structure specified by cartCoordinates together with its analytic
+      gradient and, if hessian is set, its analytic Hessian (otherwise None), all from a single evaluation of the
+      internal coordinates and potentials of every term. Same terms as in FFEnergyGradient, which is used when
+      no Hessian is needed; the table argument is as in FFHessian.
+    """
+
+        if not hessian:
+            return self.FFEnergyGradient(cartCoordinates, dtyp, table) + (None,)
+        if table is None:
+            if self.termtable is None:
+                self.compileTermTable()
+            table = self.termtable
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start("FFEnergyDerivatives")
+        X = np.asarray(cartCoordinates, dtype=float).reshape(-1, 3)
+        e_Pauli, e_ES, e_disp, gradient, hessian = self.nonbondedDerivatives(X, dtyp)
+        energy = self.Ee_QM + e_Pauli + e_ES + e_disp
+        if profiler is not None:
+            profiler.lap("nonbonded")
+
+        for family, geometry, potential in (("stretch", termDistances, stretchTableEnergies),
+                                            ("str13", termDistances, stretchTableEnergies),
+                                            ("bend", termAngles, bendTableEnergies),
+                                            ("tors", termDihedrals, torsionTableEnergies),
+                                            ("inv", termOutOfPlane, inversionTableEnergies)):
+            idx = table[family]["idx"]
+            if len(idx) == 0:
+                continue
+            q, dq, d2q = geometry(X, idx, deriv=2)
+            u, du, d2u = potential(q, table[family], deriv=2)
+            energy = energy + np.sum(u)
+            np.add.at(gradient, idx, du[:, np.newaxis, np.newaxis] * dq)
+            # Chain rule for E(q(x)): dE/dq d2q/dx2 + d2E/dq2 (dq/dx)(dq/dx)
+            block = (du[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis] * d2q
+                     + d2u[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis] * np.einsum('mai,mbj->maibj', dq, dq))
+            for a in range(idx.shape[1]):
+                for b in range(idx.shape[1]):
+                    np.add.at(hessian, (idx[:, a], idx[:, b]), block[:, a, :, b, :])
+            if profiler is not None:
+                profiler.lap(family)
+
+        n = len(X)
+        return energy, gradient.flatten(), hessian.transpose(0, 2, 1, 3).reshape(3 * n, 3 * n)
+
+    def optimise(self, method="rfo", criteria="normal", maxiter=200, dtyp=1, trust=0.3, verbosity=0, update=True):
+        """ (Molecule) -> dict
+
+      Optimises the geometry of the molecule on the Force Field energy surface with one of the methods of
+      optimiseGeometry ("bfgs", "lbfgs", "rfo" or "newton") and the given convergence criteria, taking energies,
+      gradients and, for "rfo" and "newton", Hessians from FFEnergyDerivatives. Unless update is False, the atoms
+      are moved to the optimised structure. Returns the results of optimiseGeometry.
+    """
+
+        def derivatives(coords, hessian):
+            return self.FFEnergyDerivatives(coords, dtyp, hessian)
+
+        result = optimiseGeometry(derivatives, self.cartesianCoordinates(), method, criteria, maxiter, trust,
+                                  verbosity=verbosity)
+        if not result["converged"]:
+            ProgramWarning()
+            print("Geometry optimisation of " + str(self.name) + " has not converged in " + str(
+                result["iterations"]) + " steps")
+        if update:
+            self.setGeometry(result["coords"])
+
+        return result
+
+    def kdepFFEnergy(self, cartCoordinates, ForceConstants, verbosity=0, dtyp=1):
+        """ (Molecule) -> number (Force Field energy)
+
+      Returns a number containing the molecular energy according to the current Force Field definition at a fixed structure specified by cartCoordinates
+      and using the stretch, bend and inversion force constants specified by ForceConstants
+      The contribution from non-covalent interactions, and the torsional force constants, are fixed
+      The dispersion potential
+      The dispersion correction used is specified by dtyp, with 1 for C6-only calculating cutoff radius from van der Waals radii, 2 for full D3 using C6 and C8 coefficients
+    """
+        # Note the function fed to the optimiser will need to have only force constants as variables, so must fix cartesian coordinates somehow for the molecule.
+        energy = 0.0
+        #    print("Initial force constants for k-dependent energy calculation:") # REMOVE ONCE FIXED
+        #    print(ForceConstants) # REMOVE ONCE FIXED
+        #    print("Input coordinates for k-dependent energy calculation:") # REMOVE ONCE FIXED
+        #    print(cartCoordinates) #REMOVE ONCE FIXED
+        if verbosity >= 1:
+            print("Initial energy for calculation = " + str(energy))
+        energy = energy + self.Ee_QM
+        if verbosity >= 1:
+            print("With QM energy of equilibrium structure, energy = " + str(energy))
+
+        # if verbosity >= 1: # REMOVE ONCE FIXED
+        #      print("Omitting stretching energy") # REMOVE ONCE FIXED
+
+        for j in range(len(self.stretch)):
+            i = self.stretch[j]
+            k_str0 = i.k_str  # Store the value of k_str originally associated with this stretching potential
+            i.setk(
+                ForceConstants[j])  # Set k_str equal to the value specified in the force constant list for this stretch
+            distance = (cartCoordinates[3 * i.atom1] - cartCoordinates[3 * i.atom2]) ** 2
+            distance += (cartCoordinates[3 * i.atom1 + 1] - cartCoordinates[3 * i.atom2 + 1]) ** 2
+            distance += (cartCoordinates[3 * i.atom1 + 2] - cartCoordinates[3 * i.atom2 + 2]) ** 2
+            distance = math.sqrt(distance)
+            #      print("Adding energy for bond " + str([i.atom1, i.atom2]) + ", distance = " + str(distance) + " energy = " + str(i.energy(distance)) + " to total")
+            energy = energy + i.energy(distance)
+            i.setk(
+                k_str0)  # Restore the original value of k_str so this stretching potential is not permanently modified by the calculation
+        if verbosity >= 1:
+            print("With bond stretches, energy = " + str(energy))
+
+        for j in range(len(self.str13)):
+            i = self.str13[j]
+            k_str0 = i.k_str  # Store the value of k_str originally associated with this 1,3-stretching potential
+            i.setk(ForceConstants[len(
+                self.stretch) + j])  # Set k_str equal to the value specified in the force constant list for this 1,3-stretch
+            distance = (cartCoordinates[3 * i.atom1] - cartCoordinates[3 * i.atom2]) ** 2
+            distance += (cartCoordinates[3 * i.atom1 + 1] - cartCoordinates[3 * i.atom2 + 1]) ** 2
+            distance += (cartCoordinates[3 * i.atom1 + 2] - cartCoordinates[3 * i.atom2 + 2]) ** 2
+            distance = math.sqrt(distance)
+            energy = energy + i.energy(distance)
+            i.setk(
+                k_str0)  # Restore the original value of k_str so this 1,3-stretching potential is not permanently modified by the energy calculation
+        if verbosity >= 1:
+            print("With 1,3-stretches, energy = " + str(energy))
+
+        for j in range(len(self.bend)):
+            i = self.bend[j]
+            k_bnd0 = i.k  # Store the value of k originally associated with this bending potential
+            i.setk(ForceConstants[len(self.stretch) + len(
+                self.str13) + j])  # Se k_bnd equal to the value specified in the force constant list for this bend 
+            d_bond_1 = (cartCoordinates[3 * i.atom1] - cartCoordinates[3 * i.atom2]) ** 2
+            d_bond_1 += (cartCoordinates[3 * i.atom1 + 1] - cartCoordinates[3 * i.atom2 + 1]) ** 2
+            d_bond_1 += (cartCoordinates[3 * i.atom1 + 2] - cartCoordinates[3 * i.atom2 + 2]) ** 2
+            d_bond_1 = math.sqrt(d_bond_1)
+
+            d_bond_2 = (cartCoordinates[3 * i.atom2] - cartCoordinates[3 * i.atom3]) ** 2
+            d_bond_2 += (cartCoordinates[3 * i.atom2 + 1] - cartCoordinates[3 * i.atom3 + 1]) ** 2
+            d_bond_2 += (cartCoordinates[3 * i.atom2 + 2] - cartCoordinates[3 * i.atom3 + 2]) ** 2
+            d_bond_2 = math.sqrt(d_bond_2)
+
+            d_non_bond = (cartCoordinates[3 * i.atom1] - cartCoordinates[3 * i.atom3]) ** 2
+            d_non_bond += (cartCoordinates[3 * i.atom1 + 1] - cartCoordinates[3 * i.atom3 + 1]) ** 2
+            d_non_bond += (cartCoordinates[3 * i.atom1 + 2] - cartCoordinates[3 * i.atom3 + 2]) ** 2
+            d_non_bond = math.sqrt(d_non_bond)
+
+            # Use those distances and the cosine rule to calculate bond angle theta
+            numerator = d_bond_1 ** 2 + d_bond_2 ** 2 - d_non_bond ** 2
+            denominator = 2 * d_bond_1 * d_bond_2
+            argument = numerator / denominator
+            theta = np.arccos(argument)
+            energy = energy + i.energy(theta)
+            i.setk(
+                k_bnd0)  # Restore the original value of the bending force constant so that this potentially is not permanently changed by the energy calculation
+        if verbosity >= 1:
+            print("With bends, energy = " + str(energy))
+
+        for j in range(len(self.inv)):
+            i = self.inv[j]
+            k_inv0 = i.k_inv  # Store the force constant k originally associated with this inversion potential 
+            i.setk(ForceConstants[len(self.stretch) + len(self.str13) + len(
+                self.bend) + j])  # Set k_inv equal to the value specified for this inversion potential in the force constants list
+            # Calculate the vectors along bonds, and construct a vector plane_norm orthogonal to the plane of end ato
+            atom_c = [cartCoordinates[3 * i.atom1], cartCoordinates[3 * i.atom1 + 1], cartCoordinates[3 * i.atom1 + 2]]
+            atom_e1 = [cartCoordinates[3 * i.atom2], cartCoordinates[3 * i.atom2 + 1], cartCoordinates[3 * i.atom2 + 2]]
+            atom_e2 = [cartCoordinates[3 * i.atom3], cartCoordinates[3 * i.atom3 + 1], cartCoordinates[3 * i.atom3 + 2]]
+            atom_e3 = [cartCoordinates[3 * i.atom4], cartCoordinates[3 * i.atom4 + 1], cartCoordinates[3 * i.atom4 + 2]]
+            bond_1 = [atom_e1[i] - atom_c[i] for i in range(3)]
+            bond_2 = [atom_e2[i] - atom_c[i] for i in range(3)]
+            bond_3 = [atom_e3[i] - atom_c[i] for i in range(3)]
+            inplane_12 = [atom_e2[i] - atom_e1[i] for i in range(3)]
+            inplane_13 = [atom_e3[i] - atom_e1[i] for i in range(3)]
+            plane_norm = np.cross(inplane_12, inplane_13)
+
+            # Construct vectors between end atoms and the projection of the central atom on the end-atom pla
+            cross_1 = np.cross(bond_1, plane_norm)
+            cross_2 = np.cross(bond_2, plane_norm)
+            cross_3 = np.cross(bond_3, plane_norm)
+            inplane_1 = np.cross(plane_norm, cross_1) / np.dot(plane_norm, plane_norm)
+            inplane_2 = np.cross(plane_norm, cross_2) / np.dot(plane_norm, plane_norm)
+            inplane_3 = np.cross(plane_norm, cross_3) / np.dot(plane_norm, plane_norm)
+
+            # Calculate the out of plane angle for each of the three bonds
+            cos_phi1 = np.dot(bond_1, inplane_1) / (np.linalg.norm(bond_1) * np.linalg.norm(inplane_1))
+            cos_phi2 = np.dot(bond_2, inplane_2) / (np.linalg.norm(bond_2) * np.linalg.norm(inplane_2))
+            cos_phi3 = np.dot(bond_3, inplane_3) / (np.linalg.norm(bond_3) * np.linalg.norm(inplane_3))
+
+            if (1.0 - (10 ** -15)) <= cos_phi1 and cos_phi1 <= (1.0 + (10 ** -15)):
+                phi1 = 0.0
+            else:
+                phi1 = np.arccos(cos_phi1)
+            if (1.0 - (10 ** -15)) <= cos_phi2 and cos_phi2 <= (1.0 + (10 ** -15)):
+                phi2 = 0.0
+            else:
+                phi2 = np.arccos(cos_phi2)
+            if (1.0 - (10 ** -15)) <= cos_phi3 and cos_phi3 <= (1.0 + (10 ** -15)):
+                phi3 = 0.0
+            else:
+                phi3 = np.arccos(cos_phi3)
+
+            # Take the numerical average of the three out of plane angles
+            # Note - other schemes for obtaining a single out of plane angle could be investigated
+            phi = (phi1 + phi2 + phi3) / 3
+
+            energy = energy + i.energy(phi)
+            i.setk(
+                k_inv0)  # Restore the original value of k_inv so that this inversion potential is not permanently modified by the energy caculation
+        if verbosity >= 1:
+            print("With inversion, energy = " + str(energy))
+
+        torscount = 0
+        for j in range(len(self.tors)):
+            i = self.tors[j]
+            if i.typ == 1 or i.typ == 3:
+                k_tors0 = i.k # Store the original k value associated with this torsion potential
+                # Only torsions of type 1 and 3 have an entry in the force constant list (see fitForceConstants)
+                i.setk(ForceConstants[len(self.stretch) + len(self.str13) + len(self.bend) + len(self.inv) + torscount])
+                torscount += 1
+            # Calculate the vectors lying along bonds, and their cross products
+            atom_e1 = [cartCoordinates[3 * i.atom1], cartCoordinates[3 * i.atom1 + 1], cartCoordinates[3 * i.atom1 + 2]]
+            atom_b1 = [cartCoordinates[3 * i.atom2], cartCoordinates[3 * i.atom2 + 1], cartCoordinates[3 * i.atom2 + 2]]
+            atom_b2 = [cartCoordinates[3 * i.atom3], cartCoordinates[3 * i.atom3 + 1], cartCoordinates[3 * i.atom3 + 2]]
+            atom_e2 = [cartCoordinates[3 * i.atom4], cartCoordinates[3 * i.atom4 + 1], cartCoordinates[3 * i.atom4 + 2]]
+            end_1 = [atom_e1[i] - atom_b1[i] for i in range(3)]
+            bridge = [atom_b1[i] - atom_b2[i] for i in range(3)]
+            end_2 = [atom_b2[i] - atom_e2[i] for i in range(3)]
+            vnormal_1 = np.cross(end_1, bridge)
+            vnormal_2 = np.cross(bridge, end_2)
+
+            # Construct a set of orthogonal basis vectors to define a frame with vnormal_2 as the x axis
+            vcross = np.cross(vnormal_2, bridge)
+            norm_vn2 = np.linalg.norm(vnormal_2)
+            norm_b = np.linalg.norm(bridge)
+            norm_vc = np.linalg.norm(vcross)
+            basis_vn2 = [vnormal_2[i] / norm_vn2 for i in range(3)]
+            basis_b = [bridge[i] / norm_b for i in range(3)]
+            basis_cv = [vcross[i] / norm_vc for i in range(3)]
+
+            # Find the signed angle between vnormal_1 and vnormal_2 in the new frame
+            vn1_coord_n2 = np.dot(vnormal_1, basis_vn2)
+            vn1_coord_vc = np.dot(vnormal_1, basis_cv)
+            psi = math.atan2(vn1_coord_vc, vn1_coord_n2)
+            energy = energy + i.energy(psi)
+            if i.typ == 1 or i.typ == 3:
+                i.setk(k_tors0) # Restore the original force constant associated with this torsion potential so that it is not permanently altered
+        if verbosity >= 1:
+            print("With torsion, energy = " + str(energy))
+
+        if verbosity >= 1: # REMOVE ONCE FIXED
+              print("Omitting all non-covalent interactions") # REMOVE ONCE FIXED
+
+        #    if verbosity >=1: # REMOVE ONCE FIXED
+        #      print("Total energy:") # REMOVE ONCE FIXED
+        #    return energy # REMOVE ONCE FIXED
+
+        #    print("Omitting hydrogen bond interactions") # REMOVE ONCE FIXED
+        #    print("Omitting all non-covalent interactions except hydrogen bonding")
+        #    print("Omitting all non-covalent interactions expcept halogen bonding")   
+        #    print("Omitting all non-covalent interactions except Pauli repulsion")   
+        #    print("Omitting all non-covalent interactions except electrostatics")
+        #    print("Omitting all non-covalent interactions except dispersion")
+
+        e_hbnd = 0.0
+        for i in self.hatoms:
+            atH = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+            for j in self.highENatoms:
+                atA = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                # Calculate distance between hydrogen i and electronegative atom j
+                # Determine whether they are (likely) joined by a covalent bond
+                dist_HA = (atH[0] - atA[0]) ** 2
+                dist_HA += (atH[1] - atA[1]) ** 2
+                dist_HA += (atH[2] - atA[2]) ** 2
+                dist_HA = math.sqrt(dist_HA)
+                bond_dist_HA = SymbolToRadius[self.atoms[i].symbol] + SymbolToRadius[self.atoms[j].symbol]
+                if dist_HA <= bond_dist_HA:
+                    for k in self.highENatoms:
+                        atB = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                        # Calculate distance between hydrogen i and electronegative atom k
+                        # Determine whether they are close enough for a hydrogen bonding interaction
+                        dist_HB = (atH[0] - atB[0]) ** 2
+                        dist_HB += (atH[1] - atB[1]) ** 2
+                        dist_HB += (atH[2] - atB[2]) ** 2
+                        dist_HB = math.sqrt(dist_HB)
+                        Hbond_dist_HB = SymbolToVdWRadius[self.atoms[i].symbol] + SymbolToVdWRadius[
+                            self.atoms[k].symbol]
+                        # If so, and if A and B are distinct, take the triple AHB to be involved in hydrogen bonding and use to calculate energy
+                        if dist_HB <= Hbond_dist_HB and atA != atB:
+                            dist_AB = (atA[0] - atB[0]) ** 2
+                            dist_AB += (atA[1] - atB[1]) ** 2
+                            dist_AB += (atA[2] - atB[2]) ** 2
+                            dist_AB = math.sqrt(dist_AB)
+
+                            # Use the calculated distances and the cosine rule to calculate AHB andgle theta
+                            numerator = dist_HA ** 2 + dist_HB ** 2 - dist_AB ** 2
+                            denominator = 2 * dist_HA * dist_HB
+                            argument = numerator / denominator
+                            theta = np.arccos(argument)
+
+                            # Calculate the relevant constants for a hydrogen bonding potential
+                            c_hbnd_AB = HBondStrengthFactor(j.symbol, j.charge, dist_HA, k.symbol, k.charge, dist_HB)
+                            f_dmp_theta = AngleDamping(theta)
+                            f_dmp_hbnd = HBondDamping(j.symbol, k.symbol, dist_AB)
+
+                            # Calculate the energy of this interaction, and add to the total hydrogen bonding contribution
+                            e_hbnd = e_hbnd + potHBond(f_dmp_theta, f_dmp_hbnd, c_hbnd_AB, dist_AB)
+        # Calculate total hydrogen bonding contribution from the sum over AHB triples, and add to energy
+        e_hbnd = -1 * e_hbnd
+        energy = energy + e_hbnd
+        if verbosity >= 1:
+            print("With hydrogen bonding, energy = " + str(energy))
+        # print("Omitting halogen bonding interactions")
+
+        e_xbnd = 0.0
+        for i in self.halogens:
+            atX = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+            # Locate bonding partner(s), Y, for X by searching through the list of bonds in the molecule
+            bondsX = []
+            for j in range(len(self.bonds)):
+                if self.bonds[j][0] == i:
+                    bondsX.append([self.bonds[j][1], self.bonds[j][0]])
+                elif self.bonds[j][1] == i:
+                    bondsX.append(self.bonds[j])
+            # Locate donor atoms D that could participate in halogen bonding (check for not being bonded to X implemented later)
+            # Sum of van der Waals radii currently employed as a check for this
+            donors = []
+            for k in range(len(self.atoms)):
+                sym = self.atoms[k].symbol
+                donorsyms = ["N", "O", "F", "P", "S", "Cl", "As", "Se", "Br", "Sb", "Te", "I", "Bi", "Bi", "Po", "At",
+                             "Uup", "Lv", "Uus"]
+                if sym in donorsyms:
+                    atD = [cartCoordinates[3 * k], cartCoordinates[3 * k + 1], cartCoordinates[3 * k + 2]]
+                    dist_XD = (atX[0] - atD[0]) ** 2
+                    dist_XD += (atX[1] - atD[1]) ** 2
+                    dist_XD += (atX[2] - atD[2]) ** 2
+                    dist_XD = math.sqrt(dist_XD)
+                    Xbond_dist_XD = SymbolToVdWRadius[self.atoms[k].symbol] + SymbolToVdWRadius[self.atoms[i].symbol]
+                    if dist_XD <= Xbond_dist_XD:
+                        donors.append([k, dist_XD])
+            # For each triple formed by a bond YX and donor D, calculate halogen bonding potential
+            for bond in bondsX:
+                for donor in donors:
+                    if donor[0] != bond[0] and donor[0] != bond[1]:
+                        symY = bond[0].symbol
+                        coordY = [cartCoordinates[3 * bond[0]], cartCoordinates[3 * bond[0] + 1],
+                                  cartCoordinates[3 * bond[0] + 2]]
+                        symX = self.atoms[i].symbol
+                        coordX = atX
+                        symD = donor[0].symbol
+                        coordD = [cartCoordinates[3 * donor[0]], cartCoordinates[3 * donor[0] + 1],
+                                  cartCoordinates[3 * donor[0] + 2]]
+                        r_XD = self.atoms[donor[1]].symbol
+
+                        # Calculate the DXY angle
+                        r_XY = (coordY[0] - coordX[0]) ** 2
+                        r_XY += (coordY[1] - coordX[1]) ** 2
+                        r_XY += (coordY[2] - coordX[2]) ** 2
+                        r_XY = math.sqrt(r_XY)
+
+                        r_DY = (coordY[0] - coordD[0]) ** 2
+                        r_DY += (coordY[1] - coordD[1]) ** 2
+                        r_DY += (coordY[2] - coordD[2]) ** 2
+                        r_DY = math.sqrt(r_DY)
+
+                        numerator = r_XD ** 2 + r_XY ** 2 - r_DY ** 2
+                        denominator = 2 * r_XD * r_XY
+                        argument = numerator / denominator
+                        theta = np.arccos(argument)
+
+                        # Calculate the relevant constants for a halogen bonding potential
+                        f_dmp_theta = AngleDamping(theta)
+                        f_dmp_xbnd = HBondDamping(symX, symD, r_XD)
+                        c_xbnd = AtomicXBondFactor(symX, self.atoms[i].charge)
+
+                        # Calculate the energy of this halogen bonding interaction and add to the total
+                        e_xbnd = e_xbnd + potXBond(f_dmp_theta, f_dmp_xbnd, c_xbnd_x, r_XD)
+                        # Calculate total halogen bonding contribution from the sum over DXY triples, and add to energy of the molecule
+        e_xbnd = -1 * e_xbnd
+        energy = energy + e_xbnd
+        if verbosity >= 1:
+            print("With halogen bonding, energy = " + str(energy))
+        # print("Omitting all Pauli repulsion interactions")
+
+        # Nested lists of the pair parameters, for fast access to single elements in the loops below
+        params = {key: value.tolist() for key, value in self.pairParameters().items()}
+        rep_disp, elstat = params["rep_disp"], params["elstat"]
+        e_Pauli = 0.0
+        for i in range(len(self.atoms)):
+            for j in range(i + 1, len(self.atoms)):
+                # Calculate the distance between atoms i and j
+                coordA = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+                coordB = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                distance = (coordA[0] - coordB[0]) ** 2
+                distance += (coordA[1] - coordB[1]) ** 2
+                distance += (coordA[2] - coordB[2]) ** 2
+                distance = math.sqrt(distance)
+                # Calculate the required screening parameter, then the energy for this pair, and add to the total
+                # Note that proper calculation will require the D3 cutoff radii R_0D3 which are yet to be worked in
+                # As potPauliRep(), with the pair parameters looked up once in pairParameters()
+                rep_disp_AB = rep_disp[i][j]
+                energy_AB = rep_disp_AB * (params["z_eff_AB"][i][j] / distance) * math.exp(
+                    -1 * params["decay_AB"][i][j] * distance)
+                e_Pauli = e_Pauli + energy_AB
+        energy = energy + e_Pauli
+        if verbosity >= 1:
+            print("With Pauli repulsion, energy = " + str(energy))
+        # print("Omitting all electrostatic interactions")
+
+        e_ES = 0.0
+        for i in range(len(self.atoms)):
+            for j in range(i + 1, len(self.atoms)):
+                # Note QM computed atomic charges at equilibrium structure should be used as per QMDFF
+                # Currently the charge in class atom is used, which comes from atomic number
+                chgA = self.atoms[i].QMcharge
+                chgB = self.atoms[j].QMcharge
+
+                # Calculate the distance between atoms i and j
+                coordA = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+                coordB = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                distance = (coordA[0] - coordB[0]) ** 2
+                distance += (coordA[1] - coordB[1]) ** 2
+                distance += (coordA[2] - coordB[2]) ** 2
+                distance = math.sqrt(distance)
+
+                # Calculate the required screening parameter, and the energy for this paiwise interaction, then add to the total
+                elstat_AB = elstat[i][j]
+                energy_AB = potElectrostatic(elstat_AB, chgA, chgB, distance)
+                e_ES = e_ES + energy_AB
+                #        print("Adding ES energy for atoms " + str([i, j]) + " with charges " + str([chgA, chgB]) + ", distance " + str(distance) + ", screening parameter " + str(elstat_AB) + ", giving energy = " + str(energy_AB))
+        energy = energy + e_ES
+        if verbosity >= 1:
+            print("With electrostatic interactions, energy = " + str(energy))
+        # print("Omitting all dispersion interactions")
+
+        e_disp = 0.0
+        for i in range(len(self.atoms)):
+            for j in range(len(self.atoms)):
+                # Calculate the distance between atoms i and j
+                coordA = [cartCoordinates[3 * i], cartCoordinates[3 * i + 1], cartCoordinates[3 * i + 2]]
+                coordB = [cartCoordinates[3 * j], cartCoordinates[3 * j + 1], cartCoordinates[3 * j + 2]]
+                distance = (coordA[0] - coordB[0]) ** 2
+                distance += (coordA[1] - coordB[1]) ** 2
+                distance += (coordA[2] - coordB[2]) ** 2
+                distance = math.sqrt(distance)
+                # Calculate the required paramenters and thence the energy for this pairwise interaction, then add to the total
+                # Note that this is incomplete until the D3 cutoff radii R_0D3, as well as the coefficients C6_AB and C8_AB, are incorporated properly
+                rep_disp_AB = rep_disp[i][j]
+                C6_AB = params["C6_AB"][i][j]
+                C8_AB = C6_AB  # To be completed - temporarily set equal to C6 for test run only
+                if dtyp == 1:
+                    energy_AB = potCSODisp(C6_AB, distance, params["R0_AB"][i][j])
+                elif dtyp == 2:
+                    energy_AB = potLondonDisp(rep_disp_AB, C6_AB, C8_AB, params["BJdamp_AB"][i][j], distance)
+                e_disp = e_disp + energy_AB
+        energy = energy + e_disp
+        if verbosity >= 1:
+            print("With London dispersion, energy = " + str(energy))
+
+        # Calculation of polarisation energy (for solute-solvent) to go here in future
+        # Left out for version 1 as optional, only important as intermolecular interactions
+
+        if verbosity >= 1:
+            print("Total energy:")
+        return (energy)
+
+    def kdepTermTable(self, ForceConstants):
+        """ (Molecule) -> dict
+
+    Returns a copy of the term table of the molecule with the stretch, 1,3-stretch, bend and inversion force
+    constants, and those of the type 1 and 3 torsions, replaced by the values in ForceConstants, which are
+    ordered as in kdepFFEnergy and fitForceConstants. The molecule itself is left unchanged.
+    """
+
+        if self.termtable is None:
+            self.compileTermTable()
+        table = {family: dict(self.termtable[family]) for family in self.termtable}
+        ForceConstants = np.asarray(ForceConstants, dtype=float)
+        start = 0
+        for family in ("stretch", "str13", "bend", "inv"):
+            end = start + len(table[family]["typ"])
+            table[family]["k"] = ForceConstants[start:end].copy()
+            start = end
+        typ = table["tors"]["typ"]
+        fitted = np.flatnonzero((typ == 1) | (typ == 3))
+        k_fitted = ForceConstants[start:start + len(fitted)]
+        table["tors"]["k"] = table["tors"]["k"].copy()
+        table["tors"]["k_tors"] = table["tors"]["k_tors"].copy()
+        # Type 1 torsions keep their force constant in k, type 3 as the single term of their cosine series
+        table["tors"]["k"][fitted[typ[fitted] == 1]] = k_fitted[typ[fitted] == 1]
+        table["tors"]["k_tors"][fitted[typ[fitted] == 3], 0] = k_fitted[typ[fitted] == 3]
+
+        return table
+
+    def kdepHessian(self, ForceConstants, numerical=False, nprocs=1):
+        """ (Molecule) -> 3N x 3N matrix
+
+    Returns the Hessian matrix for the molecule with the specified list of force constants, calculated analytically
+    from the term table. With numerical=True, the Hessian is instead calculated by central differences of the
+    analytic gradient on a pool of nprocs worker processes (see numericalHessian), and with numerical="energy"
+    by finite differences of kdepFFEnergy, which is much slower; both can serve to verify the analytic result.
+    """
+        if not numerical:
+            return self.FFHessian(self.cartesianCoordinates(), table=self.kdepTermTable(ForceConstants))
+        if numerical != "energy":
+            return numericalHessian(self, self.cartesianCoordinates(), nprocs=nprocs,
+                                    table=self.kdepTermTable(ForceConstants))
+
+        # For greater flexibility in usage, a list of Cartesian Coordinates could also be given as an argument if dependence upon force constants alone were not desired
+        # Take the original Cartesian coordinates of the molecule as initial geometry
+        coords = self.cartesianCoordinates()
+        epsilon = 1 * (10 ** -5)
+        # Use the finite difference approximation to calculate first derivatives at the initial geometry
+        deriv1 = scipy.optimize.approx_fprime(coords, self.kdepFFEnergy, epsilon,
+                                              ForceConstants)  # Note verbosity option not passed as an argument, so cannot be used from kdepFFEnergy at present except by modifying default values
+        # Set up a zero matrix to become the Force Field Hessian
+        n = len(coords)
+        H_FF = np.zeros((n, n))
+        # For each coordinate, displace by epsilon and calculate the second derivatives using another finite difference approximation
+        for i in range(n):
+            x0 = coords[i]
+            coords[i] = x0 + epsilon
+            deriv2 = scipy.optimize.approx_fprime(coords, self.kdepFFEnergy, epsilon,
+                                                  ForceConstants)  # Same comments on verbosity and checks apply as above
+            # Place the calculated second derivatives for coordinate i into the ith column of the Hessian matrix
+            H_FF[:, i] = (deriv2 - deriv1) / epsilon
+            coords[i] = x0
+        return H_FF
+
+    def kdepHessianBasis(self):
+        """ (Molecule) -> (3N x 3N matrix, array)
+
+    Returns the decomposition H_FF(k) = H_0 + sum_p k_p B_p of the Force Field Hessian at the current structure,
+    which is exact because every fitted force constant enters its potential linearly. H_0 is the Hessian with all
+    fitted force constants set to zero (non-bonded terms and the terms without a fitted force constant), and B_p
+    the Hessian of term p with unit force constant. The B_p are returned as the columns of an array whose rows
+    run over the upper triangle of the Hessian, in the order of np.triu_indices(3N).
+    Force constants are ordered as in kdepFFEnergy and fitForceConstants.
+    """
+
+        X = np.asarray(self.cartesianCoordinates(), dtype=float).reshape(-1, 3)
+        n = 3 * len(X)
+        table_0 = self.kdepTermTable(np.zeros(self.numFittedForceConstants()))
+        table = self.kdepTermTable(np.ones(self.numFittedForceConstants()))
+        H_0 = self.FFHessian(X, table=table_0)
+
+        # Position of each entry of the full Hessian in the list of upper triangle entries
+        ut_index = np.full((n, n), -1, dtype=int)
+        ut_index[np.triu_indices(n)] = np.arange(n * (n + 1) // 2)
+        basis = np.zeros((n * (n + 1) // 2, self.numFittedForceConstants()))
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start("kdepHessianBasis")
+
+        column = 0
+        for family, geometry, potential in (("stretch", termDistances, stretchTableEnergies),
+                                            ("str13", termDistances, stretchTableEnergies),
+                                            ("bend", termAngles, bendTableEnergies),
+                                            ("inv", termOutOfPlane, inversionTableEnergies),
+                                            ("tors", termDihedrals, torsionTableEnergies)):
+            terms = np.arange(len(table[family]["typ"]))
+            if family == "tors":
+                terms = terms[(table[family]["typ"] == 1) | (table[family]["typ"] == 3)]
+            if len(terms) == 0:
+                continue
+            idx = table[family]["idx"]
+            q, dq, d2q = geometry(X, idx, deriv=2)
+            # Difference of the unit and zero force constant potentials, as some stretch types (Morse) do not use k
+            u, du, d2u = potential(q, table[family], deriv=2)
+            u_0, du_0, d2u_0 = potential(q, table_0[family], deriv=2)
+            du, d2u = du - du_0, d2u - d2u_0
+            block = (du[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis] * d2q
+                     + d2u[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis] * np.einsum('mai,mbj->maibj', dq, dq))
+            # Cartesian index of every entry of every term block, keeping only those in the upper triangle
+            cart = 3 * idx[:, :, np.newaxis] + np.arange(3)
+            k = idx.shape[1]
+            rows = cart.reshape(-1, 3 * k)[:, :, np.newaxis]
+            cols = cart.reshape(-1, 3 * k)[:, np.newaxis, :]
+            rows, cols = np.broadcast_arrays(rows[terms], cols[terms])
+            values = block.reshape(-1, 3 * k, 3 * k)[terms]
+            columns = np.broadcast_to((column + np.arange(len(terms)))[:, np.newaxis, np.newaxis], rows.shape)
+            upper = rows <= cols
+            np.add.at(basis, (ut_index[rows[upper], cols[upper]], columns[upper]), values[upper])
+            column += len(terms)
+            if profiler is not None:
+                profiler.lap(family)
+
+        return H_0, basis
+
+    def numFittedForceConstants(self):
+        """ (Molecule) -> int
+
+    Returns the number of force constants determined by the Hessian fit
+    """
+
+        return len(self.stretch) + len(self.str13) + len(self.bend) + len(self.inv) + len(
+            [i for i in self.tors if i.typ == 1 or i.typ == 3])
+
+    def HessianDiffSquared(self, ForceConstants):
+        """
+        Objective function to be minimised in the Hessian fit
+        Gives squared deviation between QM Hessian H_QM and Force Field Hessian H_FF
+        """
+        # Take the QM calculated Hessian stored as an attribute of the molecule
+        H_QM = self.H_QM
+        # Calculate the Force Field Hessian for the given force constants
+        H_FF = self.kdepHessian(ForceConstants)
+
+        # Sum of the squared differences between all entries of the two (equally shaped) matrices
+        return np.sum((H_QM - H_FF) ** 2)
+
+    def HessianDiffSquaredGradient(self, ForceConstants, basis=None):
+        """ (Molecule) -> (number, array)
+
+    Returns the squared deviation between the QM and Force Field Hessians, as HessianDiffSquared, together with its
+    analytic gradient with respect to the force constants, from a single Force Field Hessian. As the Force Field
+    Hessian is linear in the force constants, the derivative of the deviation with respect to force constant p is
+    -2 times the sum of (H_QM - H_FF) * B_p over all entries, with B_p from kdepHessianBasis. The basis can be
+    given to avoid recomputing it for every set of force constants.
+    """
+
+        if basis is None:
+            basis = self.kdepHessianBasis()[1]
+        diff = self.H_QM - self.kdepHessian(ForceConstants)
+        upper = np.triu_indices(len(diff))
+        # The basis holds the upper triangle only; off-diagonal entries stand for both halves of the Hessian
+        weight = np.where(upper[0] == upper[1], 1.0, 2.0)
+
+        return np.sum(diff ** 2), -2 * basis.T @ (weight * diff[upper])
+
+    def projectedNormalModes(self):
+        """ (Molecule) -> (array, array, array)
+
+    Returns the normal modes of the QM Hessian H_QM in mass-weighted cartesian coordinates, with the translations
+    and rotations about the centre of mass projected out: a (3N, M) array with the M = 3N - 6 (3N - 5 for linear
+    molecules) modes as columns, their eigenvalues (the squared angular frequencies in the units of the Hessian
+    and of the atomic masses) and the 3N inverse square roots of the masses, which convert a Hessian into
+    mass-weighted coordinates.
+    """
+
+        X = np.asarray(self.cartesianCoordinates(), dtype=float).reshape(-1, 3)
+        mass = np.array([atom.mass for atom in self.atoms], dtype=float)
+        sqrtmass = np.sqrt(mass)[:, np.newaxis]
+        centred = X - mass @ X / np.sum(mass)
+
+        # Infinitesimal translations and rotations in mass-weighted coordinates
+        motions = [(np.eye(3)[d] * sqrtmass).flatten() for d in range(3)]
+        motions += [(np.cross(np.eye(3)[d], centred) * sqrtmass).flatten() for d in range(3)]
+        U, s, Vt = np.linalg.svd(np.array(motions).T)
+        rigid = np.count_nonzero(s > 1.0e-6 * s[0])
+        internal = U[:, rigid:]
+
+        minvsqrt = 1 / np.repeat(sqrtmass[:, 0], 3)
+        H_mw = minvsqrt[:, np.newaxis] * self.H_QM * minvsqrt
+        eigenvalues, vectors = np.linalg.eigh(internal.T @ H_mw @ internal)
+
+        return internal @ vectors, eigenvalues, minvsqrt
+
+    def normalModeScaling(self, eigenvalues, power=0.0):
+        """ (Molecule) -> array
+
+    Returns the scale factors |lambda_a|^(power / 2) by which the deviations between mode a and any mode b are
+    divided in NormalModeDiffSquared. power=0 weights all modes alike, while power=1 turns the diagonal deviations
+    into relative errors of the eigenvalues, i.e. about twice the relative errors of the frequencies, so that
+    soft modes count as much as stiff ones. Eigenvalues are taken at least 1e-3 times the largest one.
+    """
+
+        magnitude = np.abs(eigenvalues)
+        floor = 1.0e-3 * np.max(magnitude, initial=0.0)
+
+        return np.maximum(magnitude, floor) ** (power / 2)
+
+    def normalModeResidual(self, ForceConstants, power=0.0, modes=None):
+        """ (Molecule) -> (array, array, array)
+
+    Returns the deviation between the QM and Force Field Hessians in mass-weighted coordinates, projected onto the
+    vibrational normal modes of the QM Hessian and scaled by the factors of normalModeScaling, as an M x M matrix.
+    Also returns the cartesian components of the mass-weighted modes, Q, such that Q^T H Q is the mass-weighted
+    Hessian H in mode space, and the scale factors. The normal modes from projectedNormalModes can be given to
+    avoid recomputing them.
+    """
+
+        if modes is None:
+            modes = self.projectedNormalModes()
+        vectors, eigenvalues, minvsqrt = modes
+        scaling = self.normalModeScaling(eigenvalues, power)
+        Q = minvsqrt[:, np.newaxis] * vectors
+        residual = (np.diag(eigenvalues) - Q.T @ self.kdepHessian(ForceConstants) @ Q) / np.outer(scaling, scaling)
+
+        return residual, Q, scaling
+
+    def NormalModeDiffSquared(self, ForceConstants, power=0.0, modes=None):
+        """
+        Objective function for the Hessian fit in normal-mode space
+        Gives squared deviation between QM and Force Field Hessians in the space of the vibrational normal modes of
+        the QM Hessian, see normalModeResidual, so that translations and rotations do not contribute
+        """
+
+        return np.sum(self.normalModeResidual(ForceConstants, power, modes)[0] ** 2)
+
+    def NormalModeDiffSquaredGradient(self, ForceConstants, power=0.0, basis=None, modes=None):
+        """ (Molecule) -> (number, array)
+
+    Returns NormalModeDiffSquared together with its analytic gradient with respect to the force constants, obtained
+    as in HessianDiffSquaredGradient from the Hessian basis of kdepHessianBasis, which can be given as well
+    """
+
+        residual, Q, scaling = self.normalModeResidual(ForceConstants, power, modes)
+        if basis is None:
+            basis = self.kdepHessianBasis()[1]
+        # Derivatives of the objective with respect to the cartesian Hessian entries, of which the basis holds
+        # the upper triangle; off-diagonal entries stand for both halves of the Hessian
+        G = Q @ (residual / np.outer(scaling, scaling)) @ Q.T
+        upper = np.triu_indices(len(G))
+        weight = np.where(upper[0] == upper[1], 1.0, 2.0)
+
+        return np.sum(residual ** 2), -2 * basis.T @ (weight * G[upper])
+
+    def assembleDihedralScanFragments(self, dihedral):
+        """ (Molecule) -> two Fragments (type molecule) for dihedral angle scan
+
+        Returns two fragments for the potential energy curve scan to parametrise
+        dihedral angle potentials
+        """
+
+        # Create right hand side of the dihedral angle
+        right = Molecule("Right side of the dihedral", 0)
+
+        # Create the left hand side of the dihedral angle
+        left = Molecule("Left side of the dihedral", 0)
+
+        # Add the two "middle atoms" of the dihedral to the right and left side
+        right.addAtom(Atom(self.atoms[dihedral[1]].symbol, self.atoms[dihedral[1]].coord[0], self.atoms[dihedral[1]].coord[1], self.atoms[dihedral[1]].coord[2], self.atoms[dihedral[1]].charge))
+        left.addAtom(Atom(self.atoms[dihedral[2]].symbol, self.atoms[dihedral[2]].coord[0], self.atoms[dihedral[2]].coord[1], self.atoms[dihedral[2]].coord[2], self.atoms[dihedral[2]].charge))
+
+        # Setup two lists to keep track of atoms on either side
+        rightlist = []
+        leftlist = []
+
+        # Loop though all bonds and add all directly bonded atoms to either right or left
+        # Also add the new atoms to the prepared lists
+        # for i in self.bonds:
+        #     if i[0] == dihedral[1] and i[1] != dihedral[2]:
+        #         right.addAtom(self.atoms[i[1]])
+        #         rightlist.append(i[1])
+        #     if i[1] == dihedral[1] and i[0] != dihedral[2]:
+        #         right.addAtom(self.atoms[i[0]])
+        #         rightlist.append(i[0])
+        #     if i[0] == dihedral[2] and i[1] != dihedral[1]:
+        #         left.addAtom(self.atoms[i[1]])
+        #         leftlist.append(i[1])
+        #     if i[1] == dihedral[2] and i[0] != dihedral[1]:
+        #         left.addAtom(self.atoms[i[0]])
+        #         leftlist.append(i[0])
+        for i in self.bonds:
+            if i[0] == dihedral[1] and i[1] != dihedral[2]:
+                right.addAtom(Atom(self.atoms[i[1]].symbol, self.atoms[i[1]].coord[0], self.atoms[i[1]].coord[1],
+                                   self.atoms[i[1]].coord[2], self.atoms[i[1]].charge))
+                rightlist.append(i[1])
+            if i[1] == dihedral[1] and i[0] != dihedral[2]:
+                right.addAtom(Atom(self.atoms[i[0]].symbol, self.atoms[i[0]].coord[0], self.atoms[i[0]].coord[1],
+                                   self.atoms[i[0]].coord[2], self.atoms[i[0]].charge))
+                rightlist.append(i[0])
+            if i[0] == dihedral[2] and i[1] != dihedral[1]:
+                left.addAtom(Atom(self.atoms[i[1]].symbol, self.atoms[i[1]].coord[0], self.atoms[i[1]].coord[1],
+                                  self.atoms[i[1]].coord[2], self.atoms[i[1]].charge))
+                leftlist.append(i[1])
+            if i[1] == dihedral[2] and i[0] != dihedral[1]:
+                left.addAtom(Atom(self.atoms[i[0]].symbol, self.atoms[i[0]].coord[0], self.atoms[i[0]].coord[1],
+                                  self.atoms[i[0]].coord[2], self.atoms[i[0]].charge))
+                leftlist.append(i[0])
+
+        # Setup two more lists to keep track of "second shell"  atoms
+        rightlist2 = []
+        leftlist2 = []
+
+        # Now loop again and add atoms that are bonded to the newly added atoms
+        # but add hydrogen atoms instead of the originals
+        for i in self.bonds:
+            if i[0] in rightlist and i[1] != dihedral[1] and i[1] not in rightlist:
+                #print(self.atoms[i[1]])
+                #print(Atom("H", self.atoms[i[1]].coord[0], self.atoms[i[1]].coord[1], self.atoms[i[1]].coord[2], 1.0))
+                right.addAtom(Atom("H", self.atoms[i[1]].coord[0], self.atoms[i[1]].coord[1], self.atoms[i[1]].coord[2], 1.0))
+                rightlist2.append(i[1])
+            if i[1] in rightlist and i[0] != dihedral[1] and i[0] not in rightlist:
+                #print(self.atoms[i[0]])
+                #print(Atom("H", self.atoms[i[0]].coord[0], self.atoms[i[0]].coord[1], self.atoms[i[0]].coord[2], 1.0))
+                right.addAtom(Atom("H", self.atoms[i[0]].coord[0], self.atoms[i[0]].coord[1], self.atoms[i[0]].coord[2], 1.0))
+                rightlist2.append(i[0])
+            if i[0] in leftlist and i[1] != dihedral[2] and i[1] not in leftlist:
+                #print(self.atoms[i[1]])
+                #print(Atom("H", self.atoms[i[1]].coord[0], self.atoms[i[1]].coord[1], self.atoms[i[1]].coord[2], 1.0))
+                left.addAtom(Atom("H", self.atoms[i[1]].coord[0], self.atoms[i[1]].coord[1], self.atoms[i[1]].coord[2], 1.0))
+                leftlist2.append(i[1])
+            if i[1] in leftlist and i[0] != dihedral[2] and i[0] not in leftlist:
+                #print(self.atoms[i[0]])
+                #print(Atom("H", self.atoms[i[0]].coord[0], self.atoms[i[0]].coord[1], self.atoms[i[0]].coord[2], 1.0))
+                left.addAtom(Atom("H", self.atoms[i[0]].coord[0], self.atoms[i[0]].coord[1], self.atoms[i[0]].coord[2], 1.0))
+                leftlist2.append(i[0])
+
+        return right, left
+
+
+    def HMOEnergy(self, K=1.75, charge=None, verbosity=0, typ=1, cutoff=1.0e-9):
+        """ (Molecule) -> number (extended Hueckel aka Tight Binding energy)
+
+          Returns a number containing the molecular energy according to the current extended Hueckel aka Tight Binding
+          definition at structure specified by the provided cartesian coordinates. The number of electrons follows
+          from the charge, which defaults to the charge of the molecule. Returns infinity if the electrons do
+          not fit into the basis. Overlaps between atoms so far apart that they are below cutoff are neglected;
+          with cutoff None or <= 0, no overlaps are neglected.
+        """
+
+        # The argument typ selects the solver for HC=SCE, see solveHueckel()
+
+        # Assemble an array that holds information about the basis set.
+        molbasis = []
+        valence_electrons = 0
+        for atomnum, i in enumerate(self.atoms):
+            valence_electrons += i.valele
+            for j in i.basis:
+                for k in range(-1 * j.l, j.l + 1):
+                    molbasis.append([atomnum, j.n, j.l, k, j.exp, j.ie])
+        if charge is None:
+            charge = self.charge
+        valence_electrons -= charge
+        if valence_electrons < 0 or valence_electrons > 2 * len(molbasis):
+            if verbosity >= 1:
+                ProgramWarning()
+                print("{} electrons do not fit into {} basis functions".format(valence_electrons, len(molbasis)))
+            return np.inf
+
+        # Print the atomic basis of the calculation in a pretty way (with symbols instead of pure quantum numbers
+        if verbosity >= 2 and verbosity < 3:
+            print("\nBasis Functions")
+            print("  Atom            exp     VSIE")
+            for i in molbasis:
+                print(
+                    " {: >3}({: >3}) {:>2}{}{:<2}  {:.4f}  {: .5f}".format(self.atoms[i[0]].symbol, i[0], i[1],
+                                                                           qn2symb(i[2]), qn2symb(i[2], i[3]), i[4],
+                                                                           i[5]))
+        # Print the atomic basis of the calculation with the quantum numbers themselves shown
+        elif verbosity >= 3:
+            print("\nBasis Functions")
+            print("  Atom      n   l   m   exp     VSIE")
+            for i in molbasis:
+                print(
+                    " {: >3}({: >3}) {: >3} {: >3} {: >3}  {:.4f}  {: .5f}".format(self.atoms[i[0]].symbol, i[0], i[1],
+                                                                                   i[2], i[3], i[4], i[5]))
+
+        # Create overlap matrix, with all basis function pairs evaluated together
+        overlap = sto.OverlapMatrix([[i[0], i[1], i[2], i[3], i[4]] for i in molbasis],
+                                     [i.coord for i in self.atoms], threshold=cutoff)
+        if verbosity >= 3:
+            # Print routine for the overlap matrix
+            print("\nOverlap Matrix")
+            s = [""] * (len(overlap) + 1)
+            for i in range(0, len(overlap)):
+                s[0] += "{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[i][0]].symbol,
+                                                            molbasis[i][0], molbasis[i][1],
+                                                            qn2symb(molbasis[i][2]),
+                                                            qn2symb(molbasis[i][2], molbasis[i][3]))
+                for j in range(0, len(overlap)):
+                    s[i + 1] += "   {: .6f} ".format(overlap[i][j])
+            for i in range(0, len(s[0]), 65):
+                for j in range(0, (len(overlap) + 1)):
+                    if len(s[j]) < (i + 65):
+                        if j == 0:
+                            print("              " + s[j][i:len(s[0])])
+
+                        else:
+                            print("{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[j - 1][0]].symbol,
+                                                                      molbasis[j - 1][0], molbasis[j - 1][1],
+                                                                      qn2symb(molbasis[j - 1][2]),
+                                                                      qn2symb(molbasis[j - 1][2], molbasis[j - 1][3])) +
+                                  s[j][i:len(s[0])])
+
+                    else:
+                        if j == 0:
+                            print("              " + s[j][i:i + 65])
+                        else:
+                            print("{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[j - 1][0]].symbol,
+                                                                      molbasis[j - 1][0], molbasis[j - 1][1],
+                                                                      qn2symb(molbasis[j - 1][2]),
+                                                                      qn2symb(molbasis[j - 1][2], molbasis[j - 1][3])) +
+                                  s[j][i:i + 65])
+                print("")
+
+        # Create Hamiltonian matrix: Wolfsberg-Helmholtz for off-diagonal elements and
+        # Valence State Ionisation Energies for diagonal elements
+        vsie = np.array([i[5] for i in molbasis])
+        hamiltonian = K * overlap * ((vsie[:, np.newaxis] + vsie[np.newaxis, :]) / 2)
+        np.fill_diagonal(hamiltonian, vsie)
+        if verbosity >= 3:
+            # Print routine for the Hamiltonian matrix
+            print("\nHamiltonian Matrix")
+            s = [""] * (len(hamiltonian) + 1)
+            for i in range(0, len(hamiltonian)):
+                s[0] += "{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[i][0]].symbol,
+                                                            molbasis[i][0], molbasis[i][1],
+                                                            qn2symb(molbasis[i][2]),
+                                                            qn2symb(molbasis[i][2], molbasis[i][3]))
+                for j in range(0, len(hamiltonian)):
+                    s[i + 1] += "   {: .6f} ".format(hamiltonian[i][j])
+            for i in range(0, len(s[0]), 65):
+                for j in range(0, (len(hamiltonian) + 1)):
+                    if len(s[j]) < (i + 65):
+                        if j == 0:
+                            print("              " + s[j][i:len(s[0])])
+
+                        else:
+                            print("{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[j - 1][0]].symbol,
+                                                                      molbasis[j - 1][0], molbasis[j - 1][1],
+                                                                      qn2symb(molbasis[j - 1][2]),
+                                                                      qn2symb(molbasis[j - 1][2], molbasis[j - 1][3])) +
+                                  s[j][i:len(s[0])])
+
+                    else:
+                        if j == 0:
+                            print("              " + s[j][i:i + 65])
+                        else:
+                            print("{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[j - 1][0]].symbol,
+                                                                      molbasis[j - 1][0], molbasis[j - 1][1],
+                                                                      qn2symb(molbasis[j - 1][2]),
+                                                                      qn2symb(molbasis[j - 1][2], molbasis[j - 1][3])) +
+                                  s[j][i:i + 65])
+                print("")
+
+        # Use SciPy algorithm for generalised eigenvalue problem to solve
+        # HC = SCE, H and S are our input matrices, E holds the energies and C are the coefficients.
+        MOEnergies, MOVectors = solveHueckel(hamiltonian, overlap, typ, verbosity)
+
+        # Calculate total energy as sum over energies of occupied MOs
+        energy = 0.0
+        for i in range(0, valence_electrons):
+            energy += MOEnergies[i // 2]
+
+        # Print MO energies
+        if verbosity >= 3:
+            print("\nMO Energies ({} electrons, total energy {: .5f} hartree)".format(valence_electrons, energy))
+            s = ""
+            for i in range(0, len(MOEnergies)):
+                s += " {: .5f}".format(MOEnergies[i])
+            for i in range(0, len(s), 72):
+                if len(s) < (i + 72):
+                    print(s[i:len(s)])
+                else:
+                    print(s[i:i + 72])
+
+        # Print MO vectors in a pretty way with MO numbers, energies and occupations. Each row is prefixed by the
+        # atomic orbital that controbutes to the MO.
+        if verbosity >= 2:
+            print("\nMO Vectors")
+            s = [""] * (len(MOVectors) + 3)
+            for i in range(0, len(MOVectors)):
+                s[0] += " {:>8} ".format(i + 1)
+                s[1] += " {: .6f}".format(MOEnergies[i])
+                if (i * 2) + 1 < valence_electrons:
+                    s[2] += " {:>8} ".format(2)
+                elif (i * 2) + 1 == valence_electrons:
+                    s[2] += " {:>8} ".format(1)
+                else:
+                    s[2] += " {:>8} ".format(0)
+                for j in range(0, len(MOVectors)):
+                    s[i + 3] += " {: .6f}".format(MOVectors[i][j])
+            for i in range(0, len(s[0]), 60):
+                for j in range(0, (len(MOVectors) + 3)):
+                    if len(s[j]) < (i + 60):
+                        if j == 0:
+                            print(" MO number:  " + s[j][i:len(s[0])])
+                        elif j == 1:
+                            print(" MO energy:  " + s[j][i:len(s[0])])
+                        elif j == 2:
+                            print(" MO occ   :  " + s[j][i:len(s[0])])
+                        else:
+                            print("{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[j - 3][0]].symbol,
+                                                                      molbasis[j - 3][0], molbasis[j - 3][1],
+                                                                      qn2symb(molbasis[j - 3][2]),
+                                                                      qn2symb(molbasis[j - 3][2], molbasis[j - 3][3])) +
+                                  s[j][i:len(s[0])])
+                    else:
+                        if j == 0:
+                            print(" MO number:  " + s[j][i:i + 60])
+                        elif j == 1:
+                            print(" MO energy:  " + s[j][i:i + 60])
+                        elif j == 2:
+                            print(" MO occ   :  " + s[j][i:i + 60])
+                        else:
+                            print("{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[j - 3][0]].symbol,
+                                                                      molbasis[j - 3][0], molbasis[j - 3][1],
+                                                                      qn2symb(molbasis[j - 3][2]),
+                                                                      qn2symb(molbasis[j - 3][2], molbasis[j - 3][3])) +
+                                  s[j][i:i + 60])
+                print("")
+
+        # Calculate and print Mulliken Analysis (not calculated if not printed)
+        if verbosity >= 2:
+            print("\nMulliken Analysis")
+            # First, calculate Mulliken net AO and overlap  populations
+            mullikenNetAOandOvlPop = np.zeros((len(MOVectors), len(MOVectors)))
+            for i in range(0, len(MOVectors)):
+                for j in range(0, len(MOVectors)):
+                    for k in range(0, len(MOVectors)):
+                        # if, elif, else to establish the occupation number for the MO in question.
+                        occ = 0
+                        if ((k + 1) * 2) <= valence_electrons:
+                            occ = 2
+                        elif ((k + 1) * 2) > valence_electrons and (k * 2) < valence_electrons:
+                            occ = 1
+                        else:
+                            occ = 0
+                        # print(i, j, occ * (MOVectors[i][j] ** 2))
+                        if i != j:
+                            mullikenNetAOandOvlPop[i][j] += 2 * occ * MOVectors[i][k] * MOVectors[j][k] * overlap[i][j]
+                        else:
+                            mullikenNetAOandOvlPop[i][j] += occ * MOVectors[i][k] * MOVectors[j][k] * overlap[i][j]
+            # Print routine for the net populations
+            print("\nMuliken net AO (diagonal) and overlap (off-diagonal) populations")
+            s = [""] * (len(mullikenNetAOandOvlPop) + 1)
+            for i in range(0, len(mullikenNetAOandOvlPop)):
+                s[0] += "{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[i][0]].symbol,
+                                                            molbasis[i][0], molbasis[i][1],
+                                                            qn2symb(molbasis[i][2]),
+                                                            qn2symb(molbasis[i][2], molbasis[i][3]))
+                for j in range(0, len(mullikenNetAOandOvlPop)):
+                    s[i + 1] += "   {: .6f} ".format(mullikenNetAOandOvlPop[i][j])
+            for i in range(0, len(s[0]), 65):
+                for j in range(0, (len(mullikenNetAOandOvlPop) + 1)):
+                    if len(s[j]) < (i + 65):
+                        if j == 0:
+                            print("              " + s[j][i:len(s[0])])
+                        else:
+                            print("{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[j - 1][0]].symbol,
+                                                                      molbasis[j - 1][0], molbasis[j - 1][1],
+                                                                      qn2symb(molbasis[j - 1][2]),
+                                                                      qn2symb(molbasis[j - 1][2], molbasis[j - 1][3])) +
+                                  s[j][i:len(s[0])])
+                    else:
+                        if j == 0:
+                            print("              " + s[j][i:i + 65])
+                        else:
+                            print("{: >3}({: >3}){:>2}{}{:<2}".format(self.atoms[molbasis[j - 1][0]].symbol,
+                                                                      molbasis[j - 1][0], molbasis[j - 1][1],
+                                                                      qn2symb(molbasis[j - 1][2]),
+                                                                      qn2symb(molbasis[j - 1][2], molbasis[j - 1][3])) +
+                                  s[j][i:i + 65])
+                print("")
+            # Then, reduce Mulliken net AO and overlap populations to atoms
+            mullikenRedPop = np.zeros((self.numatoms(), self.numatoms()))
+            for i in range(0, len(MOVectors)):
+                for j in range(0, len(MOVectors)):
+                    atom1 = molbasis[i][0]
+                    atom2 = molbasis[j][0]
+                    mullikenRedPop[atom1][atom2] += mullikenNetAOandOvlPop[i][j]
+            # Print routine for the gross populations
+            print("\nMuliken reduced net atomic (diagonal) and bond (off-diagonal) populations")
+            s = [""] * (len(mullikenRedPop) + 1)
+            for i in range(0, len(mullikenRedPop)):
+                s[0] += "   {: >3}({: >3})".format(self.atoms[i].symbol, i)
+                for j in range(0, len(mullikenRedPop)):
+                    s[i + 1] += " {: .6f} ".format(mullikenRedPop[i][j])
+            for i in range(0, len(s[0]), 66):
+                for j in range(0, (len(mullikenRedPop) + 1)):
+                    if len(s[j]) < (i + 66):
+                        if j == 0:
+                            print("      " + s[j][i:len(s[0])])
+                        else:
+                            print("{: >3}({: >3})".format(self.atoms[j - 1].symbol, j - 1) + s[j][i:len(s[0])])
+                    else:
+                        if j == 0:
+                            print("      " + s[j][i:i + 66])
+                        else:
+                            print("{: >3}({: >3})".format(self.atoms[j - 1].symbol, j - 1) + s[j][i:i + 66])
+                print("")
+            # Next calculate gross Mulliken AO populations
+            mullikenGrossAOPop = np.zeros(len(MOVectors))
+            for i in range(0, len(mullikenGrossAOPop)):
+                for j in range(0, len(MOVectors)):
+                    if i == j:
+                        mullikenGrossAOPop[i] += mullikenNetAOandOvlPop[i][j]
+                    else:
+                        mullikenGrossAOPop[i] += mullikenNetAOandOvlPop[i][j] / 2.0
+            # Print routine for the gross populations
+            print("\nGross Mulliken AO populations")
+            for i in range(0, len(mullikenGrossAOPop)):
+                print("{: >3}({: >3}){:>2}{}{:<2} {: .6f}".format(self.atoms[molbasis[i][0]].symbol,
+                                                                  molbasis[i][0], molbasis[i][1],
+                                                                  qn2symb(molbasis[i][2]),
+                                                                  qn2symb(molbasis[i][2], molbasis[i][3]),
+                                                                  mullikenGrossAOPop[i]))
+            print("")
+            # Next calculate gross Mulliken atom populations
+            mullikenGrossAtomPop = np.zeros(self.numatoms())
+            for i in range(0, len(mullikenGrossAOPop)):
+                mullikenGrossAtomPop[molbasis[i][0]] += mullikenGrossAOPop[i]
+            print("\nGross Mulliken atomic populations")
+            for i in range(0, len(mullikenGrossAtomPop)):
+                print("{: >3}({: >3}) {: .6f}".format(self.atoms[i].symbol,
+                                                      i, mullikenGrossAtomPop[i]))
+
+            print("")
+            # Next determine Mulliken net atomic charges
+            mullikenNetAtomCharge = np.zeros(self.numatoms())
+            for i in range(0, len(mullikenNetAtomCharge)):
+                mullikenNetAtomCharge[i] += self.atoms[i].valele - mullikenGrossAtomPop[i]
+            print("\nNet Mulliken atomic charges")
+            for i in range(0, len(mullikenGrossAtomPop)):
+                print("{: >3}({: >3}) {: .6f}".format(self.atoms[i].symbol,
+                                                      i, mullikenNetAtomCharge[i]))
+
+            print("")
+
+        # Return the previously calculated total EHT energy
+        return energy
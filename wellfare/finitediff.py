@@ -0,0 +1,95 @@
+import os
+import concurrent.futures
+import multiprocessing
+
+import numpy as np
+
+from .messages import ProgramAbort, ProgramError
+
+
+#############################################################################################################
+# Numerical Hessians by finite differences of the analytic gradient, on a pool of worker processes
+#############################################################################################################
+
+# The molecule and the settings of a worker process, set once per worker by initialiseWorker()
+WorkerState = {}
+
+
+def initialiseWorker(molecule, coords, step, dtyp, table):
+    """
+    Stores the molecule, the reference structure and the settings of the gradient evaluations in a worker process,
+    so that they are shipped to each worker once rather than with every displacement
+    """
+    WorkerState["molecule"] = molecule
+    WorkerState["coords"] = coords
+    WorkerState["step"] = step
+    WorkerState["dtyp"] = dtyp
+    WorkerState["table"] = table
+
+
+def displacedGradient(displacement):
+    """
+    Returns the analytic gradient of the molecule of the worker at its reference structure with the cartesian
+    coordinate displacement[0] moved by displacement[1] steps
+    """
+    coordinate, steps = displacement
+    coords = WorkerState["coords"].copy()
+    coords[coordinate] += steps * WorkerState["step"]
+
+    return WorkerState["molecule"].FFEnergyGradient(coords, WorkerState["dtyp"], WorkerState["table"])[1]
+
+
+def numericalHessian(molecule, cartCoordinates, step=1.0e-4, stencil="central", nprocs=None, dtyp=1, table=None,
+                     verbosity=0):
+    """
+    Returns the 3N x 3N Hessian of the Force Field energy of molecule at the structure cartCoordinates by finite
+    differences of its analytic gradient (FFEnergyGradient, with the term table table if given), symmetrised.
+    The "central" stencil takes 6N gradients, with an error of order step^2; the "forward" stencil 3N + 1,
+    with an error of order step. The gradients are evaluated by a pool of at most nprocs worker processes
+    (by default one per CPU) where the platform provides forked processes, and one after the other otherwise.
+    """
+    if stencil not in ("central", "forward"):
+        ProgramError()
+        print("Unknown finite difference stencil: " + str(stencil))
+        ProgramAbort()
+    coords = np.asarray(cartCoordinates, dtype=float).flatten()
+    n = len(coords)
+    if table is None:
+        # Compile the term table here, so that the workers receive it with the molecule
+        if molecule.termtable is None:
+            molecule.compileTermTable()
+        table = molecule.termtable
+    if stencil == "central":
+        displacements = [(i, steps) for i in range(n) for steps in (1, -1)]
+    else:
+        displacements = [(i, 1) for i in range(n)] + [(0, 0)]
+    if nprocs is None:
+        nprocs = os.cpu_count() or 1
+    if "fork" not in multiprocessing.get_all_start_methods():
+        nprocs = 1
+    nprocs = max(min(nprocs, len(displacements)), 1)
+    if verbosity >= 1:
+        print("\nNumerical Hessian: {} gradients ({} differences) on {} workers".format(len(displacements), stencil,
+                                                                                       nprocs))
+
+    if nprocs == 1:
+        initialiseWorker(molecule, coords, step, dtyp, table)
+        try:
+            gradients = np.array([displacedGradient(displacement) for displacement in displacements])
+        finally:
+            WorkerState.clear()
+    else:
+        # Hand out the displacements in a few chunks per worker to keep the communication down
+        chunksize = max(len(displacements) // (4 * nprocs), 1)
+        # Leaving the with block shuts the workers down, also when a worker or the collection of results fails
+        with concurrent.futures.ProcessPoolExecutor(max_workers=nprocs, mp_context=multiprocessing.get_context("fork"),
+                                                    initializer=initialiseWorker,
+                                                    initargs=(molecule, coords, step, dtyp, table)) as pool:
+            gradients = np.array(list(pool.map(displacedGradient, displacements, chunksize=chunksize)))
+
+    if stencil == "central":
+        hessian = (gradients[0::2] - gradients[1::2]) / (2 * step)
+    else:
+        hessian = (gradients[:n] - gradients[n]) / step
+
+    return 0.5 * (hessian + hessian.T)
@@ -0,0 +1,155 @@
+import math
+
+import numpy as np
+import scipy.optimize
+
+from .messages import ProgramAbort, ProgramError, ProgramWarning, timestamp
+
+
+################################################################################
+# Last function needed to set up force field: carry out Hessian fit to determine
+# force constants for stretches, bends and inversion potentials
+################################################################################
+
+def normalModeDesign(molecule, H_0, basis, power=0.0, modes=None, chunk=32):
+    """
+    Returns the design matrix and target vector of the linear least-squares problem whose squared residual is
+    NormalModeDiffSquared, given the decomposition H_0, basis of the Force Field Hessian from kdepHessianBasis:
+    one row for each entry of the upper triangle of the scaled mode-space Hessian, with the off-diagonal entries
+    weighted by sqrt(2). The basis matrices are transformed into mode space chunk at a time.
+    """
+    if modes is None:
+        modes = molecule.projectedNormalModes()
+    eigenvalues = modes[1]
+    scaling = molecule.normalModeScaling(eigenvalues, power)
+    scale = np.outer(scaling, scaling)
+    Q = modes[2][:, np.newaxis] * modes[0]
+    n, m = Q.shape
+    upper_cart = np.triu_indices(n)
+    upper = np.triu_indices(m)
+    weight = np.where(upper[0] == upper[1], 1.0, math.sqrt(2.0))
+
+    target = weight * ((np.diag(eigenvalues) - Q.T @ H_0 @ Q) / scale)[upper]
+    design = np.zeros((len(target), basis.shape[1]))
+    for start in range(0, basis.shape[1], chunk):
+        columns = basis[:, start:start + chunk].T
+        B = np.zeros((len(columns), n, n))
+        B[:, upper_cart[0], upper_cart[1]] = columns
+        B[:, upper_cart[1], upper_cart[0]] = columns
+        design[:, start:start + chunk] = (weight * ((Q.T @ B @ Q) / scale)[:, upper[0], upper[1]]).T
+
+    return design, target
+
+
+def fitForceConstants(molecule, verbosity=0, method="lstsq", alpha=1.0e-3, objective="cartesian", power=0.0):
+    """
+    Fits the stretch, 1,3-stretch, bend, inversion and type 1 and 3 torsion force constants of molecule
+    to its QM Hessian, and assigns the fitted values to the force field terms.
+
+    The objective "cartesian" is the squared deviation between the QM and Force Field Hessians (HessianDiffSquared),
+    "normalmodes" the deviation in the space of the mass-weighted vibrational normal modes of the QM Hessian, with
+    translations and rotations removed and modes weighted according to power (NormalModeDiffSquared).
+
+    As the Force Field Hessian is linear in the force constants, the default methods solve the fit as a single
+    linear least-squares problem: "lstsq" without constraints, "nnls" with non-negative force constants and
+    "ridge" with a penalty alpha on the squared deviation from the initial force constants.
+    The method "bfgs" minimises HessianDiffSquared iteratively instead, with its analytic gradient.
+    Without a QM Hessian (as for ORCA output files), the fit is skipped and the initial force constants are kept.
+    """
+    if verbosity >= 1:
+        print("\nFitting force constants for WellFARe molecule: ", molecule.name)
+    if np.shape(molecule.H_QM) != (3 * molecule.numatoms(), 3 * molecule.numatoms()):
+        ProgramWarning()
+        print("No QM Hessian for molecule " + str(molecule.name) + ", keeping the initial force constants")
+        return
+    # Construct a list of the force constants initially assigned to the molecule
+    ForceConstants = []
+    for i in range(len(molecule.stretch)):
+        ForceConstants.append(molecule.stretch[i].k_str)
+    for i in range(len(molecule.str13)):
+        ForceConstants.append(molecule.str13[i].k_str)
+    for i in range(len(molecule.bend)):
+        ForceConstants.append(molecule.bend[i].k)
+    for i in range(len(molecule.inv)):
+        ForceConstants.append(molecule.inv[i].k_inv)
+    for i in range(len(molecule.tors)):
+        if molecule.tors[i].typ == 1 or molecule.tors[i].typ == 3:
+            ForceConstants.append(molecule.tors[i].k)
+    InitialFC = ForceConstants
+    if verbosity >= 1:
+        print("\nForce constants to be optimised:")
+        print(ForceConstants)
+
+    # Carry out Hessian fitting procedure to determine the appropriate values of those force constants
+    timestamp("Running Optimisation ")  # REMOVE ONCE FIXED
+    if objective not in ("cartesian", "normalmodes"):
+        ProgramError()
+        print("Unknown force constant fitting objective: " + str(objective))
+        ProgramAbort()
+    if method == "bfgs":
+        basis = molecule.kdepHessianBasis()[1]
+        if objective == "cartesian":
+            function, args = molecule.HessianDiffSquaredGradient, (basis,)
+        else:
+            function, args = molecule.NormalModeDiffSquaredGradient, (power, basis, molecule.projectedNormalModes())
+        xopt = scipy.optimize.minimize(function, ForceConstants, args=args, jac=True,
+                                       method="BFGS", options={"gtol": 0.01, "disp": verbosity >= 1}).x
+        # Tolerance has been increased from the default 1e-05 in order to speed up the optimisation
+    elif method in ("lstsq", "nnls", "ridge"):
+        H_0, basis = molecule.kdepHessianBasis()
+        if objective == "cartesian":
+            upper = np.triu_indices(len(H_0))
+            # Off-diagonal entries stand for both halves of the symmetric Hessian in the squared deviation
+            weight = np.where(upper[0] == upper[1], 1.0, math.sqrt(2.0))
+            design = weight[:, np.newaxis] * basis
+            target = weight * (molecule.H_QM - H_0)[upper]
+        else:
+            design, target = normalModeDesign(molecule, H_0, basis, power)
+        if method == "lstsq":
+            xopt = np.linalg.lstsq(design, target, rcond=None)[0]
+        elif method == "nnls":
+            xopt = scipy.optimize.nnls(design, target)[0]
+        elif method == "ridge":
+            # Ridge regression towards the initial force constants, solved as an augmented least-squares problem
+            penalty = math.sqrt(alpha) * np.eye(len(InitialFC))
+            xopt = np.linalg.lstsq(np.vstack((design, penalty)),
+                                   np.concatenate((target, penalty @ np.asarray(InitialFC, dtype=float))),
+                                   rcond=None)[0]
+        if verbosity >= 2:
+            print("\nSquared deviation from the QM Hessian: {:.8f}".format(np.sum((design @ xopt - target) ** 2)))
+    else:
+        ProgramError()
+        print("Unknown force constant fitting method: " + str(method))
+        ProgramAbort()
+    if verbosity >= 1:
+        if verbosity >= 2:
+            print("\nInitial Force constants:")
+            print(InitialFC)
+            if verbosity >= 3:
+                print("\nQM Hessian:")
+                print(molecule.H_QM)
+                print("\nInitial Force Field Hessian:")
+                print(molecule.kdepHessian(InitialFC))
+        timestamp("\nFitted Force constants: ")
+        print(xopt)
+        if verbosity >= 3:
+            print("\nForce Field Hessian with those force constants:")
+            print(molecule.kdepHessian(xopt))
+
+    # Assign the fitted force constants to the corresponding force field potentials
+    # Note: could add verbosity option here to print a representation of each after changing force constant, but probably not required
+    for i in range(len(molecule.stretch)):
+        molecule.stretch[i].setk(xopt[i])
+    for i in range(len(molecule.str13)):
+        molecule.str13[i].setk(xopt[len(molecule.stretch) + i])
+    for i in range(len(molecule.bend)):
+        molecule.bend[i].setk(xopt[len(molecule.stretch) + len(molecule.str13) + i])
+    for i in range(len(molecule.inv)):
+        molecule.inv[i].setk(xopt[len(molecule.stretch) + len(molecule.str13) + len(molecule.bend) + i])
+    torscount = 0
+    for i in range(len(molecule.tors)):
+        if molecule.tors[i].typ == 1 or molecule.tors[i].typ == 3:
+            molecule.tors[i].setk(xopt[len(molecule.stretch) + len(molecule.str13) + len(molecule.bend) + len(molecule.inv) + torscount])
+            torscount += 1
+    # Any compiled term table still holds the old force constants, so have it rebuilt on next use
+    molecule.termtable = None
@@ -0,0 +1,389 @@
+import os
+import hashlib
+import json
+import zipfile
+
+import numpy as np
+
+from .messages import ProgramAbort, ProgramError, ProgramWarning
+from .constants import isInt, NumberToSymbol
+
+
+#############################################################################################################
+# QM output parsing: a single pass over the Quantum Chemistry output file, collecting the data it contains
+#############################################################################################################
+
+class QMData:
+    """ The data read from a Quantum Chemistry output file"""
+
+    def __init__(self, filename):
+        """ (QMData, str) -> NoneType
+
+    Create an empty data record for the output file filename.
+    Where a section occurs several times in the file, only its last occurrence is kept.
+    """
+
+        self.filename = filename
+        self.program = "N/A"
+        self.atoms = []  # (symbol, x, y, z) for each atom, in Angstrom
+        self.charges = None  # Mulliken charges, one per atom
+        self.energy = None  # Final SCF / single point energy in atomic units
+        self.bondorders = None  # Mayer bond orders as an N x N array
+        self.hessian = None  # Force constants in Cartesian coordinates as a 3N x 3N array
+
+    def __str__(self):
+        """ (QMData) -> str
+
+    Return a string representation of this data record in this format:
+
+    (program, filename, number of atoms, energy)
+
+    """
+
+        return '({0}, {1}, {2}, {3})'.format(self.program, self.filename, len(self.atoms), self.energy)
+
+    def __repr__(self):
+        """ (QMData) -> str
+
+    Return a string representation of this data record in this format:
+
+    (program, filename, number of atoms, energy)
+
+    """
+
+        return '({0}, {1}, {2}, {3})'.format(self.program, self.filename, len(self.atoms), self.energy)
+
+    def numatoms(self):
+        """ (QMData) -> int
+
+    Return the number of atoms read
+    """
+
+        return len(self.atoms)
+
+
+def readSectionLines(f, last, skip=0):
+    """
+    Reads the lines of a section of the open output file f, after skipping skip lines,
+    until (and excluding) the first line for which the function last(line) is true
+    """
+    lines = []
+    try:
+        for i in range(skip):
+            f.__next__()
+        while True:
+            readBuffer = f.__next__()
+            if last(readBuffer):
+                break
+            lines.append(readBuffer)
+    except StopIteration:
+        ProgramError()
+        print("Output file " + str(f.name) + " is truncated: it ends in the middle of a section")
+        ProgramAbort()
+
+    return lines
+
+
+def parseQMOutput(filename, verbosity=0):
+    """
+    Reads a Gaussian or ORCA output file in a single pass and returns its contents as a QMData record.
+    Each recognised section start dispatches to a reader that consumes the section from the same file iterator,
+    and only the raw lines of the last occurrence of each section are kept, to be decoded once at the end.
+    """
+
+    data = QMData(filename)
+    sections = {}
+
+    # Section start markers for each program: (marker, section name, lines to skip, end of section test)
+    markers = {"g09": [("Input orientation:", "geometry", 4, lambda line: line.find("-----------") != -1),
+                       ("Mulliken charges:", "charges", 1, lambda line: line.find("Sum of Mulliken charges") != -1),
+                       ("Atomic Valencies and Mayer Atomic Bond Orders:", "bondorders", 0,
+                        lambda line: line.find("Lowdin Atomic Charges") != -1),
+                       ("Force constants in Cartesian coordinates", "hessian", 0,
+                        lambda line: line.find("FormGI is forming") != -1 or line.find(
+                            "Cartesian forces in FCRed") != -1)],
+               "orca": [("CARTESIAN COORDINATES (ANGSTROEM)", "geometry", 1, lambda line: not line.strip()),
+                        ("MULLIKEN ATOMIC CHARGES", "charges", 1,
+                         lambda line: line.find("Sum of atomic charges:") != -1),
+                        ("Mayer bond orders larger than 0.1", "bondorders", 0, lambda line: not line.strip())]}
+    messages = {"geometry": {"g09": "\nInput orientation found, reading coordinates",
+                             "orca": "\nCartesian Coordinates found"},
+                "charges": {"g09": "\nMulliken charges found, reading charges",
+                            "orca": "\nMulliken charges found, reading charges"},
+                "bondorders": {"g09": "\nAtomic Valencies and Mayer Atomic Bond Orders found, reading data",
+                               "orca": "\nMayer bond orders larger than 0.1 found, reading data"},
+                "hessian": {"g09": "\nForce constants in Cartesian coordinates, reading data"}}
+    energymarker = {"g09": "SCF Done:", "orca": "FINAL SINGLE POINT ENERGY"}
+
+    f = open(filename, 'r')
+    for line in f:
+        # Determine which QM program we're dealing with
+        if data.program == "N/A":
+            if line.find("Entering Gaussian System, Link 0=g09") != -1:
+                if verbosity >= 1:
+                    print("Reading Gaussian output file: ", filename)
+                data.program = "g09"
+            elif line.find("* O   R   C   A *") != -1:
+                if verbosity >= 1:
+                    print("Reading Orca output file: ", filename)
+                data.program = "orca"
+            continue
+        if line.find(energymarker[data.program]) != -1:
+            if verbosity >= 3:
+                print("\nEnergy found")
+                print(str(line))
+            sections["energy"] = line
+            continue
+        for marker, name, skip, last in markers[data.program]:
+            if line.find(marker) != -1:
+                if verbosity >= 2:
+                    print(messages[name][data.program])
+                sections[name] = readSectionLines(f, last, skip)
+                break
+    f.close()
+
+    # Decode the last occurrence of each section
+    if data.program == "g09":
+        for line in sections.get("geometry", []):
+            readBuffer = line.split()
+            data.atoms.append((NumberToSymbol[int(readBuffer[1])], float(readBuffer[3]), float(readBuffer[4]),
+                               float(readBuffer[5])))
+    elif data.program == "orca":
+        for line in sections.get("geometry", []):
+            readBuffer = line.split()
+            data.atoms.append((readBuffer[0], float(readBuffer[1]), float(readBuffer[2]), float(readBuffer[3])))
+    if verbosity >= 3:
+        for atom in data.atoms:
+            print(" Found atom: {:<3} {: .8f} {: .8f} {: .8f} in last geometry".format(*atom))
+    n = data.numatoms()
+
+    if "charges" in sections:
+        data.charges = [0.1] * n  # 0.1 a placeholder for atoms without a QM calculated charge
+        for line in sections["charges"]:
+            readBuffer = line.split()
+            if data.program == "g09":
+                # Gaussian numbers atoms from 1, and lists "number symbol charge"
+                data.charges[int(readBuffer[0]) - 1] = float(readBuffer[2])
+            elif data.program == "orca":
+                # ORCA numbers atoms from 0, and lists "number symbol : charge"
+                data.charges[int(readBuffer[0])] = float(readBuffer[3])
+            if verbosity >= 3:
+                print(" Found atomic charge listing: {:<3} {:<3} {: .8f} in Mulliken charges".format(
+                    int(readBuffer[0]), str(readBuffer[1]), float(readBuffer[-1])))
+
+    if "energy" in sections:
+        data.energy = float(sections["energy"].split()[4])
+
+    data.bondorders = np.zeros((n, n))
+    if data.program == "g09":
+        for line in sections.get("bondorders", []):
+            # Check if the whole line is integers only (Header line)
+            if isInt("".join(line.split())) == True:
+                # And use this information to label the columns
+                columns = line.split()
+            else:
+                row = line.split()
+                j = 1
+                for i in columns:
+                    j = j + 1
+                    data.bondorders[int(row[0]) - 1][int(i) - 1] = float(row[j])
+    elif data.program == "orca":
+        for line in sections.get("bondorders", []):
+            # Break the line into pieces
+            readBuffer = line[1:].strip()
+            readBuffer = readBuffer.split("B")
+            for i in readBuffer:
+                bondpair1 = int(i[1:4].strip())
+                bondpair2 = int(i[8:11].strip())
+                order = float(i[-9:].strip())
+                data.bondorders[bondpair1][bondpair2] = order
+                data.bondorders[bondpair2][bondpair1] = order
+
+    # The Hessian is only present in Gaussian frequency calculations; otherwise data.hessian stays None
+    if data.program == "g09" and "hessian" in sections:
+        data.hessian = np.zeros((3 * n, 3 * n))
+        for line in sections.get("hessian", []):
+            # Check if the whole line is integers only (Header line)
+            if isInt("".join(line.split())) == True:
+                # And use this information to label the columns
+                columns = line.split()
+            else:
+                row = line.split()
+                for i in range(0, len(row) - 1):
+                    data.hessian[int(row[0]) - 1][int(columns[i]) - 1] = row[i + 1].replace('D', 'E')
+                    data.hessian[int(columns[i]) - 1][int(row[0]) - 1] = row[i + 1].replace('D', 'E')
+
+    return data
+
+
+# Version of the parsed data layout, stored with every cache entry; entries of other versions are parsed again
+QMDATA_CACHE_VERSION = 2
+
+# Errors raised by np.load for cache entries that are damaged, e.g. truncated or half-written
+CacheErrors = (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile)
+
+
+def cacheDirectory():
+    """
+    Returns the directory used for on-disk caches, given by the environment variable WELLFARE_CACHE_DIR
+    or ~/.cache/wellfare by default
+    """
+
+    return os.environ.get("WELLFARE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "wellfare"))
+
+
+def fileDigest(filename):
+    """
+    Returns the SHA-256 hash of the contents of file filename as a hexadecimal string
+    """
+    digest = hashlib.sha256()
+    f = open(filename, 'rb')
+    for block in iter(lambda: f.read(1 << 20), b""):
+        digest.update(block)
+    f.close()
+
+    return digest.hexdigest()
+
+
+def saveQMData(data, path):
+    """
+    Stores the QMData record data in the .npz file path; the file is written under a temporary name
+    and then moved into place, so that other processes never see a partially written entry
+    """
+    n = data.numatoms()
+    temp = path + ".{}.tmp.npz".format(os.getpid())
+    np.savez_compressed(temp, version=QMDATA_CACHE_VERSION, program=data.program, filename=data.filename,
+                        symbols=np.array([atom[0] for atom in data.atoms], dtype=str),
+                        coords=np.array([atom[1:] for atom in data.atoms], dtype=float).reshape(n, 3),
+                        charges=np.array(data.charges if data.charges is not None else [], dtype=float),
+                        energy=np.nan if data.energy is None else data.energy, bondorders=data.bondorders,
+                        hessian=data.hessian if data.hessian is not None else np.zeros((0, 0)))
+    os.replace(temp, path)
+
+
+def loadQMData(path):
+    """
+    Returns the QMData record stored in the .npz file path, or None if the entry is of another cache version.
+    A damaged entry raises one of CacheErrors.
+    """
+    with np.load(path, allow_pickle=False) as stored:
+        if int(stored["version"]) != QMDATA_CACHE_VERSION:
+            return None
+        data = QMData(str(stored["filename"]))
+        data.program = str(stored["program"])
+        data.atoms = [(str(sym), float(xyz[0]), float(xyz[1]), float(xyz[2]))
+                      for sym, xyz in zip(stored["symbols"], stored["coords"])]
+        charges = stored["charges"]
+        if len(charges) == len(data.atoms) and len(data.atoms) != 0:
+            data.charges = [float(q) for q in charges]
+        if not np.isnan(stored["energy"]):
+            data.energy = float(stored["energy"])
+        data.bondorders = stored["bondorders"]
+        hessian = stored["hessian"]
+        if hessian.size != 0:
+            data.hessian = hessian
+
+    return data
+
+
+def writeCacheIndex(indexfile, index):
+    """
+    Writes the cache index (a dictionary) to indexfile as JSON, replacing the previous index in one step
+    """
+    temp = indexfile + ".{}.tmp".format(os.getpid())
+    f = open(temp, 'w')
+    json.dump(index, f)
+    f.close()
+    os.replace(temp, indexfile)
+
+
+def evictCache(directory, maxsize):
+    """
+    Deletes the least recently used .npz entries in directory until their total size is at most maxsize bytes
+    """
+    entries = []
+    for name in os.listdir(directory):
+        if name.endswith(".npz") and not name.endswith(".tmp.npz"):
+            stat = os.stat(os.path.join(directory, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+    total = sum(entry[1] for entry in entries)
+    for mtime, size, name in sorted(entries):
+        if total <= maxsize:
+            break
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+        total -= size
+
+
+def cachedQMOutput(filename, verbosity=0, maxsize=None):
+    """
+    Returns the QMData record for the output file filename, like parseQMOutput(), using an on-disk cache of
+    parsed files in the "logs" subdirectory of cacheDirectory(). Entries are named after the hash of the file
+    contents, and an index from (path, size, modification time) to that hash avoids rehashing unchanged files.
+    The cache is limited to maxsize bytes (by default the environment variable WELLFARE_CACHE_SIZE, in MB,
+    or 512 MB), evicting the least recently used entries first.
+    """
+    if maxsize is None:
+        maxsize = float(os.environ.get("WELLFARE_CACHE_SIZE", 512)) * 1024 ** 2
+    directory = os.path.join(cacheDirectory(), "logs")
+    indexfile = os.path.join(directory, "index.json")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        stat = os.stat(filename)
+        statkey = "{}|{}|{}".format(os.path.abspath(filename), stat.st_size, stat.st_mtime_ns)
+        try:
+            f = open(indexfile, 'r')
+            index = json.load(f)
+            f.close()
+        except (OSError, ValueError):
+            index = {}
+
+        digest = index.get(statkey)
+        if digest is None or not os.path.isfile(os.path.join(directory, digest + ".npz")):
+            digest = fileDigest(filename)
+        path = os.path.join(directory, digest + ".npz")
+        if os.path.isfile(path):
+            try:
+                data = loadQMData(path)
+            except CacheErrors as error:
+                # A damaged entry is deleted, and the file parsed again below
+                if verbosity >= 1:
+                    ProgramWarning()
+                    print("Discarding damaged cache entry " + path + ": " + str(error))
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                data = None
+            if data is not None:
+                if verbosity >= 1:
+                    print("Using cached data for output file: ", filename)
+                # Mark the entry as recently used
+                os.utime(path)
+                data.filename = filename
+                if index.get(statkey) != digest:
+                    index[statkey] = digest
+                    writeCacheIndex(indexfile, index)
+                return data
+    except OSError as error:
+        if verbosity >= 1:
+            ProgramWarning()
+            print("Parsed-log cache not available: " + str(error))
+        return parseQMOutput(filename, verbosity)
+
+    data = parseQMOutput(filename, verbosity)
+    try:
+        saveQMData(data, path)
+        # Keep only index entries whose cached data still exists
+        index = {key: value for key, value in index.items() if os.path.isfile(os.path.join(directory, value + ".npz"))}
+        index[statkey] = digest
+        writeCacheIndex(indexfile, index)
+        evictCache(directory, maxsize)
+    except OSError as error:
+        if verbosity >= 1:
+            ProgramWarning()
+            print("Could not store parsed data in cache: " + str(error))
+
+    return data
@@ -0,0 +1,129 @@
+import numpy as np
+import scipy.spatial
+
+from .messages import ProgramAbort, ProgramError
+
+
+#############################################################################################################
+# Neighbour lists for the non-bonded interactions: Verlet lists with a cutoff, a skin and a switching function
+#############################################################################################################
+
+def switchingFunction(r, switch, cutoff, deriv=0):
+    """
+    Smooth switching function that is 1 up to the distance switch, 0 beyond the distance cutoff and falls off
+    as the quintic 1 - 10 x^3 + 15 x^4 - 6 x^5 in between, with x = (r - switch) / (cutoff - switch), so that
+    the switched potentials have continuous first and second derivatives.
+    With deriv=1, also returns the derivatives with respect to r, and with deriv=2 the second derivatives as well
+    """
+    width = cutoff - switch
+    x = np.clip((np.asarray(r, dtype=float) - switch) / width, 0.0, 1.0)
+    s = 1 - x ** 3 * (10 - 15 * x + 6 * x ** 2)
+    if not deriv:
+        return s
+    ds = -30 * x ** 2 * (1 - x) ** 2 / width
+    if deriv < 2:
+        return s, ds
+    d2s = -60 * x * (1 - x) * (1 - 2 * x) / width ** 2
+
+    return s, ds, d2s
+
+
+class NeighbourList:
+    """ A Verlet list of the atom pairs within the cutoff plus a skin distance"""
+
+    def __init__(self, cutoff=12.0, skin=2.0, switch=None):
+        """ (NeighbourList, number, number, number) -> NoneType
+
+    A neighbour list for non-bonded interactions that are switched off smoothly between the distances switch
+    (by default 2 Angstrom below cutoff) and cutoff. The list holds all pairs closer than cutoff + skin, so it only
+    needs to be rebuilt once an atom has moved by more than half the skin since the last build.
+    """
+
+        if switch is None:
+            switch = max(cutoff - 2.0, 0.0)
+        if cutoff <= 0.0 or skin < 0.0 or not 0.0 <= switch < cutoff:
+            ProgramError()
+            print("Invalid neighbour list: cutoff {}, skin {}, switching distance {}".format(cutoff, skin, switch))
+            ProgramAbort()
+        self.cutoff = cutoff
+        self.skin = skin
+        self.switch = switch
+        self.reference = None  # Coordinates at the last build
+        self.box = None  # Edge lengths of the periodic cell at the last build, if any
+        self.pair_i = None
+        self.pair_j = None
+        self.builds = 0
+
+    def __str__(self):
+        """ (NeighbourList) -> str
+
+    Return a string representation of the neighbour list in this format:
+
+    (cutoff, skin, switch, number of pairs)
+    """
+
+        npairs = 0 if self.pair_i is None else len(self.pair_i)
+
+        return '({0}, {1}, {2}, {3})'.format(self.cutoff, self.skin, self.switch, npairs)
+
+    def build(self, X, box=None):
+        """ (NeighbourList, array, array) -> NoneType
+
+    Collects all pairs of atoms (i, j), i < j, of the (N, 3) coordinate array X that are closer than cutoff + skin,
+    examining only geometric neighbours found with a k-d tree of the coordinates. If the edge lengths box of an
+    orthorhombic periodic cell are given, distances are those between the nearest periodic images, and cutoff + skin
+    must not exceed half the shortest edge, so that each pair interacts through one image only.
+    """
+
+        X = np.asarray(X, dtype=float)
+        if box is not None:
+            box = np.asarray(box, dtype=float)
+            if self.cutoff + self.skin > np.min(box) / 2:
+                ProgramError()
+                print("Cutoff plus skin ({}) exceeds half the shortest edge of the periodic cell ({})".format(
+                    self.cutoff + self.skin, np.min(box)))
+                ProgramAbort()
+        if len(X) < 2:
+            pairs = np.zeros((0, 2), dtype=int)
+        else:
+            if box is None:
+                tree = scipy.spatial.cKDTree(X)
+            else:
+                # The periodic k-d tree needs coordinates inside the cell, [0, box)
+                wrapped = np.mod(X, box)
+                wrapped[wrapped >= box] = 0.0
+                tree = scipy.spatial.cKDTree(wrapped, boxsize=box)
+            pairs = tree.query_pairs(self.cutoff + self.skin, output_type='ndarray')
+            pairs = np.sort(pairs.reshape(-1, 2), axis=1)
+            pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        self.pair_i = pairs[:, 0]
+        self.pair_j = pairs[:, 1]
+        self.reference = X.copy()
+        self.box = None if box is None else box.copy()
+        self.builds += 1
+
+    def isValid(self, X, box=None):
+        """ (NeighbourList, array, array) -> bool
+
+    Returns True if the list still holds all pairs within the cutoff for the coordinates X, i.e. if it has been built
+    for the same number of atoms and periodic cell and no atom has moved by more than half the skin since
+    """
+
+        if self.reference is None or np.shape(X)[-2:] != self.reference.shape:
+            return False
+        if (box is None) != (self.box is None) or (box is not None and not np.array_equal(box, self.box)):
+            return False
+        displacement = np.asarray(X, dtype=float) - self.reference
+        return np.max(np.einsum('...i,...i->...', displacement, displacement), initial=0.0) <= (self.skin / 2) ** 2
+
+    def pairs(self, X, box=None):
+        """ (NeighbourList, array, array) -> (array, array)
+
+    Returns the index arrays (pair_i, pair_j) of the pairs in the list for the (N, 3) coordinates X in the periodic
+    cell with edge lengths box (if any), rebuilding the list first if it is no longer valid
+    """
+
+        if not self.isValid(X, box):
+            self.build(X, box)
+
+        return self.pair_i, self.pair_j
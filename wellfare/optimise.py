@@ -0,0 +1,263 @@
+import math
+
+import numpy as np
+
+from .messages import ProgramAbort, ProgramError
+from .constants import Ang2Bohr, Bohr2Ang
+
+
+#############################################################################################################
+# Geometry optimisation: quasi-Newton (BFGS, L-BFGS) and second-order (RFO, trust-region Newton) methods
+#############################################################################################################
+
+OptimisationMethods = ["bfgs", "lbfgs", "rfo", "newton"]
+
+# Convergence thresholds on the maximum and RMS force and on the maximum and RMS (predicted) displacement, with the
+# values of Gaussian's "normal", "tight" and "loose" criteria converted from Hartree/Bohr and Bohr to Angstrom
+ConvergenceCriteria = {
+    "normal": {"maxforce": 4.5e-4 * Ang2Bohr(1.0), "rmsforce": 3.0e-4 * Ang2Bohr(1.0),
+               "maxstep": Bohr2Ang(1.8e-3), "rmsstep": Bohr2Ang(1.2e-3)},
+    "tight": {"maxforce": 1.5e-5 * Ang2Bohr(1.0), "rmsforce": 1.0e-5 * Ang2Bohr(1.0),
+              "maxstep": Bohr2Ang(6.0e-5), "rmsstep": Bohr2Ang(4.0e-5)},
+    "loose": {"maxforce": 2.5e-3 * Ang2Bohr(1.0), "rmsforce": 1.7e-3 * Ang2Bohr(1.0),
+              "maxstep": Bohr2Ang(1.0e-2), "rmsstep": Bohr2Ang(6.7e-3)}}
+
+
+def convergenceStatus(gradient, step, criteria):
+    """
+    Returns whether the optimisation has converged for the gradient and the next (predicted) step, together with
+    a dictionary of the maximum and RMS force and displacement. As in Gaussian, the optimisation has converged when
+    all four are below their thresholds, or when the forces are below a hundredth of theirs.
+    """
+    values = {"maxforce": np.max(np.abs(gradient), initial=0.0), "rmsforce": math.sqrt(np.mean(gradient ** 2)),
+              "maxstep": np.max(np.abs(step), initial=0.0), "rmsstep": math.sqrt(np.mean(step ** 2))}
+    forces = values["maxforce"] < criteria["maxforce"] and values["rmsforce"] < criteria["rmsforce"]
+    steps = values["maxstep"] < criteria["maxstep"] and values["rmsstep"] < criteria["rmsstep"]
+    tiny = values["maxforce"] < criteria["maxforce"] / 100 and values["rmsforce"] < criteria["rmsforce"] / 100
+
+    return (forces and steps) or tiny, values
+
+
+def newtonStep(gradient, hessian, radius):
+    """
+    Returns the trust-region Newton step for the gradient and Hessian: the Newton step if the Hessian is positive
+    definite (apart from the zero eigenvalues of translations and rotations) and the step lies within radius,
+    otherwise the step of length radius that minimises the quadratic model, -(H + mu)^-1 g with the level shift mu
+    found by bisection. Also returns the energy change predicted by the quadratic model.
+    """
+    eigenvalues, vectors = np.linalg.eigh(hessian)
+    g = vectors.T @ gradient
+    # Directions without curvature and without force (translations and rotations) take no part in the step
+    active = (np.abs(eigenvalues) > 1.0e-8) | (np.abs(g) > 1.0e-10)
+    eigenvalues, g = eigenvalues[active], g[active]
+    vectors = vectors[:, active]
+
+    def shifted(mu):
+        return -g / (eigenvalues + mu)
+
+    lowest = np.min(eigenvalues, initial=0.0)
+    if lowest > 0.0 and np.linalg.norm(shifted(0.0)) <= radius:
+        s = shifted(0.0)
+    else:
+        # The step length falls monotonically with mu above -lowest; bracket and bisect for length radius
+        low = max(-lowest, 0.0) * (1 + 1.0e-10) + 1.0e-12
+        # The bracket grows relative to max(low, 1), as steps below the float spacing of low would not move it
+        high = max(2 * low, low + 1.0)
+        for i in range(200):
+            if np.linalg.norm(shifted(high)) <= radius:
+                break
+            high = max(2 * high, low + 1.0)
+        else:
+            return steepestDescentStep(gradient, hessian, radius)
+        for i in range(200):
+            mu = 0.5 * (low + high)
+            if np.linalg.norm(shifted(mu)) > radius:
+                low = mu
+            else:
+                high = mu
+            if high - low < 1.0e-14 * max(high, 1.0):
+                break
+        s = shifted(high)
+
+    return vectors @ s, g @ s + 0.5 * s @ (eigenvalues * s)
+
+
+def steepestDescentStep(gradient, hessian, radius):
+    """
+    Returns the step of length radius along the negative gradient and the energy change predicted for it by the
+    quadratic model of the Hessian
+    """
+    length = np.linalg.norm(gradient)
+    if length == 0.0:
+        return np.zeros_like(gradient), 0.0
+    s = -(radius / length) * gradient
+
+    return s, gradient @ s + 0.5 * s @ hessian @ s
+
+
+def rfoStep(gradient, hessian, radius):
+    """
+    Returns the rational function optimisation step for the gradient and Hessian (Banerjee et al., J. Phys. Chem.
+    89, 52 (1985)), from the lowest eigenvector of the augmented Hessian, scaled down to the trust radius if
+    necessary, and the energy change predicted by the quadratic model
+    """
+    eigenvalues, vectors = np.linalg.eigh(hessian)
+    g = vectors.T @ gradient
+    # As in newtonStep, translations and rotations are left out of the augmented Hessian
+    active = (np.abs(eigenvalues) > 1.0e-8) | (np.abs(g) > 1.0e-10)
+    eigenvalues, g = eigenvalues[active], g[active]
+    vectors = vectors[:, active]
+    n = len(g)
+    augmented = np.zeros((n + 1, n + 1))
+    augmented[:n, :n] = np.diag(eigenvalues)
+    augmented[:n, n] = g
+    augmented[n, :n] = g
+    vector = np.linalg.eigh(augmented)[1][:, 0]
+    if abs(vector[n]) < 1.0e-12:
+        # The augmented Hessian gives no usable step; fall back on the trust-region Newton step
+        return newtonStep(gradient, hessian, radius)
+    s = vector[:n] / vector[n]
+    length = np.linalg.norm(s)
+    if length > radius:
+        s = s * (radius / length)
+
+    return vectors @ s, g @ s + 0.5 * s @ (eigenvalues * s)
+
+
+def optimiseGeometry(function, coords, method="rfo", criteria="normal", maxiter=200, trust=0.3, maxtrust=1.0,
+                     mintrust=1.0e-6, memory=10, verbosity=0):
+    """
+    Minimises the energy given by function, which is called as function(coords, hessian) and returns the energy,
+    gradient and, if hessian is True, Hessian at the flat array of cartesian coordinates coords, starting from
+    coords. Methods "bfgs" and "lbfgs" (with the given memory) need gradients only, "rfo" and "newton" use the
+    Hessian of every step. All steps are confined to a trust radius (in Angstrom), starting from trust and adapted
+    to the agreement between actual and predicted energy changes; steps that raise the energy are rejected.
+    The optimisation stops without convergence once the trust radius falls below mintrust, or when the energy,
+    gradient or Hessian is not finite (in which case the last finite structure is returned).
+    Convergence follows the criteria, one of ConvergenceCriteria or a dictionary of the same form.
+
+    Returns a dictionary with the optimised coordinates, their energy and gradient, the number of iterations and of
+    function evaluations, and whether the optimisation has converged.
+    """
+    if method not in OptimisationMethods:
+        ProgramError()
+        print("Unknown optimisation method: " + str(method))
+        ProgramAbort()
+    if isinstance(criteria, str):
+        if criteria not in ConvergenceCriteria:
+            ProgramError()
+            print("Unknown convergence criteria: " + str(criteria))
+            ProgramAbort()
+        criteria = ConvergenceCriteria[criteria]
+    second = method in ("rfo", "newton")
+    x = np.array(coords, dtype=float).flatten()
+    energy, gradient, hessian = function(x, second)
+    evaluations = 1
+    if not isFinite(energy, gradient, hessian):
+        if verbosity >= 1:
+            print("\nEnergy or its derivatives are not finite at the starting structure")
+        return {"coords": x, "energy": energy, "gradient": gradient, "iterations": 0, "evaluations": evaluations,
+                "converged": False}
+    radius = trust
+    inverse = np.eye(len(x))  # Inverse Hessian of BFGS
+    pairs = []  # Recent steps and gradient changes of L-BFGS
+    converged = False
+    iteration = 0
+    if verbosity >= 1:
+        print("\n{:>5} {:>18} {:>12} {:>12} {:>12} {:>12} {:>9}".format("Step", "Energy", "Max force", "RMS force",
+                                                                          "Max displ.", "RMS displ.", "Trust"))
+
+    while iteration < maxiter:
+        if radius < mintrust:
+            if verbosity >= 1:
+                print("\nTrust radius has fallen below {:.1e} Angstrom".format(mintrust))
+            break
+        if method == "newton":
+            step, predicted = newtonStep(gradient, hessian, radius)
+        elif method == "rfo":
+            step, predicted = rfoStep(gradient, hessian, radius)
+        else:
+            if method == "bfgs":
+                step = -inverse @ gradient
+            else:
+                step = -lbfgsProduct(gradient, pairs)
+            length = np.linalg.norm(step)
+            scale = min(1.0, radius / length) if length > 0.0 else 1.0
+            step = scale * step
+            # The quadratic model of the quasi-Newton Hessian B, with B step = -scale * gradient
+            predicted = (1 - scale / 2) * (gradient @ step)
+        converged, values = convergenceStatus(gradient, step, criteria)
+        if verbosity >= 1:
+            print("{:>5} {:> 18.10f} {:>12.3e} {:>12.3e} {:>12.3e} {:>12.3e} {:>9.4f}".format(
+                iteration, energy, values["maxforce"], values["rmsforce"], values["maxstep"], values["rmsstep"],
+                radius))
+        if converged:
+            break
+        iteration += 1
+
+        x_new = x + step
+        energy_new, gradient_new, hessian_new = function(x_new, second)
+        evaluations += 1
+        if not isFinite(energy_new, gradient_new, hessian_new):
+            if verbosity >= 1:
+                print("\nEnergy or its derivatives are not finite after step {}".format(iteration))
+            break
+        change = energy_new - energy
+        ratio = change / predicted if predicted != 0.0 else 1.0
+        if change > 1.0e-12 * max(abs(energy), 1.0):
+            # Reject the step and shrink the trust region
+            radius = 0.25 * np.linalg.norm(step)
+            continue
+        if ratio > 0.75 and np.linalg.norm(step) > 0.8 * radius:
+            radius = min(2 * radius, maxtrust)
+        elif ratio < 0.25:
+            radius = 0.25 * radius
+
+        s = step
+        y = gradient_new - gradient
+        sy = s @ y
+        if sy > 1.0e-12:
+            if method == "bfgs":
+                if len(pairs) == 0:
+                    # Scale the initial inverse Hessian to the curvature along the first step
+                    inverse = (sy / (y @ y)) * np.eye(len(x))
+                rho = 1 / sy
+                v = np.eye(len(x)) - rho * np.outer(s, y)
+                inverse = v @ inverse @ v.T + rho * np.outer(s, s)
+            pairs.append((s, y))
+            if len(pairs) > memory:
+                pairs.pop(0)
+        x, energy, gradient, hessian = x_new, energy_new, gradient_new, hessian_new
+
+    return {"coords": x, "energy": energy, "gradient": gradient, "iterations": iteration,
+            "evaluations": evaluations, "converged": converged}
+
+
+def isFinite(energy, gradient, hessian=None):
+    """
+    Returns True if the energy, gradient and (if given) Hessian are all finite
+    """
+
+    return bool(np.isfinite(energy) and np.all(np.isfinite(gradient))
+                and (hessian is None or np.all(np.isfinite(hessian))))
+
+
+def lbfgsProduct(gradient, pairs):
+    """
+    Returns the product of the L-BFGS inverse Hessian, built from the (step, gradient change) pairs, with the
+    gradient, by the two-loop recursion
+    """
+    q = gradient.copy()
+    alphas = []
+    for s, y in reversed(pairs):
+        alpha = (s @ q) / (s @ y)
+        q = q - alpha * y
+        alphas.append(alpha)
+    if len(pairs) > 0:
+        s, y = pairs[-1]
+        q = q * ((s @ y) / (y @ y))
+    for (s, y), alpha in zip(pairs, reversed(alphas)):
+        beta = (y @ q) / (s @ y)
+        q = q + (alpha - beta) * s
+
+    return q
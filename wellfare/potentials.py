@@ -0,0 +1,321 @@
+import sys
+import math
+
+import numpy as np
+
+from .messages import ProgramAbort
+from .constants import (a1, a2, beta_rep, C6, CSO_a1, k_13r, k_a, k_a13, k_b13, k_damping, k_EN, k_hbnd, k_q1, k_q2,
+                        k_X, k_z, s8, SymbolToEN, SymbolToRadius, SymbolToValenceE, SymbolToVdWRadius)
+
+
+#############################################################################################################
+# Potential Fuctions are to be defined below here
+#############################################################################################################
+
+def potMorse(r, r0, D, b):
+    """
+    Morse oscillator potential
+    """
+
+    u = D * (1 - math.exp(-b * (r - r0))) ** 2
+
+    return u
+
+
+def potHarmonic(a, a0, k):
+    """"
+    Harmonic potential (for stretches and bends)
+    """
+
+    u = 0.5 * k * (a - a0) ** 2
+
+    return u
+
+
+def potSimpleCosine(theta, theta0, k):
+    """"
+    Extremely simplified cosine potential for torsions
+    """
+
+    u = k * (1 + np.cos(math.radians(180) + theta - theta0))
+
+    return u
+
+def potCosineSum(theta, theta0, k_tors):
+    """
+    Simplified torsion potential with undamped cosine sum
+    """
+
+    cossum = 0.0
+    for i in range(len(k_tors)):
+        cossum += k_tors[i] * np.cos((i+1)*(theta - theta0))
+
+    return cossum
+
+def bond_exp(a, b):
+    """
+    Exponent a used in the Generalised Lennard-Jones potential for bond stretches
+    """
+    # Now taking as input the symbols a and b for the two atoms in a bond 
+    delta_EN = SymbolToEN[a] - SymbolToEN[b]
+    bond_exp = (k_a[a] * k_a[b]) + (k_EN * (delta_EN ** 2))
+
+    return bond_exp
+
+
+def exp_1_3(a, b, inring):
+    """
+    Exponent a used in the Generalised Lennard-Jones potential for 1,3-stretches
+    """
+    # Now taking atomic symbols as input 
+    exp_1_3 = k_a13 + (k_b13 * k_a[a] * k_a[b])
+    
+    if inring:
+        exp_1_3 = exp_1_3 + k_13r
+
+    return exp_1_3
+
+
+def potGLJ(r, r0, k_str, a):
+    """"
+    Generalised Lennard-Jones potential (for bond and 1,3 stretches)
+    """
+    # k_str to be set equal to force constant for /that/ bond as read from Hessian as an initial guess, fitting implemented later
+    u = k_str * (1 + ((r0 / r) ** a) - 2 * ((r0 / r) ** (a / 2)))
+
+    return u
+
+
+def DampingFunction(a, b, r):
+    """
+    Distance dependent damping function for atoms with symbols a and b, and separation r
+    """
+    r_cov = SymbolToRadius[a] + SymbolToRadius[b]
+    # Covalent distance defined as sum of covalent radii for the two atoms - will need to check this is correct
+
+    f_dmp = 1 / (1 + k_damping * ((r / r_cov) ** 4))
+
+    return f_dmp
+
+
+def potBendNearLinear(a, a0, k_bnd, f_dmp):
+    """
+    Bending potential for equilibrium angles close to linearity
+    """
+
+    u = k_bnd * f_dmp * ((a0 - a) ** 2)
+
+    return u
+
+
+def potAnyBend(a, a0, k_bnd, f_dmp):
+    """
+    Double minimum bending potential
+    """
+
+    u = k_bnd * f_dmp * ((math.cos(a0) - math.cos(a)) ** 2)
+
+    return u
+
+
+def ChiralityFunction(theta):
+    """
+    Function used in torsion potential to give correct mirror symmetry
+    """
+
+    f_chiral = 0.5 * (1 - math.erf(theta - math.pi))
+
+    return f_chiral
+
+
+def potTorsion(theta, theta0, f_dmp, k_tors):
+    """
+    Torsion potential
+    """
+
+    f_chiral = ChiralityFunction(theta)
+
+    u = 0.0
+    for n in range(1, len(k_tors) + 1):
+        inner_sum = (f_chiral * (1 + math.cos(n * (theta - theta0) + math.pi))) + ((1 - f_chiral) * (1 + math.cos(n * (theta + theta0 - (2 * math.pi)) + math.pi)))
+        u = u + (k_tors[n-1] * inner_sum)
+    u = u * f_dmp
+
+    return u
+
+
+def AngleDamping(theta):
+    """
+    Angle dependent damping function for hydrogen bonding interactions
+    """
+
+    f_dmp_a = (0.5 * (math.cos(theta) + 1)) ** 6
+
+    return f_dmp_a
+
+
+def HBondDamping(a, b, r_ab):
+    """
+    Distance dependent damping function for hydrogen bonding with donor/acceptor atoms having symbols a and b, separation r_ab
+    """
+    r_cov = SymbolToRadius[a] + SymbolToRadius[b]
+    # Covalent distance defined as sum of covalent radii for the two atoms - will need to check this is correct
+
+    f_dmp_hbnd = 1 / (1 + k_damping * ((r_ab / r_cov) ** 12))
+
+    return f_dmp_hbnd
+
+
+def AtomicHBondFactor(sym, chg):
+    """
+    Atomic factor c_hbnd for an atom with symbol sym and atomic charge chg, used in hydrogen bond interaction strength
+    """
+
+    c_hbnd = k_hbnd[sym] * (math.exp(-1 * k_q1["hbond"] * chg) / (math.exp(-1 * k_q1["hbond"] * chg) + k_q2["hbond"]))
+
+    return c_hbnd
+
+
+def HBondStrengthFactor(sym_a, chg_a, r_ah, sym_b, chg_b, r_bh):
+    """
+    Modifier for the strength of a hydrogen bonding interaction where donor/acceptor atoms a and b are at distances r_ah and r_bh from hydrogen
+    """
+
+    c_hbnd_a = AtomicHBondFactor(sym_a, chg_a)
+    c_hbnd_b = AtomicHBondFactor(sym_b, chg_b)
+    c_hbnd_ab = (c_hbnd_a * (r_ah ** 2) + c_hbnd_b * (r_bh ** 2)) / (r_ah ** 2 + r_bh ** 2)
+
+    return c_hbnd_ab
+
+
+def potHBond(f_dmp_a, f_dmp_hbnd, c_hbnd_ab, r_ab):
+    """
+    Function for the hydrogen bonding potential over a given atom triple with donor/acceptor atoms a and b at distance r_ab apart, and calculated damping and strength factors
+    """
+
+    u = f_dmp_a * f_dmp_hbnd * (c_hbnd_a / (r_ab ** 3))
+
+    return u
+
+
+def AtomicXBondFactor(sym, chg):
+    """
+    Atomic factor c_xbnd_x for a halogen acceptor atom with symbol sym and charge chg, used in halogen bonding potential
+    """
+
+    c_xbnd_x = k_X[sym] * (math.exp(-1 * k_q1["xbond"]) / (math.exp(-1 * k_q1["xbond"]) + k_q2["xbond"]))
+
+    return c_xbnd_x
+
+
+def potXBond(f_dmp_theta, f_dmp_xbnd, c_xbnd_x, r_dx):
+    """
+    Function for the halogen bonding potential over a given atom triple with donor atom d and halogen x at a distance r_dx from one another, and calculated damping and strength factors
+    """
+
+    u = f_dmp_theta * f_dmp_xbnd * (c_xbnd_x / (r_dx ** 2))
+
+    return u
+
+
+def RadiusFromCn(C6_AB, C8_AB):
+    """
+    Function for the internuclear distance R0_AB used in London dispersion energy calculations
+    """
+    R0_AB = C6_AB / C8_AB
+    R0_AB = math.sqrt(R0_AB)
+
+    return R0_AB
+
+
+def VdWCutoffRadius(symA, symB):
+    """
+    Function to calculate the cutoff radius for a pair of atoms with symbols symA and symB as the average of van der Waals radii
+    """
+    R_A = SymbolToVdWRadius[symA]
+    R_B = SymbolToVdWRadius[symB]
+    R0_AB = (R_A + R_B) / 2
+
+    return R0_AB
+
+
+def potPauliRep(rep_disp_AB, symA, symB, r_AB, C6_AB, C8_AB, typ=1):
+    """
+    Pairwise formula for the Pauli repulsion between two atoms
+    """
+    # Calculation of valence electron numbers, and where to implement determination of Cn_AB, still to be worked out
+    z_eff_A = SymbolToValenceE[symA] * k_z[symA]
+    z_eff_B = SymbolToValenceE[symB] * k_z[symB]
+    if typ == 1:
+        R_0D3 = VdWCutoffRadius(symA, symB)
+    elif typ == 2:
+        R_0D3 = RadiusFromCn(C6_AB, C8_AB)  # Note still need to confirm whether R_0D3 and R0_AB are actually equivalent
+    u = rep_disp_AB * (z_eff_A * z_eff_B / r_AB) * math.exp(-1 * beta_rep * r_AB / (R_0D3 ** (3 / 2)))
+
+    return u
+
+
+def BJdamping(a, b, symA, symB, typ=1):
+    """
+    Function for the Becke-Johnson rational damping for atoms a and b
+    """
+    # Calculation of cutoff radius is optionally performed using either van der Waals radii or C6 and C8 coefficients
+    if typ == 1:
+        R_0AB = VdWCutoffRadius(symA, symB)
+    elif typ == 2:
+        C6_AB = (C6[symA] + C6[symB]) / 2  # Check this is correct for C6
+        C8_AB = 1.0  # 1 used as a placeholder until C8 values can be added as a dictionary
+        R_0AB = RadiusFromCn(C6_AB, C8_AB)
+    damp = a1 * R_0AB + a2
+
+    return damp
+
+
+def potLondonDisp(rep_disp_AB, C6_AB, C8_AB, BJdamp_AB, r_AB):
+    """
+    Function for the London dispersion energy under the D3 scheme employing Becke-Johnson rational damping via BJdamp_AB
+    """
+    # Calculation of rep_disp_AB, and correct values for the other arguments in this function, to be worked out
+    sixterm = C6_AB / (r_AB ** 6 + BJdamp_AB ** 6)
+    eightterm = C8_AB / (r_AB ** 8 + BJdamp_AB ** 8)
+    u = rep_disp_AB * (sixterm + s8 * eightterm)
+
+    return u
+
+
+def potElectrostatic(elstat_AB, chg_A, chg_B, r_AB):
+    """
+    Function for the electrostatic potential between atoms A and B
+    """
+    # Determination of the screening parameter elstat_AB still to be implemented
+    u = elstat_AB * (chg_A * chg_B / r_AB)
+
+    return u
+
+
+def potCSODisp(C6_AB, R_AB, R0_AB):
+    """
+    Function for the contribution to London dispersion energy from a single pair of atoms, AB, following the D3(CSO) scheme
+    """
+    # Note there are different values for a1 depending on functional, default used here is B3LYP
+    # Also s6 can have other values, and should if aligning with the B2PLYP functional
+    a1 = CSO_a1["B3LYP"]
+    s6 = 1
+    exparg = (R_AB - (2.5 * R0_AB))
+    # print(" \nFor C6-only dispersion calculation, R_AB = " + str(R_AB) + ", R0_AB = " + str(R0_AB))
+    if exparg < math.log(sys.float_info.min):
+        print("Exponential cannot be computed in C6-only dispersion potential")
+        print("Problem value of R_AB -(2.5 * R0_AB) = " + str(exparg))
+        print("Arising from: R_AB = " + str(R_AB) + ", R0_AB = " + str(R0_AB))
+        ProgramAbort()
+    elif exparg > math.log(sys.float_info.max):
+        # Internuclear distance R_AB is larger than 709, exponential greater than 1.8e308, and computing it would give an error
+        # The contribution from a1/exparg is negligible, so set C6indep equal to the limit value it approaches, that is the constant parameter s6
+        C6indep = s6
+        # print("Setting a1/(R_AB - (2.5 * R0_AB)) = 0 ")
+    else:
+        C6indep = s6 + a1 / (1 + math.exp(exparg))
+    C6dep = C6_AB / (R_AB ** 6 + (2.5 ** 2) ** 6)
+    u = C6indep * C6dep
+
+    return u
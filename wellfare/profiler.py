@@ -0,0 +1,104 @@
+import time
+
+
+#############################################################################################################
+# Profiling of the force field terms defined below
+#############################################################################################################
+
+# Contributions timed by FFProfiler, in the order in which FFEnergy adds them up. "nonbonded" stands for
+# the Pauli repulsion, electrostatics and dispersion where these are evaluated together (gradient and Hessian)
+ProfiledTerms = ["stretch", "str13", "bend", "tors", "inv", "hbond", "xbond", "pauli", "es", "disp", "nonbonded"]
+
+ProfiledTermNames = {"stretch": "bond stretches", "str13": "1,3-stretches", "bend": "angle bends",
+                     "tors": "dihedral torsions", "inv": "inversions", "hbond": "hydrogen bonds",
+                     "xbond": "halogen bonds", "pauli": "Pauli repulsion", "es": "(classic) electrostatics",
+                     "disp": "London dispersion", "nonbonded": "non-bonded (combined)"}
+
+
+class FFProfiler:
+    """ Call counts and cumulative wall times of the force field contributions"""
+
+    def __init__(self):
+        """ (FFProfiler) -> NoneType
+
+    A profiler with all counts and times set to zero. Attach it to a molecule with Molecule.enableProfiling()
+    """
+
+        self.reset()
+
+    def reset(self):
+        """ (FFProfiler) -> NoneType
+
+    Sets all call counts and times to zero
+    """
+
+        self.calls = dict.fromkeys(ProfiledTerms, 0)
+        self.time = dict.fromkeys(ProfiledTerms, 0.0)
+        self.evaluations = {}
+        self.mark = time.perf_counter()
+
+    def start(self, evaluation):
+        """ (FFProfiler, str) -> NoneType
+
+    Counts one call of the evaluation routine named evaluation and starts the clock for its first contribution
+    """
+
+        self.evaluations[evaluation] = self.evaluations.get(evaluation, 0) + 1
+        self.mark = time.perf_counter()
+
+    def lap(self, term):
+        """ (FFProfiler, str) -> NoneType
+
+    Adds the time since the previous start() or lap() to the contribution term and counts one call of it
+    """
+
+        now = time.perf_counter()
+        self.calls[term] += 1
+        self.time[term] += now - self.mark
+        self.mark = now
+
+    def report(self):
+        """ (FFProfiler) -> dict
+
+    Returns the number of calls of each evaluation routine and, for each contribution, the number of calls,
+    the cumulative and mean wall time (in seconds) and the share of the total time of all contributions
+    """
+
+        total = sum(self.time.values())
+        terms = {}
+        for term in ProfiledTerms:
+            calls = self.calls[term]
+            terms[term] = {"calls": calls, "time": self.time[term],
+                           "mean": self.time[term] / calls if calls > 0 else 0.0,
+                           "share": self.time[term] / total if total > 0.0 else 0.0}
+
+        return {"evaluations": dict(self.evaluations), "terms": terms, "total": total}
+
+    def __str__(self):
+        """ (FFProfiler) -> str
+
+    Return a table of the contributions that have been called, with their call counts and times
+    """
+
+        report = self.report()
+        s = "{:<26} {:>10} {:>14} {:>14} {:>8}\n".format("Contribution", "Calls", "Total / s", "Mean / s", "Share")
+        for term in ProfiledTerms:
+            entry = report["terms"][term]
+            if entry["calls"] == 0:
+                continue
+            s += "{:<26} {:>10d} {:>14.6f} {:>14.8f} {:>7.1f}%\n".format(ProfiledTermNames[term], entry["calls"],
+                                                                         entry["time"], entry["mean"],
+                                                                         100 * entry["share"])
+        s += "{:<26} {:>10} {:>14.6f}".format("Total", "", report["total"])
+        for evaluation in sorted(report["evaluations"]):
+            s += "\n{:<26} {:>10d}".format(evaluation, report["evaluations"][evaluation])
+
+        return s
+
+    def __repr__(self):
+        """ (FFProfiler) -> str
+
+    Return a string representation of the profiler
+    """
+
+        return "FFProfiler({})".format(self.report())
@@ -1,9 +1,47 @@
 import numpy as np
 import math
-import scipy.misc
+import functools
 import scipy.special
 
+from .constants import Ang2Bohr
 
+# Bounds for the memoised helpers below: those with only integer arguments take few distinct values and keep
+# all of them, those that also depend on a distance or angle keep the most recently used ones
+INTEGER_CACHE_SIZE = 65536
+FLOAT_CACHE_SIZE = 16384
+
+# All memoised helpers, so that their caches can be inspected and cleared together
+MemoisedHelpers = []
+
+
+def memoised(maxsize):
+    """
+    Decorator that keeps the results of a helper in a bounded LRU cache and registers it in MemoisedHelpers.
+    The helpers are pure functions of hashable arguments, so cached results are identical to recomputed ones.
+    """
+    def decorate(function):
+        cached = functools.lru_cache(maxsize=maxsize)(function)
+        MemoisedHelpers.append(cached)
+        return cached
+    return decorate
+
+
+def cacheInfo():
+    """
+    Returns a dictionary with the cache statistics of each memoised helper
+    """
+    return {function.__name__: function.cache_info() for function in MemoisedHelpers}
+
+
+def clearCaches():
+    """
+    Empties the caches of all memoised helpers
+    """
+    for function in MemoisedHelpers:
+        function.cache_clear()
+
+
+@memoised(INTEGER_CACHE_SIZE)
 def em(m1, m2):
     value = 0.0
     if m1 == 0:
@@ -18,6 +56,7 @@ def em(m1, m2):
     return value
 
 
+@memoised(INTEGER_CACHE_SIZE)
 def clm(l1, l2, L, m1, m2, M):
     if M == m1 + m2:
         kd = 1
@@ -50,6 +89,7 @@ def clm(l1, l2, L, m1, m2, M):
     return value
 
 
+@memoised(FLOAT_CACHE_SIZE)
 def tlm(a, l1, m1, l2, m2, theta, phi):
     value = 0.0
     y1 = abs(m1)
@@ -118,6 +158,7 @@ def Phi(m1, phi):
     return value
 
 
+@memoised(FLOAT_CACHE_SIZE)
 def plm(l, a, theta):
     value = []
     limit = (l - a - ((1 - ((-1) ** (l - a))) / (2))) / 2
@@ -132,30 +173,33 @@ def plm(l, a, theta):
     return value
 
 
+@memoised(FLOAT_CACHE_SIZE)
 def An(k, p):
     value = []
     for j in range(0, k + 1):
-        value.append((p ** j) / scipy.misc.factorial(j))
-    value = math.fsum(value) * np.exp(-p) * ((scipy.misc.factorial(k)) / (p ** (k + 1)))
+        value.append((p ** j) / scipy.special.factorial(j))
+    value = math.fsum(value) * np.exp(-p) * ((scipy.special.factorial(k)) / (p ** (k + 1)))
     # print("An ",k, p, " :", value)
     return value
 
 
+@memoised(FLOAT_CACHE_SIZE)
 def An3(k1, k, p):
     if p == 0.0:
         if k1 == (k + 1):
-            value = scipy.misc.factorial(k)
+            value = scipy.special.factorial(k)
         else:
             value = 0.0
     else:
         value = []
         for j in range(k1 - k - 1, k1 - 1 + 1):
-            value.append((p ** j) / (scipy.misc.factorial(j - k1 + k + 1)))
-        value = math.fsum(value) * scipy.misc.factorial(k) * np.exp(-p)
+            value.append((p ** j) / (scipy.special.factorial(j - k1 + k + 1)))
+        value = math.fsum(value) * scipy.special.factorial(k) * np.exp(-p)
         # print("An3 ", k1, k, p, " :", value)
     return value
 
 
+@memoised(FLOAT_CACHE_SIZE)
 def Bn3(k, p):
     value = []
     if p == 0.0:
@@ -163,11 +207,11 @@ def Bn3(k, p):
     elif p < 2.0:
         if k % 2 == 0:
             for i in range(0, 202, 2):
-                value.append((p ** i) / (scipy.misc.factorial(i)) / (i + k + 1))
+                value.append((p ** i) / (scipy.special.factorial(i)) / (i + k + 1))
             value = math.fsum(value) * 2.0
         else:
             for i in range(1, 203, 2):
-                value.append((p ** i) / (scipy.misc.factorial(i)) / (i + k + 1))
+                value.append((p ** i) / (scipy.special.factorial(i)) / (i + k + 1))
             value = math.fsum(value) * -2.0
     else:
         value = (((-1) ** (k + 1)) * An(k, -p)) - An(k, p)
@@ -175,6 +219,7 @@ def Bn3(k, p):
     return value
 
 
+@memoised(INTEGER_CACHE_SIZE)
 def Fmn(m, n1, n2):
     value = []
     for sigma in range(int(((m - n1) + abs(m - n1)) / 2), min(m, n2) + 1):
@@ -183,6 +228,7 @@ def Fmn(m, n1, n2):
     return math.fsum(value)
 
 
+@memoised(INTEGER_CACHE_SIZE)
 def dlbt(l, lambda_, beta):
     value = ((-1) ** (((l - beta)) / 2)) / (2 ** l)
     value = value * np.sqrt((((2 * l + 1) / 2) * scipy.special.binom(l + lambda_, l)) / scipy.special.binom(l, lambda_))
@@ -191,6 +237,7 @@ def dlbt(l, lambda_, beta):
     return value
 
 
+@memoised(INTEGER_CACHE_SIZE)
 def galbet(l1, l2, lambda_, alpha, beta):
     value = []
     for i in range(0, lambda_ + 1):
@@ -213,7 +260,7 @@ def overlap(n1, l1, n2, l2, lambda_, p, t):
     else:
         b1 = lambda_ + 1
     numerator = ((p1 ** (n1 + 0.5)) * ((p2 ** (n2 + 0.5))))
-    denominator = np.sqrt(scipy.misc.factorial(2 * n1)) * np.sqrt(scipy.misc.factorial(2 * n2))
+    denominator = np.sqrt(scipy.special.factorial(2 * n1)) * np.sqrt(scipy.special.factorial(2 * n2))
     b = numerator / denominator
     ivalue = []
     for i in range(a1, l1 + 1, 2):
@@ -244,9 +291,9 @@ def SlaterOverlap(n1, l1, m1, zeta1, n2, l2, m2, zeta2, r, theta, phi):
 
 
 def SlaterOverlapCartesian(n1, l1, m1, zeta1, x1, y1, z1, n2, l2, m2, zeta2, x2, y2, z2):
-    x = (x2 - x1) * 1.889725989
-    y = (y2 - y1) * 1.889725989
-    z = (z2 - z1) * 1.889725989
+    x = Ang2Bohr(x2 - x1)
+    y = Ang2Bohr(y2 - y1)
+    z = Ang2Bohr(z2 - z1)
     xy = x**2 + y**2
     r = np.sqrt(xy + z**2)
     theta = np.arctan2(np.sqrt(xy), z) # for elevation angle defined from Z-axis down
@@ -267,9 +314,217 @@ def SlaterOverlapCartesian(n1, l1, m1, zeta1, x1, y1, z1, n2, l2, m2, zeta2, x2,
     # print("\nx={: .3f} y={: .3f} z={: .3f}".format(x, y, z))
     # print("r={: .3f} theta={: .3f} phi={: .3f} (in degrees)".format(r, np.degrees(theta), np.degrees(phi)))
     # print("r={: .8f} theta={: .8f} phi={: .8f} (in radians)".format(r, theta, phi))
+    if r > 0.0 and l1 <= 1 and l2 <= 1:
+        return SlaterOverlapAxial(n1, l1, m1, zeta1, n2, l2, m2, zeta2, r, np.array([x, y, z]) / r)
     return SlaterOverlap(n1, l1, m1, zeta1, n2, l2, m2, zeta2, r, theta, phi)
 
 
+# Real p functions: m = 1 is px, m = -1 is py and m = 0 is pz
+POrbitalAxis = {1: 0, -1: 1, 0: 2}
+
+
+def SlaterOverlapAxial(n1, l1, m1, zeta1, n2, l2, m2, zeta2, r, u):
+    """
+    Overlap of s and p functions on two centres a distance r apart along the unit vector u. The sigma and pi
+    overlaps are evaluated with the second centre on the z axis and then projected onto u, which keeps the
+    result independent of the orientation of the pair.
+    """
+    if l1 == 0 and l2 == 0:
+        return SlaterOverlap(n1, 0, 0, zeta1, n2, 0, 0, zeta2, r, 0.0, 0.0)
+    if l2 == 0:
+        return u[POrbitalAxis[m1]] * SlaterOverlap(n1, 1, 0, zeta1, n2, 0, 0, zeta2, r, 0.0, 0.0)
+    if l1 == 0:
+        return u[POrbitalAxis[m2]] * SlaterOverlap(n1, 0, 0, zeta1, n2, 1, 0, zeta2, r, 0.0, 0.0)
+    ui = u[POrbitalAxis[m1]]
+    uj = u[POrbitalAxis[m2]]
+    sigma = SlaterOverlap(n1, 1, 0, zeta1, n2, 1, 0, zeta2, r, 0.0, 0.0)
+    pi = SlaterOverlap(n1, 1, 1, zeta1, n2, 1, 1, zeta2, r, 0.0, 0.0)
+    if m1 == m2:
+        return ui * uj * sigma + (1.0 - ui * uj) * pi
+    return ui * uj * (sigma - pi)
+
+
+def An3Array(k1, k, p):
+    """
+    An3 for an array of p > 0
+    """
+    j = np.arange(k1 - k - 1, k1)
+    terms = (p[:, np.newaxis] ** j) / scipy.special.factorial(j - k1 + k + 1)
+    return np.sum(terms, axis=1) * scipy.special.factorial(k) * np.exp(-p)
+
+
+def AnArray(k, p):
+    """
+    An for an array of p != 0
+    """
+    j = np.arange(0, k + 1)
+    terms = (p[:, np.newaxis] ** j) / scipy.special.factorial(j)
+    return np.sum(terms, axis=1) * np.exp(-p) * (scipy.special.factorial(k) / (p ** (k + 1)))
+
+
+def Bn3Array(k, p):
+    """
+    Bn3 for an array of p, using the same series and closed forms as Bn3
+    """
+    value = np.zeros(len(p))
+    series = p < 2.0
+    if np.any(series):
+        if k % 2 == 0:
+            i = np.arange(0, 202, 2)
+            sign = 2.0
+        else:
+            i = np.arange(1, 203, 2)
+            sign = -2.0
+        terms = (p[series, np.newaxis] ** i) / scipy.special.factorial(i) / (i + k + 1)
+        value[series] = np.sum(terms, axis=1) * sign
+    if not np.all(series):
+        q = p[~series]
+        value[~series] = (((-1) ** (k + 1)) * AnArray(k, -q)) - AnArray(k, q)
+    return value
+
+
+@memoised(INTEGER_CACHE_SIZE)
+def overlapTerms(n1, l1, n2, l2, lambda_, t):
+    """
+    Expands overlap(n1, l1, n2, l2, lambda_, p, t) for fixed quantum numbers and t into a tuple of
+    (kb, ka, coefficient), such that the overlap is the sum of coefficient * Bn3(kb, p * t) * An3(n1 + n2 + 1, ka, p).
+    """
+    if (l1 - lambda_) % 2 == 0:
+        a1 = -lambda_
+    else:
+        a1 = -lambda_ + 1
+    if (l2 + lambda_) % 2 == 0:
+        b1 = lambda_
+    else:
+        b1 = lambda_ + 1
+    numerator = (((1 + t) ** (n1 + 0.5)) * (((1 - t) ** (n2 + 0.5))))
+    denominator = np.sqrt(scipy.special.factorial(2 * n1)) * np.sqrt(scipy.special.factorial(2 * n2))
+    b = (numerator / denominator) * ((-1) ** (l2 + lambda_))
+    terms = {}
+    for i in range(a1, l1 + 1, 2):
+        for j in range(b1, l2 + 1, 2):
+            g = galbet(l1, l2, lambda_, i, j) * b
+            for k in range(0, i + j + 1):
+                f = Fmn(k, i + lambda_, j - lambda_) * g
+                for m in range(0, n1 + n2 - i - j + 1):
+                    key = (m + k, n1 + n2 - i - j - m + k)
+                    terms[key] = terms.get(key, 0.0) + Fmn(m, n1 - i, n2 - j) * f
+    return tuple((kb, ka, coefficient) for (kb, ka), coefficient in terms.items() if coefficient != 0.0)
+
+
+def axialOverlaps(n1, l1, zeta1, n2, l2, zeta2, m, r):
+    """
+    Overlaps of the functions (n1, l1, m) and (n2, l2, m) for an array of distances r (in bohr) with the second
+    centre on the z axis, as SlaterOverlap(n1, l1, m, zeta1, n2, l2, m, zeta2, r, 0, 0) would return them.
+    The angular factors and the expansion of the radial integrals are memoised, so that all pairs sharing
+    quantum numbers and exponents reuse them.
+    """
+    p = (r / 2.0) * (zeta1 + zeta2)
+    t = (zeta1 - zeta2) / (zeta1 + zeta2)
+    S = np.zeros(len(r))
+    for lambda_ in range(0, min(l1, l2) + 1):
+        angular = tlm(lambda_, l1, m, l2, m, 0.0, 0.0)
+        if angular == 0.0:
+            continue
+        radial = np.zeros(len(r))
+        for kb, ka, coefficient in overlapTerms(n1, l1, n2, l2, lambda_, t):
+            radial += coefficient * Bn3Array(kb, p * t) * An3Array(n1 + n2 + 1, ka, p)
+        S += angular * radial
+    return S
+
+
+@memoised(INTEGER_CACHE_SIZE)
+def overlapCutoff(n1, l1, zeta1, n2, l2, zeta2, threshold):
+    """
+    Distance (in bohr) beyond which all overlaps between the shells (n1, l1, zeta1) and (n2, l2, zeta2) are smaller
+    than threshold, found by stepping out along the exponential tail of the sigma and pi overlaps. If they have not
+    dropped below threshold within 1000 bohr (as for threshold <= 0), returns infinity, so that no pair is skipped.
+    """
+    r = 2.0
+    while r < 1000.0:
+        largest = 0.0
+        for m in range(0, min(l1, l2) + 1):
+            largest = max(largest, abs(axialOverlaps(n1, l1, zeta1, n2, l2, zeta2, m, np.array([r]))[0]))
+        if largest < threshold and r > 10.0 / (zeta1 + zeta2):
+            return r
+        r *= 1.25
+    return np.inf
+
+
+def OverlapMatrix(basis, coords, threshold=1.0e-9):
+    """
+    Overlap matrix of the Slater type basis functions in basis, a list of (centre, n, l, m, zeta), with the
+    centres at coords (in Angstrom). Functions are grouped into shells, and the sigma and pi overlaps of all shell
+    pairs with the same quantum numbers and exponents are evaluated together and projected onto the direction of
+    each pair. Pairs of shells further apart than the distance where their overlap drops below threshold are
+    skipped, unless threshold is None or <= 0. Functions beyond p fall back to SlaterOverlapCartesian.
+    """
+    angstrom = np.asarray(coords, dtype=float).reshape(-1, 3)
+    coords = Ang2Bohr(angstrom)
+    S = np.zeros((len(basis), len(basis)))
+    shells = {}
+    for index, (centre, n, l, m, zeta) in enumerate(basis):
+        shells.setdefault((centre, n, l, zeta), {})[m] = index
+    shells = list(shells.items())
+    onecentre = {}
+    groups = {}
+    for a in range(len(shells)):
+        (centre1, n1, l1, zeta1), functions1 = shells[a]
+        for b in range(a, len(shells)):
+            (centre2, n2, l2, zeta2), functions2 = shells[b]
+            # Functions on the same centre, or on two centres in the same place, have one-centre overlaps
+            coincident = centre1 == centre2 or not np.any(coords[centre1] != coords[centre2])
+            if coincident or l1 > 1 or l2 > 1:
+                for m1, i in functions1.items():
+                    for m2, j in functions2.items():
+                        if coincident:
+                            key = (n1, l1, m1, zeta1, n2, l2, m2, zeta2)
+                            if key not in onecentre:
+                                onecentre[key] = SlaterOverlap(n1, l1, m1, zeta1, n2, l2, m2, zeta2, 0.0, 0.0, 0.0)
+                            S[i][j] = onecentre[key]
+                        else:
+                            x1, y1, z1 = angstrom[centre1]
+                            x2, y2, z2 = angstrom[centre2]
+                            S[i][j] = SlaterOverlapCartesian(n1, l1, m1, zeta1, x1, y1, z1,
+                                                             n2, l2, m2, zeta2, x2, y2, z2)
+                        S[j][i] = S[i][j]
+            else:
+                groups.setdefault((n1, l1, zeta1, n2, l2, zeta2), []).append((functions1, centre1, functions2, centre2))
+
+    for (n1, l1, zeta1, n2, l2, zeta2), pairs in groups.items():
+        d = np.array([coords[centre2] - coords[centre1] for functions1, centre1, functions2, centre2 in pairs])
+        r = np.linalg.norm(d, axis=1)
+        if threshold is None or threshold <= 0.0:
+            near = np.ones(len(r), dtype=bool)
+        else:
+            near = r <= overlapCutoff(n1, l1, zeta1, n2, l2, zeta2, threshold)
+        if not np.any(near):
+            continue
+        pairs = [pair for pair, keep in zip(pairs, near) if keep]
+        r = r[near]
+        u = d[near] / r[:, np.newaxis]
+        sigma = axialOverlaps(n1, l1, zeta1, n2, l2, zeta2, 0, r)
+        if l1 == 1 and l2 == 1:
+            pi = axialOverlaps(n1, l1, zeta1, n2, l2, zeta2, 1, r)
+        for m1 in pairs[0][0]:
+            for m2 in pairs[0][2]:
+                i = np.array([pair[0][m1] for pair in pairs])
+                j = np.array([pair[2][m2] for pair in pairs])
+                if l1 == 0 and l2 == 0:
+                    value = sigma
+                elif l2 == 0:
+                    value = u[:, POrbitalAxis[m1]] * sigma
+                elif l1 == 0:
+                    value = u[:, POrbitalAxis[m2]] * sigma
+                else:
+                    uu = u[:, POrbitalAxis[m1]] * u[:, POrbitalAxis[m2]]
+                    value = uu * (sigma - pi)
+                    if m1 == m2:
+                        value = value + pi
+                S[i, j] = value
+                S[j, i] = value
+    return S
+
 if __name__ == "__main__":
     print("---------1--------   ---------2--------  ------")
     print(" n,  l,  m, zeta  n,  l,  m, zeta, dist")
@@ -0,0 +1,1053 @@
+import math
+
+import numpy as np
+import scipy.special
+
+from .potentials import (AngleDamping, bond_exp, DampingFunction, exp_1_3, HBondDamping, HBondStrengthFactor,
+                         potAnyBend, potBendNearLinear, potCosineSum, potGLJ, potHarmonic, potHBond, potMorse,
+                         potSimpleCosine, potTorsion)
+
+
+#############################################################################################################
+# Classes for Force Field Terms defined below
+#############################################################################################################
+
+class FFStretch:
+    """ A stretching potential"""
+
+    def __init__(self, a, b, r0, typ, arg):
+        """ (FFStretch, int, int, number, int, [number]) -> NoneType
+    
+    A stretch potential between atoms number a and b with equilibrium
+    distance r0, of type typ with arguments [arg] where arg[2] and arg[3]
+    are the atomic symbols of atoms number a and b respectively
+    """
+
+        self.atom1 = a
+        self.atom2 = b
+        self.r0 = r0
+        self.typ = typ
+        self.k_str = 0.0
+
+        if typ == 1:
+            self.typ = typ
+            self.k_str = arg[0]
+        elif typ == 2:
+            self.D = arg[0]
+            self.b = arg[1]
+        elif typ == 3:
+            self.exp_a = bond_exp(arg[2], arg[3])
+            # check whether an Atom can be passed to a function this way
+            self.k_str = arg[0]
+        elif typ == 4:
+            self.ring = arg[4]
+            self.exp_a = exp_1_3(arg[2], arg[3], self.ring)
+            self.k_str = arg[0]
+        else:
+            self.typ = 1
+            self.k_str = arg[0]
+
+    def __str__(self):
+        """ (FFStretch) -> str
+    
+    Return a string representation of the stretching potential in this format:
+    
+    (atom1, atom2, r0, type, arguments)
+    
+    """
+
+        s = '({0}, {1}, {2}, {3}, '.format(self.atom1, self.atom2, self.r0, self.typ)
+        r = ''
+
+        if self.typ == 1:
+            r = '{0})'.format(self.k_str)
+        elif self.typ == 2:
+            r = '{0}, {1})'.format(self.D, self.b)
+        elif self.typ == 3 or self.typ == 4:
+            r = '{0}, {1}'.format(self.k_str, self.exp_a)
+
+        return s + r
+
+    def __repr__(self):
+        """ (FFStretch) -> str
+    
+    Return a string representation of the stretching potential in this format:
+    
+    (atom1, atom2, r0, type, arguments)
+    
+    """
+
+        s = '({0}, {1}, {2}, {3}, '.format(self.atom1, self.atom2, self.r0, self.typ)
+        r = ''
+
+        if self.typ == 1:
+            r = '{0})'.format(self.k_str)
+        elif self.typ == 2:
+            r = '{0}, {1})'.format(self.D, self.b)
+
+        return s + r
+
+    def setk(self, k):
+        """ (FFStretch) -> NoneType
+
+    Set the force constant k_str equal to k
+    """
+        self.k_str = k
+
+    def energy(self, r):
+        """ Returns the energy of this stretching potential at distance r"""
+
+        energy = 0.0
+        if self.typ == 1:
+            #      print("Using Harmonic potential for stretch") # REMOVE ONCE FIXED
+            #      print("With r = " + str(r) + ", r0 = " + str(self.r0) + ", k = " + str(self.k_str)) # REMOVE ONCE FIXED
+            energy = potHarmonic(r, self.r0, self.k_str)
+        elif self.typ == 2:
+            #      print("Using Morse potential for stretch") # REMOVE ONCE FIXED
+            #      print("With r = " + str(r) + ", r0 = " + str(self.r0) + ", D = " + str(self.D) + ", b = " + str(self.b)) # REMOVE ONCE FIXED 
+            energy = potMorse(r, self.r0, self.D, self.b)
+        elif self.typ == 3 or self.typ == 4:
+            #      print("Using GLJ potential for stretch") # REMOVE ONCE FIXED 
+            #      print("With r = " + str(r) + ", r0 = " + str(self.r0) + ", k = " + str(self.k_str) + ", a = " + str(self.exp_a)) # REMOVE ONCE FIXED
+            energy = potGLJ(r, self.r0, self.k_str, self.exp_a)
+
+        return energy
+
+
+class FFBend:
+    """ A bending potential"""
+
+    def __init__(self, a, b, c, a0, typ, arg):
+        """ (FFStretch, int, int, int, number, int, [number]) -> NoneType
+    
+    A bending potential between atoms number a, b and c with equilibrium
+    angle a0, of type typ with arguments [arg] comprising angle force 
+    constant, atomic symbols of atoms a, b, and c, and the distances 
+    between atoms a and b and b and c
+    """
+
+        self.atom1 = a
+        self.atom2 = b
+        self.atom3 = c
+        self.a0 = a0
+        if typ == 1:
+            self.typ = typ
+            self.k = arg[0]
+        elif typ == 2:
+            self.typ = 2
+            self.k_bnd = arg[0]
+            r_12 = arg[4]
+            r_23 = arg[5]
+            f_dmp_12 = DampingFunction(arg[1], arg[2], r_12)
+            f_dmp_23 = DampingFunction(arg[2], arg[3], r_23)
+            self.f_dmp = f_dmp_12 * f_dmp_23
+            self.typ = 1
+            self.k = arg[0]
+
+    def __str__(self):
+        """ (FFBend) -> str
+    
+    Return a string representation of the bending potential in this format:
+    
+    (atom1, atom2, atom3, a0, type, arguments)
+    
+    """
+
+        s = '({0}, {1}, {2}, {3}, '.format(self.atom1, self.atom2, self.atom3, self.a0, self.typ)
+
+        if self.typ == 1:
+            r = '{0})'.format(self.k)
+
+        return s + r
+
+    def __repr__(self):
+        """ (FFBend) -> str
+    
+    Return a string representation of the bending potential in this format:
+    
+    (atom1, atom2, atom3, a0, type, arguments)
+    
+    """
+
+        s = '({0}, {1}, {2}, {3}, '.format(self.atom1, self.atom2, self.atom3, self.a0, self.typ)
+
+        if self.typ == 1:
+            r = '{0})'.format(self.k)
+
+        return s + r
+
+    def setk(self, newk):
+        """ (FFBend) -> NoneType
+
+    Set the bending force constant k equal to newk
+    """
+        self.k = newk
+
+    def energy(self, a):
+        """ Returns the energy of this bending potential at angle a"""
+
+        energy = 0.0
+        if self.typ == 1:
+            energy = potHarmonic(a, self.a0, self.k)
+        elif self.typ == 2:
+            if (math.pi - 0.01) <= self.a0 <= (math.pi + 0.01):
+                # Tolerance used here is essentially a placeholder, may need changing in either direction
+                energy = potBendNearLinear(a, self.a0, self.k_bnd, self.f_dmp)
+            else:
+                energy = potAnyBend(a, self.a0, self.k_bnd, self.f_dmp)
+
+        return energy
+
+
+class FFTorsion:
+    """ A torsion potential"""
+
+    def __init__(self, a, b, c, d, theta0, typ, arg):
+        """ (FFTorsion, int, int, int, int, number, int, [number]) -> NoneType
+    
+    A torsion potential between atoms number a, b, c and d with equilibrium
+    angle theta0, of type typ with arguments [arg] comprising the dihedral
+    force constant, the atomic symbols of atoms a, b, c and d,  the 
+    ab, bc and cd bond lengths, the values of k_tors_n and equilibrium angle
+    from fitting to HMOEnergy result, if applicable, and a Boolean for whether
+    the central bond of the dihedral is in a ring 
+    """
+
+        self.atom1 = a
+        self.atom2 = b
+        self.atom3 = c
+        self.atom4 = d
+        self.theta0 = theta0
+        self.ring = arg[10]
+        if typ == 1:
+            self.typ = typ
+            self.k = arg[0]
+        elif typ == 2:
+            self.typ = typ
+            r_12 = arg[5]
+            r_23 = arg[6]
+            r_34 = arg[7]
+            f_dmp_12 = DampingFunction(arg[1], arg[2], r_12)
+            f_dmp_23 = DampingFunction(arg[2], arg[3], r_23)
+            f_dmp_34 = DampingFunction(arg[3], arg[4], r_34)
+            self.f_dmp = f_dmp_12 * f_dmp_23 * f_dmp_34
+            self.k_tors = arg[8]
+            #for i in range(8, len(arg)):
+            #    self.k_tors.append(arg[i])
+            self.theta0HMO = arg[9]
+        elif typ == 3:
+            self.typ = typ
+            r_12 = arg[5]
+            r_23 = arg[6]
+            r_34 = arg[7]
+            f_dmp_12 = DampingFunction(arg[1], arg[2], r_12)
+            f_dmp_23 = DampingFunction(arg[2], arg[3], r_23)
+            f_dmp_34 = DampingFunction(arg[3], arg[4], r_34)
+            self.f_dmp = f_dmp_12 * f_dmp_23 * f_dmp_34
+            self.k = arg[8][0]
+        elif typ == 4:
+            self.typ = typ
+            r_12 = arg[5]
+            r_23 = arg[6]
+            r_34 = arg[7]
+            f_dmp_12 = DampingFunction(arg[1], arg[2], r_12)
+            f_dmp_23 = DampingFunction(arg[2], arg[3], r_23)
+            f_dmp_34 = DampingFunction(arg[3], arg[4], r_34)
+            self.f_dmp = f_dmp_12 * f_dmp_23 * f_dmp_34
+            self.k_tors = arg[8]
+            self.theta0HMO = arg[9]
+        else:
+            self.typ = 1
+            self.k = arg[0]
+
+    def __str__(self):
+        """ (FFTorsion) -> str
+    
+    Return a string representation of the torsion potential in this format:
+    
+    (atom1, atom2, atom3, atom4, theta0, type, arguments)
+    
+    """
+
+        s = '({0}, {1}, {2}, {3}, {4}, '.format(self.atom1, self.atom2, self.atom3, self.atom4, self.theta0, self.typ)
+
+        if self.typ == 1:
+            r = '{0})'.format(self.k)
+
+        return s + r
+
+    def __repr__(self):
+        """ (FFTorsion) -> str
+    
+    Return a string representation of the torsion potential in this format:
+    
+    (atom1, atom2, atom3, atom4, theta0, type, arguments)
+    
+    """
+
+        s = '({0}, {1}, {2}, {3}, {4}, '.format(self.atom1, self.atom2, self.atom3, self.atom4, self.theta0, self.typ)
+
+        if self.typ == 1:
+            r = '{0})'.format(self.k)
+
+        return s + r
+
+    def setk(self, newk):
+        """ Sets the single force constant k for type 1 or 3 torsion potentials equal to newk """
+        self.k = newk
+
+    def energy(self, theta):
+        """ Returns the energy of this torsion potential at angle theta"""
+
+        energy = 0.0
+        if self.typ == 1:
+            energy = potSimpleCosine(theta, self.theta0, self.k)
+        elif self.typ == 2:
+            energy = potTorsion(theta, self.theta0HMO, self.f_dmp, self.k_tors)
+        # Will need two cases, one for non-rotatable bonds, the other for rotatable bonds.
+        # Probably best to implement via types
+        elif self.typ == 3:
+            k_tors = []
+            k_tors.append(self.k)
+            energy = potTorsion(theta, self.theta0, self.f_dmp, k_tors)
+        elif self.typ == 4:
+            energy = potCosineSum(theta, self.theta0HMO, self.k_tors)
+        return energy
+
+
+class FFInversion:
+    """ An inversion potential for 3-fold coordinate atoms"""
+
+    def __init__(self, a, b, c, d, phi0, typ, arg):
+        """ (FFInversion, int, int, int, int, number, int, [number]) -> NoneType
+
+    An inversion potential between atoms number a, b, c and d (where a is the
+    central atom bonded to the other three) with equilibrium out of plane
+    angle phi0, of type typ with arguments [arg]
+    """
+
+        self.atom1 = a
+        self.atom2 = b
+        self.atom3 = c
+        self.atom4 = d
+        self.phi0 = phi0
+        if typ == 1:
+            self.typ = 1
+            self.k_inv = arg[0]
+        elif typ == 2:
+            self.typ = 2
+            self.k_inv = arg[
+                0]  # Will need to check there is an appropriate force constant locatable for use here, eventually will require fitting to Hessian
+            # Damping constant needs to be checked - set up below on the assumption that a product of distance dependent damping functions for the three bonds will do
+            r_12 = arg[5]
+            r_13 = arg[6]
+            r_14 = arg[7]
+            f_dmp_12 = DampingFunction(arg[1], arg[2], r_12)
+            f_dmp_13 = DampingFunction(arg[1], arg[3], r_13)
+            f_dmp_14 = DampingFunction(arg[1], arg[4], r_14)
+            self.f_dmp = f_dmp_12 * f_dmp_13 * f_dmp_14
+        else:
+            self.typ = 1
+            self.k_inv = arg[0]
+
+    def __str__(self):
+        """ (FFInversion) -> str
+
+    Return a string representation of the bending potential in this format:
+
+    (atom1, atom2, atom3, atom4, phi0, type, arguments)
+
+    """
+
+        s = '({0}, {1}, {2}, {3}, {4}, '.format(self.atom1, self.atom2, self.atom3, self.atom4, self.phi0, self.typ)
+
+        if self.typ == 1:
+            r = '{0})'.format(self.k_inv)
+
+        return s + r
+
+    def __repr__(self):
+        """ (FFInversion) -> str
+
+    Return a string representation of the bending potential in this format:
+
+    (atom1, atom2, atom3, atom4, phi0, type, arguments)
+
+    """
+
+        s = '({0}, {1}, {2}, {3}, {4}, '.format(self.atom1, self.atom2, self.atom3, self.atom4, self.phi0, self.typ)
+
+        if self.typ == 1:
+            r = '{0})'.format(self.k_inv)
+
+        return s + r
+
+    def setk(self, newk):
+        """ (FFInversion) -> NoneType
+
+    Set the inversion force constant for this potential equal to newk
+    """
+        self.k_inv = newk
+
+    def energy(self, phi):
+        """ Returns the energy of this inversion potential at out of plane angle phi"""
+
+        energy = 0.0
+        if self.typ == 1:
+            energy = potHarmonic(phi, self.phi0, self.k_inv)  # or use another sutiable simple potential here
+        elif self.typ == 2:
+            if (math.pi - 0.01) <= self.phi0 <= (math.pi + 0.01):
+                # Tolerance used here is essentially a placeholder, may need changing in either direction
+                energy = potBendNearLinear(phi, self.phi0, self.k_inv, self.f_dmp)
+            else:
+                energy = potAnyBend(phi, self.phi0, self.k_inv, self.f_dmp)
+
+        return energy
+
+
+class FFHBond:
+    """ A hydrogen bonding potential for an atom triple """
+
+    def __init__(self, a, b, c, theta, typ, arg):
+        """ (FFHBond, int, int, int, number, int, [number]) -> NoneType
+
+    A hydrogen bonding potential between atoms number a, b and c, where b is
+    hydrogen and the abc angle is theta, of type typ with arguments [arg]
+    comprising the atomic symbols and charges of atoms a, b and c, and distances
+    r_ab, r_bc, r_ab
+    """
+
+        # Including type may not be necessary, has been done here just for consistency
+
+        self.atomA = a
+        self.atomH = b
+        self.atomB = c
+        self.theta = theta
+        if typ == 1:
+            self.typ = typ
+            self.symA = arg[0]
+            self.chgA = arg[1]
+            self.symH = arg[2]
+            self.chgH = arg[3]
+            self.symB = arg[4]
+            self.chgB = arg[5]
+            self.r_AH = arg[6]
+            self.r_BH = arg[7]
+            self.r_AB = arg[8]
+
+    def __str__(self):
+        """ (FFHbond) -> str
+
+    Return a string representation of the hydrogen bonding potential in this format:
+
+    (atomA, atomH, atomB, theta, type, arguments)
+
+    """
+
+        s = '({0}, {1}, {2}, {3), '.format(self.atomA, self.atomH, self.atomB, self.theta, self.typ)
+
+        if self.typ == 1:
+            r = ')'
+        # Written now to just close the list, should ultimately expand to allow printing of all arguments in line with other classes
+
+        return s + r
+
+    def __repr__(self):
+        """ (FFHbond) -> str
+
+    Return a string representation of the hydrogen bonding potential in this format:
+
+    (atomA, atomH, atomB, theta, type, arguments)
+
+    """
+
+        s = '({0}, {1}, {2}, {3), '.format(self.atomA, self.atomH, self.atomB, self.theta, self.typ)
+
+        if self.typ == 1:
+            r = ')'
+
+        return s + r
+
+    def energy(self):
+        """ Returns the energy for this hydrogen bonding potential """
+
+        c_hbnd_AB = HBondStrengthFactor(self.symA, self.chgA, self.r_AH, self.symB, self.chgB, self.r_BH)
+
+        f_dmp_theta = AngleDamping(self.theta)
+
+        f_dmp_hbnd = HBondDamping(self.symA, self.symB, self.r_AB)
+
+        energy = potHBond(f_dmp_theta, f_dmp_hbnd, c_hbnd_AB, self.r_AB)
+
+        return energy
+
+
+# Note - will need to check in adding hbond triples that the indices used above for arguments come out correct 
+
+#############################################################################################################
+# Term tables: whole-array (vectorised) evaluation of the bonded force field terms defined below
+#############################################################################################################
+
+def packStretches(terms):
+    """
+    Packs a list of FFStretch terms into NumPy index and parameter arrays
+    """
+    n = len(terms)
+    table = {"idx": np.zeros((n, 2), dtype=int), "typ": np.zeros(n, dtype=int), "r0": np.zeros(n),
+             "k": np.zeros(n), "a": np.zeros(n), "D": np.zeros(n), "b": np.zeros(n)}
+    for m, term in enumerate(terms):
+        table["idx"][m] = [term.atom1, term.atom2]
+        table["typ"][m] = term.typ
+        table["r0"][m] = term.r0
+        table["k"][m] = term.k_str
+        if term.typ == 2:
+            table["D"][m] = term.D
+            table["b"][m] = term.b
+        elif term.typ == 3 or term.typ == 4:
+            table["a"][m] = term.exp_a
+
+    return table
+
+
+def packBends(terms):
+    """
+    Packs a list of FFBend terms into NumPy index and parameter arrays
+    """
+    n = len(terms)
+    table = {"idx": np.zeros((n, 3), dtype=int), "typ": np.zeros(n, dtype=int), "a0": np.zeros(n),
+             "k": np.zeros(n), "f_dmp": np.ones(n)}
+    for m, term in enumerate(terms):
+        table["idx"][m] = [term.atom1, term.atom2, term.atom3]
+        table["typ"][m] = term.typ
+        table["a0"][m] = term.a0
+        if term.typ == 1:
+            table["k"][m] = term.k
+        elif term.typ == 2:
+            table["k"][m] = term.k_bnd
+            table["f_dmp"][m] = term.f_dmp
+    # Same tolerance as used in FFBend.energy() to pick the near-linear form of the type 2 potential
+    table["linear"] = np.abs(table["a0"] - math.pi) <= 0.01
+
+    return table
+
+
+def packTorsions(terms):
+    """
+    Packs a list of FFTorsion terms into NumPy index and parameter arrays
+
+    The k_tors_n of the cosine series (types 2 to 4) are stored row-wise, padded with zeros
+    to the length of the longest series
+    """
+    n = len(terms)
+    nmax = 1
+    for term in terms:
+        if term.typ == 2 or term.typ == 4:
+            nmax = max(nmax, len(term.k_tors))
+    table = {"idx": np.zeros((n, 4), dtype=int), "typ": np.zeros(n, dtype=int), "theta0": np.zeros(n),
+             "k": np.zeros(n), "f_dmp": np.ones(n), "k_tors": np.zeros((n, nmax))}
+    for m, term in enumerate(terms):
+        table["idx"][m] = [term.atom1, term.atom2, term.atom3, term.atom4]
+        table["typ"][m] = term.typ
+        if term.typ == 1:
+            table["theta0"][m] = term.theta0
+            table["k"][m] = term.k
+        elif term.typ == 2 or term.typ == 4:
+            table["theta0"][m] = term.theta0HMO
+            table["k_tors"][m, :len(term.k_tors)] = term.k_tors
+        elif term.typ == 3:
+            table["theta0"][m] = term.theta0
+            table["k_tors"][m, 0] = term.k
+        if term.typ == 2 or term.typ == 3:
+            table["f_dmp"][m] = term.f_dmp
+
+    return table
+
+
+def packInversions(terms):
+    """
+    Packs a list of FFInversion terms into NumPy index and parameter arrays
+    """
+    n = len(terms)
+    table = {"idx": np.zeros((n, 4), dtype=int), "typ": np.zeros(n, dtype=int), "phi0": np.zeros(n),
+             "k": np.zeros(n), "f_dmp": np.ones(n)}
+    for m, term in enumerate(terms):
+        table["idx"][m] = [term.atom1, term.atom2, term.atom3, term.atom4]
+        table["typ"][m] = term.typ
+        table["phi0"][m] = term.phi0
+        table["k"][m] = term.k_inv
+        if term.typ == 2:
+            table["f_dmp"][m] = term.f_dmp
+    table["linear"] = np.abs(table["phi0"] - math.pi) <= 0.01
+
+    return table
+
+
+def batchTable(table, copies, numatoms):
+    """
+    Repeats a packed term table for copies structures stacked into one (copies * numatoms, 3) coordinate array,
+    with the atom indices of copy c offset by c * numatoms
+    """
+    batch = {}
+    for key, value in table.items():
+        if key == "idx":
+            offset = numatoms * np.arange(copies)[:, np.newaxis, np.newaxis]
+            batch[key] = (value[np.newaxis] + offset).reshape(-1, value.shape[1])
+        else:
+            batch[key] = np.tile(value, (copies,) + (1,) * (value.ndim - 1))
+
+    return batch
+
+
+def crossMatrices(a):
+    """
+    Cross product matrices [a]x (such that [a]x b = a x b) for an (M, 3) array of vectors a
+    """
+    m = np.zeros((len(a), 3, 3))
+    m[:, 0, 1] = -a[:, 2]
+    m[:, 0, 2] = a[:, 1]
+    m[:, 1, 0] = a[:, 2]
+    m[:, 1, 2] = -a[:, 0]
+    m[:, 2, 0] = -a[:, 1]
+    m[:, 2, 1] = a[:, 0]
+
+    return m
+
+
+def cosineDerivatives(u, v):
+    """
+    Cosine of the angle between the (M, 3) vectors u and v, with its first and second derivatives with respect to u and v
+    """
+    norm_u = np.linalg.norm(u, axis=1)[:, np.newaxis, np.newaxis]
+    norm_v = np.linalg.norm(v, axis=1)[:, np.newaxis, np.newaxis]
+    unit_u = u / norm_u[:, :, 0]
+    unit_v = v / norm_v[:, :, 0]
+    c = np.einsum('ij,ij->i', unit_u, unit_v)
+    cc = c[:, np.newaxis, np.newaxis]
+    uu = np.einsum('ij,ik->ijk', unit_u, unit_u)
+    vv = np.einsum('ij,ik->ijk', unit_v, unit_v)
+    uv = np.einsum('ij,ik->ijk', unit_u, unit_v)
+    vu = np.transpose(uv, (0, 2, 1))
+    unity = np.eye(3)
+    d_u = (unit_v - c[:, np.newaxis] * unit_u) / norm_u[:, :, 0]
+    d_v = (unit_u - c[:, np.newaxis] * unit_v) / norm_v[:, :, 0]
+    d2_uu = (-(uv + vu) + 3 * cc * uu - cc * unity) / norm_u ** 2
+    d2_vv = (-(uv + vu) + 3 * cc * vv - cc * unity) / norm_v ** 2
+    d2_uv = (unity - uu - vv + cc * uv) / (norm_u * norm_v)
+
+    return c, d_u, d_v, d2_uu, d2_uv, d2_vv
+
+
+def localToAtoms(d, d2, coeff):
+    """
+    Converts first (M, V, 3) and second (M, V, 3, V, 3) derivatives with respect to V vectors, which are linear
+    combinations of atomic positions given by the (V, A) matrix coeff, into derivatives with respect to the A atoms
+    """
+
+    return np.einsum('va,mvi->mai', coeff, d), np.einsum('va,wb,mviwj->maibj', coeff, coeff, d2)
+
+
+def termDistances(X, idx, deriv=0):
+    """
+    Distances between the atom pairs in idx for the (N, 3) coordinate array X
+    With deriv=1, also returns the derivatives with respect to the positions of both atoms, shape (M, 2, 3),
+    and with deriv=2 the second derivatives as well, shape (M, 2, 3, 2, 3)
+    """
+    u = X[idx[:, 0]] - X[idx[:, 1]]
+    r = np.linalg.norm(u, axis=1)
+    if not deriv:
+        return r
+    unit = u / r[:, np.newaxis]
+    d = np.stack((unit, -unit), axis=1)
+    if deriv < 2:
+        return r, d
+    block = (np.eye(3) - np.einsum('ij,ik->ijk', unit, unit)) / r[:, np.newaxis, np.newaxis]
+    d2 = np.zeros((len(r), 2, 3, 2, 3))
+    d2[:, 0, :, 0, :] = d2[:, 1, :, 1, :] = block
+    d2[:, 0, :, 1, :] = d2[:, 1, :, 0, :] = -block
+
+    return r, d, d2
+
+
+def pairGradient(n, pair_i, pair_j, vector, du):
+    """
+    Returns the (n, 3) gradient of a sum of pair potentials u(r) of the atom pairs (pair_i, pair_j) with
+    interatomic vectors vector = X[pair_i] - X[pair_j], given the derivatives du with respect to r
+    """
+    r = np.linalg.norm(vector, axis=1)
+    gradient = np.zeros((n, 3))
+    pairforce = (du / r)[:, np.newaxis] * vector
+    np.add.at(gradient, pair_i, pairforce)
+    np.add.at(gradient, pair_j, -pairforce)
+
+    return gradient
+
+
+def pairHessian(n, pair_i, pair_j, vector, du, d2u):
+    """
+    Returns the (n, n, 3, 3) Hessian blocks of a sum of pair potentials u(r) of the atom pairs (pair_i, pair_j) with
+    interatomic vectors vector = X[pair_i] - X[pair_j], given the first and second derivatives du and d2u
+    with respect to r
+    """
+    r = np.linalg.norm(vector, axis=1)
+    # Each pair contributes d2u along the interatomic vector and du / r perpendicular to it
+    unit = vector / r[:, np.newaxis]
+    radial = np.einsum('ij,ik->ijk', unit, unit)
+    block = (d2u[:, np.newaxis, np.newaxis] * radial
+             + (du / r)[:, np.newaxis, np.newaxis] * (np.eye(3) - radial))
+    hessian = np.zeros((n, n, 3, 3))
+    np.add.at(hessian, (pair_i, pair_i), block)
+    np.add.at(hessian, (pair_j, pair_j), block)
+    np.add.at(hessian, (pair_i, pair_j), -block)
+    np.add.at(hessian, (pair_j, pair_i), -block)
+
+    return hessian
+
+
+def termAngles(X, idx, deriv=0):
+    """
+    Bond angles (in radians) for the atom triples in idx, with the second atom at the apex
+    With deriv=1, also returns the derivatives with respect to the positions of all three atoms, shape (M, 3, 3),
+    and with deriv=2 the second derivatives as well, shape (M, 3, 3, 3, 3)
+    """
+    u = X[idx[:, 0]] - X[idx[:, 1]]
+    v = X[idx[:, 2]] - X[idx[:, 1]]
+    norm_u = np.linalg.norm(u, axis=1)
+    norm_v = np.linalg.norm(v, axis=1)
+    argument = np.clip(np.einsum('ij,ij->i', u, v) / (norm_u * norm_v), -1.0, 1.0)
+    theta = np.arccos(argument)
+    if not deriv:
+        return theta
+    # d(theta) = -d(cos theta) / sin(theta), guarded against exactly linear arrangements
+    sin_theta = np.maximum(np.sqrt(1.0 - argument ** 2), 1e-12)
+    if deriv < 2:
+        unit_u = u / norm_u[:, np.newaxis]
+        unit_v = v / norm_v[:, np.newaxis]
+        d_u = -(unit_v - argument[:, np.newaxis] * unit_u) / (norm_u * sin_theta)[:, np.newaxis]
+        d_v = -(unit_u - argument[:, np.newaxis] * unit_v) / (norm_v * sin_theta)[:, np.newaxis]
+        return theta, np.stack((d_u, -d_u - d_v, d_v), axis=1)
+    c, d_u, d_v, d2_uu, d2_uv, d2_vv = cosineDerivatives(u, v)
+    dc = np.stack((d_u, d_v), axis=1)
+    d2c = np.zeros((len(c), 2, 3, 2, 3))
+    d2c[:, 0, :, 0, :] = d2_uu
+    d2c[:, 0, :, 1, :] = d2_uv
+    d2c[:, 1, :, 0, :] = np.transpose(d2_uv, (0, 2, 1))
+    d2c[:, 1, :, 1, :] = d2_vv
+    # theta = arccos(c): first derivative -1/sin(theta), second derivative -cos(theta)/sin(theta)^3
+    dtheta = -dc / sin_theta[:, np.newaxis, np.newaxis]
+    d2theta = (-d2c / sin_theta[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis]
+               - (c / sin_theta ** 3)[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis]
+               * np.einsum('mvi,mwj->mviwj', dc, dc))
+    coeff = np.array([[1.0, -1.0, 0.0], [0.0, -1.0, 1.0]])
+
+    return (theta,) + localToAtoms(dtheta, d2theta, coeff)
+
+
+def termDihedrals(X, idx, deriv=0):
+    """
+    Signed dihedral angles (in radians) for the atom quadruples in idx, same convention as Molecule.dihedralangle()
+    With deriv=1, also returns the derivatives with respect to the positions of all four atoms, shape (M, 4, 3),
+    and with deriv=2 the second derivatives as well, shape (M, 4, 3, 4, 3)
+    """
+    end_1 = X[idx[:, 0]] - X[idx[:, 1]]
+    bridge = X[idx[:, 1]] - X[idx[:, 2]]
+    end_2 = X[idx[:, 2]] - X[idx[:, 3]]
+    vnormal_1 = np.cross(end_1, bridge)
+    vnormal_2 = np.cross(bridge, end_2)
+    vcross = np.cross(vnormal_2, bridge)
+    vn1_coord_n2 = np.einsum('ij,ij->i', vnormal_1, vnormal_2) / np.linalg.norm(vnormal_2, axis=1)
+    vn1_coord_vc = np.einsum('ij,ij->i', vnormal_1, vcross) / np.linalg.norm(vcross, axis=1)
+    psi = np.arctan2(vn1_coord_vc, vn1_coord_n2)
+    if not deriv:
+        return psi
+    if deriv < 2:
+        # Blondel-Karplus form of the derivatives; psi as defined above runs opposite to their angle,
+        # (hence the overall change of sign) and end_2 points the other way round
+        norm_b = np.linalg.norm(bridge, axis=1)[:, np.newaxis]
+        nsq_1 = np.einsum('ij,ij->i', vnormal_1, vnormal_1)[:, np.newaxis]
+        nsq_2 = np.einsum('ij,ij->i', vnormal_2, vnormal_2)[:, np.newaxis]
+        proj_1 = (np.einsum('ij,ij->i', end_1, bridge)[:, np.newaxis] / norm_b ** 2)
+        proj_2 = (np.einsum('ij,ij->i', -end_2, bridge)[:, np.newaxis] / norm_b ** 2)
+        d_1 = norm_b * vnormal_1 / nsq_1
+        d_4 = -norm_b * vnormal_2 / nsq_2
+        d_2 = -d_1 - proj_1 * d_1 - proj_2 * d_4
+        d_3 = -d_4 + proj_1 * d_1 + proj_2 * d_4
+        return psi, np.stack((d_1, d_2, d_3, d_4), axis=1)
+
+    # For second derivatives write psi = atan2(y, x) with the polynomials (in end_1, bridge and end_2)
+    # x = vnormal_1 . vnormal_2 = (e1.b)(b.e2) - (e1.e2)(b.b) and y = |b| t, t = e1 . (b x e2)
+    m = len(psi)
+    e1, b, e2 = end_1, bridge, end_2
+    e1b = np.einsum('ij,ij->i', e1, b)[:, np.newaxis]
+    be2 = np.einsum('ij,ij->i', b, e2)[:, np.newaxis]
+    e1e2 = np.einsum('ij,ij->i', e1, e2)[:, np.newaxis]
+    bb = np.einsum('ij,ij->i', b, b)[:, np.newaxis]
+    norm_b = np.sqrt(bb)
+    unity = np.eye(3)
+
+    def outer(p, q):
+        return np.einsum('ij,ik->ijk', p, q)
+
+    x = (e1b * be2 - e1e2 * bb)[:, 0]
+    dx = np.stack((b * be2 - e2 * bb, e1 * be2 + e2 * e1b - 2 * b * e1e2, b * e1b - e1 * bb), axis=1)
+    d2x = np.zeros((m, 3, 3, 3, 3))
+    d2x[:, 1, :, 1, :] = outer(e1, e2) + outer(e2, e1) - 2 * e1e2[:, :, np.newaxis] * unity
+    d2x[:, 0, :, 1, :] = be2[:, :, np.newaxis] * unity + outer(b, e2) - 2 * outer(e2, b)
+    d2x[:, 0, :, 2, :] = outer(b, b) - bb[:, :, np.newaxis] * unity
+    d2x[:, 1, :, 2, :] = outer(e1, b) + e1b[:, :, np.newaxis] * unity - 2 * outer(b, e1)
+
+    t = np.einsum('ij,ij->i', e1, np.cross(b, e2))
+    dt = np.stack((np.cross(b, e2), np.cross(e2, e1), np.cross(e1, b)), axis=1)
+    d2t = np.zeros((m, 3, 3, 3, 3))
+    d2t[:, 0, :, 1, :] = -crossMatrices(e2)
+    d2t[:, 0, :, 2, :] = crossMatrices(b)
+    d2t[:, 1, :, 2, :] = -crossMatrices(e1)
+    for v, w in ((0, 1), (0, 2), (1, 2)):
+        d2x[:, w, :, v, :] = np.transpose(d2x[:, v, :, w, :], (0, 2, 1))
+        d2t[:, w, :, v, :] = np.transpose(d2t[:, v, :, w, :], (0, 2, 1))
+
+    dnorm_b = np.zeros((m, 3, 3))
+    dnorm_b[:, 1] = b / norm_b
+    y = norm_b[:, 0] * t
+    dy = norm_b[:, :, np.newaxis] * dt + t[:, np.newaxis, np.newaxis] * dnorm_b
+    d2y = (norm_b[:, :, np.newaxis, np.newaxis, np.newaxis] * d2t + np.einsum('mvi,mwj->mviwj', dnorm_b, dt)
+           + np.einsum('mvi,mwj->mviwj', dt, dnorm_b))
+    d2y[:, 1, :, 1, :] += t[:, np.newaxis, np.newaxis] * (unity - outer(b, b) / bb[:, :, np.newaxis]) / norm_b[:, :, np.newaxis]
+
+    rsq = x ** 2 + y ** 2
+    xx = x[:, np.newaxis, np.newaxis]
+    yy = y[:, np.newaxis, np.newaxis]
+    numerator = xx * dy - yy * dx
+    dpsi = numerator / rsq[:, np.newaxis, np.newaxis]
+    d2psi = (np.einsum('mvi,mwj->mviwj', dy, dx) - np.einsum('mvi,mwj->mviwj', dx, dy)
+             + xx[:, :, :, np.newaxis, np.newaxis] * d2y - yy[:, :, :, np.newaxis, np.newaxis] * d2x)
+    d2psi = d2psi / rsq[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis]
+    d2psi -= np.einsum('mvi,mwj->mviwj', numerator, 2 * (xx * dx + yy * dy)) / (
+        rsq ** 2)[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis]
+    d2psi = 0.5 * (d2psi + np.transpose(d2psi, (0, 3, 4, 1, 2)))
+    coeff = np.array([[1.0, -1.0, 0.0, 0.0], [0.0, 1.0, -1.0, 0.0], [0.0, 0.0, 1.0, -1.0]])
+
+    return (psi,) + localToAtoms(dpsi, d2psi, coeff)
+
+
+def termOutOfPlane(X, idx, deriv=0):
+    """
+    Averaged out of plane angles (in radians) for the atom quadruples in idx, central atom first,
+    same construction as Molecule.outofplaneangle()
+    With deriv=1, also returns the derivatives with respect to the positions of all four atoms, shape (M, 4, 3),
+    and with deriv=2 the second derivatives as well, shape (M, 4, 3, 4, 3)
+    """
+    atom_c = X[idx[:, 0]]
+    inplane_12 = X[idx[:, 2]] - X[idx[:, 1]]
+    inplane_13 = X[idx[:, 3]] - X[idx[:, 1]]
+    plane_norm = np.cross(inplane_12, inplane_13)
+    normsq = np.einsum('ij,ij->i', plane_norm, plane_norm)
+    phi = np.zeros(len(idx))
+    if deriv == 1:
+        dphi = np.zeros((len(idx), 4, 3))
+        d_norm = np.zeros((len(idx), 3))
+    for e in range(1, 4):
+        bond = X[idx[:, e]] - atom_c
+        inplane = np.cross(plane_norm, np.cross(bond, plane_norm)) / normsq[:, np.newaxis]
+        cos_phi = np.einsum('ij,ij->i', bond, inplane) / (
+            np.linalg.norm(bond, axis=1) * np.linalg.norm(inplane, axis=1))
+        phi += np.where(np.abs(cos_phi - 1.0) <= 10 ** -15, 0.0, np.arccos(np.minimum(cos_phi, 1.0)))
+        if deriv == 1:
+            # Each angle is arcsin(|s|) with s the sine of the angle between the bond and the plane,
+            # s = bond . plane_norm / (|bond| |plane_norm|)
+            norm_bond = np.linalg.norm(bond, axis=1)[:, np.newaxis]
+            norm_n = np.sqrt(normsq)[:, np.newaxis]
+            s = np.einsum('ij,ij->i', bond, plane_norm)[:, np.newaxis] / (norm_bond * norm_n)
+            factor = np.sign(s) / np.sqrt(np.maximum(1.0 - s ** 2, 1e-24)) / 3
+            ds_bond = plane_norm / (norm_bond * norm_n) - s * bond / norm_bond ** 2
+            ds_norm = bond / (norm_bond * norm_n) - s * plane_norm / norm_n ** 2
+            dphi[:, e] += factor * ds_bond
+            dphi[:, 0] -= factor * ds_bond
+            d_norm += factor * ds_norm
+    if not deriv:
+        return phi / 3
+    if deriv == 1:
+        # Chain rule through plane_norm = inplane_12 x inplane_13
+        d_12 = np.cross(inplane_13, d_norm)
+        d_13 = np.cross(d_norm, inplane_12)
+        dphi[:, 1] -= d_12 + d_13
+        dphi[:, 2] += d_12
+        dphi[:, 3] += d_13
+        return phi / 3, dphi
+
+    # Second derivatives are taken with respect to the vectors (bond_1, bond_2, bond_3, inplane_12, inplane_13);
+    # each angle only depends on its own bond and, through plane_norm, on the two in-plane vectors
+    m = len(phi)
+    dphi = np.zeros((m, 5, 3))
+    d2phi = np.zeros((m, 5, 3, 5, 3))
+    dnorm_12 = -crossMatrices(inplane_13)
+    dnorm_13 = crossMatrices(inplane_12)
+    for e in range(1, 4):
+        bond = X[idx[:, e]] - atom_c
+        s, d_bond, d_n, d2_bb, d2_bn, d2_nn = cosineDerivatives(bond, plane_norm)
+        ds = np.stack((d_bond, np.einsum('mji,mj->mi', dnorm_12, d_n), np.einsum('mji,mj->mi', dnorm_13, d_n)),
+                      axis=1)
+        d2s = np.zeros((m, 3, 3, 3, 3))
+        d2s[:, 0, :, 0, :] = d2_bb
+        d2s[:, 0, :, 1, :] = np.einsum('mij,mjk->mik', d2_bn, dnorm_12)
+        d2s[:, 0, :, 2, :] = np.einsum('mij,mjk->mik', d2_bn, dnorm_13)
+        d2s[:, 1, :, 1, :] = np.einsum('mji,mjk,mkl->mil', dnorm_12, d2_nn, dnorm_12)
+        d2s[:, 2, :, 2, :] = np.einsum('mji,mjk,mkl->mil', dnorm_13, d2_nn, dnorm_13)
+        # plane_norm is bilinear in the in-plane vectors, which adds a cross term
+        d2s[:, 1, :, 2, :] = np.einsum('mji,mjk,mkl->mil', dnorm_12, d2_nn, dnorm_13) - crossMatrices(d_n)
+        for v, w in ((0, 1), (0, 2), (1, 2)):
+            d2s[:, w, :, v, :] = np.transpose(d2s[:, v, :, w, :], (0, 2, 1))
+        # arcsin(|s|): first derivative sign(s) / sqrt(1 - s^2), second derivative |s| / (1 - s^2)^(3/2)
+        factor = np.sign(s) / np.sqrt(np.maximum(1.0 - s ** 2, 1e-24))
+        factor2 = np.abs(s) / np.maximum(1.0 - s ** 2, 1e-24) ** 1.5
+        block = (factor[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis] * d2s
+                 + factor2[:, np.newaxis, np.newaxis, np.newaxis, np.newaxis] * np.einsum('mvi,mwj->mviwj', ds, ds))
+        vectors = [e - 1, 3, 4]
+        dphi[:, vectors] += factor[:, np.newaxis, np.newaxis] * ds
+        for a in range(3):
+            for b in range(3):
+                d2phi[:, vectors[a], :, vectors[b], :] += block[:, a, :, b, :]
+    coeff = np.array([[-1.0, 1.0, 0.0, 0.0], [-1.0, 0.0, 1.0, 0.0], [-1.0, 0.0, 0.0, 1.0],
+                      [0.0, -1.0, 1.0, 0.0], [0.0, -1.0, 0.0, 1.0]])
+
+    return (phi / 3,) + localToAtoms(dphi / 3, d2phi / 3, coeff)
+
+
+def stretchTableEnergies(r, table, deriv=0):
+    """
+    Energies of all packed stretches (of any type) at distances r
+    With deriv=1, also returns the derivatives of those energies with respect to r, and with deriv=2
+    the second derivatives as well
+    """
+    typ = table["typ"]
+    r0 = table["r0"]
+    k = table["k"]
+    u = np.zeros(len(r))
+    du = np.zeros(len(r))
+    d2u = np.zeros(len(r))
+    m = typ == 1
+    u[m] = 0.5 * k[m] * (r[m] - r0[m]) ** 2
+    du[m] = k[m] * (r[m] - r0[m])
+    d2u[m] = k[m]
+    m = typ == 2
+    expterm = np.exp(-table["b"][m] * (r[m] - r0[m]))
+    u[m] = table["D"][m] * (1 - expterm) ** 2
+    du[m] = 2 * table["D"][m] * table["b"][m] * (1 - expterm) * expterm
+    d2u[m] = 2 * table["D"][m] * table["b"][m] ** 2 * expterm * (2 * expterm - 1)
+    m = (typ == 3) | (typ == 4)
+    a = table["a"][m]
+    ratio = r0[m] / r[m]
+    u[m] = k[m] * (1 + ratio ** a - 2 * ratio ** (a / 2))
+    du[m] = -k[m] * a * (ratio ** a - ratio ** (a / 2)) / r[m]
+    d2u[m] = k[m] * a * ((a + 1) * ratio ** a - (a / 2 + 1) * ratio ** (a / 2)) / r[m] ** 2
+    if deriv >= 2:
+        return u, du, d2u
+    if deriv:
+        return u, du
+
+    return u
+
+
+def bendTableEnergies(a, table, deriv=0):
+    """
+    Energies of all packed bends at angles a
+    With deriv=1, also returns the derivatives of those energies with respect to a, and with deriv=2
+    the second derivatives as well
+    """
+    typ = table["typ"]
+    a0 = table["a0"]
+    k = table["k"]
+    u = np.zeros(len(a))
+    du = np.zeros(len(a))
+    d2u = np.zeros(len(a))
+    m = typ == 1
+    u[m] = 0.5 * k[m] * (a[m] - a0[m]) ** 2
+    du[m] = k[m] * (a[m] - a0[m])
+    d2u[m] = k[m]
+    m = (typ == 2) & table["linear"]
+    u[m] = k[m] * table["f_dmp"][m] * (a0[m] - a[m]) ** 2
+    du[m] = -2 * k[m] * table["f_dmp"][m] * (a0[m] - a[m])
+    d2u[m] = 2 * k[m] * table["f_dmp"][m]
+    m = (typ == 2) & ~table["linear"]
+    u[m] = k[m] * table["f_dmp"][m] * (np.cos(a0[m]) - np.cos(a[m])) ** 2
+    du[m] = 2 * k[m] * table["f_dmp"][m] * (np.cos(a0[m]) - np.cos(a[m])) * np.sin(a[m])
+    d2u[m] = 2 * k[m] * table["f_dmp"][m] * (np.sin(a[m]) ** 2 + (np.cos(a0[m]) - np.cos(a[m])) * np.cos(a[m]))
+    if deriv >= 2:
+        return u, du, d2u
+    if deriv:
+        return u, du
+
+    return u
+
+
+def torsionTableEnergies(theta, table, deriv=0):
+    """
+    Energies of all packed torsions at dihedral angles theta
+    With deriv=1, also returns the derivatives of those energies with respect to theta, and with deriv=2
+    the second derivatives as well
+    """
+    typ = table["typ"]
+    theta0 = table["theta0"]
+    n = np.arange(1, table["k_tors"].shape[1] + 1)
+    u = np.zeros(len(theta))
+    du = np.zeros(len(theta))
+    d2u = np.zeros(len(theta))
+    m = typ == 1
+    u[m] = table["k"][m] * (1 + np.cos(math.pi + theta[m] - theta0[m]))
+    du[m] = -table["k"][m] * np.sin(math.pi + theta[m] - theta0[m])
+    d2u[m] = -table["k"][m] * np.cos(math.pi + theta[m] - theta0[m])
+    m = (typ == 2) | (typ == 3)
+    shifted = (theta[m] - math.pi)[:, np.newaxis]
+    f_chiral = 0.5 * (1 - scipy.special.erf(shifted))
+    df_chiral = -np.exp(-shifted ** 2) / math.sqrt(math.pi)
+    d2f_chiral = 2 * shifted * np.exp(-shifted ** 2) / math.sqrt(math.pi)
+    arg_1 = n * (theta[m] - theta0[m])[:, np.newaxis] + math.pi
+    arg_2 = n * (theta[m] + theta0[m] - (2 * math.pi))[:, np.newaxis] + math.pi
+    inner_sum = f_chiral * (1 + np.cos(arg_1)) + (1 - f_chiral) * (1 + np.cos(arg_2))
+    d_inner_sum = df_chiral * (np.cos(arg_1) - np.cos(arg_2)) - n * (f_chiral * np.sin(arg_1) + (1 - f_chiral) * np.sin(arg_2))
+    d2_inner_sum = (d2f_chiral * (np.cos(arg_1) - np.cos(arg_2)) - 2 * n * df_chiral * (np.sin(arg_1) - np.sin(arg_2))
+                    - n ** 2 * (f_chiral * np.cos(arg_1) + (1 - f_chiral) * np.cos(arg_2)))
+    u[m] = table["f_dmp"][m] * np.sum(table["k_tors"][m] * inner_sum, axis=1)
+    du[m] = table["f_dmp"][m] * np.sum(table["k_tors"][m] * d_inner_sum, axis=1)
+    d2u[m] = table["f_dmp"][m] * np.sum(table["k_tors"][m] * d2_inner_sum, axis=1)
+    m = typ == 4
+    u[m] = np.sum(table["k_tors"][m] * np.cos(n * (theta[m] - theta0[m])[:, np.newaxis]), axis=1)
+    du[m] = -np.sum(table["k_tors"][m] * n * np.sin(n * (theta[m] - theta0[m])[:, np.newaxis]), axis=1)
+    d2u[m] = -np.sum(table["k_tors"][m] * n ** 2 * np.cos(n * (theta[m] - theta0[m])[:, np.newaxis]), axis=1)
+    if deriv >= 2:
+        return u, du, d2u
+    if deriv:
+        return u, du
+
+    return u
+
+
+def inversionTableEnergies(phi, table, deriv=0):
+    """
+    Energies of all packed inversions at out of plane angles phi
+    With deriv=1, also returns the derivatives of those energies with respect to phi, and with deriv=2
+    the second derivatives as well
+    """
+    typ = table["typ"]
+    phi0 = table["phi0"]
+    k = table["k"]
+    u = np.zeros(len(phi))
+    du = np.zeros(len(phi))
+    d2u = np.zeros(len(phi))
+    m = typ == 1
+    u[m] = 0.5 * k[m] * (phi[m] - phi0[m]) ** 2
+    du[m] = k[m] * (phi[m] - phi0[m])
+    d2u[m] = k[m]
+    m = (typ == 2) & table["linear"]
+    u[m] = k[m] * table["f_dmp"][m] * (phi0[m] - phi[m]) ** 2
+    du[m] = -2 * k[m] * table["f_dmp"][m] * (phi0[m] - phi[m])
+    d2u[m] = 2 * k[m] * table["f_dmp"][m]
+    m = (typ == 2) & ~table["linear"]
+    u[m] = k[m] * table["f_dmp"][m] * (np.cos(phi0[m]) - np.cos(phi[m])) ** 2
+    du[m] = 2 * k[m] * table["f_dmp"][m] * (np.cos(phi0[m]) - np.cos(phi[m])) * np.sin(phi[m])
+    d2u[m] = 2 * k[m] * table["f_dmp"][m] * (np.sin(phi[m]) ** 2 + (np.cos(phi0[m]) - np.cos(phi[m])) * np.cos(phi[m]))
+    if deriv >= 2:
+        return u, du, d2u
+    if deriv:
+        return u, du
+
+    return u
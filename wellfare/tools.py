@@ -0,0 +1,211 @@
+import numpy as np
+import scipy.optimize
+
+from .messages import ProgramError, ProgramWarning
+from .constants import au2kcal_mol, Bohr2Ang
+from .profiler import ProfiledTermNames
+
+
+######################################################################################
+# Functions for additional calculations, optional to the program, defined below here #
+######################################################################################
+
+def dissociateBond(molecule, atom1, atom2, epsilon, cutoff, verbosity=1):
+    """
+  Function to progressively increase separation between atoms number a1 and a2 in increments of size epsilon until it exceeds the specified cutoff, and calculate potential energy at each new geometry
+  Output can be used to generate a dissociation curve
+  """
+
+    if verbosity >= 1:
+        print("\nSetting up for bond dissociation")
+        print("epsilon = " + str(epsilon))
+        print("cutoff = " + str(cutoff))
+    # Identify the atoms to be moved apart
+    a1 = molecule.atoms[atom1]
+    a2 = molecule.atoms[atom2]
+    # Check that the two are actually bonded in the molecule, give error/warning if not
+    if [atom1, atom2] in molecule.bonds:
+        bond = [atom1, atom2]
+        if verbosity >= 2:
+            print("Bond to dissociate: " + str(bond))
+    elif [atom2, atom1] in molecule.bonds:
+        bond = [atom2, atom1]
+        if verbosity >= 2:
+            print("Bond to dissociate: " + str(bond))
+    else:
+        ProgramWarning()
+        print("\nAtoms for dissociation are not bonded in input structure")
+    # Determine how many other bonding partners each atom has
+    bonded_a1 = []
+    bonded_a2 = []
+    for i in range(len(molecule.atoms)):
+        if atom1 != i and atom2 != i:
+            if [atom1, i] in molecule.bonds or [i, atom1] in molecule.bonds:
+                bonded_a1.append(i)
+            elif [atom2, i] in molecule.bonds or [i, atom2] in molecule.bonds:
+                bonded_a2.append(i)
+    nbonds_a1 = len(bonded_a1)
+    nbonds_a2 = len(bonded_a2)
+    # Set the atom with fewest bonding partners to move, the other to remain stationary
+    atM = a1
+    atomM = atom1
+    atS = a2
+    atomS = atom2
+    if nbonds_a1 <= nbonds_a2:
+        if verbosity >= 1:
+            print("Fixing atom " + str(atom2))
+            print("Moving atom " + str(atom1))
+    elif nbonds_a2 < nbonds_a2:
+        atM = a2
+        atomM = atom2
+        atS = a1
+        atomS = atom1
+        if verbosity >= 1:
+            print("Fixing atom " + str(atom1))
+            print("Moving atom " + str(atom2))
+    # Calculate the vector along which movement should occur
+    dvector = [atM.coord[i] - atS.coord[i] for i in range(3)]
+    norm_dv = np.linalg.norm(dvector)
+    unitdv = [dvector[i] / norm_dv for i in range(3)]
+    movevector = [unitdv[i] * epsilon for i in range(3)]
+
+    # Set up the geometries, starting at half the equilibrium bond length
+    r0 = molecule.atmatmdist(atom1, atom2)
+    ri = r0 / 2
+    cartCoords = molecule.cartesianCoordinates()
+    initialmv = [unitdv[i] * (r0 / 2) for i in range(3)]
+    for i in range(3):
+        cartCoords[(atomM * 3) + i] = cartCoords[(atomM * 3) + i] - initialmv[i]
+    separations = [ri]
+    geometries = [list(cartCoords)]
+    # Iteratively increase separation until it exceeds the given cutoff
+    r = ri
+    while r <= cutoff:
+        for i in range(3):
+            cartCoords[(atomM * 3) + i] = cartCoords[(atomM * 3) + i] + movevector[i]
+        r = r + epsilon
+        separations.append(r)
+        geometries.append(list(cartCoords))
+
+    # Calculate the energies of all distorted geometries in one batch, with their breakdown into the terms
+    energies, contributions = molecule.FFEnergyBatch(geometries, terms=True)
+    if verbosity >= 1:
+        for n in range(len(geometries)):
+            if n == 0:
+                print("\nCalculating initial energy, at separation " + str(separations[n]) + ":")
+            else:
+                print("\nCalculating energy at separation " + str(separations[n]) + ":")
+            energy = molecule.Ee_QM
+            print(" + {:<34}= {:> 16.8f}".format("QM energy (equilibrium structure)", energy))
+            for term, values in contributions.items():
+                energy = energy + values[n]
+                print(" + {:<34}= {:> 16.8f}".format(ProfiledTermNames[term], energy))
+            print("{:<37}= {:> 16.8f}".format("Total energy", energies[n]))
+        print("\nCutoff reached, dissociation calculation complete")
+    ei = energies[0]
+    DissocEnergies = []
+    for n in range(len(geometries)):
+        DissocEnergies.append([separations[n], Bohr2Ang(separations[n]), energies[n], au2kcal_mol(energies[n])])
+    # NOTE Currently moving only one atom - full version should move whole bonded fragment
+    # Calculate total increase in separation, total energy change
+    nsteps = len(DissocEnergies)
+    delta_r = DissocEnergies[nsteps - 1][0] - ri
+    delta_e = DissocEnergies[nsteps - 1][1] - ei
+
+    # Output results in a nice format
+    print("\nNumber of points evaluated: " + str(nsteps))
+    print(
+        "\nCalculated distance and dissociation energy for " + str(molecule.name) + " atoms " + str(atomS) + ", " + str(
+            atomM) + ":")
+    print("---------------------------------------------------------------------")
+    print('{:<11}   {:<11}   {:<11}      {:<11}'.format("r (AU)", "r (Angstrom)", "E (Hartree)", "E (kcal/mol)"))
+    for i in range(len(DissocEnergies)):
+        data = DissocEnergies[i]
+        print('{:.8f}    {:.8f}     {:.7f}     {:.5f}'.format(data[0], data[1], data[2], data[3]))
+    print("\nTotal increase in separation: " + str(delta_r))
+    print("\nTotal energy change: " + str(delta_e))
+
+
+# End of routine
+
+def ObjFuncSEAM(X, reactant, product):
+    """
+  Objective function employed in the SEAM method to find a minimum on the intersction of reactant and product potential energy surfaces
+  Here reactant and product both belong to the class Molecule, and X is a list of cartesian coordinates with the Lagrange multiplier L appended
+  """
+    cartCoordinates = np.zeros(len(X) - 1)
+    for i in range(len(X) - 1):
+        cartCoordinates[i] = X[i]
+    lm = X[len(X) - 1]
+
+    E_r = reactant.FFEnergy(cartCoordinates, verbosity=0, dtyp=1)  # Extra arguments included as a reminder of options
+    E_p = product.FFEnergy(cartCoordinates, verbosity=0, dtyp=1)
+
+    L = (E_r + E_p) - lm * (E_r - E_p)
+
+    return L
+
+
+def dObjFuncSEAM(X, reactant, product):
+    """
+  Function to calculate the (first) derivative of the objective function for the SEAM method from the analytic force field gradients
+  """
+    cartCoordinates = np.asarray(X[:-1], dtype=float)
+    lm = X[len(X) - 1]
+
+    E_r, dE_r = reactant.FFEnergyGradient(cartCoordinates, dtyp=1)
+    E_p, dE_p = product.FFEnergyGradient(cartCoordinates, dtyp=1)
+
+    dL = np.zeros(len(X))
+    dL[:-1] = (dE_r + dE_p) - lm * (dE_r - dE_p)
+    dL[-1] = -(E_r - E_p)
+
+    return dL
+
+
+def TSbySEAM(reactant, product, verbosity=1):
+    """
+  Function to carry out the search for a transition state by the SEAM method
+  """
+
+    # Set up the list of variables X to be optimised, taking a 50:50 interpolation of coordinates for reactant and product as the initial guess
+    CoordsR = reactant.cartesianCoordinates()
+    print(CoordsR)  # Testing only
+    CoordsP = product.cartesianCoordinates()
+    guessL = 0  # Initial guess for the Lagrange multiplier can be modified as desired
+    if len(CoordsR) == len(CoordsP):
+        guessCoords = np.zeros(len(CoordsR))
+        for i in range(len(CoordsR)):
+            guessCoords[i] = (CoordsR[i] + CoordsP[i]) / 2
+    else:
+        print("Molecules provided to SEAM method have incompatible coordinates (length mismatch)")
+        ProgramError()  # Consider arranging such that the function does not execute further in this case
+    X = np.zeros(len(guessCoords) + 1)
+    for i in range(len(guessCoords)):
+        X[i] = guessCoords[i]
+    X[len(guessCoords)] = guessL
+    if verbosity >= 1:
+        print("Starting SEAM with initial coordinates + multiplier:")
+        print(X)
+
+    # Starting from X, optimise to a stationary point of the objective function
+    X_opt = scipy.optimize.fsolve(dObjFuncSEAM, X, args=(reactant, product))
+
+    # Check that the stationary point found is a minimum?
+
+    if verbosity >= 1:
+        print("Candidate transition state + multiplier located by SEAM:")
+        print(X_opt)
+
+    # Calculate the energy at the transition state (should be equal using either force field)
+    TS = np.zeros(len(X_opt) - 1)
+    for i in range((len(X_opt) - 1)):
+        TS[i] = X_opt[i]
+    E_TS = reactant.FFEnergy(TS)
+
+    # Print out the SEAM transition state in a format readable by Gaussian 
+    print("\nSEAM Transition state in Gaussian format:")
+    print(reactant.gaussStringatX(TS))
+    print("\nEnergy at Transition state: " + str(E_TS))
+
+    return TS
@@ -0,0 +1,113 @@
+import numpy as np
+import scipy.spatial
+
+
+def incidentBonds(bonds):
+    """
+    Returns a dictionary mapping each atom to the ascending list of indices of the bonds it takes part in
+    """
+    incident = {}
+    for n, bond in enumerate(bonds):
+        for atom in bond:
+            incident.setdefault(atom, []).append(n)
+    return incident
+
+
+def plausibleTerm(atoms, numatoms):
+    """
+    Same sanity checks as Molecule.addAngle() and Molecule.addDihedral(): all atoms distinct and in range
+    """
+    for atom in atoms:
+        if atom < 0 or atom > numatoms:
+            return False
+    return len(set(atoms)) == len(atoms)
+
+
+def findAngles(bonds, numatoms, existing=()):
+    """
+    Returns the list of angles [a, b, c] (with b the central atom) formed by pairs of bonds sharing an atom,
+    in the same order as comparing every pair of bonds i < j would find them, and leaving out angles
+    that are already in existing. Only the bonds incident to the atoms of bond i are compared with it.
+    """
+    incident = incidentBonds(bonds)
+    found = set(tuple(angle) for angle in existing)
+    angles = []
+
+    def add(a, b, c):
+        if (a, b, c) not in found and plausibleTerm((a, b, c), numatoms):
+            found.add((a, b, c))
+            angles.append([a, b, c])
+
+    for i, bond_i in enumerate(bonds):
+        partners = sorted(set(j for atom in bond_i for j in incident[atom] if j > i))
+        for j in partners:
+            bond_j = bonds[j]
+            if bond_i[0] == bond_j[0]:
+                add(bond_i[1], bond_i[0], bond_j[1])
+            if bond_i[0] == bond_j[1]:
+                add(bond_i[1], bond_i[0], bond_j[0])
+            if bond_i[1] == bond_j[0]:
+                add(bond_i[0], bond_i[1], bond_j[1])
+            if bond_i[1] == bond_j[1]:
+                add(bond_i[0], bond_i[1], bond_j[0])
+    return angles
+
+
+def findDihedrals(angles, numatoms, existing=()):
+    """
+    Returns the list of dihedrals [a, b, c, d] formed by pairs of angles sharing two atoms,
+    in the same order as comparing every pair of angles i < j would find them, and leaving out dihedrals
+    that are already in existing. Angles are looked up by their (first, central) and (central, last) atom pairs,
+    so only angles that can actually continue angle i are compared with it.
+    """
+    by_start = {}
+    by_end = {}
+    for n, angle in enumerate(angles):
+        by_start.setdefault((angle[0], angle[1]), []).append(n)
+        by_end.setdefault((angle[1], angle[2]), []).append(n)
+    found = set(tuple(dihedral) for dihedral in existing)
+    dihedrals = []
+
+    def add(a, b, c, d):
+        if (a, b, c, d) not in found and plausibleTerm((a, b, c, d), numatoms):
+            found.add((a, b, c, d))
+            dihedrals.append([a, b, c, d])
+
+    for i, angle_i in enumerate(angles):
+        a, b, c = angle_i
+        candidates = (by_start.get((b, c), []) + by_end.get((c, b), []) + by_start.get((b, a), [])
+                      + by_end.get((a, b), []))
+        partners = sorted(set(j for j in candidates if j > i))
+        for j in partners:
+            angle_j = angles[j]
+            if angle_i[1] == angle_j[0] and angle_i[2] == angle_j[1]:
+                add(angle_i[0], angle_i[1], angle_i[2], angle_j[2])
+            if angle_i[1] == angle_j[2] and angle_i[2] == angle_j[1]:
+                add(angle_i[0], angle_i[1], angle_i[2], angle_j[0])
+            if angle_i[1] == angle_j[0] and angle_i[0] == angle_j[1]:
+                add(angle_i[2], angle_j[0], angle_j[1], angle_j[2])
+            if angle_i[1] == angle_j[2] and angle_i[0] == angle_j[1]:
+                add(angle_i[2], angle_j[2], angle_j[1], angle_j[0])
+    return dihedrals
+
+
+def bondCandidates(coords, radii, distfactor):
+    """
+    Returns the ascending list of atom pairs (i, j), i < j, whose distance is at most (radii[i] + radii[j]) * distfactor,
+    with a small margin so that no such pair is lost to rounding. Only geometric neighbours within the largest
+    possible bond length are examined, using a k-d tree of the coordinates.
+    """
+    coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+    radii = np.asarray(radii, dtype=float)
+    if len(coords) < 2:
+        return []
+    margin = 1.0 + 1e-9
+    tree = scipy.spatial.cKDTree(coords)
+    pairs = tree.query_pairs(2 * np.max(radii) * distfactor * margin, output_type='ndarray')
+    if len(pairs) == 0:
+        return []
+    pairs = np.sort(pairs, axis=1)
+    distance = np.linalg.norm(coords[pairs[:, 0]] - coords[pairs[:, 1]], axis=1)
+    pairs = pairs[distance <= (radii[pairs[:, 0]] + radii[pairs[:, 1]]) * distfactor * margin]
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+    return [(int(i), int(j)) for i, j in pairs]
@@ -0,0 +1,206 @@
+import os
+import math
+import hashlib
+import json
+import shutil
+import tempfile
+import concurrent.futures
+import multiprocessing
+import subprocess
+
+import numpy as np
+
+from .messages import ProgramAbort, ProgramError, ProgramWarning
+from .io import cacheDirectory, writeCacheIndex
+
+
+#############################################################################################################
+# Torsion scans: the fragment calculations for all dihedral scans, dispatched to a pool of workers
+#############################################################################################################
+
+def gaussianHuckelEnergy(fragment):
+    """
+    Returns the extended Hückel energy of the Molecule fragment as calculated by Gaussian through run-gauss.bash,
+    or infinity if no energy could be obtained. The calculation runs in its own temporary directory.
+    """
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "run-gauss.bash")
+    workdir = tempfile.mkdtemp(prefix="wellfare-scan-")
+    try:
+        inputfile = os.path.join(workdir, "scan.inp")
+        afile = open(inputfile, 'w', encoding='utf-8')
+        afile.write("#T huckel\n" + fragment.gaussString())
+        afile.close()
+        gaussOutput = subprocess.check_output([script, inputfile], stderr=subprocess.DEVNULL, cwd=workdir)
+        energy = float(gaussOutput.decode('ascii').strip())
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        energy = np.inf
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return energy
+
+
+def ehtHuckelEnergy(fragment, mindist=0.5):
+    """
+    Returns the extended Hückel energy of the Molecule fragment as calculated in-process by Molecule.HMOEnergy(),
+    or infinity if no energy could be obtained. Like Gaussian, no energy is calculated when two atoms are closer
+    than mindist (in Angstrom), as happens for the capping atoms of rings at some scan angles.
+    """
+    coords = np.array([atom.coord for atom in fragment.atoms])
+    distances = np.linalg.norm(coords[:, np.newaxis, :] - coords[np.newaxis, :, :], axis=2)
+    if np.any(distances[np.triu_indices(len(coords), 1)] < mindist):
+        return np.inf
+    try:
+        energy = float(fragment.HMOEnergy())
+    except (np.linalg.LinAlgError, ValueError):
+        energy = np.inf
+
+    return energy
+
+
+# Backends for the torsion scan calculations, selected with --scan-backend
+ScanBackends = {"eht": ehtHuckelEnergy, "g09": gaussianHuckelEnergy}
+
+FRAGMENT_CACHE_VERSION = 1
+
+
+def fragmentSignature(rightside, leftside, points, backend):
+    """
+    Returns a canonical signature (a hexadecimal hash) of the dihedral scan of the fragments rightside and leftside,
+    as returned by Molecule.assembleDihedralScanFragments(), and whether the fragments are the mirror image of the
+    canonical ones. Each atom around the central bond is described by its side, element, distance from its central
+    atom, angle with the central bond and rotation about the bond relative to a reference atom on the first side
+    (in Angstrom and degrees, rounded). The signature uses the smallest such description over all choices of
+    reference atom, both mirror images and both orders of the two sides (rotating one side against the other is
+    the same either way), so that it does not depend on the position, orientation or atom order of the fragments.
+    The number of scan points and the backend are part of the signature.
+    """
+    description = None
+    mirrored = False
+    for first, second in ((rightside, leftside), (leftside, rightside)):
+        b = np.array(first.atoms[0].coord)
+        c = np.array(second.atoms[0].coord)
+        axis = (c - b) / np.linalg.norm(c - b)
+        atoms = []
+        for side, centre, fragment in ((0, b, first), (1, c, second)):
+            for atom in fragment.atoms[1:]:
+                v = np.array(atom.coord) - centre
+                r = np.linalg.norm(v)
+                angle = math.degrees(math.acos(max(-1.0, min(1.0, np.dot(v, axis) / r))))
+                atoms.append((side, atom.symbol, r, angle, v - np.dot(v, axis) * axis))
+
+        references = [atom[4] for atom in atoms if atom[0] == 0 and np.linalg.norm(atom[4]) > 1.0e-3]
+        if len(references) == 0:
+            references = [None]
+        for handedness in (1.0, -1.0):
+            for reference in references:
+                candidate = []
+                for side, symbol, r, angle, perpendicular in atoms:
+                    rotation = 0.0
+                    if reference is not None and np.linalg.norm(perpendicular) > 1.0e-3:
+                        rotation = handedness * math.degrees(
+                            math.atan2(np.dot(np.cross(reference, perpendicular), axis),
+                                       np.dot(reference, perpendicular)))
+                    candidate.append([side, symbol, "{:.3f}".format(r), "{:.1f}".format(angle),
+                                      "{:.1f}".format(round(rotation, 1) % 360.0)])
+                candidate.sort()
+                candidate = [first.atoms[0].symbol, second.atoms[0].symbol, "{:.3f}".format(np.linalg.norm(c - b)),
+                             candidate]
+                if description is None or candidate < description:
+                    description = candidate
+                    mirrored = handedness < 0.0
+
+    signature = [FRAGMENT_CACHE_VERSION, backend, points, description]
+    return hashlib.sha256(json.dumps(signature).encode('utf-8')).hexdigest(), mirrored
+
+
+def mirrorScan(energies):
+    """
+    Returns the scan energies of the mirror image fragments: rotating the mirror image by an angle is equivalent
+    to rotating the original by minus that angle
+    """
+    return [energies[(len(energies) - k) % len(energies)] for k in range(len(energies))]
+
+
+def loadFragmentCache(verbosity=0):
+    """
+    Returns the dictionary of dihedral scans stored in "fragments.json" in cacheDirectory(), keyed by their
+    fragmentSignature() and holding the scan energies and, once fitted, the k_tors values. Empty if there is none.
+    """
+    filename = os.path.join(cacheDirectory(), "fragments.json")
+    try:
+        f = open(filename, 'r')
+        stored = json.load(f)
+        f.close()
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(stored, dict) or stored.get("version") != FRAGMENT_CACHE_VERSION:
+        return {}
+    if verbosity >= 2:
+        print("\nRead {} cached dihedral scans from {}".format(len(stored["scans"]), filename))
+
+    return stored["scans"]
+
+
+def saveFragmentCache(scans, verbosity=0):
+    """
+    Adds the dihedral scans in scans to "fragments.json" in cacheDirectory()
+    """
+    filename = os.path.join(cacheDirectory(), "fragments.json")
+    try:
+        os.makedirs(cacheDirectory(), exist_ok=True)
+        stored = loadFragmentCache()
+        stored.update(scans)
+        writeCacheIndex(filename, {"version": FRAGMENT_CACHE_VERSION, "scans": stored})
+    except OSError as error:
+        if verbosity >= 1:
+            ProgramWarning()
+            print("Could not store dihedral scans in cache: " + str(error))
+
+
+def runTorsionScans(fragments, nprocs=None, verbosity=0, backend="eht"):
+    """
+    Calculates the energies of all scan fragments with the chosen backend and a pool of at most nprocs concurrent
+    calculations (by default one per CPU), collecting results as they complete. External programs run from a pool
+    of threads, in-process calculations from a pool of forked worker processes where the platform provides them
+    and one after the other otherwise. Returns the energies in the order of fragments.
+    """
+    if backend not in ScanBackends:
+        ProgramError()
+        print("Unknown torsion scan backend: " + str(backend))
+        ProgramAbort()
+    energy = ScanBackends[backend]
+    energies = [np.inf] * len(fragments)
+    if len(fragments) == 0:
+        return energies
+    if nprocs is None:
+        nprocs = os.cpu_count() or 1
+    if backend != "g09" and "fork" not in multiprocessing.get_all_start_methods():
+        nprocs = 1
+    if verbosity >= 1:
+        print("\nRunning {} torsion scan calculations ({}) on {} workers".format(len(fragments), backend, nprocs))
+    if nprocs == 1:
+        for n, fragment in enumerate(fragments):
+            energies[n] = energy(fragment)
+            if verbosity >= 3:
+                print(" Scan point {} of {} done: {}".format(n + 1, len(fragments), energies[n]))
+        return energies
+    if backend == "g09":
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=nprocs)
+    else:
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=nprocs, mp_context=multiprocessing.get_context("fork"))
+    # Leaving the with block shuts the workers down, also when a calculation fails
+    with pool:
+        jobs = {pool.submit(energy, fragment): n for n, fragment in enumerate(fragments)}
+        try:
+            for job in concurrent.futures.as_completed(jobs):
+                energies[jobs[job]] = job.result()
+                if verbosity >= 3:
+                    print(" Scan point {} of {} done: {}".format(jobs[job] + 1, len(fragments), energies[jobs[job]]))
+        except BaseException:
+            # Drop the scan points not yet started, rather than waiting for them on the way out
+            for job in jobs:
+                job.cancel()
+            raise
+
+    return energies
@@ -0,0 +1,270 @@
+import sys
+import os
+import io
+import gc
+import json
+import time
+import platform
+import statistics
+import subprocess
+import contextlib
+import tracemalloc
+import argparse
+
+import numpy as np
+import scipy
+
+import wellfare
+
+# The resource module (for the process high-water mark) is not available on all platforms
+try:
+    import resource
+except ImportError:
+    resource = None
+
+#############################################################################################################
+# Benchmarks of the hot paths over the quantum chemistry output files that come with the program
+#############################################################################################################
+
+BENCH_VERSION = 1
+
+DefaultFiles = ["g09-h2o.log", "g09-ethane.log", "propane.log", "g09-benzene.log", "g09-dielsalder-r.log",
+                "g09-dielsalder-p.log", "g09-f3bnh2cho.log", "BSP_DACP2_R.log", "orca-ethane.log"]
+
+Stages = ["parse", "topology", "fit", "energy", "gradient", "optimise"]
+
+
+def setupMolecule(filename):
+    """
+    Returns a Molecule with force field terms set up from the output file filename, with fitted force
+    constants and a compiled term table, as the main program prepares the reactant
+    """
+    molecule = wellfare.Molecule("Benchmark", 0)
+    wellfare.extractCoordinates(filename, molecule, verbosity=0, cache=False)
+    wellfare.fitForceConstants(molecule, verbosity=0)
+    molecule.compileTermTable()
+
+    return molecule
+
+
+def stageFunctions(filename, molecule, maxiter):
+    """
+    Returns a dictionary with a function without arguments for each benchmark stage. Each function performs
+    the work of its stage once on the file filename or on the prepared molecule. The topology stage perceives
+    bonds, angles and dihedrals on data parsed beforehand, so that it does not include parsing or torsion scans.
+    """
+    coords = np.array(molecule.cartesianCoordinates())
+    data = wellfare.parseQMOutput(filename)
+
+    def parse():
+        wellfare.parseQMOutput(filename)
+
+    def topology():
+        bare = wellfare.Molecule("Benchmark", 0)
+        for symbol, x, y, z in data.atoms:
+            bare.addAtom(wellfare.Atom(symbol, x, y, z, 0.1))
+        wellfare.perceiveTopology(bare, data.bondorders)
+
+    def fit():
+        wellfare.fitForceConstants(molecule, verbosity=0)
+        molecule.compileTermTable()
+
+    def energy():
+        molecule.FFEnergy(coords)
+
+    def gradient():
+        molecule.FFEnergyGradient(coords)
+
+    def optimise():
+        molecule.optimise(maxiter=maxiter, update=False)
+
+    return {"parse": parse, "topology": topology, "fit": fit, "energy": energy, "gradient": gradient,
+            "optimise": optimise}
+
+
+def timeStage(function, repeat):
+    """
+    Runs function repeat times and returns the list of wall times in seconds, with the garbage collector
+    switched off during each run
+    """
+    times = []
+    for i in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    return times
+
+
+def peakMemory(function):
+    """
+    Runs function once under tracemalloc and returns the peak of memory allocated by Python during the run, in bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def maxRSS():
+    """
+    Returns the high-water mark of the resident memory of this process in bytes, or None if it is not available
+    """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    if sys.platform != "darwin":
+        rss *= 1024
+
+    return rss
+
+
+def gitRevision():
+    """
+    Returns the git revision of the source tree, or None if it cannot be determined
+    """
+    try:
+        output = subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL,
+                                         cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.decode('ascii').strip()
+
+
+def benchmarkFile(filename, stages, repeat=5, memory=True, maxiter=200, verbosity=0):
+    """
+    Benchmarks the given stages for one output file. Returns a dictionary with, for each stage, the median,
+    minimum and all wall times (in seconds) of repeat runs and, if memory is set, the tracemalloc peak of one
+    further run (in bytes). A stage that fails is reported with its error instead.
+    """
+    result = {"file": filename, "stages": {}}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            molecule = setupMolecule(filename)
+    except Exception as error:
+        result["error"] = "{}: {}".format(type(error).__name__, error)
+        return result
+    result["atoms"] = molecule.numatoms()
+    functions = stageFunctions(filename, molecule, maxiter)
+    for stage in stages:
+        entry = {}
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                times = timeStage(functions[stage], repeat)
+                if memory:
+                    entry["peak_bytes"] = peakMemory(functions[stage])
+            entry["median_s"] = statistics.median(times)
+            entry["min_s"] = min(times)
+            entry["times_s"] = times
+        except Exception as error:
+            entry["error"] = "{}: {}".format(type(error).__name__, error)
+        result["stages"][stage] = entry
+        if verbosity >= 1:
+            print(" {:<24} {:<9} {}".format(filename, stage, formatEntry(entry)), file=sys.stderr)
+
+    return result
+
+
+def formatEntry(entry):
+    """
+    Returns a one-line summary of the result of one stage
+    """
+    if "error" in entry:
+        return "error: " + entry["error"]
+    s = "{:>12.6f} s".format(entry["median_s"])
+    if "peak_bytes" in entry:
+        s += " {:>10.1f} kB".format(entry["peak_bytes"] / 1024.0)
+    else:
+        s += " " * 14
+    return s
+
+
+def printReport(results, reference=None):
+    """
+    Prints a table of the median times and memory peaks of all files and stages, and the ratio of the median
+    times to those of the reference results if given
+    """
+    previous = {}
+    if reference is not None:
+        for result in reference["results"]:
+            for stage, entry in result.get("stages", {}).items():
+                if "median_s" in entry:
+                    previous[(result["file"], stage)] = entry["median_s"]
+    print("{:<24} {:>5}  {:<9} {:>14} {:>13} {:>8}".format("File", "Atoms", "Stage", "Median", "Peak memory",
+                                                          "Ratio" if reference is not None else ""))
+    for result in results["results"]:
+        if "error" in result:
+            print("{:<24} {:>5}  error: {}".format(result["file"], "", result["error"]))
+            continue
+        for stage, entry in result["stages"].items():
+            ratio = ""
+            key = (result["file"], stage)
+            if key in previous and "median_s" in entry and previous[key] > 0.0:
+                ratio = "{:.2f}".format(entry["median_s"] / previous[key])
+            print("{:<24} {:>5}  {:<9} {} {:>8}".format(result["file"], result["atoms"], stage, formatEntry(entry),
+                                                       ratio))
+    if results["max_rss_bytes"] is not None:
+        print("\nProcess memory high-water mark: {:.1f} MB".format(results["max_rss_bytes"] / 1024.0 ** 2))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="WellFAReFF benchmarks: times the hot paths over quantum chemistry output files",
+        epilog="stages: " + ", ".join(Stages))
+    parser.add_argument("files", metavar='file', nargs='*', help="qc output files (default: the bundled logs)")
+    parser.add_argument("-s", "--stages", help="comma separated list of stages to run", default=",".join(Stages))
+    parser.add_argument("-n", "--repeat", help="number of timed runs per stage", type=int, default=5)
+    parser.add_argument("--maxiter", help="iteration limit of the geometry optimisation", type=int, default=200)
+    parser.add_argument("--nomemory", help="skip the tracemalloc run of each stage", action="store_true")
+    parser.add_argument("-o", "--output", metavar='file', help="write the results as JSON to this file")
+    parser.add_argument("-c", "--compare", metavar='file', help="JSON results of an earlier run to compare with")
+    parser.add_argument("-v", "--verbosity", help="report progress on stderr", type=int, choices=[0, 1], default=0)
+    args = parser.parse_args()
+
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    for stage in stages:
+        if stage not in Stages:
+            parser.error("unknown stage: " + stage)
+    files = args.files
+    if len(files) == 0:
+        directory = os.path.dirname(os.path.abspath(__file__))
+        files = [os.path.join(directory, name) for name in DefaultFiles]
+    reference = None
+    if args.compare is not None:
+        f = open(args.compare, 'r')
+        reference = json.load(f)
+        f.close()
+
+    results = {"version": BENCH_VERSION, "revision": gitRevision(),
+               "date": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+               "numpy": np.__version__, "scipy": scipy.__version__, "platform": platform.platform(),
+               "repeat": args.repeat, "results": []}
+    for filename in files:
+        result = benchmarkFile(filename, stages, repeat=args.repeat, memory=not args.nomemory,
+                               maxiter=args.maxiter, verbosity=args.verbosity)
+        result["file"] = os.path.basename(filename)
+        results["results"].append(result)
+    results["max_rss_bytes"] = maxRSS()
+
+    printReport(results, reference)
+    if args.output is not None:
+        f = open(args.output, 'w')
+        json.dump(results, f, indent=1, sort_keys=True)
+        f.write("\n")
+        f.close()
+
+
+if __name__ == "__main__":
+    main()